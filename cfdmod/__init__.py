@@ -99,7 +99,10 @@ __all__ = [
     "XdmfH5Storage",
     "H5FieldStore",
     "XdmfH5BlobStorage",
+    "DirectoryBlobStore",
     "BlobStore",
+    "OutputWriter",
+    "RangedBlobStore",
     "core_ops",
     "recipes",
     "load_template",
@@ -272,6 +275,8 @@ _SYMBOL_MODULE: dict[str, str] = {
     "OpError": "cfdmod.core",
     "StorageKeyError": "cfdmod.core",
     "BlobStore": "cfdmod.core",
+    "OutputWriter": "cfdmod.core",
+    "RangedBlobStore": "cfdmod.core",
     # Storage adapters (pull h5py -- lazy on purpose)
     "MemoryStorage": "cfdmod.adapters.memory",
     "MemoryFieldStore": "cfdmod.adapters.memory",
@@ -279,6 +284,7 @@ _SYMBOL_MODULE: dict[str, str] = {
     "XdmfH5Storage": "cfdmod.adapters.xdmf_h5",
     "H5FieldStore": "cfdmod.adapters.xdmf_h5",
     "XdmfH5BlobStorage": "cfdmod.adapters.xdmf_h5",
+    "DirectoryBlobStore": "cfdmod.adapters.directory",
     # Regroup
     "RegroupConfig": "cfdmod.regroup",
     "RegroupIndex": "cfdmod.regroup",
@@ -104,6 +104,12 @@ def run(
         help="RAM the run may spend on time-resolved arrays (e.g. 4G, 512M). "
         "The window size is derived from it; mutually exclusive with --chunk-size.",
     ),
+    prefetch: int = typer.Option(
+        0,
+        "--prefetch",
+        min=0,
+        help="Time windows to read ahead while the current one computes (chunked runs only).",
+    ),
 ) -> None:
     """Execute a v3 pipeline template (cfdmod.core.pipeline_yaml).
 
@@ -126,6 +132,7 @@ def run(
             digest=digest,
             chunk_size=chunk_size,
             memory_budget=budget_bytes,
+            prefetch=prefetch,
             # Say what the run decided. A silent cap reads as "processed
             # everything comfortably" when it did not.
             on_plan=lambda plan: typer.echo(plan.describe()),
@@ -10,6 +10,8 @@ Two adapters land in Phase 1:
   demand; ``XdmfH5Storage`` resolves a logical key to an
   ``<key>.h5`` + ``<key>.xdmf`` pair under its root directory. The
   on-disk format is unchanged.
+- ``cfdmod.adapters.directory`` -- ``DirectoryBlobStore``, a local
+  directory standing in for an object store behind ``XdmfH5BlobStorage``.
 
 The core package never imports adapters. The shell (recipe runners,
 CLIs) wires them in by constructing a :class:`Context`.
@@ -24,6 +26,7 @@ __all__ = [
     "MemoryFieldStore",
     "MemoryStorage",
     "MemoryBlobStore",
+    "DirectoryBlobStore",
     "H5FieldStore",
     "XdmfH5Storage",
     "XdmfH5BlobStorage",
@@ -36,6 +39,7 @@ _SYMBOL_MODULE = {
     "MemoryFieldStore": "cfdmod.adapters.memory",
     "MemoryStorage": "cfdmod.adapters.memory",
     "MemoryBlobStore": "cfdmod.adapters.memory",
+    "DirectoryBlobStore": "cfdmod.adapters.directory",
     "H5FieldStore": "cfdmod.adapters.xdmf_h5",
     "XdmfH5Storage": "cfdmod.adapters.xdmf_h5",
     "XdmfH5BlobStorage": "cfdmod.adapters.xdmf_h5",
@@ -0,0 +1,5 @@
+"""Local-directory backend for the :class:`BlobStore` protocol."""
+
+from cfdmod.adapters.directory.blob_store import DirectoryBlobStore
+
+__all__ = ["DirectoryBlobStore"]
@@ -0,0 +1,87 @@
+"""Directory-backed :class:`RangedBlobStore`.
+
+One file per blob under a root directory, the key being its ``/``-separated
+relative path. It stands in for an object store when testing
+:class:`~cfdmod.adapters.xdmf_h5.XdmfH5BlobStorage` end to end: ranged reads
+are real ``seek`` + ``read`` calls, so a test can count exactly what a lazy
+read fetches. It is also a usable backend in its own right for a shared
+filesystem that should be addressed by key rather than by path.
+"""
+
+from __future__ import annotations
+
+__all__ = ["DirectoryBlobStore"]
+
+import os
+import pathlib
+import tempfile
+from typing import Iterable
+
+
+class DirectoryBlobStore:
+    """:class:`~cfdmod.core.protocols.RangedBlobStore` over a local directory.
+
+    Args:
+        root: Directory holding the blobs. Created on first write.
+
+    Writes go to a temporary file in the target directory and are renamed
+    into place, so a reader never observes a half-written blob.
+    """
+
+    __slots__ = ("_root",)
+
+    def __init__(self, root: pathlib.Path | str) -> None:
+        self._root = pathlib.Path(root)
+
+    @property
+    def root(self) -> pathlib.Path:
+        return self._root
+
+    def get_bytes(self, key: str) -> bytes:
+        return self._existing(key).read_bytes()
+
+    def get_range(self, key: str, offset: int, length: int) -> bytes:
+        if offset < 0 or length < 0:
+            raise ValueError(f"invalid range offset={offset} length={length}")
+        with self._existing(key).open("rb") as fh:
+            fh.seek(offset)
+            return fh.read(length)
+
+    def size(self, key: str) -> int:
+        return self._existing(key).stat().st_size
+
+    def put_bytes(self, key: str, data: bytes) -> None:
+        path = self._path(key)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.", suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as fh:
+                fh.write(data)
+            os.replace(tmp, path)
+        except BaseException:
+            pathlib.Path(tmp).unlink(missing_ok=True)
+            raise
+
+    def list_keys(self) -> Iterable[str]:
+        if not self._root.exists():
+            return []
+        return sorted(
+            p.relative_to(self._root).as_posix()
+            for p in self._root.rglob("*")
+            if p.is_file() and not (p.name.startswith(".") and p.name.endswith(".tmp"))
+        )
+
+    def __contains__(self, key: str) -> bool:
+        return self._path(key).is_file()
+
+    def _path(self, key: str) -> pathlib.Path:
+        rel = pathlib.PurePosixPath(key)
+        if rel.is_absolute() or ".." in rel.parts or not rel.parts:
+            raise ValueError(f"blob key {key!r} must be a relative path inside the store")
+        return self._root.joinpath(*rel.parts)
+
+    def _existing(self, key: str) -> pathlib.Path:
+        path = self._path(key)
+        if not path.is_file():
+            raise KeyError(f"DirectoryBlobStore has no blob under key {key!r}")
+        return path
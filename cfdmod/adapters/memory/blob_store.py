@@ -14,7 +14,7 @@ from typing import Iterable
 
 
 class MemoryBlobStore:
-    """Dict-backed :class:`~cfdmod.core.protocols.BlobStore`."""
+    """Dict-backed :class:`~cfdmod.core.protocols.RangedBlobStore`."""
 
     __slots__ = ("_blobs",)
 
@@ -29,6 +29,12 @@ class MemoryBlobStore:
     def put_bytes(self, key: str, data: bytes) -> None:
         self._blobs[key] = bytes(data)
 
+    def get_range(self, key: str, offset: int, length: int) -> bytes:
+        return self.get_bytes(key)[offset : offset + length]
+
+    def size(self, key: str) -> int:
+        return len(self.get_bytes(key))
+
     def list_keys(self) -> Iterable[str]:
         return list(self._blobs.keys())
 
@@ -16,6 +16,7 @@ import numpy as np
 
 from cfdmod.core.data_source import DataSource
 from cfdmod.core.errors import StorageKeyError
+from cfdmod.core.protocols import OutputWriter
 
 
 class MemoryStorage:
@@ -59,6 +60,21 @@ class MemoryStorage:
     def write_data_source(self, key: str, ds: DataSource) -> None:
         self._items[key] = ds
 
+    def open_writer(self, key: str, template_ds: DataSource) -> OutputWriter:
+        """Collect a time-resolved output window by window; store it on commit.
+
+        RAM is the medium here, so the windows are simply held and joined
+        with :func:`~cfdmod.core.chunked.concat_time` at ``commit`` -- this
+        backend saves nothing over writing the result whole, but it lets a
+        test exercise the streaming path.
+        """
+        if template_ds.time.is_time_aggregated:
+            raise ValueError(
+                "open_writer streams time-resolved outputs; write a time-aggregated "
+                "data source with write_data_source"
+            )
+        return _MemoryOutputWriter(self, key, template_ds)
+
     # --- Freshness --------------------------------------------------------
 
     def digest(self, key: str, strategy: str = "size_mtime") -> str:
@@ -80,6 +96,47 @@ class MemoryStorage:
         self._signatures[key] = signature
 
 
+class _MemoryOutputWriter:
+    """:class:`OutputWriter` behind :meth:`MemoryStorage.open_writer`."""
+
+    __slots__ = ("_storage", "_key", "_template", "_parts", "_filled")
+
+    def __init__(self, storage: MemoryStorage, key: str, template: DataSource) -> None:
+        self._storage = storage
+        self._key = key
+        self._template = template
+        self._parts: list[DataSource] | None = []
+        self._filled = 0
+
+    def append(self, window: DataSource) -> None:
+        if self._parts is None:
+            raise ValueError(f"writer for {self._key!r} is already closed")
+        if self._filled + window.time.n_timesteps > self._template.time.n_timesteps:
+            raise ValueError(
+                f"window ending at timestep {self._filled + window.time.n_timesteps} "
+                f"overruns the output's {self._template.time.n_timesteps} timesteps"
+            )
+        self._parts.append(window)
+        self._filled += window.time.n_timesteps
+
+    def commit(self) -> None:
+        from cfdmod.core.chunked import concat_time
+
+        if self._parts is None:
+            raise ValueError(f"writer for {self._key!r} is already closed")
+        if self._filled != self._template.time.n_timesteps:
+            raise ValueError(
+                f"output {self._key!r} received {self._filled} of "
+                f"{self._template.time.n_timesteps} timesteps"
+            )
+        ds = concat_time(self._parts).with_time(self._template.time)
+        self._parts = None
+        self._storage.write_data_source(self._key, ds)
+
+    def abort(self) -> None:
+        self._parts = None
+
+
 # Rows of a field hashed at a time. Bounds the float64 upcast + tobytes copy
 # to roughly this many bytes instead of the whole field twice over.
 _HASH_BLOCK_BYTES = 8 << 20
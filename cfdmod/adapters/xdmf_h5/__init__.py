@@ -7,8 +7,19 @@ this is the property phase 2 round-trip tests assert on every
 fixture.
 """
 
+from cfdmod.adapters.xdmf_h5.blob_file import BlobFile
 from cfdmod.adapters.xdmf_h5.blob_storage import XdmfH5BlobStorage
 from cfdmod.adapters.xdmf_h5.field_store import H5FieldStore
+from cfdmod.adapters.xdmf_h5.handle_pool import H5HandlePool, handle_pool
+from cfdmod.adapters.xdmf_h5.memmap_store import MemmapFieldStore
 from cfdmod.adapters.xdmf_h5.storage import XdmfH5Storage
 
-__all__ = ["H5FieldStore", "XdmfH5Storage", "XdmfH5BlobStorage"]
+__all__ = [
+    "H5FieldStore",
+    "MemmapFieldStore",
+    "XdmfH5Storage",
+    "XdmfH5BlobStorage",
+    "BlobFile",
+    "H5HandlePool",
+    "handle_pool",
+]
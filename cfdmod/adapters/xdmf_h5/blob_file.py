@@ -0,0 +1,183 @@
+"""Read-only file-like view of a blob, for ``h5py.File`` to open in place.
+
+h5py can open any seekable binary file object (its ``fileobj`` driver).
+:class:`BlobFile` is one over a :class:`~cfdmod.core.protocols.RangedBlobStore`:
+every ``read`` becomes ``get_range`` calls, so opening an object-store h5
+costs the superblock and object headers, and reading a slab costs that slab
+-- not a download of the whole object.
+
+HDF5 issues many small reads (headers, B-tree nodes) close together. Each
+one a round trip would be slow against a real object store, so reads go
+through fixed-size aligned blocks held in a :class:`BlockCache`. The cache
+is shared by every :class:`BlobFile` over the same blob, which is what lets
+:class:`BlobH5Opener` reopen the file once per field read without fetching
+the metadata again.
+"""
+
+from __future__ import annotations
+
+__all__ = ["BlobFile", "BlobH5Opener", "BlockCache"]
+
+import contextlib
+import io
+import threading
+from collections import OrderedDict
+from typing import Iterator
+
+import h5py
+
+from cfdmod.core.protocols import RangedBlobStore
+
+DEFAULT_BLOCK_SIZE = 1 << 20
+"""Bytes fetched per ranged request. Object stores favour few large requests."""
+
+DEFAULT_MAX_BLOCKS = 64
+"""Blocks kept per blob; the cache is bounded at ``block_size * max_blocks``."""
+
+
+class BlockCache:
+    """LRU cache of aligned blocks of one blob.
+
+    Args:
+        blobs: The ranged blob backend.
+        key: Blob key.
+        block_size: Bytes per block (and per ``get_range`` request).
+        max_blocks: Most blocks kept; least recently used are dropped.
+    """
+
+    __slots__ = ("_blobs", "_key", "_block_size", "_max_blocks", "_blocks", "_lock", "_size")
+
+    def __init__(
+        self,
+        blobs: RangedBlobStore,
+        key: str,
+        *,
+        block_size: int = DEFAULT_BLOCK_SIZE,
+        max_blocks: int = DEFAULT_MAX_BLOCKS,
+    ) -> None:
+        if block_size < 1 or max_blocks < 1:
+            raise ValueError(
+                f"block_size and max_blocks must be positive; got {block_size}, {max_blocks}"
+            )
+        self._blobs = blobs
+        self._key = key
+        self._block_size = int(block_size)
+        self._max_blocks = int(max_blocks)
+        self._blocks: OrderedDict[int, bytes] = OrderedDict()
+        self._lock = threading.Lock()
+        self._size: int | None = None
+
+    def __getstate__(self):
+        # Ship the configuration, not the cached bytes or the lock.
+        return (self._blobs, self._key, self._block_size, self._max_blocks)
+
+    def __setstate__(self, state) -> None:
+        blobs, key, block_size, max_blocks = state
+        self.__init__(blobs, key, block_size=block_size, max_blocks=max_blocks)
+
+    @property
+    def key(self) -> str:
+        return self._key
+
+    @property
+    def size(self) -> int:
+        if self._size is None:
+            self._size = int(self._blobs.size(self._key))
+        return self._size
+
+    def read(self, offset: int, length: int) -> bytes:
+        """Bytes ``[offset, offset + length)``, clipped to the blob's end."""
+        end = min(offset + length, self.size)
+        if offset >= end:
+            return b""
+        first, last = offset // self._block_size, (end - 1) // self._block_size
+        parts = []
+        for index in range(first, last + 1):
+            block = self._block(index)
+            lo = max(offset - index * self._block_size, 0)
+            hi = min(end - index * self._block_size, len(block))
+            parts.append(block[lo:hi])
+        return b"".join(parts)
+
+    def _block(self, index: int) -> bytes:
+        with self._lock:
+            block = self._blocks.get(index)
+            if block is not None:
+                self._blocks.move_to_end(index)
+                return block
+        block = self._blobs.get_range(self._key, index * self._block_size, self._block_size)
+        with self._lock:
+            self._blocks[index] = block
+            self._blocks.move_to_end(index)
+            while len(self._blocks) > self._max_blocks:
+                self._blocks.popitem(last=False)
+        return block
+
+
+class BlobFile(io.RawIOBase):
+    """Seekable, read-only binary file over a :class:`BlockCache`."""
+
+    def __init__(self, cache: BlockCache) -> None:
+        super().__init__()
+        self._cache = cache
+        self._pos = 0
+
+    def readable(self) -> bool:
+        return True
+
+    def seekable(self) -> bool:
+        return True
+
+    def tell(self) -> int:
+        return self._pos
+
+    def seek(self, offset: int, whence: int = io.SEEK_SET) -> int:
+        if whence == io.SEEK_SET:
+            pos = offset
+        elif whence == io.SEEK_CUR:
+            pos = self._pos + offset
+        elif whence == io.SEEK_END:
+            pos = self._cache.size + offset
+        else:
+            raise ValueError(f"invalid whence {whence}")
+        if pos < 0:
+            raise ValueError(f"negative seek position {pos}")
+        self._pos = pos
+        return pos
+
+    def readinto(self, buffer) -> int:
+        view = memoryview(buffer).cast("B")
+        data = self._cache.read(self._pos, len(view))
+        view[: len(data)] = data
+        self._pos += len(data)
+        return len(data)
+
+
+class BlobH5Opener:
+    """Opens an h5 blob read-only through a shared :class:`BlockCache`.
+
+    Passed to :class:`~cfdmod.adapters.xdmf_h5.H5FieldStore` as its
+    ``opener``: each call yields a fresh ``h5py.File`` over the blob, and
+    the cache keeps the reopen from refetching what earlier reads pulled.
+    Picklable when the blob store is; a worker starts with an empty cache.
+    """
+
+    __slots__ = ("_cache",)
+
+    def __init__(self, cache: BlockCache) -> None:
+        self._cache = cache
+
+    def __getstate__(self):
+        return self._cache
+
+    def __setstate__(self, state) -> None:
+        self._cache = state
+
+    @property
+    def cache(self) -> BlockCache:
+        return self._cache
+
+    @contextlib.contextmanager
+    def __call__(self) -> Iterator[h5py.File]:
+        with h5py.File(BlobFile(self._cache), "r") as f:
+            yield f
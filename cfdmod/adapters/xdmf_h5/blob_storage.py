@@ -7,13 +7,26 @@ instead of a local directory. A consumer supplies a thin ``BlobStore``
 over their object store (S3, GCS, a DB blob column); cfdmod stays free of
 any cloud SDK.
 
-The implementation bridges through a temporary directory and reuses the
-existing :class:`XdmfH5Storage` byte layout verbatim -- so the on-disk /
-in-object format is identical, and ``run_template`` runs against object
-storage with no other change. On read, all fields are materialised into
-an in-RAM :class:`MemoryFieldStore` (the temp file does not outlive the
-call), which is the right trade-off for an object-store round-trip; a
-pure streaming path can be added later without changing this seam.
+Writes bridge through a temporary directory and reuse the existing
+:class:`XdmfH5Storage` byte layout verbatim -- so the on-disk / in-object
+format is identical, and ``run_template`` runs against object storage with
+no other change. ``open_writer`` streams into the same temporary file and
+uploads it on commit.
+
+Reads depend on what the backend offers:
+
+- A :class:`~cfdmod.core.protocols.RangedBlobStore` (one that can serve a
+  byte range) is read *in place*: h5py opens the blob through a file-like
+  adapter (:mod:`cfdmod.adapters.xdmf_h5.blob_file`) and the returned
+  :class:`DataSource` stays lazy, fetching only the slabs each window
+  reads.
+- A plain :class:`BlobStore` is downloaded whole to a temporary file and
+  every field is materialised into an in-RAM :class:`MemoryFieldStore`
+  (the temp file does not outlive the call). Peak memory is then a few
+  times the file.
+
+A lazy source reads the blob as it is when each slab is fetched; do not
+overwrite a key while a data source read from it is still in use.
 """
 
 from __future__ import annotations
@@ -25,10 +38,11 @@ import tempfile
 from typing import Iterable
 
 from cfdmod.adapters.memory import MemoryFieldStore
-from cfdmod.adapters.xdmf_h5.storage import XdmfH5Storage
+from cfdmod.adapters.xdmf_h5.blob_file import DEFAULT_BLOCK_SIZE, BlobH5Opener, BlockCache
+from cfdmod.adapters.xdmf_h5.storage import XdmfH5Storage, read_h5_data_source
 from cfdmod.core.data_source import DataSource
 from cfdmod.core.errors import StorageKeyError
-from cfdmod.core.protocols import BlobStore
+from cfdmod.core.protocols import BlobStore, OutputWriter, RangedBlobStore
 
 
 class XdmfH5BlobStorage:
@@ -39,13 +53,24 @@ class XdmfH5BlobStorage:
             written, ``"<key>.xdmf"``.
         write_xdmf: When True, ``write_data_source`` also stores the
             ``.xdmf`` sidecar blob. Default True.
+        block_size: Bytes per ranged request when reading a
+            :class:`RangedBlobStore` in place.
     """
 
-    __slots__ = ("_blobs", "_write_xdmf")
-
-    def __init__(self, blobs: BlobStore, *, write_xdmf: bool = True) -> None:
+    __slots__ = ("_blobs", "_write_xdmf", "_block_size")
+
+    def __init__(
+        self,
+        blobs: BlobStore,
+        *,
+        write_xdmf: bool = True,
+        block_size: int = DEFAULT_BLOCK_SIZE,
+    ) -> None:
+        if block_size < 1:
+            raise ValueError(f"block_size must be positive; got {block_size}")
         self._blobs = blobs
         self._write_xdmf = bool(write_xdmf)
+        self._block_size = int(block_size)
 
     def __contains__(self, key: str) -> bool:
         return f"{key}.h5" in self._blobs
@@ -55,6 +80,17 @@ class XdmfH5BlobStorage:
 
     def read_data_source(self, key: str, *, kind: str | None = None) -> DataSource:
         blob_key = f"{key}.h5"
+        if isinstance(self._blobs, RangedBlobStore):
+            if blob_key not in self._blobs:
+                raise StorageKeyError(
+                    f"XdmfH5BlobStorage has no data source under key {key!r} (blob {blob_key!r})"
+                )
+            opener = BlobH5Opener(BlockCache(self._blobs, blob_key, block_size=self._block_size))
+            with opener() as f:
+                return read_h5_data_source(
+                    f, key=key, h5_path=pathlib.Path(blob_key), kind=kind, opener=opener
+                )
+
         try:
             data = self._blobs.get_bytes(blob_key)
         except KeyError as exc:
@@ -77,10 +113,28 @@ class XdmfH5BlobStorage:
         with tempfile.TemporaryDirectory() as td:
             root = pathlib.Path(td)
             XdmfH5Storage(root, write_xdmf=self._write_xdmf).write_data_source(key, ds)
-            for suffix in (".h5", ".xdmf"):
-                produced = root / f"{key}{suffix}"
-                if produced.exists():
-                    self._blobs.put_bytes(f"{key}{suffix}", produced.read_bytes())
+            self._upload(root, key)
+
+    def open_writer(self, key: str, template_ds: DataSource) -> OutputWriter:
+        """Stream a time-resolved output into a local temp file; upload it on commit.
+
+        Windows go to disk as they arrive, so the output is never held in
+        RAM. The blobs appear only once the whole file is written.
+        """
+        td = tempfile.TemporaryDirectory()
+        try:
+            root = pathlib.Path(td.name)
+            inner = XdmfH5Storage(root, write_xdmf=self._write_xdmf).open_writer(key, template_ds)
+        except BaseException:
+            td.cleanup()
+            raise
+        return _BlobOutputWriter(self, key, td, inner)
+
+    def _upload(self, root: pathlib.Path, key: str) -> None:
+        for suffix in (".h5", ".xdmf"):
+            produced = root / f"{key}{suffix}"
+            if produced.exists():
+                self._blobs.put_bytes(f"{key}{suffix}", produced.read_bytes())
 
     # --- Freshness --------------------------------------------------------
 
@@ -117,3 +171,35 @@ class XdmfH5BlobStorage:
 
     def write_signature(self, key: str, signature: str) -> None:
         self._blobs.put_bytes(f"{key}.sig", signature.encode("utf-8"))
+
+
+class _BlobOutputWriter:
+    """:class:`OutputWriter` behind :meth:`XdmfH5BlobStorage.open_writer`."""
+
+    __slots__ = ("_storage", "_key", "_tmpdir", "_inner")
+
+    def __init__(
+        self,
+        storage: XdmfH5BlobStorage,
+        key: str,
+        tmpdir: tempfile.TemporaryDirectory,
+        inner: OutputWriter,
+    ) -> None:
+        self._storage = storage
+        self._key = key
+        self._tmpdir = tmpdir
+        self._inner = inner
+
+    def append(self, window: DataSource) -> None:
+        self._inner.append(window)
+
+    def commit(self) -> None:
+        self._inner.commit()
+        self._storage._upload(pathlib.Path(self._tmpdir.name), self._key)
+        self._tmpdir.cleanup()
+
+    def abort(self) -> None:
+        try:
+            self._inner.abort()
+        finally:
+            self._tmpdir.cleanup()
@@ -6,14 +6,20 @@ one h5 group whose children are the per-timestep datasets.
 
 The store keeps the file *closed* between calls. Each :meth:`read`
 opens the file in ``r`` mode and slices the requested slab, so multi-
-process reads work without locking dance. For very hot loops, an
-explicit ``with field_store.open() as ...`` could be added later (not
-needed for the Phase 1/2 round-trip targets).
+process reads work without locking dance. For hot loops (a chunked run
+reads every field once per window), activate the handle pool -- see
+:mod:`cfdmod.adapters.xdmf_h5.handle_pool` and
+:meth:`XdmfH5Storage.session` -- and reads borrow a cached handle instead.
 
 Time-aggregated fields are accommodated by representing them as a
 single dataset at ``/{group}/{stat_name}`` (no ``t{T}`` indirection).
 The :class:`XdmfH5Storage` decides which mode applies based on the
 :class:`DataSource`'s :class:`TimeAxis`.
+
+Time-resolved fields may instead use the *columnar* layout: one chunked
+``(n_elements, n_timesteps)`` dataset at ``/{group}``. A read is then a
+single hyperslab selection rather than one dataset open per timestep,
+which is what makes a narrow element subset over a long record cheap.
 """
 
 from __future__ import annotations
@@ -21,12 +27,23 @@ from __future__ import annotations
 __all__ = ["H5FieldStore"]
 
 import pathlib
-from typing import Iterable
+from typing import Callable, ContextManager, Iterable, Literal
 
 import h5py
 import numpy as np
 
 from cfdmod.adapters.memory.field_store import MemoryFieldStore
+from cfdmod.adapters.xdmf_h5.handle_pool import open_for_read
+from cfdmod.io.h5_select import RowSelection, read_rows
+
+H5Layout = Literal["per_step", "columnar"]
+"""On-disk layout of time-resolved fields.
+
+- ``per_step``: one 1-D dataset per timestep under ``/{group}/t{T}`` (the
+  v2 layout every existing file uses).
+- ``columnar``: one chunked 2-D ``(n_elements, n_timesteps)`` dataset at
+  ``/{group}``, with the ``t{T}`` names in ``/meta/time_keys``.
+"""
 
 
 class H5FieldStore:
@@ -49,6 +66,14 @@ class H5FieldStore:
         time_aggregated: When True, every field group is a *single
             dataset path* rather than a t-keyed group. Used for
             stats files.
+        layout: How time-resolved fields are stored; see
+            :data:`H5Layout`. Ignored when ``time_aggregated``.
+        opener: Zero-argument callable returning a context manager that
+            yields the open ``h5py.File``. ``None`` opens ``h5_path``
+            through the handle pool. An object-store backend passes one
+            over a file-like blob reader (see
+            :class:`~cfdmod.adapters.xdmf_h5.blob_file.BlobH5Opener`), in
+            which case ``h5_path`` only labels the source.
     """
 
     __slots__ = (
@@ -57,7 +82,9 @@ class H5FieldStore:
         "_time_keys",
         "_n_elements",
         "_time_aggregated",
+        "_layout",
         "_overlay",
+        "_opener",
     )
 
     def __init__(
@@ -68,13 +95,19 @@ class H5FieldStore:
         time_keys: list[str],
         n_elements: int,
         time_aggregated: bool = False,
+        layout: H5Layout = "per_step",
         overlay: MemoryFieldStore | None = None,
+        opener: Callable[[], ContextManager[h5py.File]] | None = None,
     ) -> None:
         self._h5_path = pathlib.Path(h5_path)
+        self._opener = opener
         self._field_groups = dict(field_groups)
         self._time_keys = list(time_keys)
         self._n_elements = int(n_elements)
         self._time_aggregated = bool(time_aggregated)
+        if layout not in ("per_step", "columnar"):
+            raise ValueError(f"unknown h5 layout {layout!r}; expected 'per_step' or 'columnar'")
+        self._layout = layout
         # Functional updates land in the overlay rather than mutating the file.
         self._overlay = overlay if overlay is not None else MemoryFieldStore()
 
@@ -93,7 +126,7 @@ class H5FieldStore:
         if self._time_aggregated:
             # Read the real on-disk shape rather than assuming (n_elements,);
             # a stat may be broadcast differently and we must not mask that.
-            with h5py.File(self._h5_path, "r") as f:
+            with self._open() as f:
                 return tuple(f[self._field_groups[name]].shape)
         return (self._n_elements, len(self._time_keys))
 
@@ -103,8 +136,8 @@ class H5FieldStore:
         if name not in self._field_groups:
             raise KeyError(f"H5FieldStore has no field {name!r}")
         group_path = self._field_groups[name]
-        with h5py.File(self._h5_path, "r") as f:
-            if self._time_aggregated:
+        with self._open() as f:
+            if self._time_aggregated or self._layout == "columnar":
                 return f[group_path].dtype
             # Timeseries: field_groups[name] is a t-keyed group; read one slab.
             if not self._time_keys:
@@ -134,30 +167,53 @@ class H5FieldStore:
             raise ValueError("Pass either element_slice or elements, not both")
 
         group_path = self._field_groups[name]
-        with h5py.File(self._h5_path, "r") as f:
+        with self._open() as f:
             if self._time_aggregated:
-                arr = f[group_path][:]
+                dset = f[group_path]
+                if elements is not None and dset.ndim in (1, 2):
+                    return read_rows(dset, RowSelection(elements, dset.shape[0]))
                 if elements is not None:
-                    return np.asarray(arr[elements])
+                    return np.asarray(dset[()][elements])
                 if element_slice is not None:
-                    return np.asarray(arr[element_slice])
-                return np.asarray(arr)
+                    return _read_element_slice(dset, element_slice)
+                return np.asarray(dset[()])
+
+            if self._layout == "columnar":
+                return _read_columnar(
+                    f[group_path],
+                    time_slice=time_slice,
+                    element_slice=element_slice,
+                    elements=elements,
+                )
 
             grp = f[group_path]
             keys = self._time_keys if time_slice is None else self._time_keys[time_slice]
+            selection = None
+            if elements is not None:
+                selection = RowSelection(elements, self._n_elements)
+                n_rows = len(selection)
+            elif element_slice is not None:
+                n_rows = len(range(self._n_elements)[element_slice])
+            else:
+                n_rows = self._n_elements
             if not keys:
-                return np.empty((self._n_elements, 0), dtype=np.float64)
+                return np.empty((n_rows, 0), dtype=np.float64)
 
-            # Read each timestep slab; column-stack into (n_elements, T).
-            cols: list[np.ndarray] = []
-            for k in keys:
-                col = grp[k][:]
-                if elements is not None:
-                    col = col[elements]
+            # Read each timestep slab straight into its column of the output;
+            # the element selection is pushed down to h5py so a narrow subset
+            # never materialises the full column.
+            out: np.ndarray | None = None
+            for j, k in enumerate(keys):
+                if selection is not None:
+                    col = read_rows(grp[k], selection)
                 elif element_slice is not None:
-                    col = col[element_slice]
-                cols.append(col)
-            return np.stack(cols, axis=1)
+                    col = _read_element_slice(grp[k], element_slice)
+                else:
+                    col = grp[k][()]
+                if out is None:
+                    out = np.empty((col.shape[0], len(keys)), dtype=col.dtype)
+                out[:, j] = col
+            return out
 
     # --- Write -------------------------------------------------------------
 
@@ -187,9 +243,16 @@ class H5FieldStore:
             time_keys=self._time_keys,
             n_elements=self._n_elements,
             time_aggregated=self._time_aggregated,
+            layout=self._layout,
             overlay=new_overlay,
+            opener=self._opener,
         )
 
+    def _open(self) -> ContextManager[h5py.File]:
+        if self._opener is not None:
+            return self._opener()
+        return open_for_read(self._h5_path)
+
     # --- Adapter-internal accessors used by XdmfH5Storage on writeback ----
 
     @property
@@ -204,6 +267,71 @@ class H5FieldStore:
     def time_keys(self) -> list[str]:
         return list(self._time_keys)
 
+    @property
+    def time_aggregated(self) -> bool:
+        return self._time_aggregated
+
+    @property
+    def layout(self) -> H5Layout:
+        return self._layout
+
     @property
     def overlay(self) -> MemoryFieldStore:
         return self._overlay
+
+    @property
+    def opener(self) -> Callable[[], ContextManager[h5py.File]] | None:
+        return self._opener
+
+
+def _read_columnar(
+    dset: h5py.Dataset,
+    *,
+    time_slice: slice | None,
+    element_slice: slice | None,
+    elements: np.ndarray | None,
+) -> np.ndarray:
+    """Read a slab of a columnar ``(n_elements, n_timesteps)`` dataset.
+
+    Both axes are pushed down to one h5py selection. h5py only accepts
+    forward slices, so a reversed slice is read forward then flipped; a
+    fancy ``elements`` index goes through :func:`read_rows`, which coalesces
+    it into contiguous runs and restores the caller's order in RAM.
+    """
+    n_elements, n_timesteps = dset.shape
+    t_sel, t_flip = _forward_slice(time_slice, n_timesteps)
+    if elements is not None:
+        arr = read_rows(dset, RowSelection(elements, n_elements), t_sel)
+    else:
+        e_sel, e_flip = _forward_slice(element_slice, n_elements)
+        arr = dset[e_sel, t_sel]
+        if e_flip is not None:
+            arr = arr[e_flip]
+    if t_flip is not None:
+        arr = arr[:, t_flip]
+    return np.asarray(arr)
+
+
+def _read_element_slice(dset: h5py.Dataset, element_slice: slice) -> np.ndarray:
+    """Read ``dset[element_slice]`` with the slice pushed down to h5py."""
+    sel, flip = _forward_slice(element_slice, dset.shape[0])
+    arr = dset[sel]
+    return np.asarray(arr if flip is None else arr[flip])
+
+
+def _forward_slice(sl: slice | None, n: int) -> tuple[slice, slice | None]:
+    """Split ``sl`` into a forward slice h5py accepts plus an in-RAM fix-up.
+
+    Returns ``(forward, flip)``: read ``forward`` from the dataset, then apply
+    ``flip`` (``None`` when nothing is needed). Only a negative step needs one.
+    """
+    if sl is None:
+        return slice(0, n), None
+    r = range(n)[sl]
+    if not len(r):
+        return slice(0, 0), None
+    if r.step > 0:
+        return slice(r.start, r.stop, r.step), None
+    # Reverse the range: the same elements, ascending, then flip back in RAM.
+    lo = r[-1]
+    return slice(lo, r[0] + 1, -r.step), slice(None, None, -1)
@@ -0,0 +1,252 @@
+"""Process-wide pool of read-only ``h5py.File`` handles.
+
+:class:`H5FieldStore` keeps its file closed between calls: every
+``read`` / ``shape`` / ``dtype`` opens the file, does its work and closes
+it again. That is the right default -- no handle outlives the call, so
+nothing goes stale when a file is rewritten and multi-process reads need
+no coordination -- but a chunked run calls ``read`` once per field per
+window, and on a network filesystem ``H5Fopen`` then costs more than the
+numpy work it feeds.
+
+The pool is the opt-in alternative. While it is active, reads borrow a
+cached read-only handle keyed by resolved path instead of opening one:
+
+- **Bounded.** At most ``max_open`` handles stay open; the least recently
+  used idle one is closed to make room. A handle that is mid-read is never
+  closed from under its reader, so the cap can be exceeded briefly when
+  more files than that are being read at once.
+- **Fork-safe.** HDF5 handles must not be used across ``fork``. The pool
+  remembers the pid that opened each handle, and a forked
+  ``multiprocessing`` worker discards the inherited ones (without closing
+  them -- they belong to the parent) and reopens on first use. The child
+  also gets a fresh pool lock, since a parent thread may have held it
+  mid-read at the moment of the fork.
+- **Write-aware.** :class:`XdmfH5Storage` evicts a path before writing to
+  it, so a cached read handle can neither serve stale bytes nor block the
+  writer's open.
+
+Turn it on around a read-heavy phase with :meth:`XdmfH5Storage.session`
+or :func:`handle_pool`; with no pool active, :func:`open_for_read` is a
+plain ``h5py.File(path, "r")``.
+"""
+
+from __future__ import annotations
+
+__all__ = [
+    "H5HandlePool",
+    "DEFAULT_MAX_OPEN",
+    "active_pool",
+    "evict",
+    "handle_pool",
+    "open_for_read",
+]
+
+import contextlib
+import os
+import pathlib
+import threading
+import weakref
+from collections import OrderedDict
+from typing import Iterator
+
+import h5py
+
+DEFAULT_MAX_OPEN = 64
+"""Default cap on simultaneously open pooled handles.
+
+Well under typical per-process file-descriptor limits, and far more files
+than a template reads at once.
+"""
+
+
+class H5HandlePool:
+    """LRU cache of read-only ``h5py.File`` handles keyed by resolved path.
+
+    Args:
+        max_open: Most idle handles kept open at once. Must be positive.
+    """
+
+    __slots__ = ("__weakref__", "_handles", "_leases", "_lock", "_max_open", "_pid")
+
+    def __init__(self, max_open: int = DEFAULT_MAX_OPEN) -> None:
+        if max_open < 1:
+            raise ValueError(f"max_open must be positive; got {max_open}")
+        self._max_open = int(max_open)
+        self._handles: OrderedDict[str, h5py.File] = OrderedDict()
+        self._leases: dict[str, int] = {}
+        self._lock = threading.RLock()
+        self._pid = os.getpid()
+        _POOLS.add(self)
+
+    @property
+    def max_open(self) -> int:
+        return self._max_open
+
+    def __len__(self) -> int:
+        with self._lock:
+            self._check_fork()
+            return len(self._handles)
+
+    def __contains__(self, path: object) -> bool:
+        with self._lock:
+            self._check_fork()
+            return _pool_key(path) in self._handles
+
+    @contextlib.contextmanager
+    def lease(self, path: pathlib.Path | str) -> Iterator[h5py.File]:
+        """Borrow the cached handle for ``path``, opening it on first use.
+
+        The handle stays open after the ``with`` block; it is closed only
+        when evicted or when the pool closes.
+        """
+        key = _pool_key(path)
+        with self._lock:
+            self._check_fork()
+            f = self._handles.get(key)
+            if f is None or not f.id.valid:
+                f = h5py.File(key, "r")
+                self._handles[key] = f
+            self._handles.move_to_end(key)
+            self._leases[key] = self._leases.get(key, 0) + 1
+            self._trim()
+        try:
+            yield f
+        finally:
+            with self._lock:
+                if os.getpid() == self._pid:
+                    remaining = self._leases.get(key, 0) - 1
+                    if remaining > 0:
+                        self._leases[key] = remaining
+                    else:
+                        self._leases.pop(key, None)
+                    self._trim()
+
+    def evict(self, path: pathlib.Path | str) -> None:
+        """Close and forget the handle for ``path``, if one is cached.
+
+        Call before writing to ``path``: HDF5 refuses to reopen a file for
+        writing while a read-only handle to it is open in the same process.
+        """
+        key = _pool_key(path)
+        with self._lock:
+            self._check_fork()
+            f = self._handles.pop(key, None)
+            self._leases.pop(key, None)
+        if f is not None and f.id.valid:
+            f.close()
+
+    def close(self) -> None:
+        """Close every cached handle. The pool stays usable afterwards."""
+        with self._lock:
+            self._check_fork()
+            handles = list(self._handles.values())
+            self._handles.clear()
+            self._leases.clear()
+        for f in handles:
+            if f.id.valid:
+                f.close()
+
+    def _trim(self) -> None:
+        """Close least recently used idle handles down to ``max_open``."""
+        excess = len(self._handles) - self._max_open
+        if excess <= 0:
+            return
+        for key in list(self._handles):
+            if excess <= 0:
+                break
+            if self._leases.get(key):
+                continue
+            f = self._handles.pop(key)
+            if f.id.valid:
+                f.close()
+            excess -= 1
+
+    def _check_fork(self) -> None:
+        """Drop handles inherited across a ``fork`` without touching them."""
+        pid = os.getpid()
+        if pid != self._pid:
+            self._handles = OrderedDict()
+            self._leases = {}
+            self._pid = pid
+
+
+# Every live pool, so the after-fork hook can reach pools held outside ``_ACTIVE``.
+_POOLS: weakref.WeakSet[H5HandlePool] = weakref.WeakSet()
+
+
+def _pool_key(path: object) -> str:
+    return str(pathlib.Path(path).resolve())
+
+
+# The process-wide pool, when one is active. Reads consult it through
+# ``open_for_read``; ``None`` means every read opens and closes its own handle.
+_ACTIVE: H5HandlePool | None = None
+_ACTIVE_LOCK = threading.Lock()
+_ACTIVE_DEPTH = 0
+
+
+def active_pool() -> H5HandlePool | None:
+    """The process-wide pool, or ``None`` when pooling is off."""
+    return _ACTIVE
+
+
+@contextlib.contextmanager
+def handle_pool(max_open: int = DEFAULT_MAX_OPEN) -> Iterator[H5HandlePool]:
+    """Activate the process-wide handle pool for the duration of the block.
+
+    Nests: an inner block reuses the outer pool (and its cap), and only the
+    outermost exit closes the handles.
+    """
+    global _ACTIVE, _ACTIVE_DEPTH
+    with _ACTIVE_LOCK:
+        if _ACTIVE is None:
+            _ACTIVE = H5HandlePool(max_open)
+        _ACTIVE_DEPTH += 1
+        pool = _ACTIVE
+    try:
+        yield pool
+    finally:
+        with _ACTIVE_LOCK:
+            _ACTIVE_DEPTH -= 1
+            if _ACTIVE_DEPTH == 0:
+                _ACTIVE = None
+            else:
+                pool = None
+        if pool is not None:
+            pool.close()
+
+
+@contextlib.contextmanager
+def open_for_read(path: pathlib.Path | str) -> Iterator[h5py.File]:
+    """Open ``path`` read-only: a pooled handle when a pool is active, else a fresh one."""
+    pool = _ACTIVE
+    if pool is None:
+        with h5py.File(path, "r") as f:
+            yield f
+        return
+    with pool.lease(path) as f:
+        yield f
+
+
+def evict(path: pathlib.Path | str) -> None:
+    """Evict ``path`` from the active pool, if any. A no-op when pooling is off."""
+    pool = _ACTIVE
+    if pool is not None:
+        pool.evict(path)
+
+
+def _reset_after_fork() -> None:
+    # A forked child inherits the parent's pool objects; the handles in them
+    # are the parent's. Forget them here so the child's first read reopens.
+    # Only the forking thread survives, so a lock another parent thread held
+    # at fork time (a prefetch or reader thread mid-lease) would never be
+    # released: replace the locks before anything can wait on them.
+    global _ACTIVE_LOCK
+    _ACTIVE_LOCK = threading.Lock()
+    for pool in list(_POOLS):
+        pool._lock = threading.RLock()
+        pool._check_fork()
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reset_after_fork)
@@ -0,0 +1,218 @@
+"""Memory-mapped, zero-copy :class:`FieldStore` over an h5 file.
+
+:class:`H5FieldStore` answers every read with a fresh array: HDF5 copies
+the bytes out of the file into process memory. When a fan-out runs N
+worker processes over the same body, that is N private copies of the same
+pressure record.
+
+An HDF5 dataset stored *contiguously* (unchunked, hence unfiltered) keeps
+its raw bytes at a single offset in the file. :class:`MemmapFieldStore`
+asks HDF5 for that offset once (``dataset.id.get_offset()``) and from
+then on serves the field as a read-only numpy view of one ``np.memmap`` of
+the whole file -- no HDF5 call, no copy, and pages that every process
+mapping the file shares through the OS page cache.
+
+What maps:
+
+- *Time-aggregated* datasets and *columnar* datasets written with
+  ``chunks="contiguous"``: a 2-D (or 1-D) view at the dataset's offset.
+- *Per-step* fields: each ``t{T}`` dataset is contiguous. When their
+  offsets are evenly spaced (HDF5 writes them back to back, so a field
+  written in one go is), the whole field is a single strided
+  ``(n_elements, n_timesteps)`` view; otherwise each timestep is its own
+  view and a read gathers columns without going through HDF5.
+
+Anything else -- chunked or compressed datasets, compact or external
+storage, fields in the overlay -- falls back to the wrapped
+:class:`H5FieldStore`, so wrapping is always safe.
+
+Views are read-only; a caller that wants to modify what it read must copy.
+A ``time_slice`` / ``element_slice`` read of a mapped field is a view too;
+a fancy ``elements`` read copies just the selected rows.
+"""
+
+from __future__ import annotations
+
+__all__ = ["MemmapFieldStore"]
+
+import threading
+from typing import Iterable
+
+import h5py
+import numpy as np
+
+from cfdmod.adapters.xdmf_h5.field_store import H5FieldStore
+from cfdmod.adapters.xdmf_h5.handle_pool import open_for_read
+
+
+class MemmapFieldStore:
+    """:class:`H5FieldStore` whose contiguous datasets are read through a memory map.
+
+    Args:
+        base: The h5 store to serve. Shape, dtype, keys, writes and every
+            read that cannot be mapped go through it unchanged.
+
+    The map and the per-field views are built lazily on the first read of
+    a field. Pickling sends only ``base``, so a spawned worker maps the
+    file itself rather than receiving a copy of the data.
+    """
+
+    __slots__ = ("_base", "_map", "_views", "_lock")
+
+    def __init__(self, base: H5FieldStore) -> None:
+        self._base = base
+        self._map: np.memmap | None = None
+        # name -> 2-D/1-D view, list of per-timestep views, or None (not mappable).
+        self._views: dict[str, np.ndarray | list[np.ndarray] | None] = {}
+        self._lock = threading.Lock()
+
+    def __reduce__(self):
+        return (MemmapFieldStore, (self._base,))
+
+    # --- Inspection --------------------------------------------------------
+
+    def keys(self) -> Iterable[str]:
+        return self._base.keys()
+
+    def shape(self, name: str) -> tuple[int, ...]:
+        return self._base.shape(name)
+
+    def dtype(self, name: str):
+        return self._base.dtype(name)
+
+    def is_mapped(self, name: str) -> bool:
+        """Whether reads of ``name`` are served from the memory map."""
+        return self._view(name) is not None
+
+    # --- Read --------------------------------------------------------------
+
+    def read(
+        self,
+        name: str,
+        *,
+        time_slice: slice | None = None,
+        element_slice: slice | None = None,
+        elements: np.ndarray | None = None,
+    ) -> np.ndarray:
+        view = self._view(name)
+        if view is None:
+            return self._base.read(
+                name, time_slice=time_slice, element_slice=element_slice, elements=elements
+            )
+        if element_slice is not None and elements is not None:
+            raise ValueError("Pass either element_slice or elements, not both")
+
+        if isinstance(view, list):
+            cols = view if time_slice is None else view[time_slice]
+            rows = elements if elements is not None else element_slice
+            if not cols:
+                n_rows = view[0].shape[0] if rows is None else view[0][rows].shape[0]
+                return np.empty((n_rows, 0), dtype=view[0].dtype)
+            if rows is None:
+                return np.stack(cols, axis=1)
+            return np.stack([c[rows] for c in cols], axis=1)
+
+        arr = view
+        if elements is not None:
+            arr = arr[elements]
+        elif element_slice is not None:
+            arr = arr[element_slice]
+        if time_slice is not None and arr.ndim == 2:
+            arr = arr[:, time_slice]
+        return np.asarray(arr)
+
+    # --- Write -------------------------------------------------------------
+
+    def write(
+        self,
+        name: str,
+        value: np.ndarray,
+        *,
+        time_slice: slice | None = None,
+        element_slice: slice | None = None,
+    ) -> None:
+        self._base.write(name, value, time_slice=time_slice, element_slice=element_slice)
+        # The field now lives (at least partly) in the overlay.
+        self._views.pop(name, None)
+
+    def with_field(self, name: str, value: np.ndarray) -> "MemmapFieldStore":
+        new = MemmapFieldStore(self._base.with_field(name, value))
+        # Same file, same map: share it rather than mapping again.
+        new._map = self._map
+        new._views = {k: v for k, v in self._views.items() if k != name}
+        return new
+
+    # --- Adapter-internal accessors ----------------------------------------
+
+    @property
+    def base(self) -> H5FieldStore:
+        return self._base
+
+    @property
+    def h5_path(self):
+        return self._base.h5_path
+
+    # --- Mapping -----------------------------------------------------------
+
+    def _view(self, name: str) -> np.ndarray | list[np.ndarray] | None:
+        if name in self._base.overlay.keys():
+            return None
+        if name in self._views:
+            return self._views[name]
+        if name not in self._base.field_groups:
+            raise KeyError(f"MemmapFieldStore has no field {name!r}")
+        with self._lock:
+            if name not in self._views:
+                self._views[name] = self._resolve(name)
+        return self._views[name]
+
+    def _resolve(self, name: str) -> np.ndarray | list[np.ndarray] | None:
+        """Build the view for ``name``, or ``None`` when it cannot be mapped."""
+        base = self._base
+        group_path = base.field_groups[name]
+        with open_for_read(base.h5_path) as f:
+            if base.time_aggregated or base.layout == "columnar":
+                offset = _mappable_offset(f[group_path])
+                if offset is None:
+                    return None
+                dset = f[group_path]
+                return self._ndarray(dset.shape, dset.dtype, offset)
+            if not base.time_keys:
+                return None
+            grp = f[group_path]
+            dsets = [grp[k] for k in base.time_keys]
+            offsets = [_mappable_offset(d) for d in dsets]
+            if any(o is None for o in offsets):
+                return None
+            dtype = dsets[0].dtype
+            n = dsets[0].shape[0]
+            if any(d.dtype != dtype or d.shape != (n,) for d in dsets):
+                return None
+        steps = np.diff(offsets)
+        if len(offsets) > 1 and np.all(steps == steps[0]) and steps[0] >= n * dtype.itemsize:
+            # Evenly spaced timesteps: one strided (n_elements, n_timesteps) view.
+            return self._ndarray(
+                (n, len(offsets)), dtype, offsets[0], strides=(dtype.itemsize, int(steps[0]))
+            )
+        return [self._ndarray((n,), dtype, o) for o in offsets]
+
+    def _ndarray(self, shape, dtype, offset: int, strides=None) -> np.ndarray:
+        if self._map is None:
+            self._map = np.memmap(self._base.h5_path, dtype=np.uint8, mode="r")
+        view = np.ndarray(shape, dtype=dtype, buffer=self._map, offset=offset, strides=strides)
+        view.flags.writeable = False
+        return view
+
+
+def _mappable_offset(dset: h5py.Dataset) -> int | None:
+    """File offset of ``dset``'s raw bytes, or ``None`` if they cannot be mapped.
+
+    Only contiguous storage (no chunks, so no filters) of a plain numeric
+    dtype, allocated in this very file, qualifies. Compact datasets live in
+    the object header and report no offset.
+    """
+    if dset.chunks is not None or dset.external or dset.dtype.kind not in "biuf":
+        return None
+    if dset.size == 0:
+        return None
+    return dset.id.get_offset()
@@ -1,8 +1,11 @@
 """XDMF + H5 :class:`Storage`.
 
-Reads and writes :class:`DataSource` objects to disk in the same byte
+Reads and writes :class:`DataSource` objects to disk in the dataset
 layout the v2 pressure pipeline produces today. Round-trip is the
-contract: read a fixture, write it under a new key, the bytes match.
+contract: read a fixture and write it under a new key, and the new file
+holds the same datasets, shapes and values. It is not byte-identical:
+written files also carry the ``/meta/index`` (and ``/meta/time_keys``)
+described below.
 
 Layouts handled:
 
@@ -14,6 +17,22 @@ Layouts handled:
       /meta/time_normalized     float64 (n_timesteps,)
       /{field}/t{T}             float64 (n_elements,)        per timestep
 
+- *Columnar timeseries* (``layout="columnar"``)::
+
+      /Triangles, /Geometry, /meta/time_* as above
+      /meta/time_keys           bytes   (n_timesteps,)       the t{T} names
+      /{field}                  float64 (n_elements, n_timesteps), chunked
+                                (or contiguous, with ``chunks="contiguous"``)
+
+  Files written here also record ``/meta/index`` (field paths, layout,
+  shapes) and ``/meta/time_keys`` for either layout, so opening one costs the
+  same at ten timesteps as at a hundred thousand; files without an index are
+  read by walking their groups.
+
+  Either timeseries layout may be compressed (``codec=``) and stored as
+  float32 (``storage_dtype=``); ``/meta`` then records the choice in its
+  ``codec`` / ``storage_dtype`` attributes.
+
 - *Time-aggregated* (stats)::
 
       /Triangles, /Geometry as above
@@ -26,21 +45,32 @@ to say which; the byte layout does not record it, so without it the
 adapter falls back to guessing from the filename stem (``points.*`` ->
 points, anything else -> surface). ``write_data_source`` rewrites the
 file from scratch using the existing ``cfdmod.io.xdmf`` helpers, so the
-output format is exactly what the v2 pipeline produces.
+output format is exactly what the v2 pipeline produces. The columnar
+layout is opt-in on write and detected on read, so a reader never needs to
+be told which of the two timeseries layouts a file uses.
+
+``open_writer`` is the streaming form of ``write_data_source`` for
+time-resolved outputs: the chunked runner appends one time window at a
+time to a temporary file that replaces ``<key>.h5`` on commit.
 """
 
 from __future__ import annotations
 
 __all__ = ["XdmfH5Storage"]
 
+import contextlib
 import hashlib
+import os
 import pathlib
-from typing import Iterable
+import tempfile
+from typing import Callable, ContextManager, Iterable, Iterator, Literal
 
 import h5py
 import numpy as np
 
-from cfdmod.adapters.xdmf_h5.field_store import H5FieldStore
+from cfdmod.adapters.xdmf_h5 import handle_pool as _handles
+from cfdmod.adapters.xdmf_h5.field_store import H5FieldStore, H5Layout
+from cfdmod.adapters.xdmf_h5.memmap_store import MemmapFieldStore
 from cfdmod.core.data_source import (
     DataSource,
     GroupsDataSource,
@@ -49,6 +79,7 @@ from cfdmod.core.data_source import (
 )
 from cfdmod.core.errors import StorageKeyError
 from cfdmod.core.field_meta import FieldMeta
+from cfdmod.core.protocols import OutputWriter
 from cfdmod.core.time_axis import TimeAxis
 from cfdmod.core.topology import ElementMeta, Topology
 from cfdmod.io import xdmf as _xdmf
@@ -133,13 +164,81 @@ class XdmfH5Storage:
             opens ``<root>/bodies.foo.h5``.
         write_xdmf: When True, ``write_data_source`` also (re)generates
             ``<key>.xdmf`` next to the h5. Default True.
+        layout: On-disk layout for time-resolved fields written by
+            ``write_data_source``; see
+            :data:`~cfdmod.adapters.xdmf_h5.field_store.H5Layout`. Reads
+            detect the layout from the file regardless of this setting.
+        chunks: Chunk shape ``(elements, timesteps)`` for the columnar
+            layout. ``None`` picks :func:`cfdmod.io.xdmf.columnar_chunks`;
+            ``"contiguous"`` writes unchunked datasets that ``mmap`` can map.
+        mmap: When True, ``read_data_source`` returns a
+            :class:`MemmapFieldStore`: contiguous, unfiltered datasets are
+            served as read-only views of a memory map of the file, so worker
+            processes reading the same source share its pages instead of each
+            holding a private copy. Anything else falls back to
+            :class:`H5FieldStore` reads.
+        codec: Compression preset for written field and stat datasets:
+            ``"none"`` (default), ``"lzf"``, ``"gzip-N"`` or
+            ``"shuffle+gzip-N"``; see :func:`cfdmod.io.xdmf.codec_options`.
+            Compressed datasets are chunked, so they are not memory-mappable.
+        storage_dtype: On-disk dtype of time-resolved fields. ``"float32"``
+            halves Cp/Cf histories; stats stay float64. Reads return the
+            stored dtype.
+        compress_workers: Threads compressing field chunks in parallel with
+            the write for a gzip ``codec``; see
+            :class:`cfdmod.io.xdmf.TimeseriesWriter`. ``0`` (default) lets
+            HDF5 compress on the writing thread. The file reads the same
+            either way.
     """
 
-    __slots__ = ("_root", "_write_xdmf")
+    __slots__ = (
+        "_root",
+        "_write_xdmf",
+        "_layout",
+        "_chunks",
+        "_mmap",
+        "_codec",
+        "_storage_dtype",
+        "_compress_workers",
+    )
 
-    def __init__(self, root: pathlib.Path, *, write_xdmf: bool = True) -> None:
+    def __init__(
+        self,
+        root: pathlib.Path,
+        *,
+        write_xdmf: bool = True,
+        layout: H5Layout = "per_step",
+        chunks: tuple[int, int] | Literal["contiguous"] | None = None,
+        mmap: bool = False,
+        codec: str = _xdmf.DEFAULT_CODEC,
+        storage_dtype: Literal["float64", "float32"] = "float64",
+        compress_workers: int = 0,
+    ) -> None:
+        if _xdmf.codec_options(codec) and chunks == _xdmf.CONTIGUOUS:
+            raise ValueError(
+                f"chunks={_xdmf.CONTIGUOUS!r} cannot be combined with codec {codec!r}; "
+                "HDF5 filters need chunked storage"
+            )
+        _xdmf.storage_dtype(storage_dtype)
+        if compress_workers < 0:
+            raise ValueError(f"compress_workers must be non-negative; got {compress_workers}")
+        if layout not in ("per_step", "columnar"):
+            raise ValueError(f"unknown h5 layout {layout!r}; expected 'per_step' or 'columnar'")
+        if chunks is not None and chunks != _xdmf.CONTIGUOUS:
+            if isinstance(chunks, str) or len(chunks) != 2 or min(chunks) < 1:
+                raise ValueError(
+                    "chunks must be two positive ints (elements, timesteps) or "
+                    f"{_xdmf.CONTIGUOUS!r}; got {chunks!r}"
+                )
+            chunks = (int(chunks[0]), int(chunks[1]))
         self._root = pathlib.Path(root)
         self._write_xdmf = bool(write_xdmf)
+        self._layout = layout
+        self._chunks = chunks
+        self._mmap = bool(mmap)
+        self._codec = codec
+        self._storage_dtype = np.dtype(storage_dtype)
+        self._compress_workers = int(compress_workers)
 
     # --- Path helpers ------------------------------------------------------
 
@@ -147,6 +246,26 @@ class XdmfH5Storage:
     def root(self) -> pathlib.Path:
         return self._root
 
+    @property
+    def layout(self) -> H5Layout:
+        return self._layout
+
+    @property
+    def mmap(self) -> bool:
+        return self._mmap
+
+    @property
+    def codec(self) -> str:
+        return self._codec
+
+    @property
+    def storage_dtype(self) -> np.dtype:
+        return self._storage_dtype
+
+    @property
+    def compress_workers(self) -> int:
+        return self._compress_workers
+
     def h5_path(self, key: str) -> pathlib.Path:
         return self._root / f"{key}.h5"
 
@@ -161,115 +280,41 @@ class XdmfH5Storage:
     def __contains__(self, key: str) -> bool:
         return self.h5_path(key).exists()
 
+    @contextlib.contextmanager
+    def session(
+        self, *, max_open: int = _handles.DEFAULT_MAX_OPEN
+    ) -> Iterator[_handles.H5HandlePool]:
+        """Keep h5 files open across reads for the duration of the block.
+
+        Activates the process-wide :class:`~cfdmod.adapters.xdmf_h5.handle_pool.H5HandlePool`,
+        so every :class:`H5FieldStore` read -- from this storage or any other
+        -- borrows a cached read-only handle instead of opening the file per
+        call. Handles close when the outermost session exits. Writes through
+        this storage evict the written file's handle first, so a session can
+        span a whole ``run_template`` call::
+
+            with storage.session():
+                run_template(template, storage=storage, memory_budget=8 << 30)
+
+        Args:
+            max_open: Most idle handles kept open at once (LRU-evicted). Only
+                the outermost session's cap applies.
+        """
+        with _handles.handle_pool(max_open) as pool:
+            yield pool
+
     # --- Read --------------------------------------------------------------
 
     def read_data_source(self, key: str, *, kind: str | None = None) -> DataSource:
-        if kind is not None and kind not in _READABLE_KINDS:
-            raise ValueError(
-                f"XdmfH5Storage cannot read a {kind!r} data source; this byte layout "
-                f"represents {sorted(_READABLE_KINDS)} only"
-            )
+        _check_readable_kind(kind)
         h5_path = self.h5_path(key)
         if not h5_path.exists():
             raise StorageKeyError(
                 f"XdmfH5Storage has no data source under key {key!r} ({h5_path})"
             )
 
-        with h5py.File(h5_path, "r") as f:
-            if "Triangles" not in f or "Geometry" not in f:
-                raise ValueError(
-                    f"{h5_path} is missing the standard /Triangles and /Geometry datasets; "
-                    "this adapter only handles the cfdmod v2 layout."
-                )
-            triangles = np.asarray(f["Triangles"][:], dtype=np.int32)
-            vertices = np.asarray(f["Geometry"][:], dtype=np.float64)
-            has_meta = "meta" in f and "time_steps" in f["meta"]
-            time_steps = (
-                np.asarray(f["meta"]["time_steps"][:], dtype=np.float64) if has_meta else None
-            )
-            time_normalized = (
-                np.asarray(f["meta"]["time_normalized"][:], dtype=np.float64) if has_meta else None
-            )
-
-            field_groups: dict[str, str] = {}
-            time_keys: list[str] = []
-            time_aggregated = False
-
-            # Field groups are top-level groups other than 'meta'. Detect
-            # timeseries vs stats by inspecting one group's children.
-            for name in f.keys():
-                if name in _RESERVED_ROOT_KEYS:
-                    continue
-                obj = f[name]
-                if not isinstance(obj, h5py.Group):
-                    continue
-                children = [
-                    k
-                    for k in obj.keys()
-                    if isinstance(obj[k], h5py.Dataset) and k not in _RESERVED_GROUP_DATASETS
-                ]
-                if not children:
-                    continue
-                # Stats layout: per-stat datasets directly under the group, no t-prefix.
-                # Timeseries layout: every dataset is t{float}.
-                if all(k.startswith("t") and _is_floatish(k[1:]) for k in children):
-                    field_groups[name] = name
-                    if not time_keys:
-                        time_keys = sorted(children, key=lambda k: float(k[1:]))
-                else:
-                    time_aggregated = True
-                    for stat_name in children:
-                        # Bare-stat sources are written under the synthetic
-                        # "stats" group; strip it so the field name round-trips.
-                        field_name = (
-                            stat_name if name == _BARE_STATS_GROUP else f"{name}/{stat_name}"
-                        )
-                        field_groups[field_name] = f"{name}/{stat_name}"
-
-        # Topology + ElementMeta. The declared kind wins; the filename stem is
-        # only consulted when the caller did not say.
-        if kind is None:
-            kind = _kind_from_key(key)
-        if kind == "points":
-            topology = Topology.points(vertices)
-        else:
-            topology = Topology.triangles(triangles, vertices)
-        elements = ElementMeta()
-
-        # Time axis
-        if time_aggregated or not time_keys:
-            if has_meta and time_steps.shape[0] > 0 and not time_aggregated:
-                time = _derive_time_axis(time_steps, time_normalized)
-            else:
-                time = TimeAxis(initial_time=0.0, timestep_size=0.0, n_timesteps=0)
-        else:
-            if has_meta:
-                time = _derive_time_axis(time_steps, time_normalized)
-            else:
-                # Reconstruct from the keys themselves.
-                ts = np.array([float(k[1:]) for k in time_keys], dtype=np.float64)
-                time = _derive_time_axis(ts, ts)
-
-        store = H5FieldStore(
-            h5_path=h5_path,
-            field_groups=field_groups,
-            time_keys=[] if time_aggregated else time_keys,
-            n_elements=topology.n_elements,
-            time_aggregated=time_aggregated,
-        )
-        field_meta = {name: FieldMeta(name=name) for name in field_groups}
-
-        common = dict(
-            time=time,
-            topology=topology,
-            elements=elements,
-            fields=store,
-            field_meta=field_meta,
-            attrs={"source_path": str(h5_path)},
-        )
-        if kind == "points":
-            return PointsDataSource(**common)
-        return SurfaceDataSource(**common)
+        with _handles.open_for_read(h5_path) as f:
+            return read_h5_data_source(f, key=key, h5_path=h5_path, kind=kind, mmap=self._mmap)
 
     # --- Write -------------------------------------------------------------
 
@@ -288,6 +333,9 @@ class XdmfH5Storage:
             )
         h5_path = self.h5_path(key)
         h5_path.parent.mkdir(parents=True, exist_ok=True)
+        # A pooled read handle would keep serving the old bytes, and HDF5 will
+        # not open a file for writing while it is open read-only here.
+        _handles.evict(h5_path)
         if h5_path.exists():
             h5_path.unlink()
 
@@ -297,9 +345,15 @@ class XdmfH5Storage:
 
         # One open handle for the whole write. Writing a timestep at a time
         # through the module-level helpers reopened the file per timestep,
-        # which was ~3x the cost for byte-identical output.
+        # which was ~3x the cost for the same datasets.
         groups_for_xdmf: list[str] = []
-        with _xdmf.timeseries_writer(h5_path) as writer:
+        indexed: dict[str, str] = {}
+        with _xdmf.timeseries_writer(
+            h5_path,
+            codec=self._codec,
+            dtype=self._storage_dtype,
+            workers=self._compress_workers,
+        ) as writer:
             writer.write_geometry(triangles, vertices)
             if not time_aggregated:
                 writer.write_meta(ds.time.times(), ds.time.times_normalized())
@@ -322,6 +376,7 @@ class XdmfH5Storage:
                         triangles=triangles,
                         vertices=vertices,
                     )
+                    indexed[fname] = f"{group}/{stat}"
                 else:
                     # Timeseries: arr is (n_elements, n_timesteps).
                     if arr.ndim != 2:
@@ -330,8 +385,18 @@ class XdmfH5Storage:
                             f"got shape {arr.shape}"
                         )
                     keys = [f"t{t}" for t in ds.time.times()]
-                    writer.write_field(fname, np.asarray(arr, dtype=np.float64), keys)
+                    if self._layout == "columnar":
+                        writer.write_columnar_field(fname, arr, keys, chunks=self._chunks)
+                    else:
+                        writer.write_field(fname, np.asarray(arr), keys)
                     groups_for_xdmf.append(fname)
+                    indexed[fname] = fname
+
+            writer.write_index(
+                indexed,
+                n_elements=ds.topology.n_elements,
+                time_keys=None if time_aggregated else [f"t{t}" for t in ds.time.times()],
+            )
 
         if self._write_xdmf:
             xdmf_path = self.xdmf_path(key)
@@ -340,6 +405,19 @@ class XdmfH5Storage:
             elif groups_for_xdmf:
                 _xdmf.write_temporal_xdmf(h5_path, xdmf_path, groups_for_xdmf)
 
+    def open_writer(self, key: str, template_ds: DataSource) -> OutputWriter:
+        """Stream a time-resolved output to ``<key>.h5`` one window at a time.
+
+        The file is built under a temporary name next to its destination
+        and moved into place on ``commit``, so neither a reader nor an
+        aborted run ever sees a half-written output. Layout, chunks, codec
+        and storage dtype follow this storage's settings as for
+        :meth:`write_data_source`, and the file reads back the same. Only the
+        order of per-step datasets in the file differs: window by window
+        rather than field by field.
+        """
+        return _H5OutputWriter(self, key, template_ds)
+
     # --- Freshness ---------------------------------------------------------
 
     def digest(self, key: str, strategy: str = "size_mtime") -> str:
@@ -377,7 +455,7 @@ class XdmfH5Storage:
         h5_path = self.h5_path(key)
         if not h5_path.exists():
             return None
-        with h5py.File(h5_path, "r") as f:
+        with _handles.open_for_read(h5_path) as f:
             raw = f.attrs.get(_SIGNATURE_ATTR)
         if raw is None:
             return None
@@ -387,10 +465,298 @@ class XdmfH5Storage:
         h5_path = self.h5_path(key)
         if not h5_path.exists():
             raise StorageKeyError(f"cannot stamp signature: no h5 under key {key!r} ({h5_path})")
+        _handles.evict(h5_path)
         with h5py.File(h5_path, "a") as f:
             f.attrs[_SIGNATURE_ATTR] = signature
 
 
+class _H5OutputWriter:
+    """:class:`OutputWriter` behind :meth:`XdmfH5Storage.open_writer`."""
+
+    __slots__ = (
+        "_h5_path",
+        "_xdmf_path",
+        "_layout",
+        "_chunks",
+        "_groups",
+        "_keys",
+        "_n_elements",
+        "_tmp",
+        "_file",
+        "_writer",
+        "_fields",
+        "_filled",
+    )
+
+    def __init__(self, storage: XdmfH5Storage, key: str, template: DataSource) -> None:
+        if template.time.is_time_aggregated:
+            raise ValueError(
+                "open_writer streams time-resolved outputs; write a time-aggregated "
+                "data source with write_data_source"
+            )
+        self._groups = isinstance(template, GroupsDataSource)
+        surface = _groups_to_parent_surface(template) if self._groups else template
+        if surface.topology is None:
+            raise ValueError(
+                "XdmfH5Storage cannot write a DataSource with no topology "
+                f"(kind={template.kind!r})."
+            )
+        self._h5_path = storage.h5_path(key)
+        self._xdmf_path = storage.xdmf_path(key) if storage._write_xdmf else None
+        self._layout = storage.layout
+        self._chunks = storage._chunks
+        self._keys = [f"t{t}" for t in template.time.times()]
+        self._n_elements = surface.n_elements
+        self._fields: list[str] | None = None
+        self._filled = 0
+
+        self._h5_path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(
+            dir=self._h5_path.parent, prefix=f".{self._h5_path.name}.", suffix=".tmp"
+        )
+        os.close(fd)
+        self._tmp = pathlib.Path(tmp)
+        self._file: h5py.File | None = h5py.File(self._tmp, "w")
+        try:
+            self._writer = _xdmf.TimeseriesWriter(
+                self._file,
+                codec=storage.codec,
+                dtype=storage.storage_dtype,
+                workers=storage.compress_workers,
+            )
+            self._writer.write_geometry(
+                _connectivity_for_write(surface.topology),
+                np.asarray(surface.topology.vertices, dtype=np.float64),
+            )
+            self._writer.write_meta(template.time.times(), template.time.times_normalized())
+        except BaseException:
+            self.abort()
+            raise
+
+    def append(self, window: DataSource) -> None:
+        if self._file is None:
+            raise ValueError(f"writer for {self._h5_path} is already closed")
+        if self._groups:
+            window = _groups_to_parent_surface(window)
+        names = sorted(window.fields.keys())
+        if self._fields is None:
+            self._fields = names
+            if self._layout == "columnar":
+                for fname in names:
+                    self._writer.allocate_columnar_field(
+                        fname, self._n_elements, self._keys, chunks=self._chunks
+                    )
+        elif names != self._fields:
+            raise ValueError(
+                f"every window must carry the same fields; expected {self._fields}, got {names}"
+            )
+        start = self._filled
+        stop = start + window.time.n_timesteps
+        if stop > len(self._keys):
+            raise ValueError(
+                f"window ending at timestep {stop} overruns the output's "
+                f"{len(self._keys)} timesteps"
+            )
+        for fname in names:
+            arr = np.asarray(window.fields.read(fname))
+            if arr.ndim != 2:
+                raise ValueError(
+                    f"field {fname!r} must be 2-D for a non-aggregated DataSource; "
+                    f"got shape {arr.shape}"
+                )
+            if self._layout == "columnar":
+                self._writer.write_columnar_window(fname, arr, start)
+            else:
+                self._writer.write_field(fname, arr, self._keys[start:stop])
+        self._filled = stop
+
+    def commit(self) -> None:
+        if self._file is None:
+            raise ValueError(f"writer for {self._h5_path} is already closed")
+        if self._filled != len(self._keys):
+            raise ValueError(
+                f"output {self._h5_path.name} received {self._filled} of "
+                f"{len(self._keys)} timesteps"
+            )
+        self._writer.write_index(
+            {fname: fname for fname in self._fields or ()},
+            n_elements=self._n_elements,
+            time_keys=self._keys,
+        )
+        self._file.close()
+        self._file = None
+        _handles.evict(self._h5_path)
+        os.replace(self._tmp, self._h5_path)
+        if self._xdmf_path is not None and self._fields:
+            _xdmf.write_temporal_xdmf(self._h5_path, self._xdmf_path, self._fields)
+
+    def abort(self) -> None:
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+        self._tmp.unlink(missing_ok=True)
+
+
+def read_h5_data_source(
+    f: h5py.File,
+    *,
+    key: str,
+    h5_path: pathlib.Path,
+    kind: str | None = None,
+    mmap: bool = False,
+    opener: Callable[[], ContextManager[h5py.File]] | None = None,
+) -> DataSource:
+    """Build the :class:`DataSource` for an open cfdmod v2 h5 file.
+
+    Reads topology and time metadata from ``f`` now; fields stay lazy in an
+    :class:`H5FieldStore` that reopens ``h5_path`` (or calls ``opener``) on
+    each read. ``key`` only feeds the filename-based kind guess.
+    """
+    _check_readable_kind(kind)
+    if "Triangles" not in f or "Geometry" not in f:
+        raise ValueError(
+            f"{h5_path} is missing the standard /Triangles and /Geometry datasets; "
+            "this adapter only handles the cfdmod v2 layout."
+        )
+    triangles = np.asarray(f["Triangles"][:], dtype=np.int32)
+    vertices = np.asarray(f["Geometry"][:], dtype=np.float64)
+    has_meta = "meta" in f and "time_steps" in f["meta"]
+    time_steps = np.asarray(f["meta"]["time_steps"][:], dtype=np.float64) if has_meta else None
+    time_normalized = (
+        np.asarray(f["meta"]["time_normalized"][:], dtype=np.float64) if has_meta else None
+    )
+
+    index = _xdmf.read_index(f)
+    if index is not None:
+        field_groups = dict(index["fields"])
+        time_keys = index["time_keys"]
+        time_aggregated = index["time_aggregated"]
+        layout: H5Layout = index["layout"]
+    else:
+        field_groups, time_keys, time_aggregated, layout = _scan_fields(f, h5_path)
+
+    # Topology + ElementMeta. The declared kind wins; the filename stem is
+    # only consulted when the caller did not say.
+    if kind is None:
+        kind = _kind_from_key(key)
+    if kind == "points":
+        topology = Topology.points(vertices)
+    else:
+        topology = Topology.triangles(triangles, vertices)
+    elements = ElementMeta()
+
+    # Time axis
+    if time_aggregated or not time_keys:
+        if has_meta and time_steps.shape[0] > 0 and not time_aggregated:
+            time = _derive_time_axis(time_steps, time_normalized)
+        else:
+            time = TimeAxis(initial_time=0.0, timestep_size=0.0, n_timesteps=0)
+    else:
+        if has_meta:
+            time = _derive_time_axis(time_steps, time_normalized)
+        else:
+            # Reconstruct from the keys themselves.
+            ts = np.array([float(k[1:]) for k in time_keys], dtype=np.float64)
+            time = _derive_time_axis(ts, ts)
+
+    store = H5FieldStore(
+        h5_path=h5_path,
+        field_groups=field_groups,
+        time_keys=[] if time_aggregated else time_keys,
+        n_elements=topology.n_elements,
+        time_aggregated=time_aggregated,
+        layout=layout,
+        opener=opener,
+    )
+    field_meta = {name: FieldMeta(name=name) for name in field_groups}
+
+    common = dict(
+        time=time,
+        topology=topology,
+        elements=elements,
+        fields=MemmapFieldStore(store) if mmap else store,
+        field_meta=field_meta,
+        attrs={"source_path": str(h5_path)},
+    )
+    if kind == "points":
+        return PointsDataSource(**common)
+    return SurfaceDataSource(**common)
+
+
+def _scan_fields(
+    f: h5py.File, h5_path: pathlib.Path
+) -> tuple[dict[str, str], list[str], bool, H5Layout]:
+    """Work out the field datasets of a file without ``/meta/index`` by walking it.
+
+    Returns ``(field_groups, time_keys, time_aggregated, layout)``. This visits
+    every per-step dataset and parses its name, so it is linear in the number
+    of timesteps; files written by this storage carry an index instead.
+    """
+    field_groups: dict[str, str] = {}
+    time_keys: list[str] = []
+    time_aggregated = False
+    layout: H5Layout = "per_step"
+
+    # Field groups are top-level groups other than 'meta'. Detect
+    # timeseries vs stats by inspecting one group's children. A 2-D
+    # root dataset is a columnar field.
+    for name in f.keys():
+        if name in _RESERVED_ROOT_KEYS:
+            continue
+        obj = f[name]
+        if _xdmf.is_columnar(f, name):
+            layout = "columnar"
+            field_groups[name] = name
+            continue
+        if not isinstance(obj, h5py.Group):
+            continue
+        children = [
+            k
+            for k in obj.keys()
+            if isinstance(obj[k], h5py.Dataset) and k not in _RESERVED_GROUP_DATASETS
+        ]
+        if not children:
+            continue
+        # Stats layout: per-stat datasets directly under the group, no t-prefix.
+        # Timeseries layout: every dataset is t{float}.
+        if all(k.startswith("t") and _is_floatish(k[1:]) for k in children):
+            field_groups[name] = name
+            if not time_keys:
+                time_keys = sorted(children, key=lambda k: float(k[1:]))
+        else:
+            time_aggregated = True
+            for stat_name in children:
+                # Bare-stat sources are written under the synthetic
+                # "stats" group; strip it so the field name round-trips.
+                field_name = stat_name if name == _BARE_STATS_GROUP else f"{name}/{stat_name}"
+                field_groups[field_name] = f"{name}/{stat_name}"
+
+    if layout == "columnar":
+        if time_aggregated or len(field_groups) != sum(
+            _xdmf.is_columnar(f, g) for g in field_groups.values()
+        ):
+            raise ValueError(
+                f"{h5_path} mixes columnar and per-timestep field groups; "
+                "a file must use one timeseries layout throughout"
+            )
+        time_keys = _xdmf.columnar_time_keys(f)
+        widths = {f[g].shape[1] for g in field_groups.values()}
+        if widths != {len(time_keys)}:
+            raise ValueError(
+                f"{h5_path}: columnar fields have {sorted(widths)} timesteps "
+                f"but /meta/time_keys lists {len(time_keys)}"
+            )
+    return field_groups, time_keys, time_aggregated, layout
+
+
+def _check_readable_kind(kind: str | None) -> None:
+    if kind is not None and kind not in _READABLE_KINDS:
+        raise ValueError(
+            f"XdmfH5Storage cannot read a {kind!r} data source; this byte layout "
+            f"represents {sorted(_READABLE_KINDS)} only"
+        )
+
+
 def _groups_to_parent_surface(ds: GroupsDataSource) -> SurfaceDataSource:
     """Broadcast a GroupsDataSource back onto its parent surface.
 
@@ -400,22 +766,16 @@ def _groups_to_parent_surface(ds: GroupsDataSource) -> SurfaceDataSource:
     """
     from cfdmod.adapters.memory import MemoryFieldStore
     from cfdmod.core.field_meta import FieldMeta
+    from cfdmod.core.grouping import group_rows
 
     parent_indices = np.asarray(ds.parent_grouping.indices)
     group_ids = np.asarray(ds.groupings[ds.parent_grouping.name].indices)  # row -> group id
     # parent_indices has one entry per parent triangle -- GroupsDataSource's
     # validator enforces that -- so the gathered arrays come out parent-shaped.
 
-    # Group id -> row index, as a lookup array rather than a dict walked once
-    # per triangle. Group ids can be any non-negative integers (and -1 for
-    # ungrouped), so the table is sized by the largest id present.
-    max_gid = int(group_ids.max()) if group_ids.size else -1
-    row_for_gid = np.full(max(max_gid + 1, 1), -1, dtype=np.int64)
-    if group_ids.size:
-        row_for_gid[group_ids] = np.arange(group_ids.size, dtype=np.int64)
-
-    in_range = (parent_indices >= 0) & (parent_indices <= max_gid)
-    rows = np.where(in_range, row_for_gid[np.clip(parent_indices, 0, max(max_gid, 0))], -1)
+    # Group id -> row index via the shared grouping helper: a binary search
+    # over the group ids, so sparse or very large ids cost nothing extra.
+    rows = group_rows(parent_indices, group_ids)
     known = rows >= 0
     safe_rows = np.where(known, rows, 0)
 
@@ -50,7 +50,14 @@ from cfdmod.building.loadcases import (
     invert_load_cases,
     save_load_case_tables,
 )
-from cfdmod.building.peaks import PeakMethod, gust_peak_factor, peak_value
+from cfdmod.building.peaks import (
+    PeakMethod,
+    container_peaks,
+    gust_peak_factor,
+    peak_value,
+    peak_values,
+    stack_field,
+)
 from cfdmod.building.static import (
     FloorLever,
     floor_band_indices,
@@ -83,6 +90,9 @@ __all__ = [
     "PeakMethod",
     "gust_peak_factor",
     "peak_value",
+    "peak_values",
+    "stack_field",
+    "container_peaks",
     "Occupancy",
     "Standard",
     "comfort_limit",
@@ -28,6 +28,15 @@ Design notes / best-guess calls (flagged for review):
   callable object -- and not a closure, because pickle refuses a function
   defined inside another function and the fan-out would fail on its first
   dispatch.
+- ``cache=`` (a :class:`cfdmod.core.result_cache.ResultCache`) makes a fan-out
+  resumable: each key's response is stored as it finishes and reused on the
+  next run while its inputs are unchanged, so extending a study computes only
+  the new keys. :meth:`StaticSolveFn.cache` builds one keyed on the body and
+  reference-pressure digests.
+- ``broadcast=`` (a :class:`cfdmod.core.broadcast.Broadcast`) publishes the
+  ``solve_fn`` to shared memory once for a pool. Combined with
+  :meth:`StaticSolveFn.preload` -- inputs read once in the parent -- the
+  workers attach those arrays zero-copy instead of each re-reading them.
 """
 
 from __future__ import annotations
@@ -43,6 +52,7 @@ __all__ = [
     "dump_provenance",
 ]
 
+import hashlib
 import itertools
 import json
 import pathlib
@@ -52,6 +62,7 @@ import numpy as np
 import pandas as pd
 from pydantic import BaseModel
 
+from cfdmod.adapters.memory import MemoryFieldStore
 from cfdmod.building.case import BuildingCase
 from cfdmod.building.dynamic import (
     example_building_structure,
@@ -60,9 +71,11 @@ from cfdmod.building.dynamic import (
     solve_building_response,
 )
 from cfdmod.building.pressure import cf_per_floor, cm_per_floor, cp_from_pressure
+from cfdmod.core.broadcast import Broadcast
 from cfdmod.core.container import Container
-from cfdmod.core.data_source import PointsDataSource
+from cfdmod.core.data_source import DataSource, PointsDataSource
 from cfdmod.core.protocols import Pool
+from cfdmod.core.result_cache import ResultCache, map_cached
 from cfdmod.utils import save_yaml
 
 
@@ -167,6 +180,28 @@ def default_storage_key(kind: str, key: StaticCaseKey) -> str:
     raise ValueError(f"unknown storage key kind {kind!r}")
 
 
+def _structure_digest(structure) -> str:
+    """Content hash of a structure: every array field by its bytes, shape and dtype.
+
+    ``repr`` is not a fingerprint -- numpy elides arrays over 1000 entries and
+    rounds to 8 digits -- so a changed mode shape or floor mass would keep
+    the cache signature and reuse a stale response.
+    """
+    h = hashlib.blake2b(digest_size=32)
+    fields = structure.__dict__ if isinstance(structure, BaseModel) else {"": structure}
+    for name in sorted(fields):
+        value = fields[name]
+        h.update(name.encode("utf-8"))
+        arr = None if value is None or isinstance(value, dict) else np.asarray(value)
+        if arr is not None and arr.dtype.kind in "biufcUS":
+            arr = np.ascontiguousarray(arr)
+            h.update(f"{arr.dtype.str}{arr.shape}".encode("utf-8"))
+            h.update(arr.tobytes())
+        else:
+            h.update(json.dumps(value, sort_keys=True, default=str).encode("utf-8"))
+    return h.hexdigest()
+
+
 class StaticSolveFn:
     """The default per-key pipeline, as a picklable callable.
 
@@ -184,6 +219,9 @@ class StaticSolveFn:
     A custom ``key_for`` must itself be picklable for pool use -- a module-level
     function or a callable object, not a lambda. The default template path has
     no such constraint.
+
+    ``preloaded`` maps storage keys to data sources already in memory; a call
+    reads those instead of ``storage``. :meth:`preload` fills it.
     """
 
     def __init__(
@@ -201,6 +239,7 @@ class StaticSolveFn:
         body_key_template: str = DEFAULT_BODY_KEY,
         pref_key_template: str = DEFAULT_PREF_KEY,
         key_for: Callable[[str, StaticCaseKey], str] | None = None,
+        preloaded: dict[str, DataSource] | None = None,
     ) -> None:
         self.case = case
         self.storage = storage
@@ -214,6 +253,7 @@ class StaticSolveFn:
         self.body_key_template = body_key_template
         self.pref_key_template = pref_key_template
         self.key_for = key_for
+        self.preloaded = dict(preloaded or {})
 
     def storage_key(self, kind: str, key: StaticCaseKey) -> str:
         if self.key_for is not None:
@@ -221,10 +261,66 @@ class StaticSolveFn:
         template = self.body_key_template if kind == "body" else self.pref_key_template
         return template.format(direction=key.direction, body=key.body, cp_config=key.cp_config)
 
+    def input_keys(self, key: StaticCaseKey) -> tuple[str, str]:
+        """The storage keys a call for ``key`` reads: its body and reference pressure."""
+        return (self.storage_key("body", key), self.storage_key("p_ref", key))
+
+    def cache_params(self) -> dict:
+        """Everything besides the key and its inputs that determines a response."""
+        return {
+            "case": self.case.model_dump(mode="json"),
+            "mesh_path": str(self.mesh_path),
+            "structure": None if self.structure is None else _structure_digest(self.structure),
+            "method": self.method,
+            "damping_ratio": self.damping_ratio,
+            "check_sampling": self.check_sampling,
+            "point": list(self.point),
+            "cp_statistics": self.cp_statistics,
+        }
+
+    def cache(self, storage=None, *, prefix: str = "fanout") -> ResultCache[StaticCaseKey]:
+        """A :class:`ResultCache` for this pipeline's responses.
+
+        Entries go to ``storage`` (default: the input storage) under
+        ``prefix``; one is reused while the key's body and reference pressure
+        digest the same and none of :meth:`cache_params` changed.
+        """
+        return ResultCache(
+            storage if storage is not None else self.storage,
+            inputs=self.input_keys,
+            input_storage=self.storage,
+            params=self.cache_params(),
+            prefix=prefix,
+            kind="points",
+        )
+
+    def preload(self, storage_keys) -> "StaticSolveFn":
+        """A copy that reads ``storage_keys`` once, now, into memory.
+
+        Meant for inputs many keys share -- a reference pressure common to
+        every direction, a body read under every config. Published through a
+        :class:`~cfdmod.core.broadcast.Broadcast`, they reach every pool
+        worker as shared memory rather than as one read per task.
+        """
+        preloaded = dict(self.preloaded)
+        for storage_key in storage_keys:
+            if storage_key in preloaded:
+                continue
+            ds = self.storage.read_data_source(storage_key)
+            arrays = {name: np.asarray(ds.fields.read(name)) for name in ds.fields.keys()}
+            preloaded[storage_key] = ds.model_copy(update={"fields": MemoryFieldStore(arrays)})
+        clone = object.__new__(StaticSolveFn)
+        clone.__dict__.update(self.__dict__, preloaded=preloaded)
+        return clone
+
+    def _read(self, storage_key: str) -> DataSource:
+        ds = self.preloaded.get(storage_key)
+        return ds if ds is not None else self.storage.read_data_source(storage_key)
+
     def __call__(self, key: StaticCaseKey) -> PointsDataSource:
         case = self.case
-        body = self.storage.read_data_source(self.storage_key("body", key))
-        p_ref = self.storage.read_data_source(self.storage_key("p_ref", key))
+        body = self._read(self.storage_key("body", key))
+        p_ref = self._read(self.storage_key("p_ref", key))
         cp = cp_from_pressure(body, p_ref, case, statistics=self.cp_statistics)
         cf = cf_per_floor(cp, self.mesh_path, case, method=self.method)
         cm = cm_per_floor(cp, self.mesh_path, case, method=self.method)
@@ -303,6 +399,8 @@ def run_fanout(
     pool: Pool | None = None,
     writer=None,
     case: BuildingCase | None = None,
+    cache: ResultCache[StaticCaseKey] | None = None,
+    broadcast: Broadcast | None = None,
 ) -> Container[StaticCaseKey, PointsDataSource]:
     """Fan ``solve_fn`` out over every ``(direction, body, cp_config)`` key.
 
@@ -311,12 +409,21 @@ def run_fanout(
     fan-out runs through ``pool.map``. When both ``writer`` and ``case`` are
     given, the provenance dump (region info + resolved config) is written once
     beside the outputs.
+
+    With ``cache`` only the keys without a valid entry are solved, and each
+    response is written to the cache as soon as it is computed -- by the
+    worker, under a pool, so a process pool needs a file-backed cache storage.
+    An interrupted fan-out resumes where it stopped; an extended plan solves
+    only its new keys.
+
+    With ``pool`` and ``broadcast``, ``solve_fn`` is published to shared
+    memory once and each worker attaches it, rather than unpickling a copy
+    of its arrays per batch of tasks.
     """
     keys = build_static_keys(plan)
-    if pool is None:
-        results = [solve_fn(k) for k in keys]
-    else:
-        results = pool.map(solve_fn, keys)
+    if pool is not None and broadcast is not None:
+        solve_fn = broadcast.share(solve_fn)
+    results = map_cached(keys, solve_fn, cache, pool)
     container = Container(items=dict(zip(keys, results)))
     if writer is not None and case is not None:
         # actual computed floor count (pressure may drop empty floor slices)
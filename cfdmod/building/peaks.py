@@ -9,13 +9,23 @@ the field, selectable per deliverable:
   ``g`` from the response frequency and averaging duration.
 - ``"gumbel"`` -- fit a Gumbel to block maxima and read the design fractile off
   it (more stable than the raw max for short records).
+
+:func:`peak_value` reduces one series. :func:`peak_values` reduces every
+series of an array along one axis at once -- same methods, same results --
+and :func:`container_peaks` stacks a field across the cases of a container
+first, so a directional peak table is one reduction per field rather than a
+Python loop over cases and floors.
 """
 
 from __future__ import annotations
 
-from typing import Literal
+from typing import TYPE_CHECKING, Literal, Sequence
 
 import numpy as np
+import pandas as pd
+
+if TYPE_CHECKING:
+    from cfdmod.core.container import Container
 
 PeakMethod = Literal["max", "peak-factor", "gumbel"]
 
@@ -92,3 +102,140 @@ def peak_value(
         return float(loc - scale * np.log(-np.log(non_exceedance)))
 
     raise ValueError(f"unknown peak method {method!r}")
+
+
+def _gust_peak_factors(f0, duration: float) -> np.ndarray:
+    """:func:`gust_peak_factor` (full form) for a scalar or an array of ``f0``."""
+    nu_t = np.asarray(f0, dtype=np.float64) * duration
+    if np.any(nu_t <= 1.0):
+        raise ValueError(f"f0 * duration must exceed 1 (got min {float(np.min(nu_t))})")
+    base = np.sqrt(2.0 * np.log(nu_t))
+    return base + 0.5772 / base
+
+
+def _block_starts(n: int, n_blocks: int) -> np.ndarray:
+    """Start index of each ``np.array_split(range(n), n_blocks)`` block."""
+    sizes = np.full(n_blocks, n // n_blocks)
+    sizes[: n % n_blocks] += 1
+    return np.concatenate(([0], np.cumsum(sizes)[:-1]))
+
+
+def peak_values(
+    array: np.ndarray,
+    method: PeakMethod = "peak-factor",
+    *,
+    axis: int = -1,
+    f0: float | np.ndarray | None = None,
+    duration: float = 600.0,
+    absolute: bool = True,
+    n_blocks: int = 10,
+    non_exceedance: float = 0.78,
+) -> np.ndarray:
+    """:func:`peak_value` of every series of ``array`` along ``axis``, at once.
+
+    The result has ``array``'s shape without ``axis``. Non-finite samples are
+    masked out of each series, as :func:`peak_value` drops them; a series with
+    none left is ``nan``. ``f0`` may be an array broadcasting against the
+    result (one frequency per floor or per case). The keyword arguments are
+    those of :func:`peak_value`.
+
+    ``"max"`` and ``"peak-factor"`` are masked reductions. ``"gumbel"`` splits
+    every fully finite series into the same blocks and reduces them together;
+    a series with masked samples has its blocks cut from the samples left, so
+    it goes through :func:`peak_value` on its own.
+    """
+    if method not in ("max", "peak-factor", "gumbel"):
+        raise ValueError(f"unknown peak method {method!r}")
+    if method == "peak-factor" and f0 is None:
+        raise ValueError("peak-factor method requires f0")
+    x = np.moveaxis(np.asarray(array, dtype=np.float64), axis, -1)
+    out_shape = x.shape[:-1]
+    x = x.reshape(int(np.prod(out_shape)), x.shape[-1])
+    finite = np.isfinite(x)
+    count = finite.sum(axis=1)
+    empty = count == 0
+
+    if method == "max":
+        vals = np.abs(x) if absolute else x
+        with np.errstate(invalid="ignore"):
+            peaks = np.max(np.where(finite, vals, -np.inf), axis=1, initial=-np.inf)
+    elif method == "peak-factor":
+        g = np.broadcast_to(_gust_peak_factors(f0, duration), out_shape).reshape(-1)
+        with np.errstate(invalid="ignore", divide="ignore"):
+            mean = np.where(finite, x, 0.0).sum(axis=1) / count
+            dev = np.where(finite, x - mean[:, None], 0.0)
+            std = np.sqrt((dev * dev).sum(axis=1) / count)
+        peaks = (np.abs(mean) if absolute else mean) + g * std
+    else:
+        peaks = np.full(x.shape[0], np.nan)
+        full = count == x.shape[1]
+        if x.shape[1] and full.any():
+            vals = np.abs(x[full]) if absolute else x[full]
+            k = max(1, min(n_blocks, x.shape[1]))
+            block_maxima = np.maximum.reduceat(vals, _block_starts(x.shape[1], k), axis=1)
+            m = block_maxima.mean(axis=1)
+            s = block_maxima.std(axis=1, ddof=1) if k > 1 else np.zeros_like(m)
+            scale = s * np.sqrt(6.0) / np.pi
+            loc = m - 0.5772 * scale
+            peaks[full] = np.where(
+                scale == 0.0, loc, loc - scale * np.log(-np.log(non_exceedance))
+            )
+        for i in np.flatnonzero(~full & ~empty):
+            peaks[i] = peak_value(
+                x[i],
+                "gumbel",
+                absolute=absolute,
+                n_blocks=n_blocks,
+                non_exceedance=non_exceedance,
+            )
+
+    peaks = np.where(empty, np.nan, peaks)
+    return peaks.reshape(out_shape)
+
+
+def stack_field(
+    container: "Container",
+    field: str,
+    *,
+    rows: int | slice | Sequence[int] | None = None,
+) -> np.ndarray:
+    """``field`` of every value of ``container``, stacked: ``(n_cases, ...)``.
+
+    ``rows`` selects elements (floors) of each ``(n_elements, n_t)`` field
+    before stacking -- ``-1`` for the top floor. Every case must have the
+    same shape after the selection.
+    """
+    arrays = []
+    for ds in container.values():
+        arr = np.asarray(ds.fields.read(field), dtype=np.float64)
+        arrays.append(arr if rows is None else arr[rows])
+    if not arrays:
+        return np.empty((0,), dtype=np.float64)
+    shapes = {a.shape for a in arrays}
+    if len(shapes) > 1:
+        raise ValueError(f"cannot stack {field!r} across cases of shapes {sorted(shapes)}")
+    return np.stack(arrays)
+
+
+def container_peaks(
+    container: "Container",
+    fields: Sequence[str],
+    method: PeakMethod = "peak-factor",
+    **peak_kwargs,
+) -> pd.DataFrame:
+    """Design peaks of ``fields`` for every case and element of ``container``.
+
+    Each field is stacked across cases with :func:`stack_field` and reduced
+    by one :func:`peak_values` call; ``peak_kwargs`` are forwarded. Returns
+    one row per ``(case key, element)`` -- index levels ``key`` and
+    ``element`` -- and one column per field.
+    """
+    keys = list(container.keys())
+    columns: dict[str, np.ndarray] = {field: np.empty(0) for field in fields}
+    n_elements = 0
+    for field in fields if keys else ():
+        peaks = peak_values(stack_field(container, field), method, **peak_kwargs)
+        n_elements = peaks.shape[1]
+        columns[field] = peaks.reshape(-1)
+    index = pd.MultiIndex.from_product([keys, range(n_elements)], names=["key", "element"])
+    return pd.DataFrame(columns, index=index)
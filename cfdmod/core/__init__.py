@@ -16,6 +16,7 @@ public API in ``cfdmod`` remains unchanged.
 
 from __future__ import annotations
 
+from cfdmod.core.broadcast import Broadcast, Shared
 from cfdmod.core.container import Container
 from cfdmod.core.errors import (
     CfdmodError,
@@ -40,6 +41,7 @@ from cfdmod.core.freshness import (
     output_status,
     signature,
 )
+from cfdmod.core.result_cache import ResultCache
 from cfdmod.core.memory import (
     ChunkPlan,
     bytes_per_timestep,
@@ -60,7 +62,15 @@ from cfdmod.core.pipeline_yaml import (
     register_op,
     run_template,
 )
-from cfdmod.core.protocols import BlobStore, FieldStore, Logger, Pool, Storage
+from cfdmod.core.protocols import (
+    BlobStore,
+    FieldStore,
+    Logger,
+    OutputWriter,
+    Pool,
+    RangedBlobStore,
+    Storage,
+)
 from cfdmod.core.time_axis import TimeAxis
 from cfdmod.core.topology import CellType, ElementMeta, Topology
 
@@ -82,6 +92,8 @@ __all__ = [
     "FieldStore",
     "Storage",
     "BlobStore",
+    "OutputWriter",
+    "RangedBlobStore",
     "Logger",
     "Pool",
     "TimeAxis",
@@ -101,6 +113,9 @@ __all__ = [
     "OutputStatus",
     "output_status",
     "signature",
+    "ResultCache",
+    "Broadcast",
+    "Shared",
     "ChunkPlan",
     "bytes_per_timestep",
     "estimate_peak_bytes",
@@ -26,6 +26,8 @@ from __future__ import annotations
 __all__ = [
     "BroadcastRule",
     "classify_broadcast",
+    "rhs_tile",
+    "result_meta",
     "add",
     "sub",
     "mul",
@@ -106,6 +108,28 @@ def _resolve_rhs(
     return rhs_arr, rule
 
 
+def rhs_tile(rhs_arr: np.ndarray, rule: BroadcastRule, rows: slice, cols: slice) -> np.ndarray:
+    """The part of a broadcast rhs that meets the 2-D lhs block ``[rows, cols]``.
+
+    For the fused executor (:mod:`cfdmod.core.fusion`), which applies an op
+    to one tile of a time-resolved lhs at a time. ``rule`` is what
+    :func:`classify_broadcast` returned for the whole operands.
+    """
+    if rule == "elementwise":
+        return rhs_arr[rows, cols]
+    if rule == "column":
+        return rhs_arr[:, cols]
+    if rule == "row" and rhs_arr.ndim == 1:
+        return rhs_arr[rows, None]
+    raise ValueError(f"broadcast rule {rule!r} has no tile form for a 2-D lhs")
+
+
+def result_meta(field_meta: dict[str, FieldMeta], field: str, target: str) -> FieldMeta:
+    """Metadata of ``target`` written from ``field``: the target's, the source's, or new."""
+    meta = field_meta.get(target) or field_meta.get(field) or FieldMeta(name=target)
+    return meta.model_copy(update={"name": target})
+
+
 def _apply(
     lhs: DataSource,
     rhs: DataSource | float | int,
@@ -136,9 +160,8 @@ def _apply(
         raise ValueError(f"unhandled broadcast rule {rule!r}")
 
     target = out_field or field
-    meta = lhs.field_meta.get(target) or lhs.field_meta.get(field) or FieldMeta(name=target)
     return lhs.with_field(
-        target, np.asarray(result), meta=meta.model_copy(update={"name": target})
+        target, np.asarray(result), meta=result_meta(lhs.field_meta, field, target)
     )
 
 
@@ -0,0 +1,256 @@
+"""Shared-memory broadcast of large read-only inputs to pool workers.
+
+A fan-out through :class:`multiprocessing.pool.Pool` pickles its function
+with every batch of tasks, and each worker unpickles its own copy. When that
+function carries large arrays -- a body topology, a reference pressure, mode
+shapes, a floor partition -- every process holds a private copy of the same
+bytes, and the copies dominate both worker RSS and the time to first result.
+
+:class:`Broadcast` publishes an object once: every ``numpy`` array in it of
+at least ``min_bytes`` is copied into one
+:class:`multiprocessing.shared_memory.SharedMemory` segment, and what remains
+is a small pickle -- the **skeleton** -- that refers to the arrays by offset.
+The returned :class:`Shared` handle carries only the skeleton and the
+segment name, so it pickles in microseconds. :meth:`Shared.get` rebuilds the
+object: in the publishing process it is the original object itself; in any
+other process the segment is attached once and the arrays come back as
+read-only, zero-copy views of it.
+
+    with Broadcast() as broadcast:
+        container.map_values(func, pool=pool, broadcast=broadcast)
+
+The segments are unlinked when the broadcast is closed (or garbage
+collected, or the interpreter exits). A worker keeps its attached objects in
+a small per-process cache and detaches them when it exits.
+"""
+
+from __future__ import annotations
+
+__all__ = ["Broadcast", "Shared", "SharedCall"]
+
+import collections
+import io
+import pickle
+import uuid
+import weakref
+from multiprocessing import shared_memory, util
+from typing import Any, Callable, Generic, TypeVar
+
+import numpy as np
+
+T = TypeVar("T")
+
+_ALIGN = 64
+_MAX_ATTACHED = 8
+
+# Objects published by this process, by token: a handle that never leaves
+# the process resolves to the original rather than to a view of its copy.
+_PUBLISHED: dict[str, Any] = {}
+# Objects attached in this process, by token, with their segments. Bounded:
+# a worker that outlives many broadcasts only keeps the most recent ones
+# mapped.
+_ATTACHED: collections.OrderedDict[str, tuple[Any, shared_memory.SharedMemory | None]] = (
+    collections.OrderedDict()
+)
+_DETACH_REGISTERED = False
+
+
+def _detach(segment: shared_memory.SharedMemory | None) -> None:
+    if segment is None:
+        return
+    try:
+        segment.close()
+    except BufferError:
+        # A view of the segment is still referenced; the mapping goes with
+        # the process.
+        pass
+
+
+def _detach_all() -> None:
+    while _ATTACHED:
+        _, (_, segment) = _ATTACHED.popitem()
+        _detach(segment)
+
+
+def _release(segments: list[shared_memory.SharedMemory], tokens: list[str]) -> None:
+    for token in tokens:
+        _PUBLISHED.pop(token, None)
+    for segment in segments:
+        segment.close()
+        try:
+            segment.unlink()
+        except FileNotFoundError:
+            pass
+    segments.clear()
+    tokens.clear()
+
+
+class _SkeletonPickler(pickle.Pickler):
+    """Pickles an object with its large arrays swapped for segment offsets."""
+
+    def __init__(self, file: io.BytesIO, min_bytes: int) -> None:
+        super().__init__(file, protocol=pickle.HIGHEST_PROTOCOL)
+        self.min_bytes = min_bytes
+        self.arrays: list[tuple[int, np.ndarray]] = []
+        self.size = 0
+        self._seen: dict[int, tuple] = {}
+
+    def persistent_id(self, obj: Any) -> tuple | None:
+        if type(obj) is not np.ndarray or obj.dtype.hasobject or obj.nbytes < self.min_bytes:
+            return None
+        pid = self._seen.get(id(obj))
+        if pid is None:
+            offset = -(-self.size // _ALIGN) * _ALIGN
+            self.arrays.append((offset, obj))
+            self.size = offset + obj.nbytes
+            pid = self._seen[id(obj)] = ("ndarray", offset, obj.shape, obj.dtype.str)
+        return pid
+
+
+class _SkeletonUnpickler(pickle.Unpickler):
+    """Rebuilds the skeleton's arrays as read-only views of the segment."""
+
+    def __init__(self, file: io.BytesIO, buffer: memoryview) -> None:
+        super().__init__(file)
+        self.buffer = buffer
+
+    def persistent_load(self, pid: tuple) -> np.ndarray:
+        tag, offset, shape, dtype = pid
+        if tag != "ndarray":
+            raise pickle.UnpicklingError(f"unknown persistent id {tag!r}")
+        arr = np.ndarray(shape, dtype=np.dtype(dtype), buffer=self.buffer, offset=offset)
+        arr.flags.writeable = False
+        return arr
+
+
+class Shared(Generic[T]):
+    """A picklable handle on an object published by a :class:`Broadcast`.
+
+    Attributes:
+        token: Identifies the published object across processes.
+        segment: Name of the shared-memory segment holding its arrays, or
+            ``None`` when it had none large enough to share.
+        nbytes: Bytes held in the segment.
+    """
+
+    __slots__ = ("token", "segment", "nbytes", "_skeleton")
+
+    def __init__(self, token: str, skeleton: bytes, segment: str | None, nbytes: int) -> None:
+        self.token = token
+        self.segment = segment
+        self.nbytes = nbytes
+        self._skeleton = skeleton
+
+    def __getstate__(self) -> tuple:
+        return (self.token, self._skeleton, self.segment, self.nbytes)
+
+    def __setstate__(self, state: tuple) -> None:
+        self.token, self._skeleton, self.segment, self.nbytes = state
+
+    def __repr__(self) -> str:
+        return f"Shared(token={self.token!r}, segment={self.segment!r}, nbytes={self.nbytes})"
+
+    def get(self) -> T:
+        """The published object: the original here, zero-copy views elsewhere."""
+        if self.token in _PUBLISHED:
+            return _PUBLISHED[self.token]
+        hit = _ATTACHED.get(self.token)
+        if hit is not None:
+            _ATTACHED.move_to_end(self.token)
+            return hit[0]
+        return self._attach()
+
+    def _attach(self) -> T:
+        """Rebuild the object from the segment and cache it for this process."""
+        global _DETACH_REGISTERED
+        segment = None if self.segment is None else shared_memory.SharedMemory(self.segment)
+        buffer = memoryview(b"") if segment is None else segment.buf
+        obj = _SkeletonUnpickler(io.BytesIO(self._skeleton), buffer).load()
+        _ATTACHED[self.token] = (obj, segment)
+        while len(_ATTACHED) > _MAX_ATTACHED:
+            _, (_, old) = _ATTACHED.popitem(last=False)
+            _detach(old)
+        if not _DETACH_REGISTERED:
+            # multiprocessing runs these when a pool worker exits, where
+            # ``atexit`` does not.
+            util.Finalize(None, _detach_all, exitpriority=10)
+            _DETACH_REGISTERED = True
+        return obj
+
+
+class SharedCall:
+    """A callable published through a :class:`Broadcast`, called by handle.
+
+    Pickling it sends the :class:`Shared` handle rather than the callable,
+    so a pool ships the callable's large state once per worker instead of
+    once per batch of tasks.
+    """
+
+    __slots__ = ("shared",)
+
+    def __init__(self, shared: Shared[Callable[..., Any]]) -> None:
+        self.shared = shared
+
+    def __getstate__(self) -> Shared:
+        return self.shared
+
+    def __setstate__(self, shared: Shared) -> None:
+        self.shared = shared
+
+    def __call__(self, *args: Any, **kwargs: Any) -> Any:
+        return self.shared.get()(*args, **kwargs)
+
+
+class Broadcast:
+    """Owner of the shared-memory segments of published objects.
+
+    Args:
+        min_bytes: Arrays smaller than this stay in the skeleton; copying
+            them into the segment saves nothing.
+    """
+
+    def __init__(self, *, min_bytes: int = 1 << 16) -> None:
+        self.min_bytes = min_bytes
+        self._segments: list[shared_memory.SharedMemory] = []
+        self._tokens: list[str] = []
+        self._finalizer = weakref.finalize(self, _release, self._segments, self._tokens)
+
+    @property
+    def nbytes(self) -> int:
+        """Bytes held in shared memory by this broadcast."""
+        return sum(segment.size for segment in self._segments)
+
+    def publish(self, obj: T) -> Shared[T]:
+        """Copy ``obj``'s large arrays into shared memory once; return its handle."""
+        if not self._finalizer.alive:
+            raise ValueError("cannot publish through a closed Broadcast")
+        buf = io.BytesIO()
+        pickler = _SkeletonPickler(buf, self.min_bytes)
+        pickler.dump(obj)
+        token = uuid.uuid4().hex
+        name = None
+        if pickler.arrays:
+            segment = shared_memory.SharedMemory(create=True, size=pickler.size)
+            self._segments.append(segment)
+            for offset, arr in pickler.arrays:
+                view = np.ndarray(arr.shape, dtype=arr.dtype, buffer=segment.buf, offset=offset)
+                view[...] = arr
+                del view
+            name = segment.name
+        _PUBLISHED[token] = obj
+        self._tokens.append(token)
+        return Shared(token, buf.getvalue(), name, pickler.size)
+
+    def share(self, func: Callable[..., Any]) -> SharedCall:
+        """``func`` published, wrapped to be called through its handle."""
+        return SharedCall(self.publish(func))
+
+    def close(self) -> None:
+        """Unlink every segment; workers keep only what they already mapped."""
+        self._finalizer()
+
+    def __enter__(self) -> "Broadcast":
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        self.close()
@@ -18,25 +18,55 @@ window of ``k`` timesteps -> output of ``k`` timesteps) and its output element
 axis / topology must be identical across windows. Every op it is built from must
 declare ``"time"`` in ``chunkable_along`` -- use :func:`assert_time_chunkable`
 to check that from a list of op params before running.
+
+An op that reads neighbouring timesteps (a moving average) is chunkable too, as
+long as every window is read with a ``halo`` of that many extra timesteps on
+each side (:func:`halo_windows`) and the result is trimmed back to the window
+(:func:`trim_halo`). At the ends of the series there is nothing to overlap, and
+the op's own edge handling applies exactly as it would unchunked.
+
+:func:`prefetch_windows` overlaps the two halves of a window: while one is
+being computed, a background thread reads the next ones.
+
+The element axis is the other way to cut. An op that treats every element's
+time series on its own -- statistics, extreme values, filters, a moving
+average -- declares ``"elements"`` in ``chunkable_along``, and a pipeline of
+such ops can run over contiguous row blocks (:func:`element_blocks`,
+:func:`slice_elements`) and have its outputs stacked back
+(:func:`concat_elements`). That keeps whole time series but only a block of
+them, which is the cut for a pipeline that collapses time
+(``extreme_value``) and so cannot be windowed along it.
 """
 
 from __future__ import annotations
 
 __all__ = [
     "time_windows",
+    "halo_windows",
+    "trim_halo",
     "slice_time",
     "concat_time",
     "chunk_map_time",
+    "prefetch_windows",
     "assert_time_chunkable",
+    "element_blocks",
+    "slice_elements",
+    "concat_elements",
+    "chunk_map_elements",
+    "assert_element_chunkable",
 ]
 
-from typing import Callable, Iterable, Iterator, Sequence
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Callable, Iterable, Iterator, Mapping, Sequence
 
 import numpy as np
 
 from cfdmod.adapters.memory import MemoryFieldStore
 from cfdmod.core.data_source import DataSource
+from cfdmod.core.grouping import Grouping
 from cfdmod.core.time_axis import TimeAxis
+from cfdmod.core.topology import ElementMeta, Topology
 
 
 def time_windows(n_timesteps: int, chunk_size: int) -> Iterator[slice]:
@@ -51,6 +81,25 @@ def time_windows(n_timesteps: int, chunk_size: int) -> Iterator[slice]:
         yield slice(start, min(start + chunk_size, n_timesteps))
 
 
+def halo_windows(windows: Iterable[slice], n_timesteps: int, halo: int) -> list[slice]:
+    """Widen each window by ``halo`` timesteps either side, within the series."""
+    if halo < 0:
+        raise ValueError(f"halo must be non-negative; got {halo}")
+    return [slice(max(0, w.start - halo), min(n_timesteps, w.stop + halo)) for w in windows]
+
+
+def trim_halo(ds: DataSource, window: slice, read: slice) -> DataSource:
+    """Cut the result of a widened ``read`` back to its ``window``.
+
+    A time-aggregated ``ds``, or one whose read was not widened, is returned
+    as is.
+    """
+    if ds.time.is_time_aggregated or (read.start, read.stop) == (window.start, window.stop):
+        return ds
+    offset = window.start - read.start
+    return slice_time(ds, slice(offset, offset + window.stop - window.start))
+
+
 def slice_time(ds: DataSource, sl: slice) -> DataSource:
     """Return a windowed copy of ``ds`` over the time slice ``sl``.
 
@@ -124,6 +173,7 @@ def chunk_map_time(
     pipeline: Callable[[DataSource], DataSource],
     *,
     chunk_size: int | None,
+    halo: int = 0,
 ) -> DataSource:
     """Run ``pipeline`` over time windows of ``ds`` and concatenate the results.
 
@@ -131,15 +181,78 @@ def chunk_map_time(
     time-length preserving and time-chunkable (see the module docstring). With
     ``chunk_size`` ``None`` or ``>= n_timesteps`` the pipeline runs once on the
     whole series (identical result, no chunking overhead), so this is a safe
-    drop-in.
+    drop-in. ``halo`` is the total time halo of the pipeline -- the sum of its
+    ops' :meth:`~cfdmod.core.ops.OpParams.time_halo` along the chain.
     """
     n_t = ds.time.n_timesteps
     if chunk_size is None or n_t == 0 or chunk_size >= n_t:
         return pipeline(ds)
-    parts = [pipeline(slice_time(ds, sl)) for sl in time_windows(n_t, chunk_size)]
+    windows = list(time_windows(n_t, chunk_size))
+    parts = [
+        trim_halo(pipeline(slice_time(ds, read)), window, read)
+        for window, read in zip(windows, halo_windows(windows, n_t, halo))
+    ]
     return concat_time(parts)
 
 
+def prefetch_windows(
+    bindings: Mapping[str, DataSource],
+    windows: Iterable[slice],
+    depth: int,
+) -> Iterator[dict[str, DataSource]]:
+    """Yield ``bindings`` sliced to each window, reading up to ``depth`` windows ahead.
+
+    Every time-resolved binding is cut with :func:`slice_time`;
+    time-aggregated ones pass through untouched. With ``depth == 0`` each
+    window is read when it is asked for, exactly as a plain loop would. With
+    ``depth > 0`` one background thread reads windows ahead of the consumer,
+    so reading window ``w + 1`` overlaps computing window ``w`` -- h5py and
+    numpy both release the GIL for the heavy part. One thread is enough:
+    h5py serialises its calls behind a global lock, so more would only queue.
+
+    At most ``depth`` windows are held beyond the one being consumed; price
+    them with ``prefetch`` in :func:`cfdmod.core.memory.plan_chunking`. A
+    read that fails raises from this iterator at its window. Closing it early
+    (a cancelled or failing run) drops the queued reads and waits for the
+    one in flight, so no thread outlives the caller.
+    """
+    if depth < 0:
+        raise ValueError(f"depth must be non-negative; got {depth}")
+
+    def load(sl: slice) -> dict[str, DataSource]:
+        return {
+            name: ds if ds.time.is_time_aggregated else slice_time(ds, sl)
+            for name, ds in bindings.items()
+        }
+
+    if depth == 0:
+        for sl in windows:
+            yield load(sl)
+        return
+
+    remaining = iter(windows)
+    pending: deque[Future] = deque()
+    with ThreadPoolExecutor(max_workers=1, thread_name_prefix="cfdmod-prefetch") as pool:
+        try:
+            # Fill to ``depth``: the head is awaited and yielded, and the one
+            # submitted in its place keeps ``depth`` reads ahead of it.
+            for sl in remaining:
+                pending.append(pool.submit(load, sl))
+                if len(pending) >= depth:
+                    break
+            while pending:
+                window = pending.popleft().result()
+                nxt = next(remaining, None)
+                if nxt is not None:
+                    pending.append(pool.submit(load, nxt))
+                yield window
+                # Let the consumed window go before the next one is awaited.
+                del window
+        finally:
+            for future in pending:
+                future.cancel()
+
+
 def assert_time_chunkable(op_params: Iterable[object]) -> None:
     """Raise if any op in ``op_params`` does not declare ``"time"`` chunkability.
 
@@ -157,3 +270,184 @@ def assert_time_chunkable(op_params: Iterable[object]) -> None:
             "pipeline is not time-chunkable; these ops do not declare "
             f"time chunkability: {offenders}"
         )
+
+
+def element_blocks(n_elements: int, block_size: int) -> Iterator[slice]:
+    """Yield contiguous ``slice`` objects covering ``range(n_elements)``.
+
+    The element-axis counterpart of :func:`time_windows`: the last block is
+    short when ``n_elements`` is not a multiple of ``block_size``.
+    """
+    if block_size <= 0:
+        raise ValueError(f"block_size must be positive; got {block_size}")
+    for start in range(0, max(n_elements, 0), block_size):
+        yield slice(start, min(start + block_size, n_elements))
+
+
+_ELEMENT_COLUMNS = ("position", "area", "volume", "normal")
+
+
+def _slice_topology(topology: Topology | None, sl: slice) -> Topology | None:
+    if topology is None:
+        return None
+    if topology.cell_type == "triangle":
+        # Every block keeps the full vertex array, so stitching the blocks
+        # back together is a plain concatenation of connectivity rows.
+        return Topology.triangles(topology.connectivity[sl], topology.vertices)
+    if topology.cell_type == "point":
+        return Topology.points(topology.vertices[sl])
+    raise ValueError(f"cannot slice a {topology.cell_type!r} topology along elements")
+
+
+def _slice_element_meta(elements: ElementMeta, sl: slice, n_elements: int) -> ElementMeta:
+    columns = {
+        col: None if getattr(elements, col) is None else getattr(elements, col)[sl]
+        for col in _ELEMENT_COLUMNS
+    }
+    annotations = {
+        key: value[sl] if isinstance(value, np.ndarray) and len(value) == n_elements else value
+        for key, value in elements.annotations.items()
+    }
+    return ElementMeta(**columns, annotations=annotations)
+
+
+def slice_elements(ds: DataSource, sl: slice) -> DataSource:
+    """Return a copy of ``ds`` restricted to the contiguous element rows ``sl``.
+
+    Fields are read through ``FieldStore.read(element_slice=...)`` -- for an
+    h5 store, only those rows come off disk -- and materialised into a
+    :class:`MemoryFieldStore`. Topology, element metadata and groupings are
+    cut to the same rows; the time axis is untouched. A groups data source
+    cannot be cut: its parent grouping addresses rows by position.
+    """
+    if ds.kind == "groups":
+        raise ValueError("cannot slice a groups data source along elements")
+    n = ds.n_elements
+    start, stop, step = sl.indices(n)
+    if step != 1:
+        raise ValueError(f"slice_elements expects a contiguous slice (step 1); got step {step}")
+    if stop <= start:
+        raise ValueError(f"empty element block {sl!r} for n_elements={n}")
+    sl = slice(start, stop)
+
+    fields = {
+        name: np.asarray(ds.fields.read(name, element_slice=sl)) for name in ds.fields.keys()
+    }
+    groupings = {
+        name: Grouping(name=g.name, indices=g.indices[sl], id_to_label=g.id_to_label)
+        for name, g in ds.groupings.items()
+    }
+    return ds._copy_validated(
+        fields=MemoryFieldStore(fields),
+        topology=_slice_topology(ds.topology, sl),
+        elements=_slice_element_meta(ds.elements, sl, n),
+        groupings=groupings,
+    )
+
+
+def _concat_topology(parts: Sequence[DataSource]) -> Topology | None:
+    first = parts[0].topology
+    if first is None:
+        return None
+    topologies = [p.topology for p in parts]
+    if first.cell_type == "point":
+        return Topology.points(np.concatenate([t.vertices for t in topologies]))
+    if all(t.vertices is first.vertices for t in topologies):
+        return Topology.triangles(
+            np.concatenate([t.connectivity for t in topologies]), first.vertices
+        )
+    # Blocks that rebuilt their own vertices: stack them and shift each
+    # block's connectivity past the vertices before it.
+    offsets = np.cumsum([0] + [t.n_vertices for t in topologies[:-1]])
+    return Topology.triangles(
+        np.concatenate([t.connectivity + off for t, off in zip(topologies, offsets)]),
+        np.concatenate([t.vertices for t in topologies]),
+    )
+
+
+def _concat_element_meta(parts: Sequence[DataSource]) -> ElementMeta:
+    metas = [p.elements for p in parts]
+    columns = {
+        col: None
+        if getattr(metas[0], col) is None
+        else np.concatenate([getattr(m, col) for m in metas])
+        for col in _ELEMENT_COLUMNS
+    }
+    annotations: dict[str, object] = {}
+    for key, value in metas[0].annotations.items():
+        if isinstance(value, np.ndarray) and len(value) == parts[0].n_elements:
+            annotations[key] = np.concatenate([m.annotations[key] for m in metas])
+        else:
+            annotations[key] = value
+    return ElementMeta(**columns, annotations=annotations)
+
+
+def concat_elements(parts: Sequence[DataSource]) -> DataSource:
+    """Stack the outputs of successive element blocks back into one source.
+
+    ``parts`` must share kind, time axis and field set; only the element
+    axis differs. Fields, topology, element metadata and groupings are
+    concatenated in block order.
+    """
+    if not parts:
+        raise ValueError("concat_elements needs at least one part")
+    if len(parts) == 1:
+        return parts[0]
+
+    template = parts[0]
+    fields = {
+        name: np.concatenate([np.asarray(p.fields.read(name)) for p in parts], axis=0)
+        for name in template.field_names
+    }
+    groupings: dict[str, Grouping] = {}
+    for name, g in template.groupings.items():
+        labels: dict[int, str] = {}
+        for p in parts:
+            labels.update(p.groupings[name].id_to_label or {})
+        groupings[name] = Grouping(
+            name=g.name,
+            indices=np.concatenate([p.groupings[name].indices for p in parts]),
+            id_to_label=labels or None,
+        )
+    return template._copy_validated(
+        fields=MemoryFieldStore(fields),
+        topology=_concat_topology(parts),
+        elements=_concat_element_meta(parts),
+        groupings=groupings,
+        field_meta=dict(template.field_meta),
+    )
+
+
+def chunk_map_elements(
+    ds: DataSource,
+    pipeline: Callable[[DataSource], DataSource],
+    *,
+    block_size: int | None,
+) -> DataSource:
+    """Run ``pipeline`` over element blocks of ``ds`` and stack the results.
+
+    The element-axis counterpart of :func:`chunk_map_time`. ``pipeline``
+    must be element-chunkable (see :func:`assert_element_chunkable`): every
+    output row depends only on the same input row. With ``block_size``
+    ``None`` or ``>= n_elements`` the pipeline runs once on the whole source.
+    """
+    n = ds.n_elements
+    if block_size is None or n == 0 or block_size >= n:
+        return pipeline(ds)
+    return concat_elements(
+        [pipeline(slice_elements(ds, block)) for block in element_blocks(n, block_size)]
+    )
+
+
+def assert_element_chunkable(op_params: Iterable[object]) -> None:
+    """Raise if any op in ``op_params`` does not declare ``"elements"`` chunkability."""
+    offenders = [
+        getattr(p, "kind", type(p).__name__)
+        for p in op_params
+        if "elements" not in getattr(p, "chunkable_along", frozenset())
+    ]
+    if offenders:
+        raise ValueError(
+            "pipeline is not element-chunkable; these ops do not declare "
+            f"element chunkability: {offenders}"
+        )
@@ -25,6 +25,7 @@ from typing import Any, Callable, Generic, Hashable, Iterator, TypeVar
 
 from pydantic import BaseModel, ConfigDict, Field
 
+from cfdmod.core.broadcast import Broadcast
 from cfdmod.core.protocols import Pool
 
 K = TypeVar("K", bound=Hashable)
@@ -104,17 +105,23 @@ class Container(BaseModel, Generic[K, V]):
         func: Callable[[V], Any],
         *,
         pool: Pool | None = None,
+        broadcast: Broadcast | None = None,
     ) -> "Container[K, Any]":
         """Apply ``func`` to every value.
 
         If ``pool`` is supplied, fanout runs through ``pool.map`` and
         the entries' order is preserved by re-zipping with the keys.
         Without a pool the work runs sequentially in insertion order.
+        With ``broadcast`` as well, ``func`` is published to shared
+        memory once and the pool ships its handle instead (see
+        :mod:`cfdmod.core.broadcast`).
         """
         keys = list(self.items.keys())
         values = list(self.items.values())
         if pool is None:
             new_values = [func(v) for v in values]
         else:
+            if broadcast is not None:
+                func = broadcast.share(func)
             new_values = pool.map(func, values)
         return self.__class__(items=dict(zip(keys, new_values)))
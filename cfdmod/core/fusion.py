@@ -0,0 +1,230 @@
+"""Fused, tiled evaluation of consecutive elementwise steps.
+
+A Cp -> Cf -> Cm template is a chain of ops that each read a field and write
+one or more new fields of the same ``(n_elements, n_timesteps)`` shape:
+``sub`` -> ``scale`` -> ``force_contribution`` -> ``moment_contribution``. Run
+one at a time, every step allocates its full-size results -- plus the
+temporaries numpy makes on the way -- and hands them to the next step, which
+reads them back from RAM. On a large surface the chain is memory-bandwidth
+bound long before it is compute bound.
+
+Every value of such a chain depends only on the same ``[element, timestep]``
+of its inputs (and on per-element geometry or a per-timestep reference), so
+the whole chain can instead be evaluated tile by tile: a cache-sized
+``rows x cols`` block of the source goes through every step, and only the
+fields something downstream reads are written, into arrays allocated once.
+The intermediates live for one tile.
+
+An op opts in with two methods on its params, found with ``hasattr`` like
+the other optional runner hooks:
+
+- ``elementwise_tile(fields, tile, ds, rhs) -> {name: array}`` -- the op's
+  results on one :class:`Tile`. ``fields`` maps a field name to its values
+  on the tile; ``ds`` is the chain's source, for per-element geometry
+  (``ds.elements.area[tile.rows]``); ``rhs`` maps a field name to the
+  *whole* array of a binary op's right-hand side, or is ``None``.
+- ``elementwise_meta(meta) -> {name: FieldMeta}`` -- the metadata of the
+  fields it produces, given the metadata so far.
+
+Results are identical to the unfused chain: each op runs the same numpy
+expression on a slice of what it would have seen.
+"""
+
+from __future__ import annotations
+
+__all__ = [
+    "TILE_VALUES",
+    "Tile",
+    "FusedGroup",
+    "tiles",
+    "is_elementwise",
+    "run_fused",
+]
+
+from dataclasses import dataclass
+from typing import Iterator, Mapping, NamedTuple, Sequence
+
+import numpy as np
+
+from cfdmod.core import algebra
+from cfdmod.core.data_source import DataSource
+
+TILE_VALUES = 1 << 15
+"""Values per tile: 128 KiB of float32, a comfortable fit for a core's L2."""
+
+_MAX_TILE_COLS = 4096
+
+
+class Tile(NamedTuple):
+    """One ``rows x cols`` block of an ``(n_elements, n_timesteps)`` field."""
+
+    rows: slice
+    cols: slice
+    shape: tuple[int, int]
+    """Shape of the whole field the tile is cut from."""
+
+
+@dataclass(frozen=True)
+class FusedGroup:
+    """A run of consecutive elementwise steps the runner evaluates as one kernel.
+
+    Attributes:
+        source: The binding the first step reads.
+        steps: Step ids, in pipeline order. Only the last one is bound.
+        kinds: The op kind of each step.
+        fields: Fields materialised on the result, or ``None`` for every field
+            the chain produces (the result is an output, or is read by a step
+            that carries its fields on).
+    """
+
+    source: str
+    steps: tuple[str, ...]
+    kinds: tuple[str, ...]
+    fields: frozenset[str] | None
+
+    def describe(self) -> str:
+        """One line for a log or a CLI."""
+        kept = "all fields" if self.fields is None else ", ".join(sorted(self.fields))
+        return f"fused {' -> '.join(self.steps)} ({' -> '.join(self.kinds)}) keeping {kept}"
+
+
+def tiles(n_rows: int, n_cols: int, tile_values: int = TILE_VALUES) -> Iterator[Tile]:
+    """Yield :class:`Tile` blocks covering an ``(n_rows, n_cols)`` field, row-major."""
+    if tile_values <= 0:
+        raise ValueError(f"tile_values must be positive; got {tile_values}")
+    width = max(1, min(n_cols, _MAX_TILE_COLS, tile_values))
+    height = max(1, tile_values // width)
+    for r in range(0, n_rows, height):
+        rows = slice(r, min(r + height, n_rows))
+        for c in range(0, n_cols, width):
+            yield Tile(rows, slice(c, min(c + width, n_cols)), (n_rows, n_cols))
+
+
+def is_elementwise(params: object) -> bool:
+    """Whether ``params`` (or its class) can run inside a fused kernel."""
+    return hasattr(params, "elementwise_tile") and hasattr(params, "elementwise_meta")
+
+
+class _Whole(Mapping):
+    """Whole field arrays of a data source, read on first use and kept."""
+
+    __slots__ = ("_ds", "_arrays")
+
+    def __init__(self, ds: DataSource) -> None:
+        self._ds = ds
+        self._arrays: dict[str, np.ndarray] = {}
+
+    def __getitem__(self, name: str) -> np.ndarray:
+        arr = self._arrays.get(name)
+        if arr is None:
+            if name not in self._ds.fields.keys():
+                raise KeyError(name)
+            arr = self._arrays[name] = np.asarray(self._ds.fields.read(name))
+        return arr
+
+    def __iter__(self):
+        return iter(self._ds.fields.keys())
+
+    def __len__(self) -> int:
+        return len(self._ds.fields.keys())
+
+
+class _TileView(Mapping):
+    """Field values on one tile: the chain's own results, else the source's."""
+
+    __slots__ = ("_local", "_source", "_tile")
+
+    def __init__(self, local: dict[str, np.ndarray], source: _Whole, tile: Tile) -> None:
+        self._local = local
+        self._source = source
+        self._tile = tile
+
+    def __getitem__(self, name: str) -> np.ndarray:
+        arr = self._local.get(name)
+        if arr is None:
+            arr = self._source[name][self._tile.rows, self._tile.cols]
+        return arr
+
+    def __iter__(self):
+        return iter(set(self._local) | set(self._source))
+
+    def __len__(self) -> int:
+        return len(set(self._local) | set(self._source))
+
+
+def _can_fuse(ds: DataSource, steps: Sequence[tuple[object, DataSource | None]]) -> bool:
+    """Every field the chain reads from ``ds`` is a full time-resolved field."""
+    if ds.time.is_time_aggregated or ds.time.n_timesteps == 0 or ds.n_elements == 0:
+        return False
+    shape = (ds.n_elements, ds.time.n_timesteps)
+    produced: set[str] = set()
+    for params, rhs in steps:
+        for name in params.consumed_fields() - produced:
+            if name not in ds.fields.keys() or tuple(ds.fields.shape(name)) != shape:
+                return False
+        if rhs is not None:
+            # A binary op reads the same field names off its rhs.
+            for name in params.consumed_fields():
+                if name not in rhs.fields.keys():
+                    return False
+                rhs_shape = tuple(rhs.fields.shape(name))
+                try:
+                    rule = algebra.classify_broadcast(shape, rhs_shape)
+                except ValueError:
+                    return False
+                if rule == "row" and len(rhs_shape) != 1:
+                    return False
+        produced |= params.produced_fields()
+    return True
+
+
+def run_fused(
+    ds: DataSource,
+    steps: Sequence[tuple[object, DataSource | None]],
+    keep: frozenset[str] | None = None,
+    *,
+    tile_values: int = TILE_VALUES,
+) -> DataSource | None:
+    """Evaluate a chain of elementwise steps over ``ds`` tile by tile.
+
+    ``steps`` is the chain in order, each op's params paired with its bound
+    right-hand side (``None`` for a unary op). ``keep`` names the produced
+    fields to materialise on the result (``None``: all of them); the rest
+    exist only one tile at a time. The result is ``ds`` with the kept fields
+    added, as the unfused chain's last step would have returned it.
+
+    Returns ``None`` when the chain does not fit the fused model on this
+    source -- a field it reads is missing or time-aggregated -- so the caller
+    can run the steps one by one and let the op raise its own error.
+    """
+    if not _can_fuse(ds, steps):
+        return None
+
+    meta = dict(ds.field_meta)
+    produced: list[str] = []
+    for params, _ in steps:
+        for name, field_meta in params.elementwise_meta(meta).items():
+            meta[name] = field_meta
+            if name not in produced:
+                produced.append(name)
+    kept = [name for name in produced if keep is None or name in keep]
+
+    source = _Whole(ds)
+    rhs_fields = [None if rhs is None else _Whole(rhs) for _, rhs in steps]
+    out: dict[str, np.ndarray] = {}
+    n_rows, n_cols = ds.n_elements, ds.time.n_timesteps
+    for tile in tiles(n_rows, n_cols, tile_values):
+        local: dict[str, np.ndarray] = {}
+        view = _TileView(local, source, tile)
+        for (params, _), rhs in zip(steps, rhs_fields):
+            local.update(params.elementwise_tile(view, tile, ds, rhs))
+        for name in kept:
+            value = local[name]
+            if name not in out:
+                out[name] = np.empty((n_rows, n_cols), dtype=value.dtype)
+            out[name][tile.rows, tile.cols] = value
+
+    result = ds
+    for name in kept:
+        result = result.with_field(name, out[name], meta=meta[name])
+    return result
@@ -10,6 +10,9 @@ This module provides:
 - :class:`Grouping` -- a frozen view over the per-element index plus an
   optional ``id_to_label`` mapping for human-readable group names.
 - helpers (:func:`groups_in`, :func:`elements_in_group`) shared by ops.
+- :class:`GroupReducer` -- the aggregation engine behind the grouping
+  ops: one sparse (groups x elements) operator per grouping, reused for
+  every field reduced over it.
 
 The :class:`GroupsDataSource` (in ``data_source.py``) is a *separate*
 concept: it carries one row per group rather than one row per element,
@@ -24,6 +27,8 @@ __all__ = [
     "elements_in_group",
     "AggregationKind",
     "aggregate_rows",
+    "group_rows",
+    "GroupReducer",
 ]
 
 from typing import Any, Literal
@@ -33,6 +38,11 @@ from pydantic import BaseModel, ConfigDict, field_validator
 
 AggregationKind = Literal["mean", "sum", "max", "min", "area_weighted_mean"]
 
+# ``ufunc.reduceat`` along axis 0 runs one inner loop per (group, column)
+# pair, so for wide time series it loses to one vectorised reduce per
+# contiguous group slice. Past this many columns GroupReducer slices instead.
+_REDUCEAT_MAX_COLUMNS = 32
+
 
 class Grouping(BaseModel):
     """One grouping over a data source's element axis.
@@ -131,3 +141,159 @@ def aggregate_rows(
             return float((sub * w).sum() / total)
         return (sub * w[:, None]).sum(axis=0) / total
     raise ValueError(f"unknown aggregation {agg!r}")
+
+
+def group_rows(indices: np.ndarray, group_ids: np.ndarray) -> np.ndarray:
+    """Row of each element's group in ``group_ids``, or ``-1``.
+
+    ``indices`` holds one group id per element (as in
+    :attr:`Grouping.indices`); ``group_ids`` lists the groups in row
+    order. Elements whose id is not listed -- including the ``-1``
+    ungrouped sentinel, unless listed -- map to ``-1``. Ids are matched
+    by binary search, so the cost does not depend on how large or sparse
+    the ids are.
+    """
+    indices = np.asarray(indices)
+    group_ids = np.asarray(group_ids)
+    rows = np.full(indices.shape, -1, dtype=np.int64)
+    if group_ids.size == 0:
+        return rows
+    order = np.argsort(group_ids, kind="stable")
+    sorted_ids = group_ids[order]
+    pos = np.searchsorted(sorted_ids, indices)
+    pos_safe = np.minimum(pos, sorted_ids.size - 1)
+    hit = sorted_ids[pos_safe] == indices
+    rows[hit] = order[pos_safe[hit]]
+    return rows
+
+
+class GroupReducer:
+    """Reduce per-element arrays to per-group rows in one pass.
+
+    Built once per grouping and reused for every field: the element ->
+    group assignment is sorted into CSR layout (``indptr`` / ``members``)
+    up front. ``sum``, ``mean`` and ``area_weighted_mean`` become one
+    sparse (groups x elements) weight matrix applied with a single
+    sparse-dense product; ``min`` and ``max`` are a ``reduceat`` over
+    the elements gathered in group order. Results match
+    :func:`aggregate_rows` called once per group, without the
+    per-group ``flatnonzero`` scan.
+
+    Attributes:
+        n_groups: Number of output rows.
+        n_elements: Length of the element axis reduced over.
+        indptr: ``(n_groups + 1,)`` offsets into :attr:`members`.
+        members: Element indices sorted by group row (stable, so each
+            group keeps ascending element order).
+    """
+
+    __slots__ = ("n_groups", "n_elements", "indptr", "members", "_rows")
+
+    def __init__(self, rows: np.ndarray, n_groups: int) -> None:
+        """
+        Args:
+            rows: ``(n_elements,)`` output row of each element; ``-1``
+                drops the element from every group.
+            n_groups: Number of output rows. Rows with no elements are
+                allowed (see :meth:`reduce` for what each kind yields).
+        """
+        rows = np.asarray(rows, dtype=np.int64)
+        if rows.ndim != 1:
+            raise ValueError(f"GroupReducer rows must be 1-D; got shape {rows.shape}")
+        if rows.size and int(rows.max()) >= n_groups:
+            raise ValueError(f"GroupReducer row {int(rows.max())} out of range for {n_groups}")
+        self.n_groups = int(n_groups)
+        self.n_elements = int(rows.size)
+        grouped = np.flatnonzero(rows >= 0)
+        order = np.argsort(rows[grouped], kind="stable")
+        self.members = grouped[order]
+        self._rows = rows[self.members]
+        counts = np.bincount(self._rows, minlength=self.n_groups)
+        self.indptr = np.zeros(self.n_groups + 1, dtype=np.int64)
+        np.cumsum(counts, out=self.indptr[1:])
+
+    @classmethod
+    def for_grouping(cls, grouping: Grouping, group_ids: np.ndarray | None = None) -> GroupReducer:
+        """Reducer with one row per id in ``group_ids``.
+
+        ``group_ids`` defaults to :func:`groups_in` (sorted, ungrouped
+        excluded) -- the row order ``field_series_for_groups`` emits.
+        """
+        if group_ids is None:
+            group_ids = groups_in(grouping)
+        return cls(group_rows(grouping.indices, group_ids), int(np.asarray(group_ids).size))
+
+    @property
+    def counts(self) -> np.ndarray:
+        """``(n_groups,)`` number of elements in each group."""
+        return np.diff(self.indptr)
+
+    def weight_matrix(
+        self, agg: AggregationKind, weights: np.ndarray | None = None, dtype: Any = np.float64
+    ):
+        """Sparse CSR ``(n_groups, n_elements)`` operator for a linear ``agg``.
+
+        ``sum`` weighs each member by 1, ``mean`` by ``1 / count`` and
+        ``area_weighted_mean`` by ``area / group_area``. Raises the same
+        errors as :func:`aggregate_rows` for a missing ``weights`` or a
+        group with non-positive total area.
+        """
+        from scipy import sparse
+
+        counts = self.counts
+        if agg == "sum":
+            data = np.ones(self.members.size, dtype=np.float64)
+        elif agg == "mean":
+            with np.errstate(divide="ignore"):
+                data = (1.0 / counts)[self._rows]
+        elif agg == "area_weighted_mean":
+            if weights is None:
+                raise ValueError("area_weighted_mean requires per-element weights (areas)")
+            w = np.asarray(weights, dtype=np.float64)[self.members]
+            totals = np.bincount(self._rows, weights=w, minlength=self.n_groups)
+            if np.any(totals <= 0):
+                raise ValueError("area_weighted_mean: total area is non-positive")
+            data = w / totals[self._rows]
+        else:
+            raise ValueError(f"{agg!r} is not a linear aggregation")
+        return sparse.csr_matrix(
+            (data.astype(dtype, copy=False), self.members, self.indptr),
+            shape=(self.n_groups, self.n_elements),
+        )
+
+    def reduce(
+        self, arr: np.ndarray, agg: AggregationKind, weights: np.ndarray | None = None
+    ) -> np.ndarray:
+        """Reduce ``arr`` (``(n_elements,)`` or ``(n_elements, n_t)``) per group.
+
+        Floating inputs keep their dtype; anything else is reduced in
+        float64. An empty group yields 0 for ``sum`` and NaN for
+        ``mean``; ``min`` / ``max`` / ``area_weighted_mean`` raise, as
+        the per-group numpy reductions do.
+        """
+        arr = np.asarray(arr)
+        if arr.shape[:1] != (self.n_elements,):
+            raise ValueError(
+                f"GroupReducer expects {self.n_elements} elements on axis 0; got {arr.shape}"
+            )
+        if agg not in ("sum", "mean", "area_weighted_mean", "min", "max"):
+            raise ValueError(f"unknown aggregation {agg!r}")
+        dtype = arr.dtype if np.issubdtype(arr.dtype, np.floating) else np.dtype(np.float64)
+        cols = arr.reshape(self.n_elements, -1).astype(dtype, copy=False)
+        if agg in ("min", "max"):
+            if np.any(self.counts == 0):
+                raise ValueError(f"{agg}: cannot reduce an empty group")
+            ufunc = np.minimum if agg == "min" else np.maximum
+            ordered = cols[self.members]
+            if cols.shape[1] <= _REDUCEAT_MAX_COLUMNS:
+                out = ufunc.reduceat(ordered, self.indptr[:-1], axis=0)
+            else:
+                out = np.empty((self.n_groups, cols.shape[1]), dtype=dtype)
+                for row, (lo, hi) in enumerate(zip(self.indptr[:-1], self.indptr[1:])):
+                    ufunc.reduce(ordered[lo:hi], axis=0, out=out[row])
+        else:
+            matrix = self.weight_matrix(agg, weights, dtype=dtype)
+            out = np.asarray(matrix @ cols, dtype=dtype)
+            if agg == "mean":
+                out[self.counts == 0] = np.nan
+        return out.reshape((self.n_groups,) + arr.shape[1:])
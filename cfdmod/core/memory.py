@@ -1,4 +1,4 @@
-"""Turn a RAM budget into a time-chunk size.
+"""Turn a RAM budget into a time-chunk (or element-block) size.
 
 :mod:`cfdmod.core.chunked` can stream a time-preserving pipeline over windows of
 the time axis so peak memory is ``O(n_elements * chunk)`` rather than
@@ -12,6 +12,26 @@ The arithmetic is deliberately simple, and deliberately an estimate:
     live at any time  = n_live_arrays columns          (input + intermediates)
     chunk_size        = budget / (n_elements * itemsize * n_live_arrays)
 
+With read-ahead (``prefetch`` windows, see
+:func:`cfdmod.core.chunked.prefetch_windows`), each prefetched window holds
+another ``n_prefetch_arrays`` columns per timestep, and the window shrinks to
+pay for them. A pipeline with a time ``halo`` (a moving average reading
+neighbouring samples) reads ``chunk + 2 * halo`` timesteps per window, and the
+window shrinks by the overlap.
+
+The same budget can be spent the other way round (``axis="elements"``): a block
+of whole time series instead of a window of whole element columns, for
+pipelines that collapse time and so cannot be windowed (see
+:func:`cfdmod.core.chunked.slice_elements`). The arithmetic swaps its axes:
+
+    one element row   = n_timesteps * itemsize            bytes
+    block_size        = budget / (n_timesteps * itemsize * n_live_arrays)
+
+Element blocks need no halo and are not read ahead.
+
+A run that dispatches windows to a pool holds ``concurrent`` of them at once,
+and every window is priced that many times over.
+
 ``n_live_arrays`` is the count of time-resolved arrays alive at the widest point
 of the pipeline. It is not knowable exactly -- numpy temporaries inside an op,
 copies an adapter makes on read -- so this is a *lower bound on the cost* and
@@ -26,6 +46,7 @@ cheap enough to call before deciding whether to run at all.
 from __future__ import annotations
 
 __all__ = [
+    "ChunkAxis",
     "ChunkPlan",
     "DEFAULT_SAFETY_FACTOR",
     "bytes_per_timestep",
@@ -35,11 +56,15 @@ __all__ = [
 ]
 
 from dataclasses import dataclass
+from typing import Literal
 
 import numpy as np
 
 from cfdmod.core.dtypes import FIELD_DTYPE
 
+ChunkAxis = Literal["time", "elements"]
+"""Which axis a :class:`ChunkPlan` cuts."""
+
 DEFAULT_SAFETY_FACTOR = 0.8
 """Fraction of the stated budget the planner will actually spend.
 
@@ -57,8 +82,9 @@ class ChunkPlan:
     answer it.
 
     Attributes:
-        chunk_size: Timesteps per window. Equal to ``n_timesteps`` when the
-            whole series fits, in which case chunking is a no-op.
+        chunk_size: Timesteps per window -- or, on the ``elements`` axis,
+            elements per block. Equal to the axis length when everything
+            fits, in which case chunking is a no-op.
         n_timesteps: The full time axis length this was planned against.
         n_elements: Elements on the source.
         n_live_arrays: How many time-resolved arrays the plan assumed are
@@ -68,9 +94,19 @@ class ChunkPlan:
         budget_bytes: The budget the plan was derived from, or ``None`` when
             the chunk size was given directly.
         clamped: True when the arithmetic asked for something outside
-            ``[1, n_timesteps]`` and the plan was pinned to the bound. A
+            ``[1, axis length]`` and the plan was pinned to the bound. A
             ``clamped`` plan at ``chunk_size == 1`` means the budget does not
-            actually fit a single timestep and the run will exceed it.
+            actually fit a single timestep (element) and the run will exceed
+            it.
+        prefetch: Windows read ahead of the one being computed.
+        n_prefetch_arrays: Time-resolved arrays each prefetched window holds
+            (one per time-resolved input).
+        halo: Extra timesteps read on each side of a window so windowed ops
+            see the neighbours they need. Priced only when chunked.
+        axis: ``"time"`` (windows of timesteps) or ``"elements"`` (blocks of
+            element rows).
+        concurrent: Windows in flight at once when they run on a pool.
+            Priced only when chunked.
     """
 
     chunk_size: int
@@ -81,20 +117,32 @@ class ChunkPlan:
     estimated_peak_bytes: int
     budget_bytes: int | None = None
     clamped: bool = False
+    prefetch: int = 0
+    n_prefetch_arrays: int = 0
+    halo: int = 0
+    axis: ChunkAxis = "time"
+    concurrent: int = 1
+
+    @property
+    def axis_length(self) -> int:
+        """Length of the axis this plan cuts."""
+        return self.n_elements if self.axis == "elements" else self.n_timesteps
 
     @property
     def is_chunked(self) -> bool:
-        """Whether this plan actually splits the time axis."""
-        return 0 < self.chunk_size < self.n_timesteps
+        """Whether this plan actually splits its axis."""
+        return 0 < self.chunk_size < self.axis_length
 
     @property
     def exceeds_budget(self) -> bool:
-        """True when even one timestep does not fit the budget."""
+        """True when even one timestep (element) does not fit the budget."""
         return self.budget_bytes is not None and self.estimated_peak_bytes > self.budget_bytes
 
     def describe(self) -> str:
         """One line for a log or a CLI, in units a human reads."""
         peak_mb = self.estimated_peak_bytes / 1e6
+        if self.axis == "elements":
+            return self._describe_elements(peak_mb)
         if not self.is_chunked:
             return (
                 f"time chunking: off (whole series of {self.n_timesteps} steps in one pass, "
@@ -102,9 +150,27 @@ class ChunkPlan:
             )
         n_windows = -(-self.n_timesteps // self.chunk_size)
         note = " -- BUDGET EXCEEDED, one timestep does not fit" if self.exceeds_budget else ""
+        ahead = f", {self.prefetch} prefetched" if self.prefetch else ""
+        ahead += f", halo {self.halo}" if self.halo else ""
+        ahead += f", {self.concurrent} concurrent" if self.concurrent > 1 else ""
         return (
             f"time chunking: {self.chunk_size} steps x {n_windows} windows "
-            f"({self.n_elements} elements, {self.n_live_arrays} live arrays, "
+            f"({self.n_elements} elements, {self.n_live_arrays} live arrays{ahead}, "
+            f"est. peak {peak_mb:.0f} MB){note}"
+        )
+
+    def _describe_elements(self, peak_mb: float) -> str:
+        if not self.is_chunked:
+            return (
+                f"element chunking: off (all {self.n_elements} elements in one pass, "
+                f"est. peak {peak_mb:.0f} MB)"
+            )
+        n_blocks = -(-self.n_elements // self.chunk_size)
+        note = " -- BUDGET EXCEEDED, one element does not fit" if self.exceeds_budget else ""
+        ahead = f", {self.concurrent} concurrent" if self.concurrent > 1 else ""
+        return (
+            f"element chunking: {self.chunk_size} elements x {n_blocks} blocks "
+            f"({self.n_timesteps} steps, {self.n_live_arrays} live arrays{ahead}, "
             f"est. peak {peak_mb:.0f} MB){note}"
         )
 
@@ -176,6 +242,11 @@ def plan_chunking(
     n_live_arrays: int = 1,
     dtype=FIELD_DTYPE,
     safety_factor: float = DEFAULT_SAFETY_FACTOR,
+    prefetch: int = 0,
+    n_prefetch_arrays: int = 1,
+    halo: int = 0,
+    axis: ChunkAxis = "time",
+    concurrent: int = 1,
 ) -> ChunkPlan:
     """Build a :class:`ChunkPlan` from a budget, or price an explicit chunk size.
 
@@ -183,6 +254,18 @@ def plan_chunking(
     the plan is the whole series in one pass, still carrying a peak estimate --
     which is useful on its own: it is the number that says whether chunking is
     worth turning on.
+
+    ``prefetch`` windows of ``n_prefetch_arrays`` arrays each are added to
+    the cost of a window, so a budgeted plan with read-ahead picks a smaller
+    window rather than a larger peak. Likewise ``halo`` timesteps either side
+    of a chunked window: a budget pays for ``chunk + 2 * halo``.
+
+    With ``axis="elements"`` the plan is for blocks of element rows, each
+    carrying the whole time axis; ``chunk_size`` is then elements per block,
+    and ``prefetch`` / ``halo`` must be zero.
+
+    ``concurrent`` windows held at once (a run on a pool) multiply the cost
+    of a window; like the halo, they are paid only when the axis is cut.
     """
     if budget_bytes is not None and chunk_size is not None:
         raise ValueError("pass budget_bytes or chunk_size, not both")
@@ -190,33 +273,68 @@ def plan_chunking(
         raise ValueError(f"n_timesteps must be non-negative; got {n_timesteps}")
     if not 0 < safety_factor <= 1:
         raise ValueError(f"safety_factor must be in (0, 1]; got {safety_factor}")
+    if prefetch < 0:
+        raise ValueError(f"prefetch must be non-negative; got {prefetch}")
+    if n_prefetch_arrays < 0:
+        raise ValueError(f"n_prefetch_arrays must be non-negative; got {n_prefetch_arrays}")
+    if halo < 0:
+        raise ValueError(f"halo must be non-negative; got {halo}")
+    if axis not in ("time", "elements"):
+        raise ValueError(f"axis must be 'time' or 'elements'; got {axis!r}")
+    if axis == "elements" and (prefetch or halo):
+        raise ValueError("element blocks take no prefetch or halo")
+    if n_elements < 0:
+        raise ValueError(f"n_elements must be non-negative; got {n_elements}")
+    if concurrent < 1:
+        raise ValueError(f"concurrent must be at least 1; got {concurrent}")
 
     itemsize = _itemsize(dtype)
-    unit = bytes_per_timestep(n_elements, n_live_arrays=n_live_arrays, dtype=dtype)
+    n_prefetch_arrays = int(n_prefetch_arrays) if prefetch else 0
+    # ``length`` is the axis being cut; one unit of it spans ``width`` values
+    # in every live array.
+    length, width = (n_elements, n_timesteps) if axis == "elements" else (n_timesteps, n_elements)
+    unit = bytes_per_timestep(
+        width, n_live_arrays=n_live_arrays + prefetch * n_prefetch_arrays, dtype=dtype
+    )
+    # What every window costs once ``concurrent`` of them are in flight.
+    unit_in_flight = unit * int(concurrent)
     clamped = False
 
     if chunk_size is not None:
         if chunk_size < 1:
             raise ValueError(f"chunk_size must be positive; got {chunk_size}")
-        resolved = min(int(chunk_size), n_timesteps) if n_timesteps else int(chunk_size)
+        resolved = min(int(chunk_size), length) if length else int(chunk_size)
         clamped = resolved != int(chunk_size)
     elif budget_bytes is not None:
         if budget_bytes <= 0:
             raise ValueError(f"budget_bytes must be positive; got {budget_bytes}")
-        # unit == 0 only when there are no elements, in which case any window fits.
-        raw = n_timesteps if unit == 0 else int(budget_bytes * safety_factor) // unit
-        resolved = max(1, min(raw, n_timesteps)) if n_timesteps else max(1, raw)
+        # unit == 0 only when the other axis is empty, in which case any window fits.
+        spendable = int(budget_bytes * safety_factor)
+        raw = length if unit == 0 else spendable // unit
+        # The whole series needs no halo and runs alone; any shorter window
+        # pays for two halos and shares the budget with its concurrent peers.
+        if raw < length:
+            raw = spendable // unit_in_flight - 2 * halo
+        resolved = max(1, min(raw, length)) if length else max(1, raw)
         clamped = raw != resolved
     else:
-        resolved = n_timesteps
+        resolved = length
 
+    chunked = 0 < resolved < length
+    halo = int(halo) if chunked else 0
+    concurrent = int(concurrent) if chunked else 1
     return ChunkPlan(
         chunk_size=resolved,
         n_timesteps=int(n_timesteps),
         n_elements=int(n_elements),
         n_live_arrays=int(n_live_arrays),
         itemsize=itemsize,
-        estimated_peak_bytes=unit * resolved,
+        estimated_peak_bytes=unit * concurrent * min(resolved + 2 * halo, length or resolved),
         budget_bytes=budget_bytes,
         clamped=clamped,
+        prefetch=int(prefetch),
+        n_prefetch_arrays=n_prefetch_arrays,
+        halo=halo,
+        axis=axis,
+        concurrent=concurrent,
     )
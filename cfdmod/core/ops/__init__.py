@@ -28,6 +28,7 @@ from typing import Callable, ClassVar, Literal
 from pydantic import BaseModel, ConfigDict
 
 from cfdmod.core.data_source import DataSource, DataSourceKind
+from cfdmod.core.time_axis import TimeAxis
 
 OpKind = Literal["time", "geometric", "source_create", "field"]
 
@@ -61,7 +62,14 @@ class OpParams(BaseModel):
 
     :meth:`consumed_fields` / :meth:`produced_fields` derive the field
     names from the bound params (``field`` / ``out``); ops with a
-    non-standard field shape override them.
+    non-standard field shape override them. :meth:`time_halo` /
+    :meth:`output_time` do the same for the time axis, for the chunked
+    runner.
+
+    An op whose expensive part depends only on geometry (a mesh load, a
+    face cut, a grouping) may also define ``prepare_geometry(ds)`` and
+    ``apply_geometry(ds, prepared)``. The chunked runner then prepares
+    once per run and applies per time window.
     """
 
     # extra="forbid" so a typo'd step field in a YAML template (e.g.
@@ -106,6 +114,25 @@ class OpParams(BaseModel):
             return frozenset({out})
         return self.consumed_fields()
 
+    def time_halo(self, time: TimeAxis) -> int:
+        """Timesteps either side of an output sample that the op reads.
+
+        Default: ``0`` -- the op is pointwise in time. A windowed op (a
+        moving average) overrides this so a chunked run can overlap its
+        time windows by the halo and still declare ``"time"``
+        chunkability. ``time`` is the op's input time axis.
+        """
+        return 0
+
+    def output_time(self, time: TimeAxis) -> TimeAxis:
+        """The time axis this op produces from ``time``, for static planning.
+
+        Default: unchanged. Only ops that change the timestep size need
+        to override it, so the planner prices a downstream
+        :meth:`time_halo` in the right units.
+        """
+        return time
+
 
 # Op signatures. Each op is a single-arg callable on DataSource produced by
 # binding params via functools.partial -- the recipe constructs the binding,
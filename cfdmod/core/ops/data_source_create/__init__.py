@@ -20,11 +20,13 @@ from __future__ import annotations
 __all__ = [
     "StatisticsParams",
     "compute_statistics",
+    "MomentAccumulator",
     "ExtremeValueParams",
     "extreme_value",
     "moving_filter",
     "reescale_event_duration_peak",
     "gumbel_extreme_value_1d",
+    "gumbel_extreme_value_2d",
     "FaceCutParams",
     "face_cut",
     "FieldSeriesForGroupsParams",
@@ -41,12 +43,14 @@ __all__ = [
     "probe_extraction",
     "ProfileInterpolationParams",
     "profile_interpolation",
+    "linear_interp_matrix",
 ]
 
 from cfdmod.core.ops.data_source_create.extreme_value import (
     ExtremeValueParams,
     extreme_value,
     gumbel_extreme_value_1d,
+    gumbel_extreme_value_2d,
     moving_filter,
     reescale_event_duration_peak,
 )
@@ -77,6 +81,11 @@ from cfdmod.core.ops.data_source_create.probe_extraction import (
 )
 from cfdmod.core.ops.data_source_create.profile_interpolation import (
     ProfileInterpolationParams,
+    linear_interp_matrix,
     profile_interpolation,
 )
-from cfdmod.core.ops.data_source_create.statistics import StatisticsParams, compute_statistics
+from cfdmod.core.ops.data_source_create.statistics import (
+    MomentAccumulator,
+    StatisticsParams,
+    compute_statistics,
+)
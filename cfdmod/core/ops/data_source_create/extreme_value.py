@@ -16,7 +16,10 @@ estimators that ``compute_statistics`` deliberately does not:
   is the population standard deviation of the fluctuation (``ddof=0``,
   matching the legacy HFPI convention).
 
-The pure-numpy helpers (:func:`moving_filter`,
+The op runs every element through the batched
+:func:`gumbel_extreme_value_2d`, which matches the per-series
+:func:`gumbel_extreme_value_1d` without a scipy fit per element. The
+pure-numpy helpers (:func:`moving_filter`,
 :func:`reescale_event_duration_peak`, :func:`gumbel_extreme_value_1d`)
 were ported from the former legacy HFPI ``common`` module. The port is
 faithful except for one deliberate correction: the Gumbel sub-window
@@ -35,6 +38,7 @@ __all__ = [
     "moving_filter",
     "reescale_event_duration_peak",
     "gumbel_extreme_value_1d",
+    "gumbel_extreme_value_2d",
 ]
 
 from typing import ClassVar, Literal
@@ -59,15 +63,32 @@ def moving_filter(hist_series: np.ndarray, dt: float, peak_duration: float) -> n
     """
     from scipy.signal import convolve
 
+    window_size = _peak_window(hist_series.size, dt, peak_duration)
+    kernel = np.ones(window_size) / window_size
+    return convolve(hist_series, kernel, mode="valid")
+
+
+def _peak_window(n_timesteps: int, dt: float, peak_duration: float) -> int:
     window_size = max(int(peak_duration / dt), 1)
-    if window_size > hist_series.size:
+    if window_size > n_timesteps:
         raise ValueError(
             f"peak-window size {window_size} (peak_duration={peak_duration}, dt={dt}) "
-            f"exceeds the series length {hist_series.size}; use a shorter peak_duration "
+            f"exceeds the series length {n_timesteps}; use a shorter peak_duration "
             "or a longer record"
         )
-    kernel = np.ones(window_size) / window_size
-    return convolve(hist_series, kernel, mode="valid")
+    return window_size
+
+
+def _check_subdivisions(
+    n_smoothed: int, n_timesteps: int, dt: float, peak_duration: float, n_subdivisions: int
+) -> None:
+    if n_smoothed < n_subdivisions:
+        raise ValueError(
+            f"smoothed series length {n_smoothed} is shorter than "
+            f"n_subdivisions={n_subdivisions} (series length {n_timesteps}, "
+            f"peak_duration={peak_duration}, dt={dt}); use a longer record, a smaller "
+            "peak_duration, or fewer subdivisions"
+        )
 
 
 def reescale_event_duration_peak(
@@ -103,13 +124,7 @@ def gumbel_extreme_value_1d(
         raise ValueError("gumbel_extreme_value_1d works only on 1-D arrays")
 
     smoothed_parent = moving_filter(hist_series, dt, peak_duration)
-    if smoothed_parent.size < n_subdivisions:
-        raise ValueError(
-            f"smoothed series length {smoothed_parent.size} is shorter than "
-            f"n_subdivisions={n_subdivisions} (series length {hist_series.size}, "
-            f"peak_duration={peak_duration}, dt={dt}); use a longer record, a smaller "
-            "peak_duration, or fewer subdivisions"
-        )
+    _check_subdivisions(smoothed_parent.size, hist_series.size, dt, peak_duration, n_subdivisions)
     sub_arrays = np.array_split(smoothed_parent, n_subdivisions)
     # The block-maxima come from the smoothed series (valid-mode
     # convolution drops the w-1 partial-window edge samples), so the
@@ -139,6 +154,129 @@ def gumbel_extreme_value_1d(
     return float(gumbel_l.ppf(1 - non_exceedance_probability, loc=loc, scale=scale))
 
 
+def gumbel_extreme_value_2d(
+    values: np.ndarray,
+    dt: float,
+    peak_duration: float,
+    event_duration: float,
+    extreme_type: Literal["min", "max"],
+    n_subdivisions: int = 10,
+    non_exceedance_probability: float = 0.78,
+) -> np.ndarray:
+    """Gumbel extreme-value estimate for every row of ``(n_rows, n_timesteps)``.
+
+    The batched form of :func:`gumbel_extreme_value_1d`, which it matches to
+    ~1e-9 relative: the smoothing is a cumulative-sum moving average, the
+    block extremes follow ``np.array_split``'s block sizes through two
+    reshape-and-reduce passes, and the Gumbel MLE is a safeguarded Newton
+    iteration on the scale equation run for all rows at once. A ``min`` is
+    the negated ``max`` of the negated series, which is exactly what the
+    ``gumbel_l`` fit and quantile reduce to. Rows whose block extremes are
+    all equal (a constant series) have a zero-scale fit and return that
+    value, where the ``scipy`` fit degenerates to ``inf``. A row holding a
+    non-finite sample raises ``ValueError``, as the ``scipy`` fit does.
+    """
+    if values.ndim != 2:
+        raise ValueError("gumbel_extreme_value_2d works only on 2-D arrays")
+    n_rows, n_timesteps = values.shape
+    window_size = _peak_window(n_timesteps, dt, peak_duration)
+    n_smoothed = n_timesteps - window_size + 1
+    _check_subdivisions(n_smoothed, n_timesteps, dt, peak_duration, n_subdivisions)
+    if n_rows == 0:
+        return np.empty(0)
+
+    sign = 1.0 if extreme_type == "max" else -1.0
+    # Centring first keeps the running sum, and so its cancellation error,
+    # at the scale of the fluctuation rather than of the mean.
+    # (inf - inf on a non-finite row is reported below, not warned about.)
+    with np.errstate(invalid="ignore"):
+        mean = values.mean(axis=1, dtype=np.float64, keepdims=True)
+        centred = np.subtract(values, mean)
+        if sign < 0:
+            np.negative(centred, out=centred)
+        csum = np.zeros((n_rows, n_timesteps + 1))
+        np.cumsum(centred, axis=1, out=csum[:, 1:])
+        del centred
+        smoothed = csum[:, window_size:]
+        smoothed -= csum[:, :n_smoothed]
+        smoothed /= window_size
+
+    # np.array_split gives the first n_smoothed % n_subdivisions blocks one
+    # extra sample.
+    short, n_long = divmod(n_smoothed, n_subdivisions)
+    split = n_long * (short + 1)
+    v_peak = np.concatenate(
+        [
+            smoothed[:, :split].reshape(n_rows, n_long, short + 1).max(axis=2),
+            smoothed[:, split:].reshape(n_rows, n_subdivisions - n_long, short).max(axis=2),
+        ],
+        axis=1,
+    )
+
+    # A non-finite sample spreads through the mean and the running sum to the
+    # whole row, so its block extremes show it; reject it as the scipy fit of
+    # the per-series path does rather than write NaN for the element.
+    bad = ~np.isfinite(v_peak).all(axis=1)
+    if bad.any():
+        raise ValueError(
+            f"The data contains non-finite values (rows {np.flatnonzero(bad)[:10].tolist()})."
+        )
+    loc, scale = _gumbel_r_fit_rows(v_peak)
+    orig_time_duration = n_smoothed * dt / n_subdivisions
+    loc, scale = reescale_event_duration_peak(
+        loc, scale, orig_time_duration, event_duration, "max"
+    )
+    quantile = loc - scale * np.log(-np.log(non_exceedance_probability))
+    return sign * quantile + mean[:, 0]
+
+
+def _gumbel_r_fit_rows(
+    x: np.ndarray, rtol: float = 1e-12, max_iter: int = 100
+) -> tuple[np.ndarray, np.ndarray]:
+    """Row-wise ``gumbel_r`` maximum-likelihood ``(loc, scale)``.
+
+    Solves the scale equation ``f(a) = a + sum(y w) / sum(w) = 0`` with
+    ``w = exp(-y / a)`` on each row's centred sample ``y``. ``f`` increases
+    with slope ``1 + var_w(y) / a**2`` and has its root in ``(0, -min(y)]``,
+    so Newton steps that leave the shrinking bracket fall back to bisection.
+    """
+    x_mean = x.mean(axis=1, keepdims=True)
+    y = x - x_mean
+    y_min = y.min(axis=1, keepdims=True)
+    shifted = y - y_min  # >= 0, so the weights never overflow
+    lo = np.zeros(len(x))
+    hi = -y_min[:, 0]
+    degenerate = hi <= 0
+    hi[degenerate] = 1.0
+    # Method-of-moments start.
+    a = np.clip(y.std(axis=1) * np.sqrt(6.0) / np.pi, hi * 1e-3, hi)
+    active = ~degenerate
+    for _ in range(max_iter):
+        if not active.any():
+            break
+        rows = np.flatnonzero(active)
+        a_r = a[rows]
+        w = np.exp(-shifted[rows] / a_r[:, None])
+        s0 = w.sum(axis=1)
+        ew = (w * y[rows]).sum(axis=1) / s0
+        var = (w * y[rows] ** 2).sum(axis=1) / s0 - ew**2
+        f = a_r + ew
+        below = f < 0
+        lo[rows] = np.where(below, a_r, lo[rows])
+        hi[rows] = np.where(below, hi[rows], a_r)
+        step = a_r - f / (1.0 + np.maximum(var, 0.0) / a_r**2)
+        outside = (step <= lo[rows]) | (step >= hi[rows])
+        step = np.where(outside, 0.5 * (lo[rows] + hi[rows]), step)
+        a[rows] = step
+        active[rows] = np.abs(step - a_r) > rtol * step
+    a[degenerate] = 0.0
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        log_mean_w = np.log(np.exp(-shifted / a[:, None]).mean(axis=1))
+    loc = np.where(degenerate, 0.0, y_min[:, 0] - a * log_mean_w) + x_mean[:, 0]
+    return loc, a
+
+
 class ExtremeValueParams(OpParams):
     """Parameters for :func:`extreme_value`.
 
@@ -252,19 +390,14 @@ def extreme_value(ds: DataSource, p: ExtremeValueParams) -> DataSource:
         non_exceedance = (
             p.non_exceedance_probability if p.non_exceedance_probability is not None else 0.78
         )
-        result = np.array(
-            [
-                gumbel_extreme_value_1d(
-                    row,
-                    dt=dt,
-                    peak_duration=p.peak_duration,
-                    event_duration=p.event_duration,
-                    extreme_type=p.extreme_type,
-                    n_subdivisions=n_subdivisions,
-                    non_exceedance_probability=non_exceedance,
-                )
-                for row in arr
-            ]
+        result = gumbel_extreme_value_2d(
+            arr,
+            dt=dt,
+            peak_duration=p.peak_duration,
+            event_duration=p.event_duration,
+            extreme_type=p.extreme_type,
+            n_subdivisions=n_subdivisions,
+            non_exceedance_probability=non_exceedance,
         )
 
     out_name = p._out_name()
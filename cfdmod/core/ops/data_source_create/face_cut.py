@@ -29,7 +29,7 @@ from __future__ import annotations
 
 __all__ = ["FaceCutParams", "face_cut"]
 
-from typing import ClassVar, Literal
+from typing import ClassVar, Literal, NamedTuple
 
 import numpy as np
 from pydantic import ConfigDict
@@ -77,6 +77,23 @@ class FaceCutParams(OpParams):
     requires_element_meta: ClassVar[frozenset[str]] = frozenset({"normal"})
     produces_element_meta: ClassVar[frozenset[str]] = frozenset({"area", "normal", "position"})
 
+    def prepare_geometry(self, ds: DataSource) -> _FaceCutGeometry:
+        """Slice the mesh; reused across the time windows of a chunked run."""
+        return _cut_geometry(ds, self)
+
+    def apply_geometry(self, ds: DataSource, geometry: _FaceCutGeometry) -> SurfaceDataSource:
+        """Map ``ds``'s fields onto a prepared cut."""
+        return _apply_cut(ds, self, geometry)
+
+
+class _FaceCutGeometry(NamedTuple):
+    """The time-independent half of a cut: fragments and their parents."""
+
+    topology: Topology
+    elements: ElementMeta
+    grouping: Grouping
+    parent_per_fragment: np.ndarray
+
 
 def _normalize_intervals(edges: list[float]) -> list[float]:
     """Empty -> open infinite interval; otherwise pass through."""
@@ -92,7 +109,7 @@ def _triangle_areas(tri_verts: np.ndarray) -> np.ndarray:
     return 0.5 * np.linalg.norm(np.cross(e1, e2), axis=1)
 
 
-def face_cut(ds: DataSource, p: FaceCutParams) -> SurfaceDataSource:
+def _cut_geometry(ds: DataSource, p: FaceCutParams) -> _FaceCutGeometry:
     if ds.topology is None or ds.topology.cell_type != "triangle":
         raise ValueError(
             "face_cut requires a triangle Topology; got "
@@ -155,23 +172,33 @@ def face_cut(ds: DataSource, p: FaceCutParams) -> SurfaceDataSource:
         area=_triangle_areas(frag_verts),
         normal=frag_normals,
     )
+    return _FaceCutGeometry(
+        topology=new_topology,
+        elements=new_elements,
+        grouping=Grouping(name=p.name, indices=region_ids),
+        parent_per_fragment=parent_per_fragment,
+    )
+
 
+def _apply_cut(ds: DataSource, p: FaceCutParams, geometry: _FaceCutGeometry) -> SurfaceDataSource:
     # Fields: gather each fragment's timeseries from its parent row. This
     # repeats a parent's row for each of its fragments (piecewise-constant
     # inheritance). Works for both memory (direct fancy-index) and h5
     # (per-timestep gather) field stores.
     gathered: dict[str, np.ndarray] = {}
     for fname in ds.fields.keys():
-        gathered[fname] = ds.fields.read(fname, elements=parent_per_fragment)
-
-    grouping = Grouping(name=p.name, indices=region_ids)
+        gathered[fname] = ds.fields.read(fname, elements=geometry.parent_per_fragment)
 
     return SurfaceDataSource(
         time=ds.time,
-        topology=new_topology,
-        elements=new_elements,
-        groupings={p.name: grouping},
+        topology=geometry.topology,
+        elements=geometry.elements,
+        groupings={p.name: geometry.grouping},
         fields=MemoryFieldStore(gathered),
         field_meta={name: meta for name, meta in ds.field_meta.items() if name in gathered},
         attrs=dict(ds.attrs),
     )
+
+
+def face_cut(ds: DataSource, p: FaceCutParams) -> SurfaceDataSource:
+    return _apply_cut(ds, p, _cut_geometry(ds, p))
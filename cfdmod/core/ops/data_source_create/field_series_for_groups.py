@@ -20,7 +20,7 @@ import numpy as np
 from cfdmod.adapters.memory import MemoryFieldStore
 from cfdmod.core.data_source import DataSource, GroupsDataSource
 from cfdmod.core.field_meta import FieldMeta
-from cfdmod.core.grouping import AggregationKind, Grouping, aggregate_rows, groups_in
+from cfdmod.core.grouping import AggregationKind, Grouping, GroupReducer, groups_in
 from cfdmod.core.ops import OpParams
 from cfdmod.core.topology import ElementMeta
 
@@ -68,17 +68,10 @@ def field_series_for_groups(ds: DataSource, p: FieldSeriesForGroupsParams) -> Gr
     group_ids = groups_in(grouping)
     n_groups = int(group_ids.size)
 
-    is_time = arr.ndim == 2
-    n_t = arr.shape[1] if is_time else 0
-
-    out_arr = (
-        np.zeros((n_groups, n_t), dtype=arr.dtype)
-        if is_time
-        else np.zeros(n_groups, dtype=arr.dtype)
-    )
-    for row, gid in enumerate(group_ids):
-        members = np.flatnonzero(grouping.indices == gid)
-        out_arr[row] = aggregate_rows(arr, members, p.agg, weights)
+    # One sparse reduction over every group at once; output keeps the
+    # source dtype, as the per-group reductions it replaces did.
+    reducer = GroupReducer.for_grouping(grouping, group_ids)
+    out_arr = reducer.reduce(arr, p.agg, weights).astype(arr.dtype, copy=False)
 
     target = p.out or p.field
     src_meta = ds.field_meta.get(p.field)
@@ -9,12 +9,15 @@ nearest-sampled at each probe.
 Two modes:
 
 - ``"nearest"`` (default) -- map every probe to the closest source
-  element. O(n_probes * n_source_elements). Suitable for moderate-size
-  meshes.
+  element, via the KD-tree cached on the source's
+  :class:`~cfdmod.core.topology.ElementMeta`
+  (:meth:`~cfdmod.core.topology.ElementMeta.nearest`). The tree is built
+  once per element set, so each probe is an O(log n_elements) query.
 - ``"linear_zaxis"`` -- 1-D linear interpolation along the z axis.
   Used by the S1 recipe to lift a CFD probe column onto a target
-  height vector. Source elements must be sorted by z and lie on a
-  single column (same x, y).
+  height vector. Source elements should lie on a single column (same
+  x, y); the weights come from the same cached sparse operator as
+  :func:`~cfdmod.core.ops.data_source_create.profile_interpolation.profile_interpolation`.
 """
 
 from __future__ import annotations
@@ -30,6 +33,7 @@ from cfdmod.adapters.memory import MemoryFieldStore
 from cfdmod.core.data_source import DataSource, PointsDataSource
 from cfdmod.core.field_meta import FieldMeta
 from cfdmod.core.ops import OpParams
+from cfdmod.core.ops.data_source_create.profile_interpolation import interpolate_heights
 from cfdmod.core.topology import ElementMeta, Topology
 
 
@@ -58,40 +62,20 @@ class ProbeExtractionParams(OpParams):
     replaces_fields: ClassVar[bool] = True
 
 
-def _nearest_indices(src_pos: np.ndarray, probes: np.ndarray) -> np.ndarray:
-    out = np.empty(probes.shape[0], dtype=np.int64)
-    for i in range(probes.shape[0]):
-        d = ((src_pos - probes[i]) ** 2).sum(axis=1)
-        out[i] = int(np.argmin(d))
-    return out
-
-
 def probe_extraction(ds: DataSource, p: ProbeExtractionParams) -> PointsDataSource:
     if ds.elements.position is None:
         raise ValueError("probe_extraction requires elements.position on the source")
-    src_pos = ds.elements.position
     probes = np.asarray(p.probes, dtype=np.float64)
     if probes.ndim != 2 or probes.shape[1] != 3:
         raise ValueError(f"probes must have shape (n_probes, 3); got {probes.shape}")
 
     arr = np.asarray(ds.fields.read(p.field))
-    is_time = arr.ndim == 2
 
     if p.mode == "nearest":
-        idx = _nearest_indices(src_pos, probes)
+        idx = ds.elements.nearest(probes)
         sub = arr[idx]
     elif p.mode == "linear_zaxis":
-        order = np.argsort(src_pos[:, 2])
-        z_sorted = src_pos[order, 2]
-        target_z = probes[:, 2]
-        if is_time:
-            n_probes = probes.shape[0]
-            n_t = arr.shape[1]
-            sub = np.empty((n_probes, n_t), dtype=arr.dtype)
-            for t in range(n_t):
-                sub[:, t] = np.interp(target_z, z_sorted, arr[order, t])
-        else:
-            sub = np.interp(target_z, z_sorted, arr[order])
+        sub = interpolate_heights(ds, probes[:, 2].copy(), arr)
     else:  # pragma: no cover -- guarded by Literal
         raise ValueError(f"unknown probe extraction mode {p.mode!r}")
 
@@ -5,14 +5,22 @@ needs to be lifted onto the heights of a reference profile so the two
 can be divided element-wise.
 
 Operates exclusively on :class:`PointsDataSource` whose
-``elements.position`` z column gives the heights. Time-resolved fields
-are interpolated per timestep; time-aggregated fields are interpolated
-in 1-D.
+``elements.position`` z column gives the heights. The interpolation
+weights depend only on the heights, so they are assembled once into a
+sparse ``(n_targets, n_sources)`` operator (:func:`linear_interp_matrix`)
+and every timestep is interpolated by one sparse product. The operator
+is cached on the source's :class:`ElementMeta`, which the time windows
+of a chunked run share.
 """
 
 from __future__ import annotations
 
-__all__ = ["ProfileInterpolationParams", "profile_interpolation"]
+__all__ = [
+    "ProfileInterpolationParams",
+    "profile_interpolation",
+    "linear_interp_matrix",
+    "interpolate_heights",
+]
 
 from typing import Any, ClassVar, Literal
 
@@ -20,7 +28,7 @@ import numpy as np
 from pydantic import ConfigDict
 
 from cfdmod.adapters.memory import MemoryFieldStore
-from cfdmod.core.data_source import PointsDataSource
+from cfdmod.core.data_source import DataSource, PointsDataSource
 from cfdmod.core.ops import OpParams
 from cfdmod.core.topology import ElementMeta, Topology
 
@@ -45,23 +53,74 @@ class ProfileInterpolationParams(OpParams):
     replaces_fields: ClassVar[bool] = True
 
 
+def linear_interp_matrix(xp: np.ndarray, x: np.ndarray) -> Any:
+    """Sparse ``(len(x), len(xp))`` operator for 1-D linear interpolation.
+
+    ``linear_interp_matrix(xp, x) @ fp`` equals
+    ``np.interp(x, xp[order], fp[order])`` with ``order = argsort(xp)``:
+    ``xp`` need not be sorted, each row holds the two weights of the
+    bracketing samples, and targets outside ``[min(xp), max(xp)]`` clamp
+    to the end samples. ``fp`` may be ``(len(xp),)`` or
+    ``(len(xp), n_t)``.
+    """
+    from scipy import sparse
+
+    xp = np.asarray(xp, dtype=np.float64).ravel()
+    x = np.asarray(x, dtype=np.float64).ravel()
+    if xp.size == 0:
+        raise ValueError("linear interpolation needs at least one source sample")
+    order = np.argsort(xp, kind="stable")
+    xs = xp[order]
+    if xs.size == 1:
+        return sparse.csr_matrix(
+            (np.ones(x.size), (np.arange(x.size), np.zeros(x.size, dtype=np.int64))),
+            shape=(x.size, 1),
+        )
+
+    lo = np.clip(np.searchsorted(xs, x, side="right") - 1, 0, xs.size - 2)
+    dx = xs[lo + 1] - xs[lo]
+    with np.errstate(divide="ignore", invalid="ignore"):
+        w = np.clip(np.where(dx > 0, (x - xs[lo]) / dx, 1.0), 0.0, 1.0)
+    # Below a duplicated lowest height dx is 0; clamp to the first sample.
+    w = np.where(x < xs[0], 0.0, w)
+    rows = np.repeat(np.arange(x.size), 2)
+    cols = np.column_stack((order[lo], order[lo + 1])).ravel()
+    data = np.column_stack((1.0 - w, w)).ravel()
+    matrix = sparse.csr_matrix((data, (rows, cols)), shape=(x.size, xp.size))
+    # A clamped or on-knot target stores a zero weight, and 0 * NaN would
+    # leak a NaN sample into a target np.interp leaves finite.
+    matrix.eliminate_zeros()
+    return matrix
+
+
+def interpolate_heights(ds: DataSource, heights: np.ndarray, arr: np.ndarray) -> np.ndarray:
+    """Interpolate ``arr`` (one row per element of ``ds``) onto ``heights`` along z.
+
+    The operator is built from ``ds.elements.position`` once per target
+    set and cached on ``ds.elements``. Time-resolved input keeps its
+    dtype; a 1-D input comes back as float64, like ``np.interp``.
+    """
+    if arr.ndim == 1 or not np.issubdtype(arr.dtype, np.floating):
+        dtype = np.dtype(np.float64)
+    else:
+        dtype = arr.dtype
+    # Weights in the field's own precision: a float64 operator would make
+    # scipy upcast the whole (n_sources, n_t) block before the product.
+    op = ds.elements.derived(
+        ("linear_zaxis", heights.tobytes(), dtype.str),
+        lambda position: linear_interp_matrix(position[:, 2], heights).astype(dtype),
+    )
+    out = np.asarray(op @ arr.astype(dtype, copy=False))
+    return out if arr.ndim == 1 else out.astype(arr.dtype, copy=False)
+
+
 def profile_interpolation(ds: PointsDataSource, p: ProfileInterpolationParams) -> PointsDataSource:
     if ds.elements.position is None:
         raise ValueError("profile_interpolation requires elements.position on the source")
-    z_src = ds.elements.position[:, 2]
     z_target = np.asarray(p.target_heights, dtype=np.float64).ravel()
 
-    order = np.argsort(z_src)
-    z_sorted = z_src[order]
-
     arr = np.asarray(ds.fields.read(p.field))
-    is_time = arr.ndim == 2
-    if is_time:
-        out = np.empty((z_target.size, arr.shape[1]), dtype=arr.dtype)
-        for t in range(arr.shape[1]):
-            out[:, t] = np.interp(z_target, z_sorted, arr[order, t])
-    else:
-        out = np.interp(z_target, z_sorted, arr[order])
+    out = interpolate_heights(ds, z_target, arr)
 
     new_pos = np.zeros((z_target.size, 3), dtype=np.float64)
     new_pos[:, 2] = z_target
@@ -24,11 +24,17 @@ Supported statistics
   element.
 
 For each requested stat, the output field is shape ``(n_elements,)``.
+
+Every statistic is finished from a :class:`MomentAccumulator` -- count,
+mean, the central moment sums ``M2``..``M4``, min and max per element --
+which merges exactly across disjoint stretches of the time axis. That is
+what lets a chunked run fold ``statistics`` one time window at a time
+(:meth:`StatisticsParams.fold_window`) instead of refusing to chunk.
 """
 
 from __future__ import annotations
 
-__all__ = ["StatisticsParams", "compute_statistics", "STAT_KINDS"]
+__all__ = ["StatisticsParams", "compute_statistics", "MomentAccumulator", "STAT_KINDS"]
 
 from typing import ClassVar, Literal
 
@@ -51,6 +57,160 @@ STAT_KINDS = Literal[
 ]
 
 
+# Highest central moment each statistic is finished from.
+_ORDER: dict[str, int] = {
+    "mean": 1,
+    "rms": 2,
+    "min": 1,
+    "max": 1,
+    "peak_min": 1,
+    "peak_max": 1,
+    "skewness": 3,
+    "kurtosis": 4,
+}
+
+
+class MomentAccumulator:
+    """Mergeable per-element moments of a ``(n_elements, n_timesteps)`` field.
+
+    Holds the sample count, mean, central moment sums ``M2``..``M{order}``,
+    min and max of every row. :meth:`from_array` computes them for one block
+    of timesteps in two passes; :meth:`merge` combines two disjoint blocks
+    with the pairwise update of Chan et al. (extended to ``M3`` / ``M4`` by
+    Pébay), so folding a series window by window gives the statistics of
+    the whole series to rounding. Sums are kept in float64 whatever the
+    source dtype; :meth:`stat` casts back to it.
+
+    Moments above ``order`` are not tracked, so a run asking only for
+    ``mean`` / ``rms`` pays for two powers of the fluctuation, not four.
+    """
+
+    __slots__ = ("count", "mean", "m2", "m3", "m4", "minimum", "maximum", "order", "dtype")
+
+    def __init__(
+        self,
+        count: int,
+        mean: np.ndarray,
+        m2: np.ndarray | None,
+        m3: np.ndarray | None,
+        m4: np.ndarray | None,
+        minimum: np.ndarray,
+        maximum: np.ndarray,
+        order: int,
+        dtype: np.dtype,
+    ) -> None:
+        self.count = count
+        self.mean = mean
+        self.m2 = m2
+        self.m3 = m3
+        self.m4 = m4
+        self.minimum = minimum
+        self.maximum = maximum
+        self.order = order
+        self.dtype = dtype
+
+    @classmethod
+    def from_array(cls, arr: np.ndarray, order: int = 4) -> "MomentAccumulator":
+        """Moments of ``arr`` (``(n_elements, n_timesteps)``) up to ``order``."""
+        if arr.ndim != 2 or arr.shape[1] == 0:
+            raise ValueError(
+                f"moments need a non-empty (n_elements, n_timesteps) array; got shape {arr.shape}"
+            )
+        if not 1 <= order <= 4:
+            raise ValueError(f"order must be in 1..4, got {order}")
+        mean = arr.mean(axis=1, dtype=np.float64)
+        m2 = m3 = m4 = None
+        if order >= 2:
+            dev = arr - mean[:, None]
+            sq = dev * dev
+            m2 = sq.sum(axis=1)
+            if order >= 3:
+                m3 = (sq * dev).sum(axis=1)
+            if order >= 4:
+                m4 = (sq * sq).sum(axis=1)
+        dtype = arr.dtype if np.issubdtype(arr.dtype, np.floating) else np.dtype(np.float64)
+        return cls(
+            int(arr.shape[1]),
+            mean,
+            m2,
+            m3,
+            m4,
+            arr.min(axis=1),
+            arr.max(axis=1),
+            order,
+            dtype,
+        )
+
+    def merge(self, other: "MomentAccumulator") -> "MomentAccumulator":
+        """The moments of both blocks together, as a new accumulator."""
+        if self.order != other.order:
+            raise ValueError(f"cannot merge moments of order {self.order} and {other.order}")
+        if self.mean.shape != other.mean.shape:
+            raise ValueError(
+                f"cannot merge moments over {self.mean.shape[0]} and "
+                f"{other.mean.shape[0]} elements"
+            )
+        na, nb = self.count, other.count
+        n = na + nb
+        delta = other.mean - self.mean
+        mean = self.mean + delta * (nb / n)
+        m2 = m3 = m4 = None
+        if self.order >= 2:
+            m2 = self.m2 + other.m2 + delta**2 * (na * nb / n)
+        if self.order >= 3:
+            m3 = (
+                self.m3
+                + other.m3
+                + delta**3 * (na * nb * (na - nb) / n**2)
+                + 3.0 * delta * (na * other.m2 - nb * self.m2) / n
+            )
+        if self.order >= 4:
+            m4 = (
+                self.m4
+                + other.m4
+                + delta**4 * (na * nb * (na * na - na * nb + nb * nb) / n**3)
+                + 6.0 * delta**2 * (na * na * other.m2 + nb * nb * self.m2) / n**2
+                + 4.0 * delta * (na * other.m3 - nb * self.m3) / n
+            )
+        return MomentAccumulator(
+            n,
+            mean,
+            m2,
+            m3,
+            m4,
+            np.minimum(self.minimum, other.minimum),
+            np.maximum(self.maximum, other.maximum),
+            self.order,
+            np.promote_types(self.dtype, other.dtype),
+        )
+
+    def stat(self, name: str) -> np.ndarray:
+        """Finish one of :data:`STAT_KINDS` from the accumulated moments."""
+        if name not in _ORDER:
+            raise ValueError(f"unknown statistic kind {name!r}")
+        if _ORDER[name] > self.order:
+            raise ValueError(
+                f"{name!r} needs moments up to order {_ORDER[name]}; have {self.order}"
+            )
+        if name == "mean":
+            out = self.mean
+        elif name in ("min", "peak_min"):
+            out = self.minimum
+        elif name in ("max", "peak_max"):
+            out = self.maximum
+        else:
+            var = self.m2 / self.count
+            if name == "rms":
+                out = np.sqrt(var)
+            else:
+                with np.errstate(divide="ignore", invalid="ignore"):
+                    if name == "skewness":
+                        out = np.where(var > 0, self.m3 / self.count / var**1.5, 0.0)
+                    else:
+                        out = np.where(var > 0, self.m4 / self.count / var**2 - 3.0, 0.0)
+        return out.astype(self.dtype, copy=False)
+
+
 class StatisticsParams(OpParams):
     """Parameters for :func:`compute_statistics`.
 
@@ -58,6 +218,11 @@ class StatisticsParams(OpParams):
         kinds: Statistics to compute, one output field per kind.
         field: Source field to aggregate over time. Defaults to
             ``"pressure"``.
+
+    ``statistics`` collapses the time axis, so it does not declare ``"time"``
+    chunkability. It folds instead: a chunked run calls :meth:`fold_window`
+    on every window and :meth:`finish_fold` once at the end. Windows folded
+    apart (on a pool) are combined with :meth:`merge_folds`.
     """
 
     kind: Literal["statistics"] = "statistics"
@@ -70,50 +235,46 @@ class StatisticsParams(OpParams):
     def produced_fields(self) -> frozenset[str]:
         return frozenset(self.kinds)
 
+    def fold_window(self, ds: DataSource, acc: MomentAccumulator | None) -> MomentAccumulator:
+        """Fold one time window of ``ds`` into ``acc`` (``None`` on the first)."""
+        window = MomentAccumulator.from_array(
+            _read_series(ds, self.field), order=max((_ORDER[k] for k in self.kinds), default=1)
+        )
+        return window if acc is None else acc.merge(window)
 
-def _stat(arr: np.ndarray, name: str) -> np.ndarray:
-    if name == "mean":
-        return arr.mean(axis=1)
-    if name == "rms":
-        return arr.std(axis=1)
-    if name in ("min", "peak_min"):
-        return arr.min(axis=1)
-    if name in ("max", "peak_max"):
-        return arr.max(axis=1)
-    if name == "skewness":
-        m = arr.mean(axis=1, keepdims=True)
-        var = ((arr - m) ** 2).mean(axis=1)
-        m3 = ((arr - m) ** 3).mean(axis=1)
-        with np.errstate(divide="ignore", invalid="ignore"):
-            return np.where(var > 0, m3 / var**1.5, 0.0)
-    if name == "kurtosis":
-        m = arr.mean(axis=1, keepdims=True)
-        var = ((arr - m) ** 2).mean(axis=1)
-        m4 = ((arr - m) ** 4).mean(axis=1)
-        with np.errstate(divide="ignore", invalid="ignore"):
-            return np.where(var > 0, m4 / var**2 - 3.0, 0.0)
-    raise ValueError(f"unknown statistic kind {name!r}")
+    def merge_folds(self, acc: MomentAccumulator, other: MomentAccumulator) -> MomentAccumulator:
+        """Combine the folds of two runs of consecutive windows, in time order."""
+        return acc.merge(other)
 
+    def finish_fold(self, ds: DataSource, acc: MomentAccumulator) -> DataSource:
+        """The op's output from the folded moments; ``ds`` is the first window."""
+        return _collapse(ds, self, acc)
 
-def compute_statistics(ds: DataSource, p: StatisticsParams) -> DataSource:
+
+def _read_series(ds: DataSource, field: str) -> np.ndarray:
     if ds.time.is_time_aggregated:
         raise ValueError("compute_statistics requires a time-resolved data source")
-
-    arr = np.asarray(ds.fields.read(p.field))
+    arr = np.asarray(ds.fields.read(field))
     if arr.ndim != 2:
         raise ValueError(
-            f"field {p.field!r} must be 2-D (n_elements, n_timesteps); got shape {arr.shape}"
+            f"field {field!r} must be 2-D (n_elements, n_timesteps); got shape {arr.shape}"
         )
+    return arr
+
 
+def _collapse(ds: DataSource, p: StatisticsParams, acc: MomentAccumulator) -> DataSource:
     out_arrays: dict[str, np.ndarray] = {}
     out_meta: dict[str, FieldMeta] = {}
     src_meta = ds.field_meta.get(p.field)
     for kind in p.kinds:
-        out_arrays[kind] = _stat(arr, kind)
+        out_arrays[kind] = acc.stat(kind)
         out_meta[kind] = (
             FieldMeta(name=kind, unit=src_meta.unit, scale=src_meta.scale)
             if src_meta is not None
             else FieldMeta(name=kind)
         )
-
     return collapse_time_axis(ds, out_arrays, out_meta)
+
+
+def compute_statistics(ds: DataSource, p: StatisticsParams) -> DataSource:
+    return _collapse(ds, p, p.fold_window(ds, None))
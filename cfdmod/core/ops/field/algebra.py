@@ -25,10 +25,14 @@ __all__ = [
     "scale",
 ]
 
-from typing import ClassVar, Literal
+from typing import ClassVar, Literal, Mapping
+
+import numpy as np
 
 from cfdmod.core import algebra
 from cfdmod.core.data_source import DataSource
+from cfdmod.core.field_meta import FieldMeta
+from cfdmod.core.fusion import Tile
 from cfdmod.core.ops import OpParams
 
 # Binary ops require an explicit rhs DataSource passed at recipe-build
@@ -36,32 +40,59 @@ from cfdmod.core.ops import OpParams
 # and an optional out alias; the rhs is bound by the recipe.
 
 
-class AddParams(OpParams):
+class _BinaryParams(OpParams):
+    """Fused-kernel hooks (see :mod:`cfdmod.core.fusion`) shared by the four
+    binary ops; ``_ufunc`` is the numpy op each one applies."""
+
+    _ufunc: ClassVar[np.ufunc]
+
+    def elementwise_tile(
+        self,
+        fields: Mapping[str, np.ndarray],
+        tile: Tile,
+        ds: DataSource,
+        rhs: Mapping[str, np.ndarray] | None,
+    ) -> dict[str, np.ndarray]:
+        rhs_arr = rhs[self.field]
+        rule = algebra.classify_broadcast(tile.shape, rhs_arr.shape)
+        rhs_part = algebra.rhs_tile(rhs_arr, rule, tile.rows, tile.cols)
+        return {self.out or self.field: self._ufunc(fields[self.field], rhs_part)}
+
+    def elementwise_meta(self, meta: Mapping[str, FieldMeta]) -> dict[str, FieldMeta]:
+        target = self.out or self.field
+        return {target: algebra.result_meta(dict(meta), self.field, target)}
+
+
+class AddParams(_BinaryParams):
     kind: Literal["field_add"] = "field_add"
     field: str
     out: str | None = None
     chunkable_along: ClassVar[frozenset[str]] = frozenset({"time", "elements"})
+    _ufunc: ClassVar[np.ufunc] = np.add
 
 
-class SubParams(OpParams):
+class SubParams(_BinaryParams):
     kind: Literal["field_sub"] = "field_sub"
     field: str
     out: str | None = None
     chunkable_along: ClassVar[frozenset[str]] = frozenset({"time", "elements"})
+    _ufunc: ClassVar[np.ufunc] = np.subtract
 
 
-class MulParams(OpParams):
+class MulParams(_BinaryParams):
     kind: Literal["field_mul"] = "field_mul"
     field: str
     out: str | None = None
     chunkable_along: ClassVar[frozenset[str]] = frozenset({"time", "elements"})
+    _ufunc: ClassVar[np.ufunc] = np.multiply
 
 
-class DivParams(OpParams):
+class DivParams(_BinaryParams):
     kind: Literal["field_div"] = "field_div"
     field: str
     out: str | None = None
     chunkable_along: ClassVar[frozenset[str]] = frozenset({"time", "elements"})
+    _ufunc: ClassVar[np.ufunc] = np.divide
 
 
 def add(ds: DataSource, rhs: DataSource | float | int, p: AddParams) -> DataSource:
@@ -95,6 +126,19 @@ class ScaleParams(OpParams):
     out: str | None = None
     chunkable_along: ClassVar[frozenset[str]] = frozenset({"time", "elements"})
 
+    def elementwise_tile(
+        self,
+        fields: Mapping[str, np.ndarray],
+        tile: Tile,
+        ds: DataSource,
+        rhs: Mapping[str, np.ndarray] | None,
+    ) -> dict[str, np.ndarray]:
+        return {self.out or self.field: np.multiply(fields[self.field], self.factor)}
+
+    def elementwise_meta(self, meta: Mapping[str, FieldMeta]) -> dict[str, FieldMeta]:
+        target = self.out or self.field
+        return {target: algebra.result_meta(dict(meta), self.field, target)}
+
 
 def scale(ds: DataSource, p: ScaleParams) -> DataSource:
     return algebra.mul(ds, p.factor, field=p.field, out=p.out)
@@ -19,15 +19,18 @@ from __future__ import annotations
 
 __all__ = ["ForceContributionParams", "force_contribution"]
 
-from typing import ClassVar, Literal
+from typing import ClassVar, Literal, Mapping
 
 import numpy as np
 from pydantic import Field
 
 from cfdmod.core.data_source import DataSource
 from cfdmod.core.field_meta import FieldMeta
+from cfdmod.core.fusion import Tile
 from cfdmod.core.ops import OpParams
 
+_AXIS = {"x": 0, "y": 1, "z": 2}
+
 
 class ForceContributionParams(OpParams):
     """Parameters for :func:`force_contribution`.
@@ -53,33 +56,58 @@ class ForceContributionParams(OpParams):
     def produced_fields(self) -> frozenset[str]:
         return frozenset(f"{self.out_prefix}_{d}" for d in self.directions)
 
+    def elementwise_tile(
+        self,
+        fields: Mapping[str, np.ndarray],
+        tile: Tile,
+        ds: DataSource,
+        rhs: Mapping[str, np.ndarray] | None,
+    ) -> dict[str, np.ndarray]:
+        _check_elements(ds)
+        return _contributions(
+            fields[self.field], ds.elements.area[tile.rows], ds.elements.normal[tile.rows], self
+        )
 
-def force_contribution(ds: DataSource, p: ForceContributionParams) -> DataSource:
+    def elementwise_meta(self, meta: Mapping[str, FieldMeta]) -> dict[str, FieldMeta]:
+        return {
+            f"{self.out_prefix}_{d}": FieldMeta(name=f"{self.out_prefix}_{d}", unit="-")
+            for d in self.directions
+        }
+
+
+def _check_elements(ds: DataSource) -> None:
     if ds.elements.area is None or ds.elements.normal is None:
         raise ValueError(
             "force_contribution requires elements.area and elements.normal; "
             "attach them with mesh_attach first."
         )
 
+
+def _contributions(
+    cp: np.ndarray, area: np.ndarray, normals: np.ndarray, p: ForceContributionParams
+) -> dict[str, np.ndarray]:
     # Preserve the Cp field's dtype (float32 for solver output, float64 for
     # float64 sources) rather than upcasting; cast the geometric factor to match
     # so a float64 area does not silently promote a float32 result back up.
+    dt = cp.dtype
+    area = np.asarray(area, dtype=dt)
+    normals = np.asarray(normals, dtype=dt)
+    # cf_dir[tri, t] = -cp[tri, t] * area[tri] * normal_dir[tri] / nominal_area
+    return {
+        f"{p.out_prefix}_{d}": -cp * (area * normals[:, _AXIS[d]])[:, None] / p.nominal_area
+        for d in p.directions
+    }
+
+
+def force_contribution(ds: DataSource, p: ForceContributionParams) -> DataSource:
+    _check_elements(ds)
     cp = np.asarray(ds.fields.read(p.field))
     if cp.ndim != 2:
         raise ValueError(
             f"field {p.field!r} must be 2-D (n_elements, n_timesteps); got {cp.shape}"
         )
 
-    dt = cp.dtype
-    area = np.asarray(ds.elements.area, dtype=dt)
-    normals = np.asarray(ds.elements.normal, dtype=dt)
-    axis_map = {"x": 0, "y": 1, "z": 2}
-
     out = ds
-    for d in p.directions:
-        axis = axis_map[d]
-        # cf_dir[tri, t] = -cp[tri, t] * area[tri] * normal_dir[tri] / nominal_area
-        cf = -cp * (area * normals[:, axis])[:, None] / p.nominal_area
-        name = f"{p.out_prefix}_{d}"
+    for name, cf in _contributions(cp, ds.elements.area, ds.elements.normal, p).items():
         out = out.with_field(name, cf, meta=FieldMeta(name=name, unit="-"))
     return out
@@ -20,13 +20,14 @@ from __future__ import annotations
 
 __all__ = ["MomentContributionParams", "moment_contribution"]
 
-from typing import ClassVar, Literal
+from typing import ClassVar, Literal, Mapping
 
 import numpy as np
 from pydantic import Field
 
 from cfdmod.core.data_source import DataSource
 from cfdmod.core.field_meta import FieldMeta
+from cfdmod.core.fusion import Tile
 from cfdmod.core.ops import OpParams
 
 
@@ -61,19 +62,40 @@ class MomentContributionParams(OpParams):
     def produced_fields(self) -> frozenset[str]:
         return frozenset(f"{self.out_prefix}_{d}" for d in self.directions)
 
-
-def moment_contribution(ds: DataSource, p: MomentContributionParams) -> DataSource:
+    def elementwise_tile(
+        self,
+        fields: Mapping[str, np.ndarray],
+        tile: Tile,
+        ds: DataSource,
+        rhs: Mapping[str, np.ndarray] | None,
+    ) -> dict[str, np.ndarray]:
+        _check_elements(ds)
+        cf = {d: fields[f"{self.in_prefix}_{d}"] for d in ("x", "y", "z")}
+        return _moments(cf, ds.elements.position[tile.rows], self)
+
+    def elementwise_meta(self, meta: Mapping[str, FieldMeta]) -> dict[str, FieldMeta]:
+        return {
+            f"{self.out_prefix}_{d}": FieldMeta(name=f"{self.out_prefix}_{d}")
+            for d in ("x", "y", "z")
+            if d in self.directions
+        }
+
+
+def _check_elements(ds: DataSource) -> None:
     if ds.elements.position is None:
         raise ValueError(
             "moment_contribution requires elements.position; "
             "attach centroids with mesh_attach first."
         )
 
+
+def _moments(
+    cf_arrays: dict[str, np.ndarray], position: np.ndarray, p: MomentContributionParams
+) -> dict[str, np.ndarray]:
     # Follow the Cf fields' dtype (see force_contribution) so float32 forces stay
     # float32 through the moment; cast the lever arm to match.
-    cf_arrays = {d: np.asarray(ds.fields.read(f"{p.in_prefix}_{d}")) for d in ("x", "y", "z")}
     dt = cf_arrays["x"].dtype
-    centroids = np.asarray(ds.elements.position, dtype=dt)
+    centroids = np.asarray(position, dtype=dt)
     r = centroids - np.asarray(p.lever_origin, dtype=dt)[None, :]
 
     # Undo Cf's nominal-area normalisation -> per-element force.
@@ -83,14 +105,20 @@ def moment_contribution(ds: DataSource, p: MomentContributionParams) -> DataSour
 
     # m = r x f, component-wise.
     rx, ry, rz = r[:, 0:1], r[:, 1:2], r[:, 2:3]
-    out = ds
+    out: dict[str, np.ndarray] = {}
     if "x" in p.directions:
-        mx = (ry * fz - rz * fy) / p.nominal_volume
-        out = out.with_field(f"{p.out_prefix}_x", mx, meta=FieldMeta(name=f"{p.out_prefix}_x"))
+        out[f"{p.out_prefix}_x"] = (ry * fz - rz * fy) / p.nominal_volume
     if "y" in p.directions:
-        my = (rz * fx - rx * fz) / p.nominal_volume
-        out = out.with_field(f"{p.out_prefix}_y", my, meta=FieldMeta(name=f"{p.out_prefix}_y"))
+        out[f"{p.out_prefix}_y"] = (rz * fx - rx * fz) / p.nominal_volume
     if "z" in p.directions:
-        mz = (rx * fy - ry * fx) / p.nominal_volume
-        out = out.with_field(f"{p.out_prefix}_z", mz, meta=FieldMeta(name=f"{p.out_prefix}_z"))
+        out[f"{p.out_prefix}_z"] = (rx * fy - ry * fx) / p.nominal_volume
+    return out
+
+
+def moment_contribution(ds: DataSource, p: MomentContributionParams) -> DataSource:
+    _check_elements(ds)
+    cf_arrays = {d: np.asarray(ds.fields.read(f"{p.in_prefix}_{d}")) for d in ("x", "y", "z")}
+    out = ds
+    for name, cm in _moments(cf_arrays, ds.elements.position, p).items():
+        out = out.with_field(name, cm, meta=FieldMeta(name=name))
     return out
@@ -4,9 +4,16 @@ Reproduces ``cfdmod.pressure.filters.MovingAverageFilter`` exactly.
 
 The window is given in input time units; it is rounded to the nearest
 odd integer number of samples (so the output stays aligned with the
-input timestamps), edges are handled with ``np.pad(mode="edge")`` so
-the output length matches the input. This matches the legacy
-implementation byte-for-byte.
+input timestamps), edges are handled as ``np.pad(mode="edge")`` would
+so the output length matches the input. This matches the legacy
+padded-convolution implementation to floating-point rounding.
+
+The mean is a running sum over every row at once
+(``scipy.ndimage.uniform_filter1d``, accumulated in double precision),
+so the cost is ``O(n_elements * n_timesteps)`` whatever the window.
+Each output sample reads ``n // 2`` samples either side of it, which is
+the op's :meth:`~MovingAverageParams.time_halo`: a chunked run that
+overlaps its time windows by that much gets the unchunked result.
 
 The op operates on a single named field; chain multiple ops to filter
 several fields. The data source's :class:`TimeAxis` is unchanged.
@@ -23,6 +30,7 @@ from pydantic import Field
 
 from cfdmod.core.data_source import DataSource
 from cfdmod.core.ops import OpParams
+from cfdmod.core.time_axis import TimeAxis
 
 
 class MovingAverageParams(OpParams):
@@ -42,7 +50,10 @@ class MovingAverageParams(OpParams):
     field: str = "pressure"
     out: str | None = None
 
-    chunkable_along: ClassVar[frozenset[str]] = frozenset({"elements"})
+    chunkable_along: ClassVar[frozenset[str]] = frozenset({"time", "elements"})
+
+    def time_halo(self, time: TimeAxis) -> int:
+        return window_in_samples(self.window, float(time.timestep_size)) // 2
 
 
 def window_in_samples(window: float, dt: float) -> int:
@@ -59,34 +70,30 @@ def window_in_samples(window: float, dt: float) -> int:
     return n
 
 
-def _convolve_rows(data: np.ndarray, n: int) -> np.ndarray:
-    """Per-row 1-D convolution with a uniform kernel.
+def _moving_mean_rows(data: np.ndarray, n: int) -> np.ndarray:
+    """Centred ``n``-sample mean along axis 1, edge-padded.
 
     ``data`` shape is ``(n_elements, n_timesteps)``. Returns the same
-    shape with reflect-edge padding so the output length matches the
-    input.
+    shape and dtype; samples past either end repeat the end value.
     """
     if n == 1:
         return data
-    kernel = np.ones(n, dtype=data.dtype) / n
-    pad = n // 2
-    padded = np.pad(data, ((0, 0), (pad, pad)), mode="edge")
-    out = np.empty_like(data)
-    for i in range(data.shape[0]):
-        out[i, :] = np.convolve(padded[i, :], kernel, mode="valid")
-    return out
+    from scipy.ndimage import uniform_filter1d
+
+    return uniform_filter1d(data, n, axis=1, mode="nearest", output=np.empty_like(data))
 
 
 def moving_average(ds: DataSource, p: MovingAverageParams) -> DataSource:
     if ds.time.is_time_aggregated:
         raise ValueError("moving_average requires a time-resolved data source")
-    if ds.time.n_timesteps < 2:
+    # dt is the axis' own timestep_size, so a single step is fine: it is the
+    # ragged tail window of a chunked run as often as a degenerate series.
+    dt = float(ds.time.timestep_size)
+    if ds.time.n_timesteps < 1 or not dt > 0.0:
         raise ValueError(
-            "moving_average requires at least 2 timesteps to derive dt "
-            f"(got n_timesteps={ds.time.n_timesteps})"
+            "moving_average requires at least 1 timestep and a positive dt "
+            f"(got n_timesteps={ds.time.n_timesteps}, dt={dt})"
         )
-
-    dt = float(ds.time.timestep_size)
     n = window_in_samples(p.window, dt)
 
     arr = np.asarray(ds.fields.read(p.field))
@@ -94,7 +101,7 @@ def moving_average(ds: DataSource, p: MovingAverageParams) -> DataSource:
         raise ValueError(
             f"field {p.field!r} must be 2-D (n_elements, n_timesteps); got shape {arr.shape}"
         )
-    out = _convolve_rows(arr, n)
+    out = _moving_mean_rows(arr, n)
 
     target = p.out or p.field
     src_meta = ds.field_meta.get(p.field)
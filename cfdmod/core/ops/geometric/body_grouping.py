@@ -53,8 +53,15 @@ class BodyGroupingParams(OpParams):
 
     chunkable_along: ClassVar[frozenset[str]] = frozenset({"time"})
 
+    def prepare_geometry(self, ds: DataSource) -> Grouping:
+        """Build the grouping; reused across the time windows of a chunked run."""
+        return _build_grouping(ds, self)
 
-def body_grouping(ds: DataSource, p: BodyGroupingParams) -> DataSource:
+    def apply_geometry(self, ds: DataSource, geometry: Grouping) -> DataSource:
+        return ds.with_grouping(geometry)
+
+
+def _build_grouping(ds: DataSource, p: BodyGroupingParams) -> Grouping:
     lnas = LnasFormat.from_file(pathlib.Path(p.mesh))
     if lnas.geometry.triangles.shape[0] != ds.n_elements:
         raise ValueError(
@@ -76,5 +83,8 @@ def body_grouping(ds: DataSource, p: BodyGroupingParams) -> DataSource:
         indices[tris[unassigned]] = i
         id_to_label[i] = body_name
 
-    grouping = Grouping(name=p.name, indices=indices, id_to_label=id_to_label)
-    return ds.with_grouping(grouping)
+    return Grouping(name=p.name, indices=indices, id_to_label=id_to_label)
+
+
+def body_grouping(ds: DataSource, p: BodyGroupingParams) -> DataSource:
+    return ds.with_grouping(_build_grouping(ds, p))
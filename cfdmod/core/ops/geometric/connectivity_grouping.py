@@ -61,8 +61,15 @@ class ConnectivityGroupingParams(OpParams):
 
     chunkable_along: ClassVar[frozenset[str]] = frozenset({"time"})
 
+    def prepare_geometry(self, ds: DataSource) -> Grouping:
+        """Build the grouping; reused across the time windows of a chunked run."""
+        return _build_grouping(ds, self)
 
-def connectivity_grouping(ds: DataSource, p: ConnectivityGroupingParams) -> DataSource:
+    def apply_geometry(self, ds: DataSource, geometry: Grouping) -> DataSource:
+        return ds.with_grouping(geometry)
+
+
+def _build_grouping(ds: DataSource, p: ConnectivityGroupingParams) -> Grouping:
     lnas = LnasFormat.from_file(pathlib.Path(p.mesh))
     if lnas.geometry.triangles.shape[0] != ds.n_elements:
         raise ValueError(
@@ -80,5 +87,8 @@ def connectivity_grouping(ds: DataSource, p: ConnectivityGroupingParams) -> Data
         indices[tris] = region_id
         id_to_label[region_id] = name
 
-    grouping = Grouping(name=p.name, indices=indices, id_to_label=id_to_label)
-    return ds.with_grouping(grouping)
+    return Grouping(name=p.name, indices=indices, id_to_label=id_to_label)
+
+
+def connectivity_grouping(ds: DataSource, p: ConnectivityGroupingParams) -> DataSource:
+    return ds.with_grouping(_build_grouping(ds, p))
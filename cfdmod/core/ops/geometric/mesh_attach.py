@@ -41,8 +41,15 @@ class MeshAttachParams(OpParams):
     chunkable_along: ClassVar[frozenset[str]] = frozenset({"time"})
     produces_element_meta: ClassVar[frozenset[str]] = frozenset({"area", "normal", "position"})
 
+    def prepare_geometry(self, ds: DataSource) -> ElementMeta:
+        """Load the mesh attributes; reused across the time windows of a chunked run."""
+        return _mesh_elements(ds, self)
 
-def mesh_attach(ds: DataSource, p: MeshAttachParams) -> DataSource:
+    def apply_geometry(self, ds: DataSource, geometry: ElementMeta) -> DataSource:
+        return ds.with_elements(geometry)
+
+
+def _mesh_elements(ds: DataSource, p: MeshAttachParams) -> ElementMeta:
     lnas = LnasFormat.from_file(pathlib.Path(p.mesh))
     geom = lnas.geometry
     if geom.triangles.shape[0] != ds.n_elements:
@@ -52,9 +59,12 @@ def mesh_attach(ds: DataSource, p: MeshAttachParams) -> DataSource:
         )
 
     centroids = geom.triangle_vertices.mean(axis=1)
-    elements = ElementMeta(
+    return ElementMeta(
         position=centroids,
         area=geom.areas,
         normal=geom.normals,
     )
-    return ds.with_elements(elements)
+
+
+def mesh_attach(ds: DataSource, p: MeshAttachParams) -> DataSource:
+    return ds.with_elements(_mesh_elements(ds, p))
@@ -21,7 +21,7 @@ from __future__ import annotations
 __all__ = ["RegroupTopologyParams", "regroup_topology"]
 
 import pathlib
-from typing import ClassVar, Literal
+from typing import ClassVar, Literal, NamedTuple
 
 import numpy as np
 from lnas import LnasFormat
@@ -30,7 +30,7 @@ from pydantic import ConfigDict, Field
 from cfdmod.adapters.memory import MemoryFieldStore
 from cfdmod.core.data_source import DataSource, GroupsDataSource
 from cfdmod.core.field_meta import FieldMeta
-from cfdmod.core.grouping import AggregationKind, Grouping, aggregate_rows
+from cfdmod.core.grouping import AggregationKind, Grouping, GroupReducer
 from cfdmod.core.ops import OpParams
 from cfdmod.core.topology import ElementMeta, Topology
 from cfdmod.geometry.grouping import (
@@ -72,6 +72,24 @@ class RegroupTopologyParams(OpParams):
     consumes: ClassVar[frozenset[str] | None] = frozenset({"surface"})
     produces: ClassVar[str] = "groups"
 
+    def prepare_geometry(self, ds: DataSource) -> _RegroupGeometry:
+        """Group the mesh; reused across the time windows of a chunked run."""
+        return _regroup_geometry(ds, self)
+
+    def apply_geometry(self, ds: DataSource, geometry: _RegroupGeometry) -> GroupsDataSource:
+        """Aggregate ``ds``'s fields over a prepared regrouping."""
+        return _apply_regroup(ds, self, geometry)
+
+
+class _RegroupGeometry(NamedTuple):
+    """The time-independent half of a regroup: groups and their reducer."""
+
+    output_names: list[str]
+    parent_grouping: Grouping
+    parent_topology: Topology
+    reducer: GroupReducer
+    weights: np.ndarray | None
+
 
 def _build_parent_grouping(
     n_parent: int,
@@ -101,7 +119,7 @@ def _build_parent_grouping(
     )
 
 
-def regroup_topology(ds: DataSource, p: RegroupTopologyParams) -> GroupsDataSource:
+def _regroup_geometry(ds: DataSource, p: RegroupTopologyParams) -> _RegroupGeometry:
     if ds.topology is None or ds.topology.cell_type != "triangle":
         raise ValueError("regroup_topology requires a triangle (surface) parent")
 
@@ -134,19 +152,32 @@ def regroup_topology(ds: DataSource, p: RegroupTopologyParams) -> GroupsDataSour
 
     parent_grouping = _build_parent_grouping(ds.n_elements, output_names, members_per_group)
 
-    weights = lnas.geometry.areas if p.aggregation == "area_weighted_mean" else None
+    parent_topology = ds.topology
+    if parent_topology.n_elements != ds.n_elements:
+        # Fall back to constructing parent topology from the lnas directly.
+        parent_topology = Topology.triangles(
+            lnas.geometry.triangles, lnas.geometry.vertices.astype(np.float64)
+        )
+
+    return _RegroupGeometry(
+        output_names=output_names,
+        parent_grouping=parent_grouping,
+        parent_topology=parent_topology,
+        # Group ids are the output rows, so the parent grouping doubles as the
+        # reducer's row map; its CSR layout is built once and shared by every field.
+        reducer=GroupReducer(parent_grouping.indices, len(output_names)),
+        weights=lnas.geometry.areas if p.aggregation == "area_weighted_mean" else None,
+    )
+
 
+def _apply_regroup(
+    ds: DataSource, p: RegroupTopologyParams, geometry: _RegroupGeometry
+) -> GroupsDataSource:
     new_arrays: dict[str, np.ndarray] = {}
     new_meta: dict[str, FieldMeta] = {}
-    n_groups = len(output_names)
     for fname in ds.fields.keys():
         arr = np.asarray(ds.fields.read(fname), dtype=np.float64)
-        is_time = arr.ndim == 2
-        n_t = arr.shape[1] if is_time else 0
-        out_arr = np.zeros((n_groups, n_t)) if is_time else np.zeros(n_groups)
-        for row, members in enumerate(members_per_group):
-            out_arr[row] = aggregate_rows(arr, members, p.aggregation, weights)
-        new_arrays[fname] = out_arr
+        new_arrays[fname] = geometry.reducer.reduce(arr, p.aggregation, geometry.weights)
         src_meta = ds.field_meta.get(fname)
         new_meta[fname] = (
             FieldMeta(name=fname, unit=src_meta.unit, scale=src_meta.scale)
@@ -154,26 +185,24 @@ def regroup_topology(ds: DataSource, p: RegroupTopologyParams) -> GroupsDataSour
             else FieldMeta(name=fname)
         )
 
-    parent_topology = ds.topology
-    if parent_topology.n_elements != ds.n_elements:
-        # Fall back to constructing parent topology from the lnas directly.
-        parent_topology = Topology.triangles(
-            lnas.geometry.triangles, lnas.geometry.vertices.astype(np.float64)
-        )
-
+    n_groups = len(geometry.output_names)
     group_grouping = Grouping(
         name=p.grouping_name,
         indices=np.arange(n_groups, dtype=np.int32),
-        id_to_label={i: name for i, name in enumerate(output_names)},
+        id_to_label={i: name for i, name in enumerate(geometry.output_names)},
     )
 
     return GroupsDataSource(
         time=ds.time,
         topology=None,
         elements=ElementMeta(),
-        parent_topology=parent_topology,
-        parent_grouping=parent_grouping,
+        parent_topology=geometry.parent_topology,
+        parent_grouping=geometry.parent_grouping,
         groupings={p.grouping_name: group_grouping},
         fields=MemoryFieldStore(new_arrays),
         field_meta=new_meta,
     )
+
+
+def regroup_topology(ds: DataSource, p: RegroupTopologyParams) -> GroupsDataSource:
+    return _apply_regroup(ds, p, _regroup_geometry(ds, p))
@@ -54,6 +54,13 @@ class ZoningGroupingParams(OpParams):
 
     chunkable_along: ClassVar[frozenset[str]] = frozenset({"time"})
 
+    def prepare_geometry(self, ds: DataSource) -> Grouping:
+        """Build the grouping; reused across the time windows of a chunked run."""
+        return _build_grouping(ds, self)
+
+    def apply_geometry(self, ds: DataSource, geometry: Grouping) -> DataSource:
+        return ds.with_grouping(geometry)
+
 
 def _normalize_intervals(edges: list[float]) -> list[float]:
     """Empty -> open infinite interval; otherwise pass through."""
@@ -62,7 +69,7 @@ def _normalize_intervals(edges: list[float]) -> list[float]:
     return edges
 
 
-def zoning_grouping(ds: DataSource, p: ZoningGroupingParams) -> DataSource:
+def _build_grouping(ds: DataSource, p: ZoningGroupingParams) -> Grouping:
     lnas = LnasFormat.from_file(pathlib.Path(p.mesh))
     if lnas.geometry.triangles.shape[0] != ds.n_elements:
         raise ValueError(
@@ -90,4 +97,8 @@ def zoning_grouping(ds: DataSource, p: ZoningGroupingParams) -> DataSource:
         region_id = ix + nx * iy + (nx * ny) * iz
         indices[tris] = region_id
 
-    return ds.with_grouping(Grouping(name=p.name, indices=indices))
+    return Grouping(name=p.name, indices=indices)
+
+
+def zoning_grouping(ds: DataSource, p: ZoningGroupingParams) -> DataSource:
+    return ds.with_grouping(_build_grouping(ds, p))
@@ -13,6 +13,7 @@ from typing import ClassVar, Literal
 
 from cfdmod.core.data_source import DataSource
 from cfdmod.core.ops import OpParams
+from cfdmod.core.time_axis import TimeAxis
 
 
 class RescaleTimeParams(OpParams):
@@ -28,6 +29,9 @@ class RescaleTimeParams(OpParams):
 
     chunkable_along: ClassVar[frozenset[str]] = frozenset({"time", "elements"})
 
+    def output_time(self, time: TimeAxis) -> TimeAxis:
+        return time.rescale(self.factor)
+
 
 def rescale(ds: DataSource, p: RescaleTimeParams) -> DataSource:
     return ds.with_time(ds.time.rescale(p.factor))
@@ -72,6 +72,7 @@ __all__ = [
     "OpSpec",
     "BinaryOpSpec",
     "run_template",
+    "plan_fusion",
     "load_template",
     "validate_template",
     "OpInfo",
@@ -81,9 +82,10 @@ __all__ = [
     "FreshnessConfig",
 ]
 
+import contextlib
 import inspect
 import pathlib
-from typing import TYPE_CHECKING, Callable, Literal
+from typing import TYPE_CHECKING, Callable, Iterator, Literal
 
 from pydantic import BaseModel, ConfigDict, Field
 from pydantic.json_schema import GenerateJsonSchema
@@ -95,11 +97,12 @@ from cfdmod.core.errors import (
     TemplateError,
     TemplateReferenceError,
 )
-from cfdmod.core.protocols import Storage
+from cfdmod.core.protocols import OutputWriter, Pool, Storage
 from cfdmod.utils import read_yaml
 
 if TYPE_CHECKING:
-    from cfdmod.core.memory import ChunkPlan
+    from cfdmod.core.fusion import FusedGroup
+    from cfdmod.core.memory import ChunkAxis, ChunkPlan
     from cfdmod.core.progress import RunEvent
 
 # ---------------------------------------------------------------------------
@@ -780,44 +783,229 @@ def _live_time_arrays(template: PipelineTemplate) -> int:
 
 
 def _chunkable_step_params(template: PipelineTemplate) -> list[BaseModel]:
-    """Bound params for every step, for :func:`assert_time_chunkable`."""
+    """Bound params for every windowed step, for :func:`assert_time_chunkable`.
+
+    Steps that fold across windows, and the steps downstream of them that run
+    once after the windows (see :func:`_time_folds`), are not windowed and so
+    need no time chunkability.
+    """
+    folded, post = _time_folds(template)
     out: list[BaseModel] = []
-    for step in template.pipeline:
+    for i, step in enumerate(template.pipeline):
         entry = OP_REGISTRY.get(step.kind)
-        if entry is None:
+        step_id = step.id or f"step_{i}"
+        if entry is None or step_id in folded or step_id in post:
             continue
         out.append(_step_params(step, entry[2], template.root))
     return out
 
 
+def _element_chunkable_step_params(template: PipelineTemplate) -> list[BaseModel]:
+    """Bound params for every step, for :func:`assert_element_chunkable`.
+
+    Unlike the time axis, nothing folds across element blocks: every step
+    runs per block, so every step must declare ``"elements"``.
+    """
+    out: list[BaseModel] = []
+    for step in template.pipeline:
+        entry = OP_REGISTRY.get(step.kind)
+        if entry is not None:
+            out.append(_step_params(step, entry[2], template.root))
+    return out
+
+
+def _time_halo(template: PipelineTemplate, bindings: dict[str, DataSource]) -> int:
+    """Timesteps a chunked run must overlap its windows by, on each side.
+
+    Each step's :meth:`~cfdmod.core.ops.OpParams.time_halo` is evaluated on
+    the time axis it will see -- its input's, carried through
+    :meth:`~cfdmod.core.ops.OpParams.output_time` from the loaded bindings --
+    and the halos add up along every chain from an input to what the run
+    keeps: a moving average of a moving average needs both. Steps that run
+    after the windows (see :func:`_time_folds`) see the whole series and add
+    nothing.
+    """
+    _populate_default_registry()
+    _, post = _time_folds(template)
+    times = {name: ds.time for name, ds in bindings.items() if not ds.time.is_time_aggregated}
+    chain: list[tuple[str, tuple[str, ...], int]] = []
+    for i, step in enumerate(template.pipeline):
+        step_id = step.id or f"step_{i}"
+        entry = OP_REGISTRY.get(step.kind)
+        time = times.get(step.source)
+        if entry is None or time is None or step_id in post:
+            continue
+        params = _step_params(step, entry[2], template.root)
+        halo = params.time_halo(time) if hasattr(params, "time_halo") else 0
+        if hasattr(params, "output_time"):
+            time = params.output_time(time)
+        times[step_id] = time
+        chain.append((step_id, tuple(ref for ref in (step.source, step.rhs) if ref), halo))
+    margin: dict[str, int] = {}
+    for step_id, refs, halo in reversed(chain):
+        need = margin.get(step_id, 0) + halo
+        for ref in refs:
+            margin[ref] = max(margin.get(ref, 0), need)
+    return max((margin.get(name, 0) for name in bindings), default=0)
+
+
+def _time_folds(template: PipelineTemplate) -> tuple[set[str], set[str]]:
+    """Step ids a chunked run folds across windows, and those that run after.
+
+    An op that collapses the time axis cannot run per window, but one whose
+    params implement ``fold_window(ds, state) -> state`` and
+    ``finish_fold(first_window, state) -> DataSource`` (``statistics``) can
+    be folded: every window updates its state and the result is built once
+    at the end. Anything reading a folded result, directly or through another
+    such step, only exists after the last window, so it runs then, once.
+    """
+    _populate_default_registry()
+    folded: set[str] = set()
+    post: set[str] = set()
+    for i, step in enumerate(template.pipeline):
+        step_id = step.id or f"step_{i}"
+        entry = OP_REGISTRY.get(step.kind)
+        if any(ref in folded or ref in post for ref in (step.source, step.rhs) if ref):
+            post.add(step_id)
+        elif entry is not None and hasattr(entry[2], "fold_window"):
+            folded.add(step_id)
+    return folded, post
+
+
 def _plan_for(
     template: PipelineTemplate,
     bindings: dict[str, DataSource],
     chunk_size: int | None,
     memory_budget: int | None,
     n_live_arrays: int | None,
+    prefetch: int = 0,
+    axis: "ChunkAxis" = "time",
+    concurrent: int = 1,
 ) -> "ChunkPlan":
-    """Size the time window for this run from the loaded inputs.
+    """Size the time window (or element block) for this run from the loaded inputs.
 
     The shape comes from the widest time-resolved input: that is what a window
     of the pipeline actually costs. With no time-resolved input, or a single
     timestep, the plan is a single pass -- there is nothing to split.
+
+    ``prefetch`` windows of every time-resolved input are priced into the
+    window, and only when the run is asked to chunk: a single pass reads
+    nothing ahead. So is the pipeline's time halo (:func:`_time_halo`).
+
+    With ``axis="elements"``, ``chunk_size`` is elements per block and the
+    plan cuts the element axis of the same inputs instead; blocks take
+    neither read-ahead nor a halo. ``concurrent`` windows in flight on a
+    pool are priced in either way.
     """
     from cfdmod.core.memory import plan_chunking
 
+    if prefetch < 0:
+        raise ValueError(f"prefetch must be non-negative; got {prefetch}")
     resolved_live = n_live_arrays if n_live_arrays is not None else _live_time_arrays(template)
     timed = [ds for ds in bindings.values() if not ds.time.is_time_aggregated]
     n_timesteps = max((ds.time.n_timesteps for ds in timed), default=0)
     n_elements = max((ds.n_elements for ds in timed), default=0)
 
+    if axis == "elements":
+        return plan_chunking(
+            n_elements,
+            n_timesteps,
+            budget_bytes=memory_budget,
+            chunk_size=chunk_size,
+            n_live_arrays=resolved_live,
+            axis="elements",
+            concurrent=concurrent,
+        )
     if n_timesteps <= 1:
         return plan_chunking(n_elements, n_timesteps, n_live_arrays=resolved_live)
+    chunking = chunk_size is not None or memory_budget is not None
     return plan_chunking(
         n_elements,
         n_timesteps,
         budget_bytes=memory_budget,
         chunk_size=chunk_size,
         n_live_arrays=resolved_live,
+        prefetch=prefetch if chunking else 0,
+        n_prefetch_arrays=max(1, len(timed)),
+        halo=_time_halo(template, bindings) if chunking else 0,
+        concurrent=concurrent,
+    )
+
+
+def _choose_plan(
+    template: PipelineTemplate,
+    bindings: dict[str, DataSource],
+    chunk_size: int | None,
+    element_chunk: int | None,
+    memory_budget: int | None,
+    chunk_axis: str,
+    n_live_arrays: int | None,
+    prefetch: int,
+    concurrent: int = 1,
+) -> "ChunkPlan":
+    """Pick the chunking axis for this run and size it.
+
+    An explicit ``chunk_size`` or ``element_chunk`` names its axis. A
+    ``memory_budget`` is spent on ``chunk_axis``; with ``"auto"`` the time
+    axis wins whenever the pipeline can be windowed and a window fits the
+    budget (time windows stream their outputs), and element blocks are the
+    fallback for a pipeline that cannot be windowed or a surface too wide
+    for a single timestep. A pipeline that fits in one pass is not chunked
+    at all.
+    """
+    from cfdmod.core.chunked import assert_element_chunkable, assert_time_chunkable
+
+    if chunk_axis not in ("time", "elements", "auto"):
+        raise ValueError(f"chunk_axis must be 'time', 'elements' or 'auto'; got {chunk_axis!r}")
+    if element_chunk is not None:
+        if chunk_size is not None or memory_budget is not None:
+            raise ValueError("pass one of chunk_size, element_chunk or memory_budget")
+        if chunk_axis == "time":
+            chunk_axis = "elements"
+    if chunk_size is not None and chunk_axis == "elements":
+        raise ValueError("chunk_size is in timesteps; use element_chunk for element blocks")
+    if chunk_axis == "elements":
+        return _plan_for(
+            template,
+            bindings,
+            element_chunk,
+            memory_budget,
+            n_live_arrays,
+            axis="elements",
+            concurrent=concurrent,
+        )
+
+    plan = _plan_for(
+        template,
+        bindings,
+        chunk_size,
+        memory_budget,
+        n_live_arrays,
+        prefetch,
+        concurrent=concurrent,
+    )
+    if chunk_axis == "time" or chunk_size is not None or not plan.is_chunked:
+        return plan
+    try:
+        assert_time_chunkable(_chunkable_step_params(template))
+        time_ok = not plan.exceeds_budget
+    except ValueError:
+        time_ok = False
+    if time_ok:
+        return plan
+    try:
+        assert_element_chunkable(_element_chunkable_step_params(template))
+    except ValueError:
+        # Neither axis works: the time plan's own check reports why.
+        return plan
+    return _plan_for(
+        template,
+        bindings,
+        None,
+        memory_budget,
+        n_live_arrays,
+        axis="elements",
+        concurrent=concurrent,
     )
 
 
@@ -861,6 +1049,87 @@ def _retained_bindings(template: PipelineTemplate) -> set[str] | None:
     return sources or None
 
 
+def plan_fusion(
+    template: PipelineTemplate,
+    *,
+    needed_steps: set[str] | None = None,
+    keep_all: bool = False,
+) -> list["FusedGroup"]:
+    """The runs of elementwise steps ``run_template(fuse=True)`` evaluates as one kernel.
+
+    A run is a chain of consecutive steps whose ops implement the fused-kernel
+    hooks (:mod:`cfdmod.core.fusion`), each reading the previous one as its
+    ``source``, where no step but the last is read by anything else -- another
+    step, an ``rhs``, or an output. Only the last step's binding exists
+    afterwards, and it carries just the fields its readers consume, unless
+    one of them carries its fields on (``replaces_fields`` false) or it is an
+    output, in which case it carries all of them.
+
+    With ``keep_all`` (``run_template(return_all=True)``, or a template with
+    no outputs, both of which are run for their intermediates) nothing is
+    fused. ``needed_steps`` restricts the plan to the steps a ``skip_fresh``
+    run executes.
+    """
+    from cfdmod.core.fusion import FusedGroup, is_elementwise
+
+    _populate_default_registry()
+    if keep_all or not template.outputs:
+        return []
+    readers: dict[str, list[int]] = {}
+    for i, step in enumerate(template.pipeline):
+        for ref in (step.source, step.rhs):
+            if ref:
+                readers.setdefault(ref, []).append(i)
+    outputs = {out.source for out in template.outputs.values()}
+
+    def group(run: list[int]) -> FusedGroup:
+        steps = [template.pipeline[i] for i in run]
+        last = steps[-1].id or f"step_{run[-1]}"
+        fields: set[str] | None = None if last in outputs else set()
+        for i in readers.get(last, []):
+            reader = template.pipeline[i]
+            params = _step_params(reader, OP_REGISTRY[reader.kind][2], template.root)
+            if fields is None or (
+                reader.source == last and not getattr(params, "replaces_fields", False)
+            ):
+                fields = None
+                break
+            fields |= _consumed_fields(params)
+        return FusedGroup(
+            source=steps[0].source,
+            steps=tuple(st.id or f"step_{i}" for i, st in zip(run, steps)),
+            kinds=tuple(st.kind for st in steps),
+            fields=None if fields is None else frozenset(fields),
+        )
+
+    groups: list[FusedGroup] = []
+    run: list[int] = []
+    for i, step in enumerate(template.pipeline):
+        step_id = step.id or f"step_{i}"
+        entry = OP_REGISTRY.get(step.kind)
+        fusable = (
+            entry is not None
+            and is_elementwise(entry[2])
+            and (needed_steps is None or step_id in needed_steps)
+        )
+        prev = (template.pipeline[run[-1]].id or f"step_{run[-1]}") if run else None
+        if (
+            fusable
+            and prev is not None
+            and step.source == prev
+            and readers.get(prev) == [i]
+            and prev not in outputs
+        ):
+            run.append(i)
+            continue
+        if len(run) > 1:
+            groups.append(group(run))
+        run = [i] if fusable else []
+    if len(run) > 1:
+        groups.append(group(run))
+    return groups
+
+
 class _Reporter:
     """Bundles the ``on_progress`` / ``cancel`` seams so the runner takes one
     argument instead of threading two optionals through four functions.
@@ -893,6 +1162,286 @@ class _Reporter:
 _NULL_REPORTER = _Reporter(None, None)
 
 
+class _OutputStreams:
+    """The chunked runner's incremental output path.
+
+    When the storage has ``open_writer``, each output the run will write gets
+    an :class:`~cfdmod.core.protocols.OutputWriter` on the first window, and
+    every window's result is appended to it instead of being kept for
+    :func:`~cfdmod.core.chunked.concat_time`. The full output never exists in
+    RAM; :func:`_write_outputs` commits each writer where it would otherwise
+    have written the concatenated result, and anything left uncommitted --
+    a cancel, a failing op -- is aborted, so nothing half-written is published.
+
+    A binding streams only when every output reading it is persisted (an
+    unpersisted one has nowhere to be read back from) and it is
+    time-resolved and not a ``groups`` source: those are a row per group,
+    cheap to concatenate, and the h5 layout stores them as the broadcast
+    parent surface, which would not read back as the same kind.
+    """
+
+    __slots__ = ("_storage", "_accepts_kind", "_targets", "_writers", "_committed", "_sources")
+
+    def __init__(
+        self,
+        template: PipelineTemplate,
+        storage: Storage,
+        stale_outputs: set[str] | None,
+        accepts_kind: bool,
+    ) -> None:
+        targets: dict[str, list[tuple[str, str]]] = {}
+        unpersisted: set[str] = set()
+        for out_name, out in template.outputs.items():
+            if stale_outputs is not None and out_name not in stale_outputs:
+                continue
+            if not out.persist:
+                unpersisted.add(out.source)
+                continue
+            key = _resolve_key(template.root, out.path)
+            targets.setdefault(out.source, []).append((out_name, key))
+        self._storage = storage
+        self._accepts_kind = accepts_kind
+        # binding -> [(output name, storage key)] it may stream to.
+        self._targets = {s: t for s, t in targets.items() if s not in unpersisted}
+        self._writers: dict[str, OutputWriter] = {}
+        self._committed: set[str] = set()
+        # streamed binding -> (key, kind) to read it back from once committed.
+        self._sources: dict[str, tuple[str, str]] = {}
+
+    def offer(self, name: str, part: DataSource, n_timesteps: int) -> bool:
+        """Append ``part`` to ``name``'s writers; False if ``name`` does not stream.
+
+        The decision is taken on the first window and holds for the rest:
+        every window produces the same bindings, of the same kind.
+        """
+        if name not in self._sources:
+            targets = self._targets.get(name)
+            if not targets or part.kind == "groups" or part.time.is_time_aggregated:
+                return False
+            from cfdmod.adapters.memory import MemoryFieldStore
+            from cfdmod.core.time_axis import TimeAxis
+
+            full = part._copy_validated(
+                fields=MemoryFieldStore({}),
+                field_meta={},
+                time=TimeAxis(
+                    initial_time=part.time.initial_time,
+                    timestep_size=part.time.timestep_size,
+                    n_timesteps=n_timesteps,
+                    time_normalized_offset=part.time.normalization_offset,
+                ),
+            )
+            for out_name, key in targets:
+                self._writers[out_name] = self._storage.open_writer(key, full)
+            self._sources[name] = (targets[0][1], part.kind)
+        for out_name, _ in self._targets[name]:
+            self._writers[out_name].append(part)
+        return True
+
+    def is_streamed(self, out_name: str) -> bool:
+        return out_name in self._writers
+
+    def commit(self, out_name: str) -> None:
+        self._writers[out_name].commit()
+        self._committed.add(out_name)
+
+    def read_back(self, name: str) -> DataSource:
+        """The committed output of binding ``name``, as the storage reads it."""
+        key, kind = self._sources[name]
+        if self._accepts_kind:
+            return self._storage.read_data_source(key, kind=kind)
+        return self._storage.read_data_source(key)
+
+    def abort(self) -> None:
+        """Discard every writer not yet committed."""
+        for out_name, writer in self._writers.items():
+            if out_name not in self._committed:
+                writer.abort()
+        self._committed.update(self._writers)
+
+
+def _kept_window(
+    produced: dict[str, DataSource], retain: set[str] | None, window: slice, read: slice
+) -> dict[str, DataSource]:
+    """The retained results of one time window, trimmed back to it."""
+    from cfdmod.core.chunked import trim_halo
+
+    return {
+        name: trim_halo(ds, window, read)
+        for name, ds in produced.items()
+        if retain is None or name in retain
+    }
+
+
+def _windows_in_process(
+    template: PipelineTemplate,
+    bindings: dict[str, DataSource],
+    window_steps: set[str],
+    plan: "ChunkPlan",
+    reporter: "_Reporter",
+    last_use: dict[str, int] | None,
+    retain: set[str] | None,
+    folds: dict[str, tuple[object, DataSource]],
+    fused: dict[str, "FusedGroup"] | None = None,
+) -> Iterator[tuple[dict[str, DataSource], dict[str, tuple[object, DataSource]]]]:
+    """Yield each time window's retained results, computed in this process.
+
+    Folds go straight into ``folds``, so every yielded fold dict is empty.
+    """
+    from cfdmod.core.chunked import halo_windows, prefetch_windows, time_windows
+
+    windows = list(time_windows(plan.n_timesteps, plan.chunk_size))
+    reads = halo_windows(windows, plan.n_timesteps, plan.halo)
+    geometry: dict[tuple, tuple[object, object, object]] = {}
+    # With plan.prefetch > 0 the next windows are read on a background thread
+    # while this one computes; closing the iterator stops it on any exit.
+    with contextlib.closing(prefetch_windows(bindings, reads, plan.prefetch)) as sliced:
+        for w in range(len(windows)):
+            # Poll per window: that is the unit of work that actually takes time,
+            # so it is the granularity at which cancelling is useful.
+            reporter.check("step", f"window {w + 1}")
+            window = next(sliced)
+            read = reads[w]
+            core = slice(windows[w].start - read.start, windows[w].stop - read.start)
+            produced = _walk_steps(
+                template,
+                window,
+                window_steps,
+                reporter,
+                window_index=w,
+                n_windows=len(windows),
+                last_use=last_use,
+                folds=folds,
+                fold_slice=core if plan.halo else None,
+                geometry=geometry,
+                fused=fused,
+            )
+            kept = _kept_window(produced, retain, windows[w], read)
+            # Drop the window's own bindings before allocating the next one.
+            del produced, window
+            yield kept, {}
+
+
+class _InputLoader:
+    """Reads a run's inputs from its storage by name; picklable for a pool."""
+
+    __slots__ = ("storage", "keys", "accepts_kind")
+
+    def __init__(
+        self, storage: Storage, keys: dict[str, tuple[str, str]], accepts_kind: bool
+    ) -> None:
+        self.storage = storage
+        # input name -> (storage key, declared kind)
+        self.keys = keys
+        self.accepts_kind = accepts_kind
+
+    def load(self) -> dict[str, DataSource]:
+        if self.accepts_kind:
+            return {
+                name: self.storage.read_data_source(key, kind=kind)
+                for name, (key, kind) in self.keys.items()
+            }
+        return {name: self.storage.read_data_source(key) for name, (key, _) in self.keys.items()}
+
+
+class _BlockTask:
+    """One time window or element block of a chunked run, as a :class:`Pool` task.
+
+    ``pool.map(task, indices)`` runs block ``i`` in a worker, which reads
+    its own inputs through the loader and cuts them to the block -- from a
+    file-backed storage only the block's slab comes off disk -- so nothing
+    the size of an input crosses a process boundary. It returns the block's
+    retained results and, for a time window, that window's own folds for
+    the parent to merge.
+
+    Progress events and the geometry cache stay with the parent: a worker
+    runs its steps unobserved and prepares its own geometry.
+    """
+
+    __slots__ = ("template", "loader", "plan", "steps", "retain", "last_use", "fused")
+
+    def __init__(
+        self,
+        template: PipelineTemplate,
+        loader: _InputLoader,
+        plan: "ChunkPlan",
+        steps: set[str] | None,
+        retain: set[str] | None,
+        last_use: dict[str, int] | None,
+        fused: dict[str, "FusedGroup"] | None = None,
+    ) -> None:
+        self.template = template
+        self.loader = loader
+        self.plan = plan
+        self.steps = steps
+        self.retain = retain
+        self.last_use = last_use
+        self.fused = fused
+
+    def __call__(
+        self, index: int
+    ) -> tuple[dict[str, DataSource], dict[str, tuple[object, DataSource]]]:
+        from cfdmod.core.chunked import halo_windows, slice_elements, slice_time
+
+        plan = self.plan
+        bindings = self.loader.load()
+        start = index * plan.chunk_size
+        block = slice(start, min(start + plan.chunk_size, plan.axis_length))
+        if plan.axis == "elements":
+            cut = {
+                name: slice_elements(ds, block) if ds.n_elements == plan.n_elements else ds
+                for name, ds in bindings.items()
+            }
+            produced = _walk_steps(
+                self.template, cut, self.steps, last_use=self.last_use, fused=self.fused
+            )
+            kept = {
+                name: ds
+                for name, ds in produced.items()
+                if name not in bindings and (self.retain is None or name in self.retain)
+            }
+            return kept, {}
+        read = halo_windows([block], plan.n_timesteps, plan.halo)[0]
+        cut = {
+            name: ds if ds.time.is_time_aggregated else slice_time(ds, read)
+            for name, ds in bindings.items()
+        }
+        folds: dict[str, tuple[object, DataSource]] = {}
+        produced = _walk_steps(
+            self.template,
+            cut,
+            self.steps,
+            last_use=self.last_use,
+            folds=folds,
+            fold_slice=slice(block.start - read.start, block.stop - read.start)
+            if plan.halo
+            else None,
+            fused=self.fused,
+        )
+        return _kept_window(produced, self.retain, block, read), folds
+
+
+def _dispatch(
+    pool: Pool,
+    task: _BlockTask,
+    n_blocks: int,
+    batch: int,
+    reporter: "_Reporter",
+    label: str,
+) -> Iterator[tuple[dict[str, DataSource], dict[str, tuple[object, DataSource]]]]:
+    """Yield ``task(i)`` for every block in order, ``batch`` blocks per ``pool.map``.
+
+    Batching is what bounds memory: at most ``batch`` blocks' results exist
+    before they are consumed. Cancellation is polled per batch.
+    """
+    for start in range(0, n_blocks, batch):
+        reporter.check("step", f"{label} {start + 1}")
+        indices = list(range(start, min(start + batch, n_blocks)))
+        for i, outcome in zip(indices, list(pool.map(task, indices))):
+            reporter.emit("step", f"{label} {i + 1}", i, n_blocks, window=i, n_windows=n_blocks)
+            yield outcome
+
+
 def _walk_chunked(
     template: PipelineTemplate,
     bindings: dict[str, DataSource],
@@ -900,6 +1449,10 @@ def _walk_chunked(
     plan: "ChunkPlan",
     reporter: "_Reporter" = _NULL_REPORTER,
     last_use: dict[str, int] | None = None,
+    streams: _OutputStreams | None = None,
+    pool: Pool | None = None,
+    loader: "_InputLoader | None" = None,
+    fused: dict[str, "FusedGroup"] | None = None,
 ) -> dict[str, DataSource]:
     """Run the step walk once per time window and concatenate the results.
 
@@ -913,42 +1466,74 @@ def _walk_chunked(
     across windows; the rest go out of scope with their window, which is the
     entire source of the memory saving. The returned dict therefore carries
     the inputs (unsliced, as loaded) plus the retained results -- an
-    intermediate that no output depends on is not reconstructed.
+    intermediate that no output depends on is not reconstructed. A result
+    that ``streams`` takes is appended to its writers window by window and
+    is absent from the returned dict; :func:`_write_outputs` commits it.
 
     Safe only for a time-length-preserving pipeline -- the caller must have
-    run :func:`~cfdmod.core.chunked.assert_time_chunkable` first. An op that
-    reduces the time axis (``statistics``) does not declare time
-    chunkability precisely because windowed statistics are not the statistics
-    of the whole series.
+    run :func:`~cfdmod.core.chunked.assert_time_chunkable` first -- with one
+    exception: a step that folds (``statistics``, see :func:`_time_folds`)
+    is fed every window in turn and finished after the last one, since
+    windowed statistics are not the statistics of the whole series. The
+    steps downstream of it then run once on the merged bindings, so any
+    per-window result they read is retained for them.
+
+    With ``plan.halo`` every window is read that many timesteps wider on each
+    side, the walk runs on the wider window, and each time-resolved result
+    (and what a fold sees) is trimmed back to the window.
+
+    Geometry work (mesh loads, face cuts, groupings) is done on the first
+    window and reused by the rest; see ``geometry`` in :func:`_walk_steps`.
+
+    With ``pool``, ``plan.concurrent`` windows at a time are dispatched to it
+    as :class:`_BlockTask` calls that read their own inputs through
+    ``loader``; results come back in window order, and a folding step's
+    per-window folds are combined with its params' ``merge_folds``.
     """
-    from cfdmod.core.chunked import concat_time, slice_time, time_windows
-
+    from cfdmod.core.chunked import concat_time
+
+    folded, post = _time_folds(template)
+    post_refs = {
+        ref
+        for i, step in enumerate(template.pipeline)
+        if (step.id or f"step_{i}") in post
+        for ref in (step.source, step.rhs)
+        if ref
+    }
     retain = _retained_bindings(template)
-    windows = list(time_windows(plan.n_timesteps, plan.chunk_size))
+    if retain is not None:
+        retain |= post_refs - set(bindings)
+    window_steps = {step.id or f"step_{i}" for i, step in enumerate(template.pipeline)} - post
+    if needed_steps is not None:
+        window_steps &= needed_steps
+    n_windows = -(-plan.n_timesteps // plan.chunk_size)
     accumulated: dict[str, list[DataSource]] = {}
-    for w, sl in enumerate(windows):
-        # Poll per window: that is the unit of work that actually takes time,
-        # so it is the granularity at which cancelling is useful.
-        reporter.check("step", f"window {w + 1}")
-        window = {
-            name: ds if ds.time.is_time_aggregated else slice_time(ds, sl)
-            for name, ds in bindings.items()
-        }
-        produced = _walk_steps(
-            template,
-            window,
-            needed_steps,
-            reporter,
-            window_index=w,
-            n_windows=len(windows),
-            last_use=last_use,
+    folds: dict[str, tuple[object, DataSource]] = {}
+    if pool is None:
+        outcomes = _windows_in_process(
+            template, bindings, window_steps, plan, reporter, last_use, retain, folds, fused
         )
-        for name, ds in produced.items():
-            if retain is not None and name not in retain:
-                continue
-            accumulated.setdefault(name, []).append(ds)
-        # Drop the window's own bindings before allocating the next one.
-        del produced, window
+    else:
+        fold_params = {
+            step.id or f"step_{i}": _step_params(step, OP_REGISTRY[step.kind][2], template.root)
+            for i, step in enumerate(template.pipeline)
+            if (step.id or f"step_{i}") in folded
+        }
+        task = _BlockTask(template, loader, plan, window_steps, retain, last_use, fused)
+        outcomes = _dispatch(pool, task, n_windows, plan.concurrent, reporter, "window")
+    with contextlib.closing(outcomes):
+        for kept, window_folds in outcomes:
+            for name, ds in kept.items():
+                if streams is not None and streams.offer(name, ds, plan.n_timesteps):
+                    continue
+                accumulated.setdefault(name, []).append(ds)
+            for step_id, (state, first) in window_folds.items():
+                if step_id in folds:
+                    earlier, first = folds[step_id]
+                    state = fold_params[step_id].merge_folds(earlier, state)
+                folds[step_id] = (state, first)
+            # Drop the window's results before the next one is computed.
+            del kept, window_folds
 
     merged: dict[str, DataSource] = dict(bindings)
     for name, parts in accumulated.items():
@@ -956,6 +1541,94 @@ def _walk_chunked(
             merged[name] = parts[0]
         else:
             merged[name] = concat_time(parts)
+    for i, step in enumerate(template.pipeline):
+        step_id = step.id or f"step_{i}"
+        if step_id not in folds or (
+            retain is not None and step_id not in retain and step_id not in post_refs
+        ):
+            continue
+        state, first = folds.pop(step_id)
+        params = _step_params(step, OP_REGISTRY[step.kind][2], template.root)
+        merged[step_id] = params.finish_fold(first, state)
+    if post:
+        needed_post = post if needed_steps is None else post & needed_steps
+        merged = _walk_steps(
+            template, merged, needed_post, reporter, last_use=last_use, fused=fused
+        )
+    return merged
+
+
+def _walk_elements(
+    template: PipelineTemplate,
+    bindings: dict[str, DataSource],
+    needed_steps: set[str] | None,
+    plan: "ChunkPlan",
+    reporter: "_Reporter" = _NULL_REPORTER,
+    last_use: dict[str, int] | None = None,
+    pool: Pool | None = None,
+    loader: _InputLoader | None = None,
+    fused: dict[str, "FusedGroup"] | None = None,
+) -> dict[str, DataSource]:
+    """Run the step walk once per element block and stack the results.
+
+    The element-axis counterpart of :func:`_walk_chunked`: every binding
+    over the planned element axis is cut to the same contiguous rows
+    (:func:`~cfdmod.core.chunked.slice_elements`), the whole walk runs on the
+    block, and the retained results are stacked back
+    (:func:`~cfdmod.core.chunked.concat_elements`). Bindings over some other
+    element axis -- a single reference row, a mesh -- pass through whole.
+
+    Each block carries the full time axis, so nothing folds and nothing
+    needs a halo; every step must declare ``"elements"`` (the caller runs
+    :func:`~cfdmod.core.chunked.assert_element_chunkable` first). Results
+    are stacked in RAM rather than streamed: the pipelines this is for
+    collapse time, so what they keep is one row per element at most.
+
+    With ``pool``, blocks are dispatched to it as in :func:`_walk_chunked`.
+    """
+    from cfdmod.core.chunked import concat_elements, element_blocks, slice_elements
+
+    for name, ds in bindings.items():
+        if ds.kind == "groups" and ds.n_elements == plan.n_elements:
+            raise TemplateError(
+                f"cannot run this template chunked over elements: input {name!r} is a "
+                "groups source, whose rows cannot be cut into blocks"
+            )
+    retain = _retained_bindings(template)
+    blocks = list(element_blocks(plan.n_elements, plan.chunk_size))
+    accumulated: dict[str, list[DataSource]] = {}
+    if pool is not None:
+        task = _BlockTask(template, loader, plan, needed_steps, retain, last_use, fused)
+        for kept, _ in _dispatch(pool, task, len(blocks), plan.concurrent, reporter, "block"):
+            for name, ds in kept.items():
+                accumulated.setdefault(name, []).append(ds)
+    else:
+        for b, block in enumerate(blocks):
+            reporter.check("step", f"block {b + 1}")
+            sliced = {
+                name: slice_elements(ds, block) if ds.n_elements == plan.n_elements else ds
+                for name, ds in bindings.items()
+            }
+            produced = _walk_steps(
+                template,
+                sliced,
+                needed_steps,
+                reporter,
+                window_index=b,
+                n_windows=len(blocks),
+                last_use=last_use,
+                fused=fused,
+            )
+            for name, ds in produced.items():
+                if name in bindings or (retain is not None and name not in retain):
+                    continue
+                accumulated.setdefault(name, []).append(ds)
+            # Drop the block's own bindings before reading the next one.
+            del produced, sliced
+
+    merged: dict[str, DataSource] = dict(bindings)
+    for name, parts in accumulated.items():
+        merged[name] = concat_elements(parts)
     return merged
 
 
@@ -971,6 +1644,13 @@ def run_template(
     on_progress: Callable[["RunEvent"], None] | None = None,
     cancel: Callable[[], bool] | None = None,
     return_all: bool = False,
+    prefetch: int = 0,
+    element_chunk: int | None = None,
+    chunk_axis: Literal["time", "elements", "auto"] = "time",
+    pool: Pool | None = None,
+    pool_size: int | None = None,
+    fuse: bool = False,
+    on_fuse: Callable[[list["FusedGroup"]], None] | None = None,
 ) -> dict[str, DataSource]:
     """Run a parsed template against a :class:`Storage`.
 
@@ -999,17 +1679,64 @@ def run_template(
 
     Two things are worth being clear about:
 
-    - **It is not free on every template.** The win is real when the pipeline
-      collapses the element axis before the concatenation (a per-triangle force
-      summed to a per-floor coefficient): the big intermediates then live for
-      one window at a time while the concatenated result stays small. A
-      pipeline that keeps the full element axis still bounds its transient
-      allocations, but its final output is the same size as the unchunked one.
+    - **Outputs stream when the storage allows it.** A storage with
+      ``open_writer`` (every built-in h5 backend) receives each persisted,
+      time-resolved output one window at a time, so even a pipeline that keeps
+      the full element axis -- a whole-surface Cp history -- never holds its
+      output in RAM and ``memory_budget`` bounds the real peak. A held output
+      is then returned as the storage reads it back (lazily, for h5). Without
+      ``open_writer``, or for an output with ``persist: false``, the windows
+      are concatenated in RAM as before, and the win is real only when the
+      pipeline collapses the element axis first (a per-triangle force summed
+      to a per-floor coefficient).
     - **Not every pipeline may be chunked.** Every op must declare ``"time"``
-      in ``chunkable_along``. ``statistics`` deliberately does not -- the
-      statistics of a window are not the statistics of the series -- so a
-      template containing it raises before any I/O, naming the offending ops,
-      rather than producing plausible wrong numbers.
+      in ``chunkable_along``, or fold across windows: ``statistics`` folds
+      each window into mergeable moments and finishes once, so a Cp ->
+      stats template runs under ``memory_budget`` with the statistics of
+      the whole series. Steps reading a folded result run once, after the
+      last window. Any other op that collapses the time axis
+      (``extreme_value``) raises before any I/O, naming the offending ops,
+      rather than producing plausible wrong numbers. An op that reads
+      neighbouring timesteps (``moving_average``) declares a time halo, and
+      the windows are read overlapping by it.
+
+    Element chunking
+    ----------------
+    With ``element_chunk`` (or ``memory_budget`` and ``chunk_axis="elements"``)
+    the pipeline instead runs over contiguous blocks of element rows, each
+    with its whole time series, and the results are stacked back. That is the
+    cut for a pipeline that collapses time over a huge surface -- an
+    ``extreme_value`` run that cannot be windowed -- and it needs every op to
+    declare ``"elements"`` in ``chunkable_along``; anything else (a face cut,
+    a group reduction) raises before any work. Outputs are stacked in RAM,
+    not streamed. ``chunk_axis="auto"`` spends ``memory_budget`` on time
+    windows when the pipeline can be windowed and a window fits, and on
+    element blocks otherwise.
+
+    Parallel windows
+    ----------------
+    With ``pool`` (anything with ``map``: a ``multiprocessing.Pool``, a
+    thread pool), the windows or blocks of a chunked run are dispatched to
+    it ``pool_size`` at a time instead of running one after the other. Each
+    worker reads its own inputs from ``storage`` and cuts its window, so the
+    storage must be picklable for a process pool, and should be file-backed
+    for the point of it: a memory storage is copied to every worker. Results
+    come back in order and are streamed or stacked exactly as in a serial
+    run; ``statistics`` folds each window apart and merges the folds. The
+    plan prices ``pool_size`` windows in flight, so under ``memory_budget``
+    every window shrinks to make room for its peers. A run that is not
+    chunked ignores the pool.
+
+    Fused elementwise chains
+    ------------------------
+    With ``fuse=True`` each run of consecutive elementwise steps over one
+    source -- ``sub`` -> ``scale`` -> ``force_contribution`` ->
+    ``moment_contribution``, see :func:`plan_fusion` -- is evaluated as a
+    single kernel over cache-sized tiles of the source, writing straight
+    into preallocated outputs. The intermediate steps' full-size fields are
+    never allocated, and the last step keeps only the fields something
+    downstream reads. The numbers are the same as an unfused run. This
+    composes with chunking: the kernel runs on each window or block.
 
     Args:
         chunk_size: Timesteps per window. Mutually exclusive with
@@ -1036,6 +1763,28 @@ def run_template(
             step or output reads it, so the peak of a run is its widest live
             set rather than the sum of everything it ever computed. Turn it on
             for notebook work where inspecting intermediates is the point.
+        prefetch: Time windows to read ahead on a background thread in a
+            chunked run, so reading the next window overlaps computing this
+            one. ``0`` (the default) reads each window when it is reached.
+            The read-ahead is priced into the plan: under ``memory_budget``
+            the window shrinks to make room for it. Worth ``1`` or ``2``
+            when reading a window takes about as long as computing it.
+        element_chunk: Elements per block for an element-chunked run.
+            Mutually exclusive with ``chunk_size`` and ``memory_budget``.
+        chunk_axis: The axis ``memory_budget`` is spent on: ``"time"`` (the
+            default), ``"elements"``, or ``"auto"`` to pick whichever fits.
+        pool: Runs the windows (or element blocks) of a chunked run in
+            parallel; see above. Exclusive with ``prefetch``: workers read
+            their own windows.
+        pool_size: Windows in flight at once on ``pool``; required with
+            ``pool``, since the memory plan prices that many windows.
+        fuse: Evaluate runs of elementwise steps as fused kernels; see above.
+            Intermediates inside a run are never bound, so this has no
+            effect together with ``return_all``.
+        on_fuse: Called with the list of
+            :class:`~cfdmod.core.fusion.FusedGroup` before execution starts
+            when ``fuse`` is on, even if it is empty; ``FusedGroup.describe()``
+            renders a line per group.
 
     Returns:
         The inputs, plus the outputs declared with ``hold: true`` (the
@@ -1044,6 +1793,17 @@ def run_template(
     _populate_default_registry()
     # Static validation first: fail on typos/dangling refs before any I/O.
     validate_template(template)
+    concurrent = 1
+    if pool is not None:
+        if prefetch:
+            raise ValueError(
+                "prefetch and pool are exclusive: pool workers read their own windows"
+            )
+        if pool_size is None:
+            raise ValueError("pool needs pool_size: the number of windows it runs at once")
+        concurrent = pool_size
+        if concurrent < 1:
+            raise ValueError(f"pool_size must be at least 1; got {concurrent}")
 
     strategy = template.freshness.digest
     supports_freshness = hasattr(storage, "write_signature") and hasattr(storage, "digest")
@@ -1108,11 +1868,29 @@ def run_template(
             )
         bindings[name] = ds
 
-    # 2. Decide whether and how to chunk the time axis, and say so.
-    plan = _plan_for(template, bindings, chunk_size, memory_budget, n_live_arrays)
+    # 2. Decide whether and how to chunk, along which axis, and say so.
+    plan = _choose_plan(
+        template,
+        bindings,
+        chunk_size,
+        element_chunk,
+        memory_budget,
+        chunk_axis,
+        n_live_arrays,
+        prefetch,
+        concurrent,
+    )
     if on_plan is not None:
         on_plan(plan)
-    if plan.is_chunked:
+    element_blocks = plan.is_chunked and plan.axis == "elements"
+    if element_blocks:
+        from cfdmod.core.chunked import assert_element_chunkable
+
+        try:
+            assert_element_chunkable(_element_chunkable_step_params(template))
+        except ValueError as exc:
+            raise TemplateError(f"cannot run this template chunked over elements: {exc}") from exc
+    elif plan.is_chunked:
         # Fail before any work if an op in the chain cannot be windowed.
         from cfdmod.core.chunked import assert_time_chunkable
 
@@ -1120,23 +1898,84 @@ def run_template(
             assert_time_chunkable(_chunkable_step_params(template))
         except ValueError as exc:
             raise TemplateError(f"cannot run this template chunked over time: {exc}") from exc
+        if pool is not None:
+            folded, _ = _time_folds(template)
+            unmergeable = [
+                step.kind
+                for i, step in enumerate(template.pipeline)
+                if (step.id or f"step_{i}") in folded
+                and not hasattr(OP_REGISTRY[step.kind][2], "merge_folds")
+            ]
+            if unmergeable:
+                raise TemplateError(
+                    "cannot run this template over a pool: these folding ops cannot "
+                    f"merge folds computed apart: {unmergeable}"
+                )
+    fused = None
+    if fuse:
+        groups = plan_fusion(
+            template, needed_steps=needed_steps, keep_all=return_all or not template.outputs
+        )
+        if on_fuse is not None:
+            on_fuse(groups)
+        fused = {group.steps[0]: group for group in groups}
+    loader = None
+    if pool is not None and plan.is_chunked:
+        loader = _InputLoader(
+            storage,
+            {
+                name: (_resolve_key(template.root, spec.path), spec.kind)
+                for name, spec in template.inputs.items()
+                if name in bindings
+            },
+            accepts_kind,
+        )
+    else:
+        pool = None
 
     # 3. Walk pipeline, over the whole time axis or one window at a time.
-    if plan.is_chunked:
-        bindings = _walk_chunked(template, bindings, needed_steps, plan, reporter, last_use)
-    else:
-        bindings = _walk_steps(template, bindings, needed_steps, reporter, last_use=last_use)
+    #    A chunked run appends each window's outputs straight to the storage
+    #    when it can take them incrementally.
+    streams = None
+    if plan.is_chunked and not element_blocks and hasattr(storage, "open_writer"):
+        streams = _OutputStreams(template, storage, stale_outputs, accepts_kind)
+    try:
+        if element_blocks:
+            bindings = _walk_elements(
+                template, bindings, needed_steps, plan, reporter, last_use, pool, loader, fused
+            )
+        elif plan.is_chunked:
+            bindings = _walk_chunked(
+                template,
+                bindings,
+                needed_steps,
+                plan,
+                reporter,
+                last_use,
+                streams,
+                pool,
+                loader,
+                fused,
+            )
+        else:
+            bindings = _walk_steps(
+                template, bindings, needed_steps, reporter, last_use=last_use, fused=fused
+            )
 
-    return _write_outputs(
-        template,
-        bindings,
-        storage,
-        stale_outputs,
-        supports_freshness,
-        strategy,
-        reporter,
-        return_all,
-    )
+        return _write_outputs(
+            template,
+            bindings,
+            storage,
+            stale_outputs,
+            supports_freshness,
+            strategy,
+            reporter,
+            return_all,
+            streams,
+        )
+    finally:
+        if streams is not None:
+            streams.abort()
 
 
 def _walk_steps(
@@ -1148,13 +1987,33 @@ def _walk_steps(
     window_index: int | None = None,
     n_windows: int | None = None,
     last_use: dict[str, int] | None = None,
+    folds: dict[str, tuple[object, DataSource]] | None = None,
+    fold_slice: slice | None = None,
+    geometry: dict[tuple, tuple[object, object, object]] | None = None,
+    fused: dict[str, "FusedGroup"] | None = None,
 ) -> dict[str, DataSource]:
     """Execute the template's steps against ``bindings``, returning them extended.
 
     Split out of :func:`run_template` so the chunked runner can call it once per
-    time window with windowed inputs. ``bindings`` is not mutated.
+    time window with windowed inputs. ``bindings`` is not mutated. With
+    ``folds``, a step whose params can fold (see :func:`_time_folds`) updates
+    its ``(state, first window)`` entry there instead of producing a binding,
+    from only the ``fold_slice`` timesteps of its input when one is given.
+
+    With ``geometry``, a step whose params split off their time-independent
+    work (``prepare_geometry`` / ``apply_geometry``: mesh loads, face cuts,
+    groupings) prepares it once per ``(step, topology, elements)`` and only
+    applies it on later windows. Windows share their source's topology and
+    elements by reference, and a cached op hands the same objects on, so the
+    key holds for every window of a run.
+
+    With ``fused`` (keyed by first step id, see :func:`plan_fusion`), a run
+    of elementwise steps is evaluated as one tiled kernel when its first step
+    is reached, and only its last step is bound. A run the kernel cannot take
+    on these bindings falls back to stepping through it.
     """
     bindings = dict(bindings)
+    fused_done: set[str] = set()
     total = len(template.pipeline)
     for i, step in enumerate(template.pipeline):
         step_id = step.id or f"step_{i}"
@@ -1170,6 +2029,10 @@ def _walk_steps(
             window=window_index,
             n_windows=n_windows,
         )
+        if step_id in fused_done:
+            # Already computed by its run's fused kernel.
+            _drop_dead(bindings, last_use, i)
+            continue
         if step.kind not in OP_REGISTRY:
             raise TemplateReferenceError(
                 f"unknown op kind {step.kind!r} at step {step_id!r}; "
@@ -1196,8 +2059,33 @@ def _walk_steps(
         # the failing step id / kind, so a consumer can map it precisely
         # (rather than string-matching a bare exception) -- but cfdmod's own
         # TemplateError / TemplateReferenceError pass through untouched.
+        bound_id = step_id
+        group = fused.get(step_id) if fused else None
         try:
-            if arity == "binary":
+            result = _run_fused_group(template, group, bindings) if group else None
+            if result is not None:
+                bound_id = group.steps[-1]
+                fused_done.update(group.steps[1:])
+            elif folds is not None and hasattr(params, "fold_window"):
+                if fold_slice is not None and not ds.time.is_time_aggregated:
+                    from cfdmod.core.chunked import slice_time
+
+                    ds = slice_time(ds, fold_slice)
+                state, first = folds.get(step_id, (None, None))
+                if first is None:
+                    # Keep the window's axes, not its arrays, for finish_fold.
+                    from cfdmod.adapters.memory import MemoryFieldStore
+
+                    first = ds.model_copy(update={"fields": MemoryFieldStore({})})
+                folds[step_id] = (params.fold_window(ds, state), first)
+                result = None
+            elif geometry is not None and hasattr(params, "prepare_geometry"):
+                key = (step_id, id(ds.topology), id(ds.elements), ds.n_elements)
+                if key not in geometry:
+                    # Keep the keyed objects alive so their ids cannot be reused.
+                    geometry[key] = (ds.topology, ds.elements, params.prepare_geometry(ds))
+                result = params.apply_geometry(ds, geometry[key][2])
+            elif arity == "binary":
                 result = fn(ds, bindings[step.rhs], params)
             else:
                 result = fn(ds, params)
@@ -1210,18 +2098,41 @@ def _walk_steps(
                 op_kind=step.kind,
             ) from exc
 
-        bindings[step_id] = result
-
-        # Drop our reference to anything no downstream step or output reads.
-        # Refcounting frees the arrays; we never mutate a store, because
-        # bindings share field arrays and another binding may still hold one.
-        if last_use is not None:
-            for name in [n for n, last in last_use.items() if last <= i and n in bindings]:
-                del bindings[name]
+        if result is not None:
+            bindings[bound_id] = result
+        _drop_dead(bindings, last_use, i)
 
     return bindings
 
 
+def _drop_dead(bindings: dict[str, DataSource], last_use: dict[str, int] | None, i: int) -> None:
+    """Drop our reference to anything no step after ``i`` or output reads.
+
+    Refcounting frees the arrays; we never mutate a store, because bindings
+    share field arrays and another binding may still hold one.
+    """
+    if last_use is not None:
+        for name in [n for n, last in last_use.items() if last <= i and n in bindings]:
+            del bindings[name]
+
+
+def _run_fused_group(
+    template: PipelineTemplate, group: "FusedGroup", bindings: dict[str, DataSource]
+) -> DataSource | None:
+    """Evaluate ``group`` as one kernel, or ``None`` to step through it instead."""
+    from cfdmod.core.fusion import run_fused
+
+    by_id = {step.id or f"step_{i}": step for i, step in enumerate(template.pipeline)}
+    chain: list[tuple[BaseModel, DataSource | None]] = []
+    for step_id in group.steps:
+        step = by_id[step_id]
+        if step.rhs is not None and step.rhs not in bindings:
+            return None
+        params = _step_params(step, OP_REGISTRY[step.kind][2], template.root)
+        chain.append((params, bindings[step.rhs] if step.rhs is not None else None))
+    return run_fused(bindings[group.source], chain, group.fields)
+
+
 def _write_outputs(
     template: PipelineTemplate,
     bindings: dict[str, DataSource],
@@ -1231,15 +2142,17 @@ def _write_outputs(
     strategy: str,
     reporter: "_Reporter" = _NULL_REPORTER,
     return_all: bool = False,
+    streams: _OutputStreams | None = None,
 ) -> dict[str, DataSource]:
     """Write the ``outputs:`` block, stamping freshness where supported.
 
     Honours each output's ``persist`` / ``hold``: ``persist: false`` computes it
     without touching storage, ``hold: false`` drops it from the returned dict
-    once written.
+    once written. An output the chunked runner streamed is committed rather
+    than written, and a held one is returned as the storage reads it back.
 
     Cancellation is polled before each write, so a cancelled run never leaves a
-    partially written output set.
+    partially written output.
     """
     sign = None
     if supports_freshness and any(o.persist for o in template.outputs.values()):
@@ -1250,23 +2163,37 @@ def _write_outputs(
     for i, (out_name, out) in enumerate(template.outputs.items()):
         if stale_outputs is not None and out_name not in stale_outputs:
             continue
-        if out.source not in bindings:
+        streamed = streams is not None and streams.is_streamed(out_name)
+        if not streamed and out.source not in bindings:
             raise TemplateReferenceError(f"output references unknown source {out.source!r}")
         if out.persist:
             reporter.check("write", out_name)
             reporter.emit("write", out_name, i, total)
             key = _resolve_key(template.root, out.path)
-            storage.write_data_source(key, bindings[out.source])
+            if streamed:
+                streams.commit(out_name)
+            else:
+                storage.write_data_source(key, bindings[out.source])
             if sign is not None:
                 storage.write_signature(key, sign(template, out_name, storage, strategy))
         if not out.hold:
             dropped.add(out.source)
 
     # An output source is only released if *no* output that holds shares it.
+    kept = {o.source for o in template.outputs.values() if o.hold}
     if not return_all:
-        kept = {o.source for o in template.outputs.values() if o.hold}
         for name in dropped - kept:
             bindings.pop(name, None)
+    if streams is not None:
+        # A streamed result was never assembled here; hand back the stored one,
+        # which a lazy backend serves without loading it.
+        for out_name, out in template.outputs.items():
+            if (
+                streams.is_streamed(out_name)
+                and out.source not in bindings
+                and (return_all or out.source in kept)
+            ):
+                bindings[out.source] = streams.read_back(out.source)
 
     return bindings
 
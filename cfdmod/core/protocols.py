@@ -30,7 +30,9 @@ from __future__ import annotations
 __all__ = [
     "FieldStore",
     "Storage",
+    "OutputWriter",
     "BlobStore",
+    "RangedBlobStore",
     "Logger",
     "Pool",
 ]
@@ -214,6 +216,53 @@ class Storage(Protocol):
         """Stamp ``signature`` onto an already-written object at ``key``."""
         ...
 
+    # --- Streaming writes (optional) --------------------------------------
+    #
+    # Like the freshness methods, ``run_template`` only calls this when the
+    # backend has it; without it a chunked run concatenates each output in
+    # RAM and writes it whole through ``write_data_source``.
+
+    def open_writer(self, key: str, template_ds: "DataSource") -> "OutputWriter":
+        """Open an incremental writer for a time-resolved output under ``key``.
+
+        ``template_ds`` describes the finished output -- kind, topology,
+        elements and its *full* time axis. Its fields are ignored (it may
+        have none); the field set comes from the windows passed to
+        :meth:`OutputWriter.append`. Nothing is visible under ``key`` until
+        :meth:`OutputWriter.commit`.
+        """
+        ...
+
+
+@runtime_checkable
+class OutputWriter(Protocol):
+    """Sink that receives one output a time window at a time.
+
+    Returned by :meth:`Storage.open_writer`. The chunked runner appends
+    each window's result as soon as it is computed, so the full
+    ``(n_elements, n_timesteps)`` output never has to exist in RAM.
+    """
+
+    def append(self, window: "DataSource") -> None:
+        """Write the next contiguous time window of the output.
+
+        Every window carries the same fields over the same elements; the
+        windows together must cover the template's time axis in order.
+        """
+        ...
+
+    def commit(self) -> None:
+        """Finish the output and publish it under its key.
+
+        Raises ``ValueError`` if the appended windows do not cover the
+        whole time axis.
+        """
+        ...
+
+    def abort(self) -> None:
+        """Discard everything appended; whatever was under the key stays."""
+        ...
+
 
 @runtime_checkable
 class BlobStore(Protocol):
@@ -249,6 +298,31 @@ class BlobStore(Protocol):
         ...
 
 
+@runtime_checkable
+class RangedBlobStore(BlobStore, Protocol):
+    """A :class:`BlobStore` that can also serve a byte range of a blob.
+
+    Optional extension. With it, :class:`XdmfH5BlobStorage` opens the
+    ``.h5`` blob in place through a file-like adapter and reads only the
+    slabs a window touches, instead of downloading the whole object. Object
+    stores support this natively (an HTTP ``Range`` GET plus a ``HEAD`` for
+    the size); a plain ``BlobStore`` keeps working through the
+    download-everything path.
+    """
+
+    def get_range(self, key: str, offset: int, length: int) -> bytes:
+        """Return up to ``length`` bytes of ``key`` starting at ``offset``.
+
+        Fewer bytes (possibly none) come back only when the range runs past
+        the end of the blob. Raise ``KeyError`` if the blob is absent.
+        """
+        ...
+
+    def size(self, key: str) -> int:
+        """Size of the blob under ``key`` in bytes; raise ``KeyError`` if absent."""
+        ...
+
+
 @runtime_checkable
 class Logger(Protocol):
     """Minimal structured-log seam.
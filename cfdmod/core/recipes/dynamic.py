@@ -129,15 +129,70 @@ def _sdof_recurrence_coeffs(dt: float, wp: float, xi: float) -> tuple[float, ...
     return a, b, c, d, ap, bp, cp, dp
 
 
+def _solve_sdof_mode(q: np.ndarray, dt: float, wp: float, xi: float) -> np.ndarray:
+    """One mode of :func:`_solve_sdof_exact`, as a first-order complex IIR filter.
+
+    The recurrence of :func:`_sdof_recurrence_coeffs` advances the state
+    ``(x, v)`` by a 2x2 transition matrix, ``exp(M dt)`` for the ODE's system
+    matrix ``M``. Its eigenvectors are those of ``M``, ``(1, mu)`` and
+    ``(1, conj(mu))`` with ``mu = -xi wp + i wd``, so in the eigen-coordinate
+
+        w = (conj(mu) x - v) / (conj(mu) - mu),    x = 2 Re(w)
+
+    the recurrence decouples into ``w[n+1] = lam w[n] + alpha Q[n] + beta
+    Q[n+1]`` with ``lam = exp(mu dt)`` -- one complex pole, which
+    ``scipy.signal.lfilter`` runs without a Python loop. Unlike the
+    equivalent second-order real filter in ``x`` alone, whose two poles crowd
+    ``z = 1`` when ``wp dt`` is small, this form loses nothing to the
+    recurrence stepped directly.
+    """
+    from scipy.signal import lfilter, lfiltic
+
+    _, _, c, d, _, _, cp, dp = _sdof_recurrence_coeffs(dt, wp, xi)
+    mu = complex(-xi * wp, wp * np.sqrt(1.0 - xi**2))
+    split = mu.conjugate() - mu
+    alpha = (mu.conjugate() * c - cp) / split
+    beta = (mu.conjugate() * d - dp) / split
+
+    x = np.empty(q.shape[0], dtype=np.float64)
+    x0, v0 = _sdof_seed(q, dt, wp, xi)
+    x[0] = x0
+    if q.shape[0] > 1:
+        num, den = np.array([beta, alpha]), np.array([1.0, -np.exp(mu * dt)])
+        zi = lfiltic(num, den, y=[(mu.conjugate() * x0 - v0) / split], x=[q[0]])
+        w = lfilter(num, den, q[1:].astype(np.complex128), zi=zi)[0]
+        np.multiply(w.real, 2.0, out=x[1:])
+    return x
+
+
 def _solve_sdof_exact(
     gen_force: np.ndarray, dt: float, wp: np.ndarray, xi: np.ndarray
 ) -> np.ndarray:
-    """Advance every mode together with the Nigam-Jennings recurrence.
+    """Advance every mode with the Nigam-Jennings recurrence, as an IIR filter.
 
-    ``gen_force`` is ``(n_modes, n_t)``. The recurrence is sequential in time but
-    vectorised across modes, so the Python loop runs once per timestep rather
-    than once per (mode, timestep) -- orders of magnitude faster than an adaptive
-    ODE integrator, with no step-size error.
+    ``gen_force`` is ``(n_modes, n_t)``. Each mode runs through
+    ``scipy.signal.lfilter`` (see :func:`_solve_sdof_mode`), so the only Python
+    loop is over modes, and the result matches :func:`_solve_sdof_recurrence`
+    to rounding.
+    """
+    q = np.asarray(gen_force, dtype=np.float64)
+    n_modes, n_t = q.shape
+    if n_t == 0:
+        return q.copy()
+
+    x = np.empty((n_modes, n_t), dtype=np.float64)
+    for m in range(n_modes):
+        x[m] = _solve_sdof_mode(q[m], dt, float(wp[m]), float(xi[m]))
+    return x
+
+
+def _solve_sdof_recurrence(
+    gen_force: np.ndarray, dt: float, wp: np.ndarray, xi: np.ndarray
+) -> np.ndarray:
+    """The same solve stepped in Python, one timestep at a time.
+
+    Vectorised across modes only. Kept as the plain statement of the
+    recurrence that :func:`_solve_sdof_exact` is checked against.
     """
     q = np.asarray(gen_force, dtype=np.float64)
     n_modes, n_t = q.shape
@@ -165,6 +220,14 @@ def _solve_sdof_exact(
     return x
 
 
+def _check_sdof_inputs(dt: float, xis: np.ndarray) -> None:
+    """Reject what :func:`_solve_sdof_exact` cannot solve: it would return NaN."""
+    if np.any(xis < 0) or np.any(xis >= 1):
+        raise ValueError(f"the exact solver needs sub-critical damping 0 <= xi < 1; got {xis}")
+    if not np.isfinite(dt) or dt <= 0:
+        raise ValueError(f"modal time step must be positive and finite; got {dt}")
+
+
 def sdof_exact_solver(*, natural_frequencies: Any, damping_ratio: Any) -> ModalSolver:
     """:class:`ModalSolver` using the exact piecewise-linear recurrence.
 
@@ -187,11 +250,8 @@ def sdof_exact_solver(*, natural_frequencies: Any, damping_ratio: Any) -> ModalS
         xis = np.broadcast_to(
             np.atleast_1d(np.asarray(damping_ratio, dtype=np.float64)), (n_modes,)
         )
-        if np.any(xis < 0) or np.any(xis >= 1):
-            raise ValueError(f"the exact solver needs sub-critical damping 0 <= xi < 1; got {xis}")
         dt = float(modes.time.timestep_size)
-        if not np.isfinite(dt) or dt <= 0:
-            raise ValueError(f"modal time step must be positive and finite; got {dt}")
+        _check_sdof_inputs(dt, xis)
         return modes.with_field("q", _solve_sdof_exact(q, dt, wps, xis))
 
     return solver
@@ -373,6 +433,13 @@ def build_building_dynamic_response(
 
     # 3. Recompose physical floor response + static-equivalent loads.
     q = np.asarray(solved.fields.read("q"), dtype=np.float64)  # (n_modes, n_t)
+    return _recompose_building(q, solved.time, cfg)
+
+
+def _recompose_building(q: np.ndarray, time, cfg: BuildingDynamicConfig) -> PointsDataSource:
+    """Floor displacements and static-equivalent loads from modal displacements ``q``."""
+    phi = np.asarray(cfg.mode_shapes, dtype=np.float64)
+    wps = np.atleast_1d(np.asarray(cfg.natural_frequencies, dtype=np.float64))
     dx = phi[:, :, 0]  # (n_floors, n_modes)
     dy = phi[:, :, 1]
     rz = phi[:, :, 2]
@@ -399,7 +466,7 @@ def build_building_dynamic_response(
         "meq_z": meq_z,
     }
     return PointsDataSource(
-        time=solved.time,
+        time=time,
         topology=Topology.points(pts),
         elements=ElementMeta(position=pts),
         fields=MemoryFieldStore(fields),
@@ -44,6 +44,7 @@ def run_yaml(
     digest: DigestStrategy | None = None,
     chunk_size: int | None = None,
     memory_budget: int | None = None,
+    prefetch: int = 0,
     on_plan=None,
     on_progress=None,
     cancel=None,
@@ -64,6 +65,8 @@ def run_yaml(
         memory_budget: Bytes the run may spend on time-resolved arrays. The
             window size is derived from it. Mutually exclusive with
             ``chunk_size``.
+        prefetch: Time windows read ahead on a background thread in a
+            chunked run; see :func:`run_template`.
         on_plan: Called with the chosen
             :class:`~cfdmod.core.memory.ChunkPlan` before execution.
         on_progress: Called with a :class:`~cfdmod.core.progress.RunEvent` per
@@ -91,6 +94,7 @@ def run_yaml(
         skip_fresh=skip_fresh,
         chunk_size=chunk_size,
         memory_budget=memory_budget,
+        prefetch=prefetch,
         on_plan=on_plan,
         on_progress=on_progress,
         cancel=cancel,
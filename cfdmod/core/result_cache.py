@@ -0,0 +1,196 @@
+"""Persistent per-key result cache for fan-outs.
+
+A fan-out (:func:`cfdmod.building.fanout.run_fanout`,
+:func:`cfdmod.dynamics.solve_building_cases`) maps a list of frozen keys --
+``(direction, body, cp_config)``, a building case -- to one
+:class:`~cfdmod.core.data_source.DataSource` each. Recomputing all of them on
+every invocation makes a campaign's cost grow with its history rather than
+with what changed: adding two directions to a 36-direction study re-solves
+all 38, and a worker that dies at key 30 loses the 29 before it.
+
+:class:`ResultCache` persists each result through an ordinary
+:class:`~cfdmod.core.protocols.Storage` as soon as it is computed, under a
+location derived from the key alone, and stamps it with a **signature** in
+the sense of :mod:`cfdmod.core.freshness`: a hash over
+
+1. the key,
+2. the :meth:`Storage.digest` of every input the key's computation reads
+   (``inputs``, resolved against ``input_storage``),
+3. ``params`` -- whatever else determines the result (damping, the case
+   config, a mesh path), and
+4. :func:`~cfdmod.core.freshness.code_version`.
+
+A later lookup recomputes the signature from metadata only and returns the
+stored result when it matches; an edited input, a changed ``params`` or an
+upgrade makes it miss, and the recomputed result overwrites the entry. The
+signature is stamped after the result is written, so an entry interrupted
+mid-write never matches.
+"""
+
+from __future__ import annotations
+
+__all__ = ["ResultCache", "CachedSolve", "map_cached"]
+
+import hashlib
+import json
+from typing import Any, Callable, Generic, Hashable, Iterable, TypeVar
+
+from pydantic import BaseModel
+
+from cfdmod.core.data_source import DataSource
+from cfdmod.core.errors import StorageKeyError
+from cfdmod.core.protocols import Storage
+
+K = TypeVar("K", bound=Hashable)
+
+
+def _canonical(value: Any) -> str:
+    """Deterministic JSON for a key or params: sorted, compact, models dumped."""
+    if isinstance(value, BaseModel):
+        value = value.model_dump(mode="json")
+    return json.dumps(value, sort_keys=True, separators=(",", ":"), default=str)
+
+
+def _hash(blob: str) -> str:
+    return hashlib.blake2b(blob.encode("utf-8"), digest_size=32).hexdigest()
+
+
+class ResultCache(Generic[K]):
+    """Results of a fan-out, one entry per key, reused while their inputs hold.
+
+    Args:
+        storage: Where entries are written. Use a file-backed storage for a
+            cache that outlives the process -- and for a process pool, whose
+            workers write their own entries.
+        inputs: ``key -> storage keys`` the key's computation reads. Their
+            digests enter the signature. ``None``: the result depends on the
+            key and ``params`` alone.
+        input_storage: The storage ``inputs`` are digested in. Defaults to
+            ``storage``.
+        params: Everything else that determines a result; any JSON-able value
+            or pydantic model.
+        prefix: Storage-key prefix for the entries.
+        kind: The :class:`DataSource` kind of the results, passed to
+            ``read_data_source`` so a backend that does not record it need not
+            guess.
+        strategy: :meth:`Storage.digest` strategy for the inputs.
+    """
+
+    def __init__(
+        self,
+        storage: Storage,
+        *,
+        inputs: Callable[[K], Iterable[str]] | None = None,
+        input_storage: Storage | None = None,
+        params: Any = None,
+        prefix: str = "cache",
+        kind: str | None = None,
+        strategy: str = "size_mtime",
+    ) -> None:
+        self.storage = storage
+        self.inputs = inputs
+        self.input_storage = input_storage if input_storage is not None else storage
+        self.params = params
+        self.prefix = prefix
+        self.kind = kind
+        self.strategy = strategy
+
+    def entry_key(self, key: K) -> str:
+        """Storage key of ``key``'s entry; depends on the key alone."""
+        return f"{self.prefix}/{_hash(_canonical(key))[:32]}"
+
+    def signature(self, key: K) -> str | None:
+        """The signature ``key``'s entry must carry to be reused.
+
+        ``None`` when an input cannot be digested (it does not exist yet), in
+        which case nothing can be reused for the key.
+        """
+        from cfdmod.core.freshness import code_version
+
+        digests: dict[str, str] = {}
+        for input_key in self.inputs(key) if self.inputs is not None else ():
+            try:
+                digests[input_key] = self.input_storage.digest(input_key, self.strategy)
+            except StorageKeyError:
+                return None
+        payload = {
+            "code_version": code_version(),
+            "key": json.loads(_canonical(key)),
+            "inputs": digests,
+            "params": json.loads(_canonical(self.params)),
+        }
+        return _hash(_canonical(payload))
+
+    def get(self, key: K) -> DataSource | None:
+        """The stored result for ``key`` if it is still valid, else ``None``."""
+        expected = self.signature(key)
+        if expected is None:
+            return None
+        entry = self.entry_key(key)
+        try:
+            if self.storage.read_signature(entry) != expected:
+                return None
+            if self.kind is not None:
+                return self.storage.read_data_source(entry, kind=self.kind)
+            return self.storage.read_data_source(entry)
+        except StorageKeyError:
+            return None
+
+    def put(self, key: K, result: DataSource) -> None:
+        """Store ``result`` for ``key``, then stamp it valid."""
+        expected = self.signature(key)
+        entry = self.entry_key(key)
+        self.storage.write_data_source(entry, result)
+        if expected is not None:
+            self.storage.write_signature(entry, expected)
+
+    def missing(self, keys: Iterable[K]) -> list[K]:
+        """The keys, in order, that have no valid entry."""
+        return [key for key in keys if self.get(key) is None]
+
+
+class CachedSolve(Generic[K]):
+    """``solve_fn`` wrapped to write each result to a cache as it finishes.
+
+    Picklable whenever ``solve_fn`` and the cache are, so a pool worker
+    stores its own result: a crash loses only the keys still running.
+    """
+
+    __slots__ = ("solve_fn", "cache")
+
+    def __init__(self, solve_fn: Callable[[K], DataSource], cache: ResultCache[K]) -> None:
+        self.solve_fn = solve_fn
+        self.cache = cache
+
+    def __call__(self, key: K) -> DataSource:
+        result = self.solve_fn(key)
+        self.cache.put(key, result)
+        return result
+
+
+def map_cached(
+    keys: list[K],
+    solve_fn: Callable[[K], DataSource],
+    cache: ResultCache[K] | None,
+    pool: Any = None,
+) -> list[DataSource]:
+    """``solve_fn`` over ``keys`` (through ``pool.map`` when given), reusing ``cache``.
+
+    Valid entries are read back; only the other keys are computed, and each
+    is written to the cache as it finishes. Results come back in key order.
+    """
+    if cache is None:
+        return [solve_fn(k) for k in keys] if pool is None else list(pool.map(solve_fn, keys))
+    results: dict[int, DataSource] = {}
+    todo: list[int] = []
+    for i, key in enumerate(keys):
+        hit = cache.get(key)
+        if hit is None:
+            todo.append(i)
+        else:
+            results[i] = hit
+    task = CachedSolve(solve_fn, cache)
+    pending = [keys[i] for i in todo]
+    computed = [task(k) for k in pending] if pool is None else pool.map(task, pending)
+    results.update(zip(todo, computed))
+    return [results[i] for i in range(len(keys))]
@@ -24,10 +24,17 @@ __all__ = [
     "ElementMeta",
 ]
 
-from typing import Annotated, Any, Literal
+from typing import Annotated, Any, Callable, Literal
 
 import numpy as np
-from pydantic import BaseModel, ConfigDict, Field, field_validator, model_validator
+from pydantic import (
+    BaseModel,
+    ConfigDict,
+    Field,
+    PrivateAttr,
+    field_validator,
+    model_validator,
+)
 
 CellType = Literal["triangle", "point", "cell"]
 """Supported cell-type discriminators.
@@ -162,6 +169,10 @@ class ElementMeta(BaseModel):
     Free-form per-element metadata (e.g. station name) belongs in
     ``annotations``: a dict whose values are arrays of length
     ``n_elements`` or constants.
+
+    Nearest-element queries go through :meth:`nearest`, which builds a
+    KD-tree over ``position`` on first use and caches it on the
+    instance.
     """
 
     model_config = ConfigDict(frozen=True, arbitrary_types_allowed=True)
@@ -174,6 +185,9 @@ class ElementMeta(BaseModel):
         dict[str, Any],
         Field(default_factory=dict, description="Free-form per-element metadata."),
     ]
+    # (position array the entries were derived from, {key: value}). Keyed on
+    # identity so a model_copy with a new position never serves stale entries.
+    _derived: tuple[np.ndarray, dict[Any, Any]] | None = PrivateAttr(default=None)
 
     @field_validator("position", "normal", mode="before")
     @classmethod
@@ -200,3 +214,52 @@ class ElementMeta(BaseModel):
             if arr is not None and arr.ndim != 1:
                 raise ValueError(f"{name} must have shape (n_elements,); got {arr.shape}")
         return self
+
+    def __getstate__(self) -> dict[Any, Any]:
+        # Derived values are a cache: rebuild them after unpickling rather
+        # than ship them.
+        state = super().__getstate__()
+        private = dict(state.get("__pydantic_private__") or {})
+        private["_derived"] = None
+        state["__pydantic_private__"] = private
+        return state
+
+    def derived(self, key: Any, build: Callable[[np.ndarray], Any]) -> Any:
+        """Value computed from :attr:`position`, built once per ``key``.
+
+        ``build(position)`` runs on the first request for ``key`` and the
+        result is cached on this instance. Time windows of a chunked run
+        share ``elements`` by reference, so spatial indexes and operators
+        derived here are built once per run rather than once per window.
+        """
+        if self.position is None:
+            raise ValueError("derived values require elements.position")
+        cached = self._derived
+        if cached is None or cached[0] is not self.position:
+            cached = (self.position, {})
+            self._derived = cached
+        entries = cached[1]
+        if key not in entries:
+            entries[key] = build(self.position)
+        return entries[key]
+
+    def position_tree(self) -> Any:
+        """``scipy.spatial.cKDTree`` over :attr:`position`, built once."""
+        from scipy.spatial import cKDTree
+
+        return self.derived("position_tree", cKDTree)
+
+    def nearest(self, points: Any) -> np.ndarray:
+        """Index of the element whose position is closest to each point.
+
+        Args:
+            points: ``(n_points, 3)`` query coordinates.
+
+        Returns:
+            ``(n_points,)`` int64 element indices.
+        """
+        if self.position is not None and self.position.shape[0] == 0:
+            raise ValueError("nearest requires at least one element position")
+        pts = _arr(points, np.dtype("float64"))
+        _, idx = self.position_tree().query(pts)
+        return np.asarray(idx, dtype=np.int64)
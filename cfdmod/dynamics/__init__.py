@@ -21,6 +21,7 @@ __all__ = [
     "BuildingCaseParameters",
     "build_cases",
     "solve_building_cases",
+    "sweep_building_cases",
     "filter_by_recurrence_period",
     "filter_by_xi",
     "filter_by_kd",
@@ -65,6 +66,7 @@ from cfdmod.dynamics.cases import (
     join_by_direction,
     join_by_recurrence_period,
     solve_building_cases,
+    sweep_building_cases,
 )
 from cfdmod.dynamics.forces import (
     DimensionalData,
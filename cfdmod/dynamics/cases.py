@@ -19,6 +19,7 @@ __all__ = [
     "BuildingCaseParameters",
     "build_cases",
     "solve_building_cases",
+    "sweep_building_cases",
     "filter_by_recurrence_period",
     "filter_by_xi",
     "filter_by_kd",
@@ -38,12 +39,17 @@ import numpy as np
 import pandas as pd
 from pydantic import BaseModel
 
+from cfdmod.core.broadcast import Broadcast
 from cfdmod.core.container import Container
-from cfdmod.core.data_source import PointsDataSource
+from cfdmod.core.data_source import DataSource, PointsDataSource
 from cfdmod.core.protocols import Pool
+from cfdmod.core.result_cache import ResultCache, map_cached
+from cfdmod.core.time_axis import TimeAxis
 
 if TYPE_CHECKING:
     from cfdmod.building.peaks import PeakMethod
+    from cfdmod.dynamics.forces import DimensionalData
+    from cfdmod.dynamics.structural import BuildingStructuralData
 
 StatType = Literal["min", "max", "mean"]
 
@@ -108,6 +114,8 @@ def solve_building_cases(
     solve_fn: Callable[[BuildingCaseParameters], PointsDataSource],
     *,
     pool: Pool | None = None,
+    cache: ResultCache[BuildingCaseParameters] | None = None,
+    broadcast: Broadcast | None = None,
 ) -> Container[BuildingCaseParameters, PointsDataSource]:
     """Solve every case and collect the responses in a Container.
 
@@ -116,14 +124,153 @@ def solve_building_cases(
     With ``pool`` the fanout runs through ``pool.map``; otherwise it is
     sequential. Group the result with ``container.join_by(lambda c:
     c.direction)`` and slice it with ``container.filter_by(...)``.
+
+    With ``cache`` (a :class:`~cfdmod.core.result_cache.ResultCache`) cases
+    with a valid entry are read back instead of solved, and each solved case
+    is stored as it finishes. With ``pool`` and ``broadcast`` (a
+    :class:`~cfdmod.core.broadcast.Broadcast`), ``solve_fn`` and the arrays
+    it carries are published to shared memory once instead of pickled to
+    every worker.
     """
-    if pool is None:
-        results = [solve_fn(c) for c in cases]
-    else:
-        results = pool.map(solve_fn, cases)
+    if pool is not None and broadcast is not None:
+        solve_fn = broadcast.share(solve_fn)
+    results = map_cached(cases, solve_fn, cache, pool)
     return Container(items=dict(zip(cases, results)))
 
 
+def _solve_modal(task: tuple[np.ndarray, float, np.ndarray, np.ndarray]) -> np.ndarray:
+    """One SDOF solve of :func:`sweep_building_cases`; module-level for a process pool."""
+    from cfdmod.core.recipes.dynamic import _solve_sdof_exact
+
+    return _solve_sdof_exact(*task)
+
+
+def sweep_building_cases(
+    cases: list[BuildingCaseParameters],
+    *,
+    structure: "BuildingStructuralData",
+    floor_loads: Callable[[float], DataSource],
+    dimensions: Callable[[BuildingCaseParameters], "DimensionalData"],
+    field_x: str = "cf_x",
+    field_y: str = "cf_y",
+    field_mz: str = "cm_z",
+    check_sampling: bool = True,
+    pool: Pool | None = None,
+) -> Container[BuildingCaseParameters, PointsDataSource]:
+    """Solve a case sweep of the building recipe, sharing work across cases.
+
+    The same responses as :func:`solve_building_cases` with a ``solve_fn``
+    that scales ``floor_loads(case.direction)`` by ``dimensions(case)`` (as
+    :func:`~cfdmod.dynamics.forces.build_floor_load_source` does), applies
+    ``structure.with_multipliers`` and runs
+    :func:`~cfdmod.core.recipes.dynamic.build_building_dynamic_response` --
+    but the chain is linear from the coefficients to the modal response, so:
+
+    - ``floor_loads`` is called, and the generalized loads computed, once per
+      direction rather than once per case;
+    - a case's dimensional scaling only multiplies its generalized load by
+      the force factor (the moment factor is that times ``base``), so cases
+      that differ by that factor alone -- damping aside, the same direction,
+      time step, ``base`` and multipliers -- share one SDOF solve, scaled;
+    - a damping sweep reuses the generalized load and re-runs only the SDOF
+      solve.
+
+    A recurrence period or ``use_kd`` changes the design speed, which scales
+    the forces *and* the physical time step. Cases whose time step comes out
+    the same share a solve; in general each speed is its own solve, because
+    the modal response to the same record played at another speed is not a
+    multiple of it.
+
+    Args:
+        cases: The sweep, e.g. from :func:`build_cases`.
+        structure: Base structural data (mass / frequency multipliers 1).
+        floor_loads: ``direction -> `` per-floor load coefficients
+            (``field_x`` / ``field_y`` / ``field_mz``, each ``(n_floors, n_t)``)
+            on the normalised time axis.
+        dimensions: ``case -> DimensionalData`` giving the force, moment and
+            time normalisation factors of the case.
+        check_sampling: Warn, once per solve, when the time axis cannot carry
+            the modal response (see
+            :func:`~cfdmod.core.recipes.dynamic.check_modal_sampling`).
+        pool: Runs the distinct SDOF solves through ``pool.map``.
+    """
+    from cfdmod.core.ops.data_source_create.generalized_building_load import (
+        GeneralizedBuildingLoadParams,
+        generalized_building_load,
+    )
+    from cfdmod.core.recipes.dynamic import (
+        _check_sdof_inputs,
+        _recompose_building,
+        check_modal_sampling,
+    )
+
+    # 1. Per direction: coefficient generalized loads, force and torsion apart.
+    params = GeneralizedBuildingLoadParams(
+        mode_shapes=np.asarray(structure.mode_shapes, dtype=np.float64),
+        cm_positions=np.asarray(structure.cm_positions, dtype=np.float64),
+        field_x=field_x,
+        field_y=field_y,
+        field_mz=field_mz,
+    )
+    loads: dict[float, tuple[np.ndarray, np.ndarray, TimeAxis]] = {}
+    for direction in dict.fromkeys(c.direction for c in cases):
+        ds = floor_loads(direction)
+        zeros = np.zeros((ds.n_elements, ds.time.n_timesteps))
+        forces_only = ds.with_field(field_mz, zeros)
+        torsion_only = ds.with_field(field_x, zeros).with_field(field_y, zeros)
+        loads[direction] = (
+            np.asarray(generalized_building_load(forces_only, params).fields.read("q")),
+            np.asarray(generalized_building_load(torsion_only, params).fields.read("q")),
+            ds.time,
+        )
+
+    # 2. Group cases by the solve they share; the force factor scales the rest.
+    solves: dict[tuple, int] = {}
+    tasks: list[tuple[np.ndarray, float, np.ndarray, np.ndarray]] = []
+    plan: list[tuple[BuildingCaseParameters, int, float, "BuildingStructuralData", TimeAxis]] = []
+    for case in cases:
+        dim = dimensions(case)
+        q_force, q_torsion, time = loads[case.direction]
+        scale = dim.time_normalization_factor
+        key = (
+            case.direction,
+            float(dim.base),
+            float(scale),
+            case.mass_multiplier,
+            case.frequency_multiplier,
+            case.xi,
+        )
+        varied = structure.with_multipliers(
+            mass_multiplier=case.mass_multiplier,
+            frequency_multiplier=case.frequency_multiplier,
+        )
+        axis = TimeAxis(
+            initial_time=time.initial_time * scale,
+            timestep_size=time.timestep_size * scale,
+            n_timesteps=time.n_timesteps,
+        )
+        if key not in solves:
+            wps = np.atleast_1d(np.asarray(varied.natural_frequencies, dtype=np.float64))
+            if check_sampling:
+                check_modal_sampling(axis, wps)
+            xis = np.full(wps.shape, case.xi)
+            # Validate before dispatch, as sdof_exact_solver would, rather
+            # than let a worker return NaN for a supercritical case.
+            _check_sdof_inputs(float(axis.timestep_size), xis)
+            unit_load = (q_force + dim.base * q_torsion) / np.sqrt(case.mass_multiplier)
+            solves[key] = len(tasks)
+            tasks.append((unit_load, axis.timestep_size, wps, xis))
+        plan.append((case, solves[key], dim.force_normalization_factor, varied, axis))
+
+    # 3. One SDOF solve per group, then each case's recomposition.
+    solved = [_solve_modal(t) for t in tasks] if pool is None else pool.map(_solve_modal, tasks)
+    results: dict[BuildingCaseParameters, PointsDataSource] = {}
+    for case, index, factor, varied, axis in plan:
+        cfg = varied.to_config(case.xi, check_sampling=False)
+        results[case] = _recompose_building(factor * solved[index], axis, cfg)
+    return Container(items=results)
+
+
 # --- Multi-direction result queries -----------------------------------------
 #
 # Thin, domain-named views over the generic ``Container`` primitives, plus the
@@ -180,19 +327,26 @@ def get_max_acceleration(
     """Largest design peak comfort acceleration across the container's cases.
 
     For every case, the ``field`` history at ``floor`` (default the top floor)
-    is reduced to a single design peak by :func:`cfdmod.building.peaks.peak_value`
+    is reduced to a single design peak by :func:`cfdmod.building.peaks.peak_values`
     (``method`` selects max / peak-factor / gumbel), and the maximum over cases
     is returned. The response must carry accelerations (see
     :func:`cfdmod.building.dynamic.floor_accelerations`). Returns ``nan`` for an
     empty container.
     """
-    from cfdmod.building.peaks import peak_value
+    from cfdmod.building.peaks import peak_values
 
-    peaks: list[float] = []
-    for response in container.values():
-        acc = np.asarray(response.fields.read(field), dtype=np.float64)  # (n_floors, n_t)
-        peaks.append(peak_value(acc[floor], method, absolute=True, **peak_kwargs))
-    return float(np.max(peaks)) if peaks else float("nan")
+    series = [
+        np.asarray(response.fields.read(field), dtype=np.float64)[floor]
+        for response in container.values()
+    ]
+    if not series:
+        return float("nan")
+    if len({s.shape for s in series}) == 1:
+        # one reduction over every case's history
+        peaks = peak_values(np.stack(series), method, absolute=True, **peak_kwargs)
+    else:
+        peaks = np.array([peak_values(s, method, absolute=True, **peak_kwargs) for s in series])
+    return float(np.max(peaks))
 
 
 def get_max_acceleration_by_recurrence_period(
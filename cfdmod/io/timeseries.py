@@ -2,7 +2,8 @@
 into pandas DataFrames -- and from there to CSV or matplotlib.
 
 The v2 timeseries layout stores one 1-D dataset per timestep under
-``/{group}/t{T}``, with mesh metadata at ``/Triangles + /Geometry`` and
+``/{group}/t{T}`` (or, in the columnar layout, one 2-D dataset at
+``/{group}``), with mesh metadata at ``/Triangles + /Geometry`` and
 time arrays at ``/meta``. This module flattens that into the
 spreadsheet-friendly **wide-form** ``pandas.DataFrame``::
 
@@ -13,7 +14,8 @@ spreadsheet-friendly **wide-form** ``pandas.DataFrame``::
 For Cf and Cm, where every triangle in a region carries the same value,
 ``regions=True`` deduplicates by unique value to give one column per
 region. For Cp (truly per-triangle), pass ``triangles=[...]`` to filter
-to a tractable subset before exporting.
+to a tractable subset before exporting; the filter is pushed down to the
+h5 read, so only the requested triangles come off disk.
 """
 
 from __future__ import annotations
@@ -28,6 +30,9 @@ import h5py
 import numpy as np
 import pandas as pd
 
+from cfdmod.io.h5_select import RowSelection, read_rows
+from cfdmod.io.xdmf import columnar_time_keys, is_columnar
+
 if TYPE_CHECKING:
     from matplotlib.axes import Axes
 
@@ -95,26 +100,36 @@ def read_timeseries_df(
         if group not in f:
             raise ValueError(f"{h5_path}:/{group} not found")
         grp = f[group]
-        all_keys = sorted(grp.keys(), key=lambda k: float(k[1:]))
-        raw_times = np.array([float(k[1:]) for k in all_keys])
+        columnar = is_columnar(f, group)
+        all_keys = columnar_time_keys(f) if columnar else list(grp.keys())
+        all_times = np.array([float(k[1:]) for k in all_keys])
+        # Position of each retained key in ``all_keys`` (= its column in a
+        # columnar dataset), in time order.
+        order = np.argsort(all_times, kind="stable")
 
         if timestep_range is not None:
             t_min, t_max = timestep_range
-            mask = (raw_times >= t_min) & (raw_times <= t_max)
-            keys = [k for k, m in zip(all_keys, mask) if m]
-            raw_times = raw_times[mask]
-        else:
-            keys = all_keys
+            order = order[(all_times[order] >= t_min) & (all_times[order] <= t_max)]
+        raw_times = all_times[order]
+        keys = [all_keys[i] for i in order]
 
         if not keys:
             raise ValueError(f"no timesteps in {h5_path}:/{group} for range {timestep_range}")
 
         if triangles is not None:
-            tri_idx = np.array(sorted(set(int(t) for t in triangles)))
-            data = np.stack([grp[k][:][tri_idx] for k in keys])
+            tri_idx = np.array(sorted(set(int(t) for t in triangles)), dtype=np.int64)
+            n_tri = grp.shape[0] if columnar else grp[keys[0]].shape[0]
+            selection = RowSelection(tri_idx, n_tri)
+            if columnar:
+                data = _read_columnar_block(grp, order, selection)
+            else:
+                data = np.stack([read_rows(grp[k], selection) for k in keys])
             cols: list[int] = tri_idx.tolist()
         else:
-            data = np.stack([grp[k][:] for k in keys])
+            if columnar:
+                data = _read_columnar_block(grp, order)
+            else:
+                data = np.stack([grp[k][()] for k in keys])
             n_tri = data.shape[1]
             if regions:
                 # Each region's triangles share their value vector across
@@ -141,6 +156,26 @@ def read_timeseries_df(
     return pd.DataFrame(data, index=norm_index, columns=cols)
 
 
+def _read_columnar_block(
+    dset: h5py.Dataset, order: np.ndarray, selection: RowSelection | None = None
+) -> np.ndarray:
+    """Read the ``order`` columns of a columnar dataset as ``(T, n)`` rows.
+
+    A contiguous run of columns (the common case: the whole record or one
+    ``timestep_range``) is read as a single hyperslab; anything else reads
+    the full time axis and picks columns in RAM.
+    """
+    contiguous = order.size and np.all(np.diff(order) == 1)
+    tsl = slice(int(order[0]), int(order[-1]) + 1) if contiguous else slice(None)
+    if selection is None:
+        block = dset[:, tsl]
+    else:
+        block = read_rows(dset, selection, tsl)
+    if not contiguous:
+        block = block[:, order]
+    return np.ascontiguousarray(block.T)
+
+
 def to_csv(df: pd.DataFrame, path: pathlib.Path | str, **kwargs) -> None:
     """Save a timeseries DataFrame as CSV.
 
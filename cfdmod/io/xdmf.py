@@ -14,6 +14,28 @@ Two layout conventions are used:
   the tree and emits one Grid per group that has both Triangles and Geometry.
   This lets a single file describe stats over different sub-meshes (e.g. a
   sliced regions mesh for Ce, body subsets for Cf/Cm) without length collisions.
+
+- **Columnar timeseries files** keep the root mesh but store each group as a
+  *single* chunked 2-D dataset ``/{group}`` of shape ``(n_elements,
+  n_timesteps)`` instead of one dataset per timestep. The ``t{T}`` names live in
+  ``/meta/time_keys`` and ``/meta`` carries ``layout="columnar"``. A long record
+  is then one dataset rather than tens of thousands, and reading a few elements
+  over the whole record is a single strided read. ``write_temporal_xdmf``
+  detects the layout and references each timestep as a hyperslab of the 2-D
+  dataset, so ParaView opens both layouts the same way.
+
+Field and stat datasets may be written compressed (``codec=``, see
+:func:`codec_options`) and time-resolved fields as float32 (``dtype=``).
+Either choice is recorded as an attribute of ``/meta`` (:func:`read_encoding`)
+and the XDMF ``Precision`` follows the stored dtype; h5py decompresses on
+read, so readers need no changes.
+
+Files written through :class:`TimeseriesWriter` also carry ``/meta/index``, a
+small JSON document naming the field datasets, the layout and the shapes, with
+the time keys in ``/meta/time_keys`` (:meth:`TimeseriesWriter.write_index`).
+It lets a reader skip walking every ``t{T}`` dataset and parsing its name
+(:func:`read_index`). It is a cache: files without one, or whose index no
+longer matches their groups, are read by walking them as before.
 """
 
 from __future__ import annotations
@@ -23,6 +45,13 @@ __all__ = [
     "filter_keys_by_range",
     "read_step",
     "read_timeseries_meta",
+    "is_columnar",
+    "columnar_chunks",
+    "columnar_time_keys",
+    "codec_options",
+    "read_encoding",
+    "read_index",
+    "storage_dtype",
     "timeseries_reader",
     "timeseries_writer",
     "TimeseriesReader",
@@ -39,23 +68,215 @@ __all__ = [
 
 import contextlib
 import datetime as _dt
+import json
 import pathlib
 import xml.etree.ElementTree as ET
-from typing import Iterator, Sequence
+import zlib
+from concurrent.futures import ThreadPoolExecutor
+from typing import Iterator, Literal, Mapping, Sequence
 from xml.dom import minidom
 
 import h5py
 import numpy as np
+from h5py import h5d, h5p, h5s, h5t
 from ruamel.yaml import YAML
 
+# /meta attribute naming the on-disk layout of the time-resolved groups. Absent
+# on per-step files, which predate it; "columnar" on files written by
+# :meth:`TimeseriesWriter.write_columnar_field`.
+LAYOUT_ATTR = "layout"
+COLUMNAR_LAYOUT = "columnar"
+
+# Target size of one chunk of a columnar dataset. HDF5 reads and caches whole
+# chunks, so this is the unit of I/O; around a megabyte keeps the chunk index
+# small without making a narrow element read drag in much unrelated data.
+_COLUMNAR_CHUNK_BYTES = 1 << 20
+# Upper bound on the time extent of a default chunk. Long in time and narrow in
+# elements favours the "few elements, whole record" read; capping it keeps a
+# windowed read of the whole surface from touching far more than its window.
+_COLUMNAR_CHUNK_MAX_T = 4096
+# ``chunks=`` value asking for an unchunked columnar dataset. Contiguous
+# storage cannot be filtered, but its bytes sit at one file offset and can be
+# memory-mapped (see :class:`cfdmod.adapters.xdmf_h5.MemmapFieldStore`).
+CONTIGUOUS = "contiguous"
+
+# /meta attributes recording how the datasets were encoded. Written only when
+# the writer departs from the defaults (no filter, float64), so files written
+# with the defaults keep their exact byte layout; a reader treats a missing
+# attribute as the default.
+CODEC_ATTR = "codec"
+STORAGE_DTYPE_ATTR = "storage_dtype"
+DEFAULT_CODEC = "none"
+_STORAGE_DTYPES = ("float64", "float32")
+_DEFAULT_GZIP_LEVEL = 4
+
+# Size of the reusable buffer a field is converted to its storage dtype through,
+# one block of timesteps (or element rows) at a time, instead of one temporary
+# per column or a full-size copy of the field.
+_WRITE_BUFFER_BYTES = 8 << 20
+
+# /meta dataset holding the JSON index written by :meth:`TimeseriesWriter.write_index`.
+INDEX_DATASET = "index"
+_INDEX_VERSION = 2
+
+
+def codec_options(codec: str) -> dict:
+    """``create_dataset`` filter keywords for a codec preset.
+
+    Presets:
+
+    - ``"none"``: no filter (contiguous storage, memory-mappable).
+    - ``"lzf"``: h5py's LZF -- fast, modest ratio. Other HDF5 tools (ParaView
+      included) need the h5py LZF plugin to read it.
+    - ``"gzip"`` / ``"gzip-N"``: deflate at level ``N`` (0-9, default 4).
+    - ``"shuffle+gzip"`` / ``"shuffle+gzip-N"``: byte-shuffle before deflate,
+      which groups the slowly varying exponent bytes of floats together and
+      usually compresses them markedly better than gzip alone.
+
+    Raises:
+        ValueError: For an unknown preset or gzip level.
+    """
+    name = codec.strip().lower()
+    if name == "none":
+        return {}
+    if name == "lzf":
+        return {"compression": "lzf"}
+    shuffle = name.startswith("shuffle+")
+    if shuffle:
+        name = name[len("shuffle+") :]
+    base, _, level = name.partition("-")
+    if base == "gzip" and (not level or (level.isdigit() and 0 <= int(level) <= 9)):
+        opts: dict = {
+            "compression": "gzip",
+            "compression_opts": int(level) if level else _DEFAULT_GZIP_LEVEL,
+        }
+        if shuffle:
+            opts["shuffle"] = True
+        return opts
+    raise ValueError(
+        f"unknown codec {codec!r}; expected 'none', 'lzf', 'gzip[-N]' or "
+        "'shuffle+gzip[-N]' with N in 0..9"
+    )
+
+
+def storage_dtype(dtype) -> np.dtype:
+    """Validate a timeseries storage dtype (``float64`` or ``float32``)."""
+    dt = np.dtype(dtype)
+    if dt.name not in _STORAGE_DTYPES:
+        raise ValueError(f"storage dtype must be one of {_STORAGE_DTYPES}; got {dt.name!r}")
+    return dt
+
+
+def read_encoding(f: h5py.File) -> dict[str, str]:
+    """The ``codec`` and ``storage_dtype`` a file's datasets were written with."""
+    attrs = f["meta"].attrs if "meta" in f else {}
+    codec = attrs.get(CODEC_ATTR, DEFAULT_CODEC)
+    dtype = attrs.get(STORAGE_DTYPE_ATTR, "float64")
+    return {
+        CODEC_ATTR: codec.decode() if isinstance(codec, bytes) else str(codec),
+        STORAGE_DTYPE_ATTR: dtype.decode() if isinstance(dtype, bytes) else str(dtype),
+    }
+
+
+def is_columnar(f: h5py.File, group: str) -> bool:
+    """Whether ``group`` is stored as a single 2-D columnar dataset."""
+    obj = f.get(group)
+    return isinstance(obj, h5py.Dataset) and obj.ndim == 2
+
+
+def columnar_chunks(
+    n_elements: int,
+    n_timesteps: int,
+    itemsize: int = 8,
+) -> tuple[int, int] | None:
+    """Default chunk shape for a ``(n_elements, n_timesteps)`` columnar dataset.
+
+    Roughly :data:`_COLUMNAR_CHUNK_BYTES` per chunk, as long in time as
+    :data:`_COLUMNAR_CHUNK_MAX_T` allows. Returns ``None`` (contiguous storage)
+    for an empty dataset, which HDF5 cannot chunk.
+    """
+    if n_elements <= 0 or n_timesteps <= 0:
+        return None
+    chunk_t = min(n_timesteps, _COLUMNAR_CHUNK_MAX_T)
+    chunk_e = max(1, min(n_elements, _COLUMNAR_CHUNK_BYTES // (chunk_t * itemsize)))
+    return (chunk_e, chunk_t)
+
+
+def columnar_time_keys(f: h5py.File) -> list[str]:
+    """The ``t{T}`` names of a columnar file, in column order."""
+    meta = f["meta"]
+    if "time_keys" in meta:
+        return [k.decode() if isinstance(k, bytes) else str(k) for k in meta["time_keys"][:]]
+    # A columnar file always records its keys; rebuilding them from the time
+    # array keeps a hand-assembled file without them readable.
+    return [f"t{t}" for t in meta["time_steps"][:]]
+
+
+def read_index(f: h5py.File) -> dict | None:
+    """The ``/meta/index`` of ``f``, or ``None`` when it is absent or stale.
+
+    Returns the written index (``layout``, ``time_aggregated``,
+    ``n_elements``, ``n_timesteps`` and ``fields``, a field name -> dataset
+    path mapping) plus ``time_keys``, the ``t{T}`` names in time order. The
+    index is checked against the file first -- the same root entries, the
+    same entries in every stats group, every field present with the recorded
+    number of timesteps -- so a file that was appended to after it was
+    written is reported as unindexed rather than misread. The check costs one
+    lookup per field and one listing per stats group, never one per timestep.
+    """
+    meta = f.get("meta")
+    if not isinstance(meta, h5py.Group) or INDEX_DATASET not in meta:
+        return None
+    raw = meta[INDEX_DATASET][()]
+    try:
+        index = json.loads(raw.decode() if isinstance(raw, bytes) else raw)
+    except (TypeError, ValueError):
+        return None
+    if not isinstance(index, dict) or index.get("version") != _INDEX_VERSION:
+        return None
+    if sorted(f.keys()) != index["root"]:
+        return None
+    for group, names in index["groups"].items():
+        obj = f.get(group)
+        if not isinstance(obj, h5py.Group) or sorted(obj.keys()) != names:
+            return None
+    n_t = index["n_timesteps"]
+    for path in index["fields"].values():
+        obj = f.get(path)
+        if index["time_aggregated"]:
+            stale = not isinstance(obj, h5py.Dataset)
+        elif index["layout"] == COLUMNAR_LAYOUT:
+            stale = not isinstance(obj, h5py.Dataset) or obj.shape[1:] != (n_t,)
+        else:
+            stale = not isinstance(obj, h5py.Group) or len(obj) != n_t
+        if stale:
+            return None
+    if index["time_aggregated"]:
+        index["time_keys"] = []
+    else:
+        if "time_keys" not in meta or meta["time_keys"].shape != (n_t,):
+            return None
+        index["time_keys"] = columnar_time_keys(f)
+    return index
+
+
+def _step_keys(f: h5py.File, group: str) -> list[str]:
+    """The ``t{T}`` names of per-step ``group`` in time order, from the index when it has them."""
+    index = read_index(f)
+    if index is not None and group in index["fields"].values():
+        return index["time_keys"]
+    return sorted(f[group].keys(), key=lambda k: float(k[1:]))
+
 
 def get_pressure_keys(h5_path: pathlib.Path, group: str = "pressure") -> list[tuple[float, str]]:
     """Return sorted (float_time, key_str) pairs from H5 group.
 
-    Keys are expected in the form t{T} where T is the float time value.
+    Keys are expected in the form t{T} where T is the float time value. A
+    columnar group, or any group of an indexed file (see :func:`read_index`),
+    reports the keys recorded in ``/meta/time_keys`` without listing the group.
     """
     with h5py.File(h5_path, "r") as f:
-        keys = list(f[group].keys())
+        keys = columnar_time_keys(f) if is_columnar(f, group) else _step_keys(f, group)
     result = [(float(k[1:]), k) for k in keys]
     return sorted(result, key=lambda x: x[0])
 
@@ -70,8 +291,8 @@ def filter_keys_by_range(
 
 def read_step(h5_path: pathlib.Path, key: str, group: str) -> np.ndarray:
     """Read a single timestep array from an H5 group."""
-    with h5py.File(h5_path, "r") as f:
-        return f[group][key][:]
+    with timeseries_reader(h5_path) as reader:
+        return reader.read_step(key, group)
 
 
 def read_timeseries_meta(h5_path: pathlib.Path) -> dict:
@@ -81,6 +302,8 @@ def read_timeseries_meta(h5_path: pathlib.Path) -> dict:
         time_steps: float64 array of raw simulation time values
         time_normalized: float64 array of normalized time values
         region_labels: list[str] (only if present in file)
+        codec: str codec preset the fields were written with
+        storage_dtype: str on-disk dtype of the time-resolved fields
     """
     with h5py.File(h5_path, "r") as f:
         meta = f["meta"]
@@ -90,6 +313,7 @@ def read_timeseries_meta(h5_path: pathlib.Path) -> dict:
         }
         if "region_labels" in meta:
             result["region_labels"] = [s.decode() for s in meta["region_labels"][:]]
+        result.update(read_encoding(f))
     return result
 
 
@@ -104,12 +328,44 @@ class TimeseriesWriter:
 
     The module-level functions below delegate here, so there is one
     implementation of each write and their behaviour is unchanged.
+
+    Args:
+        f: Open, writable h5 handle.
+        codec: Filter preset for every field and stat dataset; see
+            :func:`codec_options`. Geometry and ``/meta`` stay unfiltered.
+        dtype: On-disk dtype of time-resolved fields (``float64`` or
+            ``float32``). Stats are always float64.
+        workers: Threads that compress field chunks for a gzip ``codec``
+            while the calling thread writes them. HDF5 runs its filters
+            under a global lock, one chunk at a time; compressing with
+            :mod:`zlib` (which releases the GIL) and writing the result with
+            ``write_direct_chunk`` is what lets the work spread over cores.
+            The stored bytes decode exactly as HDF5's own filter output.
+            ``0`` (default) leaves compression to HDF5; ignored without a
+            gzip codec.
+
+    A non-default ``codec`` or ``dtype`` is recorded in the ``/meta``
+    attributes (see :func:`read_encoding`); h5py decompresses transparently,
+    so nothing else on the read side needs to know.
     """
 
-    __slots__ = ("_f",)
+    __slots__ = ("_f", "_codec", "_filters", "_dtype", "_workers")
 
-    def __init__(self, f: h5py.File) -> None:
+    def __init__(
+        self,
+        f: h5py.File,
+        *,
+        codec: str = DEFAULT_CODEC,
+        dtype=np.float64,
+        workers: int = 0,
+    ) -> None:
+        if workers < 0:
+            raise ValueError(f"workers must be non-negative; got {workers}")
         self._f = f
+        self._filters = codec_options(codec)
+        self._codec = codec if self._filters else DEFAULT_CODEC
+        self._dtype = storage_dtype(dtype)
+        self._workers = int(workers) if self._filters.get("compression") == "gzip" else 0
 
     def write_geometry(self, triangles: np.ndarray, vertices: np.ndarray) -> None:
         """Write /Triangles and /Geometry (only needed once per file)."""
@@ -141,13 +397,20 @@ class TimeseriesWriter:
         grp = self._f.require_group(group)
         if key in grp:
             del grp[key]
-        grp.create_dataset(key, data=np.asarray(data).astype(np.float64))
+        self._create(grp, key, np.asarray(data).astype(self._dtype))
 
     def write_field(self, group: str, values: np.ndarray, keys: Sequence[str]) -> None:
         """Write a whole ``(n_elements, n_timesteps)`` field as per-timestep datasets.
 
         ``keys[i]`` names the dataset for column ``i``. This is the batched form
         of :meth:`write_step` and the reason this class exists.
+
+        Columns are transposed into a reusable buffer in the storage dtype a
+        block of timesteps at a time, so each dataset is written from a
+        contiguous row rather than a strided column copied on its own. The
+        first dataset is created as :meth:`write_step` would; the rest are
+        created like it through h5py's low-level API, which halves the
+        per-dataset overhead that dominates this layout.
         """
         values = np.asarray(values)
         if values.ndim != 2:
@@ -159,10 +422,214 @@ class TimeseriesWriter:
                 f"write_field got {values.shape[1]} time columns but {len(keys)} keys"
             )
         grp = self._f.require_group(group)
-        for i, key in enumerate(keys):
-            if key in grp:
-                del grp[key]
-            grp.create_dataset(key, data=values[:, i].astype(np.float64))
+        n_elements, n_steps = values.shape
+        if not n_steps:
+            return
+        # A fresh group cannot hold any of the keys; skip a lookup per step.
+        fresh = len(grp) == 0
+        rows = max(1, _WRITE_BUFFER_BYTES // max(1, n_elements * self._dtype.itemsize))
+        buf = np.empty((min(rows, n_steps), n_elements), dtype=self._dtype)
+        proto: tuple | None = None
+        with self._compressor() as compress:
+            for start in range(0, n_steps, buf.shape[0]):
+                stop = min(start + buf.shape[0], n_steps)
+                block = buf[: stop - start]
+                block[...] = values[:, start:stop].T
+                payloads = compress(list(block), (n_elements,)) if n_elements else None
+                for i, key in enumerate(keys[start:stop]):
+                    if not fresh and key in grp:
+                        del grp[key]
+                    if proto is not None:
+                        dsid = h5d.create(grp.id, key.encode(), *proto)
+                        if payloads is None:
+                            dsid.write(h5s.ALL, h5s.ALL, block[i])
+                        else:
+                            dsid.write_direct_chunk((0,), next(payloads))
+                        continue
+                    if payloads is None:
+                        self._create(grp, key, block[i])
+                    else:
+                        # One chunk per per-step dataset, as _create lays it out.
+                        dset = self._allocate(grp, key, (n_elements,), (n_elements,))
+                        dset.id.write_direct_chunk((0,), next(payloads))
+                    if n_elements:
+                        proto = self._step_prototype(grp[key].id)
+
+    def write_columnar_field(
+        self,
+        group: str,
+        values: np.ndarray,
+        keys: Sequence[str],
+        *,
+        chunks: tuple[int, int] | Literal["contiguous"] | None = None,
+    ) -> None:
+        """Write a whole ``(n_elements, n_timesteps)`` field as one chunked dataset.
+
+        The columnar counterpart of :meth:`write_field`: the field lands at
+        ``/{group}`` and ``keys`` are recorded once in ``/meta/time_keys``, which
+        every columnar field in the file shares. ``chunks`` defaults to
+        :func:`columnar_chunks`; ``"contiguous"`` stores the dataset unchunked
+        (and so unfiltered), which is what lets a reader memory-map it.
+        """
+        values = np.asarray(values)
+        if values.ndim != 2:
+            raise ValueError(
+                f"write_columnar_field expects a 2-D (elements, time) array; got {values.shape}"
+            )
+        if values.shape[1] != len(keys):
+            raise ValueError(
+                f"write_columnar_field got {values.shape[1]} time columns but {len(keys)} keys"
+            )
+        self._write_time_keys(keys)
+        if group in self._f:
+            del self._f[group]
+        chunks = self._columnar_chunks(chunks, values.shape)
+        if not values.size or (values.dtype == self._dtype and not self._workers):
+            # Already in the storage dtype: hand the array to HDF5 as it is.
+            self._create(self._f, group, values, chunks=chunks)
+            return
+        self._write_rows(self._allocate(self._f, group, values.shape, chunks), values)
+
+    def allocate_columnar_field(
+        self,
+        group: str,
+        n_elements: int,
+        keys: Sequence[str],
+        *,
+        chunks: tuple[int, int] | Literal["contiguous"] | None = None,
+    ) -> None:
+        """Create an empty ``(n_elements, len(keys))`` columnar dataset to fill later.
+
+        The streaming form of :meth:`write_columnar_field`: same chunking,
+        codec and ``/meta/time_keys``, but the columns arrive through
+        :meth:`write_columnar_window` one time window at a time.
+        """
+        self._write_time_keys(keys)
+        if group in self._f:
+            del self._f[group]
+        shape = (int(n_elements), len(keys))
+        self._allocate(self._f, group, shape, self._columnar_chunks(chunks, shape))
+
+    def _write_rows(self, dset: h5py.Dataset, values: np.ndarray) -> None:
+        """Fill ``dset`` from ``values`` through a reusable conversion buffer.
+
+        Rows are converted a block at a time, each block a whole number of
+        chunk rows, so every chunk is written once and in full: by HDF5
+        through its filters, or compressed by the worker threads.
+        """
+        n_elements, n_steps = values.shape
+        # Contiguous storage has no chunk grid; any run of rows is one extent.
+        chunk_e, chunk_t = dset.chunks or (1, n_steps)
+        rows = max(1, _WRITE_BUFFER_BYTES // (n_steps * self._dtype.itemsize) // chunk_e)
+        buf = np.empty((min(rows * chunk_e, n_elements), n_steps), dtype=self._dtype)
+        with self._compressor() as compress:
+            for start in range(0, n_elements, buf.shape[0]):
+                stop = min(start + buf.shape[0], n_elements)
+                block = buf[: stop - start]
+                block[...] = values[start:stop]
+                if not self._workers:
+                    dset[start:stop] = block
+                    continue
+                offsets = [
+                    (e, t) for e in range(start, stop, chunk_e) for t in range(0, n_steps, chunk_t)
+                ]
+                parts = [
+                    block[e - start : e - start + chunk_e, t : t + chunk_t] for e, t in offsets
+                ]
+                for offset, payload in zip(offsets, compress(parts, dset.chunks)):
+                    dset.id.write_direct_chunk(offset, payload)
+
+    def write_columnar_window(self, group: str, values: np.ndarray, start: int) -> None:
+        """Write ``values`` into columns ``start:start + k`` of an allocated field."""
+        values = np.asarray(values)
+        dset = self._f[group]
+        stop = start + values.shape[1]
+        if values.ndim != 2 or values.shape[0] != dset.shape[0] or stop > dset.shape[1]:
+            raise ValueError(
+                f"window of shape {values.shape} at column {start} does not fit "
+                f"{group!r} of shape {dset.shape}"
+            )
+        dset[:, start:stop] = values.astype(self._dtype, copy=False)
+
+    def _columnar_chunks(
+        self,
+        chunks: tuple[int, int] | Literal["contiguous"] | None,
+        shape: tuple[int, int],
+    ) -> tuple[int, ...] | None:
+        """Resolve a columnar ``chunks`` argument against the dataset ``shape``."""
+        if chunks == CONTIGUOUS:
+            if self._filters:
+                raise ValueError(
+                    f"chunks={CONTIGUOUS!r} cannot be combined with codec {self._codec!r}; "
+                    "HDF5 filters need chunked storage"
+                )
+            return None
+        if chunks is None:
+            return columnar_chunks(*shape, itemsize=self._dtype.itemsize)
+        # HDF5 rejects a chunk larger than a fixed-size dataset; clamp
+        # rather than make every caller size its chunks per field.
+        return tuple(max(1, min(c, n)) for c, n in zip(chunks, shape))
+
+    def _write_time_keys(self, keys: Sequence[str]) -> None:
+        """Record the columnar time keys in ``/meta``, once per file."""
+        meta = self._f.require_group("meta")
+        encoded = np.array([k.encode() for k in keys])
+        if "time_keys" in meta:
+            existing = [k.decode() for k in meta["time_keys"][:]]
+            if existing != list(keys):
+                raise ValueError(
+                    "columnar fields in one file must share a time axis; "
+                    f"/meta/time_keys has {len(existing)} keys, got {len(keys)} different ones"
+                )
+        else:
+            meta.create_dataset("time_keys", data=encoded)
+        meta.attrs[LAYOUT_ATTR] = COLUMNAR_LAYOUT
+
+    def write_index(
+        self,
+        fields: Mapping[str, str],
+        *,
+        n_elements: int,
+        time_keys: Sequence[str] | None,
+    ) -> None:
+        """Record ``/meta/index`` so a reader can skip walking the file.
+
+        ``fields`` maps each field name to its dataset path (the group of a
+        per-step field, the 2-D dataset of a columnar one, ``group/stat`` of a
+        stat). ``time_keys`` are the ``t{T}`` names in time order, or ``None``
+        for a stats file. Call it after the last field is written: the index
+        records the file's root entries, and :func:`read_index` treats any
+        later change to them as a stale index.
+        """
+        meta = self._f.require_group("meta")
+        time_aggregated = time_keys is None
+        columnar = not time_aggregated and any(is_columnar(self._f, p) for p in fields.values())
+        if not time_aggregated:
+            # Columnar files already hold these; per-step ones gain them here.
+            if "time_keys" in meta:
+                del meta["time_keys"]
+            meta.create_dataset(
+                "time_keys", data=np.array([k.encode() for k in time_keys], dtype=bytes)
+            )
+        index = {
+            "version": _INDEX_VERSION,
+            "layout": COLUMNAR_LAYOUT if columnar else "per_step",
+            "time_aggregated": time_aggregated,
+            "n_elements": int(n_elements),
+            "n_timesteps": 0 if time_aggregated else len(time_keys),
+            "fields": dict(fields),
+            "root": sorted(self._f.keys()),
+            # The entries of each stats group: a stat written into one later
+            # is no recorded field, so only its listing can reveal it.
+            "groups": {
+                group: sorted(self._f[group].keys())
+                for group in sorted({path.rpartition("/")[0] for path in fields.values()} - {""})
+                if isinstance(self._f.get(group), h5py.Group)
+            },
+        }
+        if INDEX_DATASET in meta:
+            del meta[INDEX_DATASET]
+        meta.create_dataset(INDEX_DATASET, data=json.dumps(index, sort_keys=True))
 
     def write_stats_field(
         self,
@@ -180,7 +647,84 @@ class TimeseriesWriter:
             grp.create_dataset("Geometry", data=vertices.astype(np.float64))
         if stat_name in grp:
             del grp[stat_name]
-        grp.create_dataset(stat_name, data=values.astype(np.float64))
+        self._create(grp, stat_name, values.astype(np.float64), timeseries=False)
+
+    def _create(
+        self,
+        parent: h5py.Group,
+        name: str,
+        data: np.ndarray,
+        chunks: tuple[int, ...] | None = None,
+        *,
+        timeseries: bool = True,
+    ) -> None:
+        """Create a field / stat dataset with this writer's codec applied."""
+        if self._filters and data.size:
+            # One chunk per per-step dataset: a timestep is always read whole.
+            # (HDF5 cannot chunk, and so cannot filter, an empty dataset.)
+            parent.create_dataset(name, data=data, chunks=chunks or data.shape, **self._filters)
+        else:
+            parent.create_dataset(name, data=data, chunks=chunks)
+        self._record_encoding(timeseries=timeseries)
+
+    @contextlib.contextmanager
+    def _compressor(self) -> Iterator:
+        """Yield ``compress(parts, chunk_shape)``: the parts' payloads, in order.
+
+        Parts are compressed concurrently and the caller writes each payload
+        as soon as it is ready. Without workers ``compress`` returns ``None``
+        and the caller leaves the filtering to HDF5.
+        """
+        if not self._workers:
+            yield lambda parts, chunk_shape: None
+            return
+        level = self._filters["compression_opts"]
+        shuffle = self._filters.get("shuffle", False)
+        with ThreadPoolExecutor(self._workers, thread_name_prefix="cfdmod-deflate") as pool:
+
+            def compress(parts, chunk_shape):
+                return pool.map(lambda p: _deflate(p, chunk_shape, level, shuffle), parts)
+
+            yield compress
+
+    def _step_prototype(self, created: h5d.DatasetID) -> tuple:
+        """``(type, space, dcpl)`` to create further steps like ``created``.
+
+        Unfiltered steps get a fresh property list set up as h5py's
+        ``create_dataset`` sets it, so each step's dataset is stored exactly
+        as ``create_dataset`` would store it. A filtered step's list is copied
+        from ``created``: the data and filters are the same, only the
+        fill-value header differs.
+        """
+        if self._filters:
+            return created.get_type(), created.get_space(), created.get_create_plist()
+        dcpl = h5p.create(h5p.DATASET_CREATE)
+        dcpl.set_obj_track_times(False)
+        return h5t.py_create(self._dtype, logical=1), created.get_space(), dcpl
+
+    def _allocate(
+        self,
+        parent: h5py.Group,
+        name: str,
+        shape: tuple[int, ...],
+        chunks: tuple[int, ...] | None,
+    ) -> h5py.Dataset:
+        """Create an empty field dataset with this writer's codec, to be filled later."""
+        if self._filters and chunks is not None:
+            dset = parent.create_dataset(
+                name, shape=shape, dtype=self._dtype, chunks=chunks, **self._filters
+            )
+        else:
+            dset = parent.create_dataset(name, shape=shape, dtype=self._dtype, chunks=chunks)
+        self._record_encoding(timeseries=True)
+        return dset
+
+    def _record_encoding(self, *, timeseries: bool) -> None:
+        """Note a non-default codec / storage dtype on ``/meta``."""
+        if self._filters:
+            self._f.require_group("meta").attrs[CODEC_ATTR] = self._codec
+        if timeseries and self._dtype != np.float64:
+            self._f.require_group("meta").attrs[STORAGE_DTYPE_ATTR] = self._dtype.name
 
 
 class TimeseriesReader:
@@ -190,26 +734,46 @@ class TimeseriesReader:
     that calls :func:`read_step` per timestep reopens the file per timestep.
     """
 
-    __slots__ = ("_f",)
+    __slots__ = ("_f", "_columns")
 
     def __init__(self, f: h5py.File) -> None:
         self._f = f
+        # key -> column index of a columnar file, built on first columnar read.
+        self._columns: dict[str, int] | None = None
 
     def keys(self, group: str = "pressure") -> list[tuple[float, str]]:
         """Sorted ``(float_time, key_str)`` pairs from an H5 group."""
-        result = [(float(k[1:]), k) for k in self._f[group].keys()]
+        if is_columnar(self._f, group):
+            names = columnar_time_keys(self._f)
+        else:
+            names = _step_keys(self._f, group)
+        result = [(float(k[1:]), k) for k in names]
         return sorted(result, key=lambda x: x[0])
 
     def read_step(self, key: str, group: str) -> np.ndarray:
         """Read a single timestep array from an H5 group."""
-        return self._f[group][key][:]
+        if not is_columnar(self._f, group):
+            return self._f[group][key][:]
+        if self._columns is None:
+            self._columns = {k: i for i, k in enumerate(columnar_time_keys(self._f))}
+        return self._f[group][:, self._columns[key]]
 
 
 @contextlib.contextmanager
-def timeseries_writer(h5_path: pathlib.Path, mode: str = "a") -> Iterator[TimeseriesWriter]:
-    """Open ``h5_path`` once and write many steps / fields through the handle."""
+def timeseries_writer(
+    h5_path: pathlib.Path,
+    mode: str = "a",
+    *,
+    codec: str = DEFAULT_CODEC,
+    dtype=np.float64,
+    workers: int = 0,
+) -> Iterator[TimeseriesWriter]:
+    """Open ``h5_path`` once and write many steps / fields through the handle.
+
+    ``codec``, ``dtype`` and ``workers`` are forwarded to :class:`TimeseriesWriter`.
+    """
     with h5py.File(h5_path, mode) as f:
-        yield TimeseriesWriter(f)
+        yield TimeseriesWriter(f, codec=codec, dtype=dtype, workers=workers)
 
 
 @contextlib.contextmanager
@@ -264,9 +828,11 @@ def write_temporal_xdmf(
     """Write temporal XDMF XML for a timeseries H5.
 
     Reads ``/Triangles``, ``/Geometry``, and ``/{group}/t{T}`` keys from
-    ``h5_path``. Produces a temporal collection (one Grid per timestep)
-    compatible with ParaView. When multiple groups are supplied, each Grid
-    carries one Attribute per group (e.g. for Cf with x/y/z directions).
+    ``h5_path`` (or, for a columnar file, ``/meta/time_keys``, with each
+    timestep referenced as a hyperslab column of ``/{group}``). Produces a
+    temporal collection (one Grid per timestep) compatible with ParaView. When
+    multiple groups are supplied, each Grid carries one Attribute per group
+    (e.g. for Cf with x/y/z directions).
 
     Args:
         h5_path: Source H5 file.
@@ -281,7 +847,19 @@ def write_temporal_xdmf(
     with h5py.File(h5_path, "r") as f:
         n_tri = f["Triangles"].shape[0]
         n_verts = f["Geometry"].shape[0]
-        keys = sorted(f[groups[0]].keys(), key=lambda k: float(k[1:]))
+        columnar = is_columnar(f, groups[0])
+        if columnar:
+            # Columnar keys are already in column order; the column index is
+            # what the hyperslab needs, so keep it alongside the name.
+            keys = columnar_time_keys(f)
+            n_steps = len(keys)
+        else:
+            keys = _step_keys(f, groups[0])
+        # Fields may be stored as float32; XDMF must state the real width.
+        precision = {
+            g: str((f[g] if columnar else f[g][keys[0]]).dtype.itemsize) if keys else "8"
+            for g in groups
+        }
 
     h5_name = h5_path.name
     root = ET.Element("Xdmf", Version="3.0")
@@ -294,7 +872,7 @@ def write_temporal_xdmf(
         CollectionType="Temporal",
     )
 
-    for key in keys:
+    for col, key in enumerate(keys):
         t_val = float(key[1:])
         grid = ET.SubElement(collection, "Grid", Name=key, GridType="Uniform")
         ET.SubElement(grid, "Time", Value=str(t_val))
@@ -327,12 +905,17 @@ def write_temporal_xdmf(
 
         for grp_name in groups:
             attr = ET.SubElement(grid, "Attribute", Name=grp_name, Center="Cell")
+            if columnar:
+                _columnar_hyperslab(
+                    attr, f"{h5_name}:/{grp_name}", n_tri, n_steps, col, precision[grp_name]
+                )
+                continue
             attr_item = ET.SubElement(
                 attr,
                 "DataItem",
                 Format="HDF",
                 DataType="Float",
-                Precision="8",
+                Precision=precision[grp_name],
                 Dimensions=str(n_tri),
             )
             attr_item.text = f"{h5_name}:/{grp_name}/{key}"
@@ -340,6 +923,55 @@ def write_temporal_xdmf(
     _write_pretty_xml(root, xdmf_path)
 
 
+def _deflate(part: np.ndarray, chunk_shape: tuple[int, ...], level: int, shuffle: bool) -> bytes:
+    """Encode one chunk exactly as HDF5's shuffle + deflate filters would.
+
+    An edge chunk is zero-padded to the full ``chunk_shape``, which is how
+    HDF5 stores it. Shuffle groups byte ``j`` of every value together.
+    """
+    if part.shape != tuple(chunk_shape):
+        padded = np.zeros(chunk_shape, dtype=part.dtype)
+        padded[tuple(slice(0, n) for n in part.shape)] = part
+        part = padded
+    data = np.ascontiguousarray(part).reshape(-1)
+    if shuffle:
+        data = data.view(np.uint8).reshape(-1, part.dtype.itemsize).T.copy()
+    return zlib.compress(memoryview(data).cast("B"), level)
+
+
+def _columnar_hyperslab(
+    parent: ET.Element,
+    dataset_ref: str,
+    n_tri: int,
+    n_steps: int,
+    col: int,
+    precision: str = "8",
+) -> None:
+    """Reference column ``col`` of a columnar ``(n_tri, n_steps)`` dataset.
+
+    XDMF expresses the column as a HyperSlab over the whole 2-D dataset:
+    start ``(0, col)``, stride ``(1, 1)``, count ``(n_tri, 1)``.
+    """
+    slab = ET.SubElement(
+        parent,
+        "DataItem",
+        ItemType="HyperSlab",
+        Type="HyperSlab",
+        Dimensions=f"{n_tri} 1",
+    )
+    selection = ET.SubElement(slab, "DataItem", Format="XML", Dimensions="3 2")
+    selection.text = f"0 {col} 1 1 {n_tri} 1"
+    source = ET.SubElement(
+        slab,
+        "DataItem",
+        Format="HDF",
+        DataType="Float",
+        Precision=precision,
+        Dimensions=f"{n_tri} {n_steps}",
+    )
+    source.text = dataset_ref
+
+
 def write_stats_field(
     h5_path: pathlib.Path,
     group: str,
@@ -320,29 +320,23 @@ def create_value_tags(
     X, Y, Z = np.meshgrid(x_targets, y_targets, [z_level], indexing="ij")
     target_points = np.column_stack((X.ravel(), Y.ravel(), Z.ravel()))
 
-    def find_cells():
-        nonlocal mesh, target_points
-        cells = np.array([c.center for c in mesh.cell])
-        closest_mesh_ids = []
-        for pt in target_points:
-            closest_cell_id = mesh.find_closest_cell(pt)
-            closest_pt = cells[closest_cell_id]
-            if np.linalg.norm(pt - closest_pt) < 10:
-                closest_mesh_ids.append(closest_cell_id)
+    def nearest_within(candidates: np.ndarray) -> np.ndarray:
+        # One KD-tree query for every target instead of a mesh search per
+        # point; targets farther than 10 units from any candidate get no tag.
+        from scipy.spatial import cKDTree
+
+        dist, idx = cKDTree(candidates).query(target_points)
+        return idx[dist < 10]
 
+    def find_cells():
+        cells = np.asarray(mesh.cell_centers().points)
+        closest_mesh_ids = nearest_within(cells)
         points = cells[closest_mesh_ids]
         values = mesh.cell_data[projection_config.scalar][closest_mesh_ids]
         return points, values
 
     def find_pts():
-        nonlocal mesh, target_points
-        closest_mesh_ids = []
-        for pt in target_points:
-            closest_point_id = mesh.find_closest_point(pt)
-            closest_pt = mesh.points[closest_point_id]
-            if np.linalg.norm(pt - closest_pt) < 10:
-                closest_mesh_ids.append(closest_point_id)
-
+        closest_mesh_ids = nearest_within(np.asarray(mesh.points))
         points = mesh.points[closest_mesh_ids]
         values = mesh.point_data[projection_config.scalar][closest_mesh_ids]
         return points, values
@@ -0,0 +1,196 @@
+"""In-place reads from a ranged ``BlobStore`` (``get_range`` / ``size``).
+
+When the backend can serve byte ranges, ``XdmfH5BlobStorage`` must return a
+lazy data source that reads exactly what the unranged path reads while
+fetching only the blocks a window touches -- never the whole object. A plain
+``BlobStore`` must keep working through the download-everything path.
+"""
+
+from __future__ import annotations
+
+import io
+import pickle
+
+import h5py
+import numpy as np
+import pytest
+
+from cfdmod.adapters import DirectoryBlobStore
+from cfdmod.adapters.memory import MemoryBlobStore, MemoryFieldStore
+from cfdmod.adapters.xdmf_h5 import BlobFile, H5FieldStore, XdmfH5BlobStorage
+from cfdmod.adapters.xdmf_h5.blob_file import BlockCache
+from cfdmod.core import (
+    ElementMeta,
+    PipelineTemplate,
+    RangedBlobStore,
+    StorageKeyError,
+    SurfaceDataSource,
+    TimeAxis,
+    Topology,
+    run_template,
+)
+
+pytestmark = pytest.mark.unit
+
+
+class _CountingStore(DirectoryBlobStore):
+    """Records every byte a reader pulls from the backend."""
+
+    __slots__ = ("fetched", "whole_reads")
+
+    def __init__(self, root) -> None:
+        super().__init__(root)
+        self.fetched = 0
+        self.whole_reads = 0
+
+    def get_range(self, key, offset, length):
+        data = super().get_range(key, offset, length)
+        self.fetched += len(data)
+        return data
+
+    def get_bytes(self, key):
+        self.whole_reads += 1
+        return super().get_bytes(key)
+
+
+class _PlainStore:
+    """A BlobStore with no ranged reads."""
+
+    def __init__(self) -> None:
+        self._inner = MemoryBlobStore()
+
+    def get_bytes(self, key):
+        return self._inner.get_bytes(key)
+
+    def put_bytes(self, key, data):
+        self._inner.put_bytes(key, data)
+
+    def list_keys(self):
+        return self._inner.list_keys()
+
+    def __contains__(self, key):
+        return key in self._inner
+
+
+def _surface(n_elements: int = 2000, n_timesteps: int = 200) -> SurfaceDataSource:
+    rng = np.random.default_rng(0)
+    return SurfaceDataSource(
+        time=TimeAxis(initial_time=0.0, timestep_size=0.1, n_timesteps=n_timesteps),
+        topology=Topology.triangles(
+            np.arange(n_elements * 3, dtype=np.int32).reshape(n_elements, 3),
+            rng.random((n_elements * 3, 3)),
+        ),
+        elements=ElementMeta(),
+        fields=MemoryFieldStore({"cp": rng.random((n_elements, n_timesteps))}),
+    )
+
+
+def test_ranged_read_is_lazy_and_fetches_only_the_window(tmp_path):
+    ds = _surface()
+    blobs = _CountingStore(tmp_path)
+    # Per-step object headers sit between the timestep payloads, so opening
+    # touches one block per timestep: small blocks keep that cheap.
+    storage = XdmfH5BlobStorage(blobs, write_xdmf=False, block_size=4096)
+    storage.write_data_source("body", ds)
+    file_size = blobs.size("body.h5")
+
+    back = storage.read_data_source("body")
+    assert isinstance(back.fields, H5FieldStore)
+    np.testing.assert_array_equal(back.topology.vertices, ds.topology.vertices)
+    opened = blobs.fetched
+    window = back.fields.read("cp", time_slice=slice(40, 50))
+    np.testing.assert_array_equal(window, ds.fields.read("cp", time_slice=slice(40, 50)))
+
+    assert blobs.whole_reads == 0
+    # Ten 16 KB timesteps out of two hundred, plus geometry and headers.
+    assert blobs.fetched - opened < 0.1 * file_size
+    assert blobs.fetched < 0.25 * file_size
+
+
+def test_ranged_and_unranged_reads_agree(tmp_path):
+    ds = _surface(n_elements=50, n_timesteps=12)
+    ranged = XdmfH5BlobStorage(DirectoryBlobStore(tmp_path))
+    plain = XdmfH5BlobStorage(_PlainStore())
+    for storage in (ranged, plain):
+        storage.write_data_source("out/cp", ds)
+    a = ranged.read_data_source("out/cp")
+    b = plain.read_data_source("out/cp")
+    assert isinstance(b.fields, MemoryFieldStore)
+    assert a.time == b.time
+    np.testing.assert_array_equal(
+        a.fields.read("cp", elements=np.array([7, 3])), b.fields.read("cp")[[7, 3]]
+    )
+    assert a.attrs["source_path"] == "out/cp.h5"
+
+
+def test_lazy_source_pickles_without_its_cache(tmp_path):
+    blobs = DirectoryBlobStore(tmp_path)
+    storage = XdmfH5BlobStorage(blobs)
+    storage.write_data_source("cp", _surface(n_elements=50, n_timesteps=12))
+    fields = storage.read_data_source("cp").fields
+    expected = fields.read("cp")
+    clone = pickle.loads(pickle.dumps(fields))
+    np.testing.assert_array_equal(clone.read("cp"), expected)
+
+
+def test_missing_key_raises_storage_key_error(tmp_path):
+    with pytest.raises(StorageKeyError):
+        XdmfH5BlobStorage(DirectoryBlobStore(tmp_path)).read_data_source("nope")
+
+
+def test_run_template_against_a_directory_blob_store(tmp_path):
+    blobs = DirectoryBlobStore(tmp_path)
+    storage = XdmfH5BlobStorage(blobs)
+    ds = _surface(n_elements=20, n_timesteps=30)
+    storage.write_data_source("body", ds)
+    tpl = PipelineTemplate(
+        inputs={"body": {"kind": "surface", "path": "body"}},
+        pipeline=[
+            {"id": "cp", "kind": "scale", "source": "body", "field": "cp", "factor": 2.0},
+        ],
+        outputs={"cp": {"source": "cp", "path": "out/cp"}},
+    )
+    run_template(tpl, storage=storage, chunk_size=7)
+    assert "out/cp.h5" in set(blobs.list_keys())
+    scaled = storage.read_data_source("out/cp").fields.read("cp")
+    np.testing.assert_allclose(scaled, 2.0 * ds.fields.read("cp"))
+
+
+def test_blob_file_behaves_like_a_binary_file():
+    blobs = MemoryBlobStore()
+    payload = bytes(range(256)) * 10
+    blobs.put_bytes("k", payload)
+    fh = io.BufferedReader(BlobFile(BlockCache(blobs, "k", block_size=100)))
+    assert fh.read(5) == payload[:5]
+    fh.seek(-3, io.SEEK_END)
+    assert fh.read() == payload[-3:]
+    fh.seek(250)
+    assert fh.read(120) == payload[250:370]
+    assert fh.read(0) == b""
+
+
+def test_h5py_opens_a_blob_file(tmp_path):
+    path = tmp_path / "x.h5"
+    with h5py.File(path, "w") as f:
+        f["a"] = np.arange(10.0)
+    blobs = MemoryBlobStore()
+    blobs.put_bytes("x.h5", path.read_bytes())
+    with h5py.File(BlobFile(BlockCache(blobs, "x.h5", block_size=512)), "r") as f:
+        np.testing.assert_array_equal(f["a"][3:6], [3.0, 4.0, 5.0])
+
+
+def test_directory_blob_store(tmp_path):
+    store = DirectoryBlobStore(tmp_path / "blobs")
+    assert isinstance(store, RangedBlobStore)
+    assert list(store.list_keys()) == []
+    store.put_bytes("a/b.h5", b"0123456789")
+    store.put_bytes("c.tmp", b"x")
+    assert "a/b.h5" in store and "a/x" not in store
+    assert store.get_range("a/b.h5", 3, 4) == b"3456"
+    assert store.get_range("a/b.h5", 8, 10) == b"89"
+    assert store.size("a/b.h5") == 10
+    assert list(store.list_keys()) == ["a/b.h5", "c.tmp"]
+    with pytest.raises(KeyError):
+        store.get_bytes("missing")
+    with pytest.raises(ValueError, match="relative"):
+        store.put_bytes("../escape", b"")
@@ -0,0 +1,148 @@
+"""Codec presets and float32 storage (``XdmfH5Storage(codec=..., storage_dtype=...)``).
+
+A compressed or narrowed file must read back through the unchanged read path,
+record its encoding in ``/meta``, describe its real precision in the XDMF, and
+actually be smaller. The default must leave the written bytes alone.
+"""
+
+from __future__ import annotations
+
+import xml.etree.ElementTree as ET
+
+import h5py
+import numpy as np
+import pytest
+
+from cfdmod.adapters import XdmfH5Storage
+from cfdmod.adapters.memory import MemoryFieldStore
+from cfdmod.core import SurfaceDataSource, TimeAxis
+from cfdmod.core.topology import ElementMeta, Topology
+from cfdmod.io.xdmf import codec_options, read_timeseries_meta
+
+pytestmark = pytest.mark.unit
+
+
+def _surface(n_elements: int = 200, n_timesteps: int = 64, *, stats: bool = False):
+    rng = np.random.default_rng(0)
+    t = np.linspace(0.0, 8.0 * np.pi, n_timesteps)
+    # Smooth, correlated signal with a little noise: what a Cp history looks like.
+    cp = np.sin(t)[None, :] * rng.random((n_elements, 1)) + 0.01 * rng.random(
+        (n_elements, n_timesteps)
+    )
+    fields = {"cp/mean": cp.mean(axis=1)} if stats else {"cp": cp}
+    return SurfaceDataSource(
+        time=TimeAxis(
+            initial_time=0.0,
+            timestep_size=0.0 if stats else 0.1,
+            n_timesteps=0 if stats else n_timesteps,
+        ),
+        topology=Topology.triangles(
+            np.arange(n_elements * 3, dtype=np.int32).reshape(n_elements, 3),
+            rng.random((n_elements * 3, 3)),
+        ),
+        elements=ElementMeta(),
+        fields=MemoryFieldStore(fields),
+    )
+
+
+@pytest.mark.parametrize("codec", ["lzf", "gzip-1", "gzip", "shuffle+gzip-9"])
+@pytest.mark.parametrize("layout", ["per_step", "columnar"])
+def test_compressed_round_trip_is_exact(tmp_path, codec, layout):
+    ds = _surface()
+    storage = XdmfH5Storage(tmp_path, codec=codec, layout=layout)
+    storage.write_data_source("cp", ds)
+    back = storage.read_data_source("cp").fields
+    np.testing.assert_array_equal(back.read("cp"), ds.fields.read("cp"))
+    np.testing.assert_array_equal(
+        back.read("cp", elements=np.array([5, 1])), ds.fields.read("cp")[[5, 1]]
+    )
+    meta = read_timeseries_meta(storage.h5_path("cp"))
+    assert meta["codec"] == codec and meta["storage_dtype"] == "float64"
+
+
+def test_float32_storage_reads_back_as_float32(tmp_path):
+    ds = _surface()
+    storage = XdmfH5Storage(tmp_path, storage_dtype="float32")
+    storage.write_data_source("cp", ds)
+    back = storage.read_data_source("cp").fields
+    assert back.dtype("cp") == np.float32
+    np.testing.assert_array_equal(back.read("cp"), ds.fields.read("cp").astype(np.float32))
+    assert read_timeseries_meta(storage.h5_path("cp"))["storage_dtype"] == "float32"
+
+    root = ET.parse(storage.xdmf_path("cp")).getroot()
+    attr = root.find(".//Attribute[@Name='cp']/DataItem")
+    assert attr.get("Precision") == "4"
+    geom = root.find(".//Geometry/DataItem")
+    assert geom.get("Precision") == "8"
+
+
+def test_float32_columnar_xdmf_states_precision(tmp_path):
+    storage = XdmfH5Storage(tmp_path, layout="columnar", storage_dtype="float32")
+    storage.write_data_source("cp", _surface())
+    root = ET.parse(storage.xdmf_path("cp")).getroot()
+    source = root.findall(".//Attribute[@Name='cp']/DataItem/DataItem")[1]
+    assert source.get("Precision") == "4"
+
+
+def test_stats_are_compressed_but_stay_float64(tmp_path):
+    ds = _surface(stats=True)
+    storage = XdmfH5Storage(tmp_path, codec="shuffle+gzip", storage_dtype="float32")
+    storage.write_data_source("stats", ds)
+    with h5py.File(storage.h5_path("stats"), "r") as f:
+        dset = f["cp/mean"]
+        assert dset.compression == "gzip" and dset.shuffle
+        assert dset.dtype == np.float64
+        assert f["meta"].attrs["codec"] == "shuffle+gzip"
+        assert "storage_dtype" not in f["meta"].attrs
+    back = storage.read_data_source("stats").fields
+    np.testing.assert_array_equal(back.read("cp/mean"), ds.fields.read("cp/mean"))
+
+
+def test_presets_shrink_histories(tmp_path):
+    ds = _surface(n_elements=500, n_timesteps=256)
+    sizes = {}
+    for name, kwargs in {
+        "default": {},
+        "float32": {"storage_dtype": "float32"},
+        "packed": {"codec": "shuffle+gzip", "storage_dtype": "float32", "layout": "columnar"},
+    }.items():
+        storage = XdmfH5Storage(tmp_path / name, write_xdmf=False, **kwargs)
+        storage.write_data_source("cp", ds)
+        sizes[name] = storage.h5_path("cp").stat().st_size
+    assert sizes["float32"] < 0.6 * sizes["default"]
+    assert sizes["packed"] < 0.5 * sizes["default"]
+
+
+def test_default_writes_no_encoding_attributes(tmp_path):
+    storage = XdmfH5Storage(tmp_path)
+    storage.write_data_source("cp", _surface())
+    with h5py.File(storage.h5_path("cp"), "r") as f:
+        assert dict(f["meta"].attrs) == {}
+        assert f["cp/t0.0"].chunks is None
+    meta = read_timeseries_meta(storage.h5_path("cp"))
+    assert meta["codec"] == "none" and meta["storage_dtype"] == "float64"
+
+
+def test_codec_options():
+    assert codec_options("none") == {}
+    assert codec_options("LZF") == {"compression": "lzf"}
+    assert codec_options("gzip") == {"compression": "gzip", "compression_opts": 4}
+    assert codec_options("shuffle+gzip-7") == {
+        "compression": "gzip",
+        "compression_opts": 7,
+        "shuffle": True,
+    }
+
+
+@pytest.mark.parametrize(
+    "kwargs, match",
+    [
+        ({"codec": "zstd"}, "codec"),
+        ({"codec": "gzip-10"}, "codec"),
+        ({"storage_dtype": "float16"}, "storage dtype"),
+        ({"codec": "lzf", "layout": "columnar", "chunks": "contiguous"}, "chunked"),
+    ],
+)
+def test_invalid_encoding_rejected(tmp_path, kwargs, match):
+    with pytest.raises(ValueError, match=match):
+        XdmfH5Storage(tmp_path, **kwargs)
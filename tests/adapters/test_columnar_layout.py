@@ -0,0 +1,155 @@
+"""Columnar H5 layout: one chunked ``(n_elements, n_timesteps)`` dataset per field.
+
+The per-step layout stores one dataset per timestep, so a long record is tens
+of thousands of tiny datasets and any read opens every one of them. The
+columnar layout must read back exactly what the per-step layout does, be
+detected on read without being told, and keep the XDMF openable by pointing
+each timestep at a hyperslab of the 2-D dataset.
+"""
+
+from __future__ import annotations
+
+import xml.etree.ElementTree as ET
+
+import h5py
+import numpy as np
+import pytest
+
+from cfdmod.adapters import XdmfH5Storage
+from cfdmod.adapters.memory import MemoryFieldStore
+from cfdmod.core import SurfaceDataSource, TimeAxis
+from cfdmod.core.topology import ElementMeta, Topology
+from cfdmod.io.xdmf import columnar_chunks, get_pressure_keys, read_step
+
+pytestmark = pytest.mark.unit
+
+
+def _surface(n_elements: int = 7, n_timesteps: int = 11) -> SurfaceDataSource:
+    rng = np.random.default_rng(0)
+    vertices = rng.random((n_elements * 3, 3))
+    triangles = np.arange(n_elements * 3, dtype=np.int32).reshape(n_elements, 3)
+    return SurfaceDataSource(
+        time=TimeAxis(initial_time=0.0, timestep_size=0.5, n_timesteps=n_timesteps),
+        topology=Topology.triangles(triangles, vertices),
+        elements=ElementMeta(),
+        fields=MemoryFieldStore(
+            {
+                "cf_x": rng.random((n_elements, n_timesteps)),
+                "cf_y": rng.random((n_elements, n_timesteps)),
+            }
+        ),
+    )
+
+
+@pytest.fixture()
+def columnar(tmp_path):
+    ds = _surface()
+    storage = XdmfH5Storage(tmp_path, layout="columnar", chunks=(3, 4))
+    storage.write_data_source("cf", ds)
+    return storage, ds
+
+
+def test_columnar_file_has_one_dataset_per_field(columnar):
+    storage, ds = columnar
+    with h5py.File(storage.h5_path("cf"), "r") as f:
+        assert isinstance(f["cf_x"], h5py.Dataset)
+        assert f["cf_x"].shape == (7, 11)
+        assert f["cf_x"].chunks == (3, 4)
+        assert f["meta"].attrs["layout"] == "columnar"
+        keys = [k.decode() for k in f["meta/time_keys"][:]]
+    assert keys == [f"t{t}" for t in ds.time.times()]
+
+
+def test_columnar_round_trip_is_detected_without_being_told(columnar, tmp_path):
+    storage, ds = columnar
+    # A default (per-step) storage over the same root must still read it.
+    back = XdmfH5Storage(tmp_path).read_data_source("cf")
+    assert back.fields.layout == "columnar"
+    assert back.time.n_timesteps == 11
+    for name in ("cf_x", "cf_y"):
+        np.testing.assert_array_equal(back.fields.read(name), ds.fields.read(name))
+        assert back.fields.shape(name) == (7, 11)
+        assert back.fields.dtype(name) == np.float64
+
+
+_SLABS = [
+    {"time_slice": slice(2, 9)},
+    {"time_slice": slice(1, 10, 3)},
+    {"time_slice": slice(None, None, -2)},
+    {"element_slice": slice(1, 6)},
+    {"element_slice": slice(5, 0, -2), "time_slice": slice(3, 4)},
+    {"elements": np.array([6, 0, 3, 3, -1])},
+    {"elements": np.array([], dtype=np.int64), "time_slice": slice(0, 5)},
+]
+
+
+@pytest.mark.parametrize("kwargs", _SLABS)
+def test_columnar_slab_reads_match_memory_store(columnar, kwargs):
+    storage, ds = columnar
+    back = storage.read_data_source("cf")
+    expected = ds.fields.read("cf_x", **kwargs)
+    got = back.fields.read("cf_x", **kwargs)
+    assert got.shape == expected.shape
+    np.testing.assert_array_equal(got, expected)
+
+
+@pytest.mark.parametrize("kwargs", _SLABS)
+def test_per_step_slab_reads_match_memory_store(tmp_path, kwargs):
+    ds = _surface()
+    storage = XdmfH5Storage(tmp_path)
+    storage.write_data_source("cf", ds)
+    back = storage.read_data_source("cf")
+    expected = ds.fields.read("cf_x", **kwargs)
+    got = back.fields.read("cf_x", **kwargs)
+    assert got.shape == expected.shape
+    np.testing.assert_array_equal(got, expected)
+
+
+def test_columnar_matches_per_step_layout(tmp_path):
+    ds = _surface()
+    per_step = XdmfH5Storage(tmp_path / "a")
+    per_step.write_data_source("cf", ds)
+    col = XdmfH5Storage(tmp_path / "b", layout="columnar")
+    col.write_data_source("cf", ds)
+    a = per_step.read_data_source("cf")
+    b = col.read_data_source("cf")
+    assert a.time == b.time
+    np.testing.assert_array_equal(a.fields.read("cf_y"), b.fields.read("cf_y"))
+
+
+def test_columnar_xdmf_references_hyperslabs(columnar):
+    storage, _ = columnar
+    root = ET.parse(storage.xdmf_path("cf")).getroot()
+    grids = root.findall(".//Grid[@GridType='Uniform']")
+    assert len(grids) == 11
+    slab = grids[4].find("Attribute[@Name='cf_y']/DataItem")
+    assert slab.get("ItemType") == "HyperSlab"
+    assert slab.get("Dimensions") == "7 1"
+    selection, source = slab.findall("DataItem")
+    assert selection.text.split() == ["0", "4", "1", "1", "7", "1"]
+    assert source.text == "cf.h5:/cf_y"
+    assert source.get("Dimensions") == "7 11"
+
+
+def test_io_helpers_understand_columnar_groups(columnar):
+    storage, ds = columnar
+    path = storage.h5_path("cf")
+    keys = get_pressure_keys(path, group="cf_x")
+    assert [k for _, k in keys] == [f"t{t}" for t in ds.time.times()]
+    np.testing.assert_array_equal(
+        read_step(path, keys[3][1], group="cf_x"), ds.fields.read("cf_x")[:, 3]
+    )
+
+
+def test_default_chunks_are_bounded_and_fit_the_dataset():
+    assert columnar_chunks(0, 10) is None
+    assert columnar_chunks(5, 3) == (5, 3)
+    e, t = columnar_chunks(2_000_000, 50_000)
+    assert t <= 50_000 and e * t * 8 <= 1 << 20
+
+
+def test_invalid_layout_and_chunks_rejected(tmp_path):
+    with pytest.raises(ValueError, match="layout"):
+        XdmfH5Storage(tmp_path, layout="rows")
+    with pytest.raises(ValueError, match="chunks"):
+        XdmfH5Storage(tmp_path, layout="columnar", chunks=(0, 4))
@@ -0,0 +1,162 @@
+"""``/meta/index``: open a written file without walking its timesteps.
+
+Files written by ``XdmfH5Storage`` record their field datasets and time keys
+once, so ``read_data_source`` and ``get_pressure_keys`` never list a per-step
+group or parse its ``t{T}`` names. The index is a cache: a file without one,
+or one changed after it was written, must still read exactly as before.
+"""
+
+from __future__ import annotations
+
+import h5py
+import numpy as np
+import pytest
+
+import cfdmod.adapters.xdmf_h5.storage as _storage
+from cfdmod.adapters import XdmfH5Storage
+from cfdmod.adapters.memory import MemoryFieldStore
+from cfdmod.core import ElementMeta, SurfaceDataSource, TimeAxis, Topology
+from cfdmod.core.chunked import slice_time
+from cfdmod.io.xdmf import (
+    get_pressure_keys,
+    read_index,
+    write_stats_field,
+    write_timeseries_step,
+)
+
+pytestmark = pytest.mark.unit
+
+
+def _surface(fields: dict[str, np.ndarray], time: TimeAxis) -> SurfaceDataSource:
+    n_elements = next(iter(fields.values())).shape[0]
+    return SurfaceDataSource(
+        time=time,
+        topology=Topology.triangles(
+            np.arange(n_elements * 3, dtype=np.int32).reshape(n_elements, 3),
+            np.random.default_rng(0).random((n_elements * 3, 3)),
+        ),
+        elements=ElementMeta(),
+        fields=MemoryFieldStore(fields),
+    )
+
+
+def _timeseries(n_elements: int = 8, n_timesteps: int = 12) -> SurfaceDataSource:
+    rng = np.random.default_rng(1)
+    return _surface(
+        {
+            "cf_x": rng.random((n_elements, n_timesteps)),
+            "cf_y": rng.random((n_elements, n_timesteps)),
+        },
+        TimeAxis(initial_time=0.5, timestep_size=0.25, n_timesteps=n_timesteps),
+    )
+
+
+def _stats() -> SurfaceDataSource:
+    rng = np.random.default_rng(2)
+    return _surface(
+        {"cp/mean": rng.random(8), "cp/rms": rng.random(8)},
+        TimeAxis(initial_time=0.0, timestep_size=0.0, n_timesteps=0),
+    )
+
+
+@pytest.fixture()
+def no_scan(monkeypatch):
+    def fail(f, h5_path):
+        raise AssertionError(f"{h5_path} was walked instead of read from its index")
+
+    monkeypatch.setattr(_storage, "_scan_fields", fail)
+
+
+@pytest.mark.parametrize("layout", ["per_step", "columnar"])
+def test_indexed_timeseries_opens_without_walking(tmp_path, layout, no_scan):
+    ds = _timeseries()
+    storage = XdmfH5Storage(tmp_path, layout=layout)
+    storage.write_data_source("cf", ds)
+
+    with h5py.File(storage.h5_path("cf"), "r") as f:
+        index = read_index(f)
+    assert index["layout"] == layout
+    assert index["fields"] == {"cf_x": "cf_x", "cf_y": "cf_y"}
+    assert (index["n_elements"], index["n_timesteps"]) == (8, 12)
+
+    back = storage.read_data_source("cf")
+    np.testing.assert_array_equal(back.time.times(), ds.time.times())
+    for name in ("cf_x", "cf_y"):
+        np.testing.assert_array_equal(back.fields.read(name), ds.fields.read(name))
+        np.testing.assert_array_equal(
+            back.fields.read(name, time_slice=slice(3, 7)), ds.fields.read(name)[:, 3:7]
+        )
+    assert [k for _, k in get_pressure_keys(storage.h5_path("cf"), "cf_x")] == [
+        f"t{t}" for t in ds.time.times()
+    ]
+
+
+def test_indexed_stats_open_without_walking(tmp_path, no_scan):
+    storage = XdmfH5Storage(tmp_path)
+    ds = _stats()
+    storage.write_data_source("stats", ds)
+    back = storage.read_data_source("stats")
+    assert back.time.is_time_aggregated
+    assert sorted(back.fields.keys()) == ["cp/mean", "cp/rms"]
+    np.testing.assert_array_equal(back.fields.read("cp/rms"), ds.fields.read("cp/rms"))
+
+
+def test_streamed_output_is_indexed(tmp_path, no_scan):
+    ds = _timeseries()
+    storage = XdmfH5Storage(tmp_path)
+    writer = storage.open_writer("cf", ds)
+    writer.append(slice_time(ds, slice(0, 5)))
+    writer.append(slice_time(ds, slice(5, 12)))
+    writer.commit()
+    np.testing.assert_array_equal(
+        storage.read_data_source("cf").fields.read("cf_y"), ds.fields.read("cf_y")
+    )
+
+
+def test_index_matches_a_walk_of_the_same_file(tmp_path):
+    storage = XdmfH5Storage(tmp_path)
+    storage.write_data_source("cf", _timeseries())
+    path = storage.h5_path("cf")
+    with h5py.File(path, "r") as f:
+        index = read_index(f)
+        walked = _storage._scan_fields(f, path)
+    assert walked == (index["fields"], index["time_keys"], False, "per_step")
+
+
+def test_a_file_changed_after_writing_falls_back_to_walking(tmp_path):
+    storage = XdmfH5Storage(tmp_path)
+    storage.write_data_source("cf", _timeseries())
+    path = storage.h5_path("cf")
+
+    # A legacy helper appending a timestep leaves the index behind.
+    write_timeseries_step(path, "cf_x", "t99.0", np.zeros(8))
+    with h5py.File(path, "r") as f:
+        assert read_index(f) is None
+    assert get_pressure_keys(path, "cf_x")[-1] == (99.0, "t99.0")
+
+    # So does a new field group.
+    storage.write_data_source("cp", _timeseries())
+    write_timeseries_step(storage.h5_path("cp"), "extra", "t0.5", np.ones(8))
+    assert "extra" in storage.read_data_source("cp").fields.keys()
+
+    # And so does a stat added to an indexed stats group.
+    storage.write_data_source("stats", _stats())
+    write_stats_field(storage.h5_path("stats"), "cp", "peak", np.full(8, 3.0))
+    with h5py.File(storage.h5_path("stats"), "r") as f:
+        assert read_index(f) is None
+    back = storage.read_data_source("stats")
+    assert sorted(back.fields.keys()) == ["cp/mean", "cp/peak", "cp/rms"]
+    np.testing.assert_array_equal(back.fields.read("cp/peak"), np.full(8, 3.0))
+
+
+def test_a_file_without_an_index_reads_as_before(tmp_path):
+    ds = _timeseries()
+    storage = XdmfH5Storage(tmp_path)
+    storage.write_data_source("cf", ds)
+    with h5py.File(storage.h5_path("cf"), "a") as f:
+        del f["meta/index"]
+        del f["meta/time_keys"]
+        assert read_index(f) is None
+    back = storage.read_data_source("cf")
+    np.testing.assert_array_equal(back.time.times(), ds.time.times())
+    np.testing.assert_array_equal(back.fields.read("cf_x"), ds.fields.read("cf_x"))
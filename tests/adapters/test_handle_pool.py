@@ -0,0 +1,183 @@
+"""Opt-in pool of read-only h5 handles (``XdmfH5Storage.session``).
+
+Without a session every ``H5FieldStore`` call opens and closes the file, so a
+chunked run pays one open per field per window. Inside a session the count must
+not depend on the number of reads, the cap must bound what stays open, a write
+must never be blocked or served stale by a cached handle, and a forked worker
+must not reuse its parent's handles.
+
+Like ``test_h5_open_count``, these count opens rather than time them.
+"""
+
+from __future__ import annotations
+
+import multiprocessing
+import sys
+import threading
+
+import h5py
+import numpy as np
+import pytest
+
+from cfdmod.adapters import XdmfH5Storage
+from cfdmod.adapters.memory import MemoryFieldStore
+from cfdmod.adapters.xdmf_h5 import H5HandlePool, handle_pool
+from cfdmod.adapters.xdmf_h5.handle_pool import active_pool
+from cfdmod.core import SurfaceDataSource, TimeAxis
+from cfdmod.core.chunked import slice_time, time_windows
+from cfdmod.core.topology import ElementMeta, Topology
+
+pytestmark = pytest.mark.unit
+
+
+@pytest.fixture()
+def count_h5_opens(monkeypatch):
+    opens: list[str] = []
+    real_file = h5py.File
+
+    def counting_file(path, *args, **kwargs):
+        opens.append(str(path))
+        return real_file(path, *args, **kwargs)
+
+    monkeypatch.setattr(h5py, "File", counting_file)
+    return opens
+
+
+def _surface(n_timesteps: int = 40, offset: float = 0.0) -> SurfaceDataSource:
+    vertices = np.random.default_rng(0).random((12, 3))
+    triangles = np.arange(12, dtype=np.int32).reshape(4, 3)
+    cp = np.arange(4 * n_timesteps, dtype=np.float64).reshape(4, n_timesteps) + offset
+    return SurfaceDataSource(
+        time=TimeAxis(initial_time=0.0, timestep_size=0.1, n_timesteps=n_timesteps),
+        topology=Topology.triangles(triangles, vertices),
+        elements=ElementMeta(),
+        fields=MemoryFieldStore({"cp": cp, "cq": -cp}),
+    )
+
+
+@pytest.fixture()
+def storage(tmp_path):
+    st = XdmfH5Storage(tmp_path, write_xdmf=False)
+    st.write_data_source("a", _surface())
+    st.write_data_source("b", _surface(offset=100.0))
+    return st
+
+
+def test_windowed_reads_open_each_file_once_in_a_session(storage, count_h5_opens):
+    with storage.session():
+        ds = storage.read_data_source("a")
+        for sl in time_windows(ds.time.n_timesteps, 7):
+            slice_time(ds, sl)
+        assert len(count_h5_opens) == 1
+    assert active_pool() is None
+
+
+def test_without_a_session_every_read_reopens(storage, count_h5_opens):
+    ds = storage.read_data_source("a")
+    count_h5_opens.clear()
+    for sl in time_windows(ds.time.n_timesteps, 10):
+        slice_time(ds, sl)
+    # Two fields x four windows.
+    assert len(count_h5_opens) == 8
+
+
+def test_session_reads_match_unpooled_reads(storage):
+    expected = storage.read_data_source("b").fields.read("cp", time_slice=slice(5, 9))
+    with storage.session():
+        got = storage.read_data_source("b").fields.read("cp", time_slice=slice(5, 9))
+    np.testing.assert_array_equal(got, expected)
+
+
+def test_cap_closes_least_recently_used(storage):
+    with storage.session(max_open=1) as pool:
+        a = storage.read_data_source("a")
+        b = storage.read_data_source("b")
+        assert storage.h5_path("b") in pool and storage.h5_path("a") not in pool
+        a.fields.read("cp")
+        assert len(pool) == 1 and storage.h5_path("a") in pool
+        np.testing.assert_array_equal(b.fields.read("cp")[:, 0], [100.0, 140.0, 180.0, 220.0])
+
+
+def test_leased_handle_is_not_closed_under_its_reader(storage):
+    pool = H5HandlePool(max_open=1)
+    with pool.lease(storage.h5_path("a")) as fa:
+        with pool.lease(storage.h5_path("b")):
+            pass
+        # "a" was over the cap but mid-read, so it must still be usable.
+        assert fa.id.valid
+        assert "cp" in fa
+    pool.close()
+    assert len(pool) == 0
+
+
+def test_write_inside_session_evicts_and_is_visible(storage):
+    with storage.session() as pool:
+        before = storage.read_data_source("a").fields.read("cp")
+        storage.write_data_source("a", _surface(offset=1000.0))
+        after = storage.read_data_source("a").fields.read("cp")
+        storage.write_signature("a", "sig")
+        assert storage.read_signature("a") == "sig"
+        assert len(pool) == 1
+    np.testing.assert_array_equal(after, before + 1000.0)
+
+
+def test_sessions_nest_and_only_the_outermost_closes(storage):
+    with storage.session() as outer:
+        storage.read_data_source("a")
+        with handle_pool() as inner:
+            assert inner is outer
+        assert active_pool() is outer and len(outer) == 1
+    assert len(outer) == 0
+
+
+def _read_first_column(path: str) -> list[float]:
+    from cfdmod.adapters.xdmf_h5.handle_pool import open_for_read
+
+    with open_for_read(path) as f:
+        return [float(v) for v in f["cp"]["t0.0"][:]]
+
+
+@pytest.mark.skipif(
+    sys.platform != "linux", reason="fork start method is only the default-safe choice on Linux"
+)
+def test_forked_workers_reopen_instead_of_inheriting(storage):
+    path = str(storage.h5_path("a"))
+    with storage.session() as pool:
+        expected = _read_first_column(path)
+        assert len(pool) == 1
+        ctx = multiprocessing.get_context("fork")
+        with ctx.Pool(2) as workers:
+            results = workers.map(_read_first_column, [path] * 4)
+    assert results == [expected] * 4
+
+
+@pytest.mark.skipif(
+    sys.platform != "linux", reason="fork start method is only the default-safe choice on Linux"
+)
+def test_a_fork_while_another_thread_holds_the_pool_lock_does_not_deadlock(storage):
+    path = str(storage.h5_path("a"))
+    with storage.session() as pool:
+        expected = _read_first_column(path)
+        held, release = threading.Event(), threading.Event()
+
+        def hold_lock():
+            with pool._lock:
+                held.set()
+                release.wait()
+
+        holder = threading.Thread(target=hold_lock)
+        holder.start()
+        held.wait()
+        try:
+            ctx = multiprocessing.get_context("fork")
+            with ctx.Pool(1) as workers:
+                results = workers.map_async(_read_first_column, [path] * 2).get(timeout=30)
+        finally:
+            release.set()
+            holder.join()
+    assert results == [expected] * 2
+
+
+def test_invalid_cap_rejected():
+    with pytest.raises(ValueError, match="max_open"):
+        H5HandlePool(max_open=0)
@@ -0,0 +1,161 @@
+"""Memory-mapped reads (``XdmfH5Storage(mmap=True)`` / ``MemmapFieldStore``).
+
+A mapped read must return exactly what ``H5FieldStore`` returns, as a
+read-only view of the file rather than a private copy. Datasets that cannot
+be mapped (chunked, compressed) must silently take the h5py path, and the
+store must survive the trips a fan-out puts it through: overlays, pickling
+to a worker.
+"""
+
+from __future__ import annotations
+
+import pickle
+
+import numpy as np
+import pytest
+
+from cfdmod.adapters import XdmfH5Storage
+from cfdmod.adapters.memory import MemoryFieldStore
+from cfdmod.adapters.xdmf_h5 import H5FieldStore, MemmapFieldStore
+from cfdmod.core import SurfaceDataSource, TimeAxis
+from cfdmod.core.topology import ElementMeta, Topology
+from cfdmod.io.xdmf import write_timeseries_geometry, write_timeseries_meta, write_timeseries_step
+
+pytestmark = pytest.mark.unit
+
+_SLABS = [
+    {},
+    {"time_slice": slice(2, 9)},
+    {"time_slice": slice(None, None, -2)},
+    {"element_slice": slice(5, 0, -2), "time_slice": slice(3, 4)},
+    {"elements": np.array([6, 0, 3, 3, -1])},
+    {"elements": np.array([], dtype=np.int64), "time_slice": slice(0, 5)},
+    {"time_slice": slice(4, 4)},
+]
+
+
+def _surface(n_elements: int = 7, n_timesteps: int = 11, *, time_aggregated=False):
+    rng = np.random.default_rng(0)
+    shape = (n_elements,) if time_aggregated else (n_elements, n_timesteps)
+    return SurfaceDataSource(
+        time=TimeAxis(
+            initial_time=0.0,
+            timestep_size=0.0 if time_aggregated else 0.5,
+            n_timesteps=0 if time_aggregated else n_timesteps,
+        ),
+        topology=Topology.triangles(
+            np.arange(n_elements * 3, dtype=np.int32).reshape(n_elements, 3),
+            rng.random((n_elements * 3, 3)),
+        ),
+        elements=ElementMeta(),
+        fields=MemoryFieldStore({"cp/mean" if time_aggregated else "cp": rng.random(shape)}),
+    )
+
+
+def _pair(tmp_path, **storage_kwargs):
+    """The same file read plainly and memory-mapped."""
+    ds = _surface()
+    XdmfH5Storage(tmp_path, write_xdmf=False, **storage_kwargs).write_data_source("s", ds)
+    plain = XdmfH5Storage(tmp_path).read_data_source("s").fields
+    mapped = XdmfH5Storage(tmp_path, mmap=True).read_data_source("s").fields
+    return plain, mapped
+
+
+@pytest.mark.parametrize(
+    "storage_kwargs",
+    [{}, {"layout": "columnar", "chunks": "contiguous"}],
+    ids=["per_step", "columnar_contiguous"],
+)
+@pytest.mark.parametrize("kwargs", _SLABS)
+def test_mapped_reads_match_h5_reads(tmp_path, storage_kwargs, kwargs):
+    plain, mapped = _pair(tmp_path, **storage_kwargs)
+    assert isinstance(mapped, MemmapFieldStore) and mapped.is_mapped("cp")
+    expected = plain.read("cp", **kwargs)
+    got = mapped.read("cp", **kwargs)
+    assert got.shape == expected.shape
+    np.testing.assert_array_equal(got, expected)
+
+
+@pytest.mark.parametrize(
+    "storage_kwargs",
+    [{}, {"layout": "columnar", "chunks": "contiguous"}],
+    ids=["per_step", "columnar_contiguous"],
+)
+def test_mapped_read_is_a_read_only_view_of_the_file(tmp_path, storage_kwargs):
+    _, mapped = _pair(tmp_path, **storage_kwargs)
+    a = mapped.read("cp")
+    b = mapped.read("cp", time_slice=slice(3, 8))
+    assert np.shares_memory(a, b)
+    assert not a.flags.writeable
+    with pytest.raises(ValueError, match="read-only"):
+        a[0, 0] = 1.0
+
+
+def test_chunked_datasets_fall_back_to_h5py(tmp_path):
+    plain, mapped = _pair(tmp_path, layout="columnar", chunks=(3, 4))
+    assert not mapped.is_mapped("cp")
+    np.testing.assert_array_equal(
+        mapped.read("cp", time_slice=slice(1, 6)), plain.read("cp")[:, 1:6]
+    )
+
+
+def test_interleaved_timesteps_are_gathered_per_column(tmp_path):
+    # Alternating fields per timestep leaves each field's datasets unevenly
+    # spaced, so no single strided view covers them.
+    path = tmp_path / "s.h5"
+    write_timeseries_geometry(path, np.zeros((4, 3), dtype=np.int32), np.zeros((3, 3)))
+    times = np.arange(5, dtype=np.float64)
+    values = np.random.default_rng(1).random((4, 5))
+    for i, t in enumerate(times):
+        write_timeseries_step(path, "cp", f"t{t}", values[:, i])
+        write_timeseries_step(path, "cq", f"t{t}", np.zeros(4 + i % 2))
+    write_timeseries_meta(path, time_steps=times, time_normalized=times)
+    store = MemmapFieldStore(
+        H5FieldStore(path, {"cp": "cp"}, time_keys=[f"t{t}" for t in times], n_elements=4)
+    )
+    assert store.is_mapped("cp")
+    np.testing.assert_array_equal(store.read("cp"), values)
+    np.testing.assert_array_equal(store.read("cp", elements=np.array([3, 1])), values[[3, 1]])
+
+
+def test_time_aggregated_fields_map(tmp_path):
+    ds = _surface(time_aggregated=True)
+    storage = XdmfH5Storage(tmp_path, mmap=True)
+    storage.write_data_source("stats", ds)
+    fields = storage.read_data_source("stats").fields
+    assert fields.is_mapped("cp/mean")
+    np.testing.assert_array_equal(fields.read("cp/mean"), ds.fields.read("cp/mean"))
+
+
+def test_overlay_fields_are_served_from_the_overlay(tmp_path):
+    _, mapped = _pair(tmp_path)
+    updated = mapped.with_field("cp", np.ones((7, 11)))
+    assert isinstance(updated, MemmapFieldStore) and not updated.is_mapped("cp")
+    np.testing.assert_array_equal(updated.read("cp", time_slice=slice(0, 2)), np.ones((7, 2)))
+    assert mapped.read("cp")[0, 0] != 1.0
+
+
+def test_pickling_sends_the_path_not_the_data(tmp_path):
+    plain, mapped = _pair(tmp_path)
+    mapped.read("cp")
+    payload = pickle.dumps(mapped)
+    assert len(payload) < 7 * 11 * 8
+    clone = pickle.loads(payload)
+    assert clone.is_mapped("cp")
+    np.testing.assert_array_equal(clone.read("cp"), plain.read("cp"))
+
+
+def test_rewriting_the_source_does_not_disturb_a_live_map(tmp_path):
+    storage = XdmfH5Storage(tmp_path, write_xdmf=False, mmap=True)
+    storage.write_data_source("s", _surface())
+    before = storage.read_data_source("s").fields.read("cp").copy()
+    live = storage.read_data_source("s").fields
+    live.read("cp")
+    storage.write_data_source("s", _surface(n_elements=3))
+    np.testing.assert_array_equal(live.read("cp"), before)
+    assert storage.read_data_source("s").fields.read("cp").shape == (3, 11)
+
+
+def test_invalid_chunks_string_rejected(tmp_path):
+    with pytest.raises(ValueError, match="contiguous"):
+        XdmfH5Storage(tmp_path, chunks="auto")
@@ -0,0 +1,65 @@
+"""Opt-in benchmark: opening an indexed per-step file is independent of its length.
+
+Runs with ``pytest -m perf``. A long, narrow per-step record (many ``t{T}``
+datasets, few elements) is the worst case for the walk that
+``read_data_source`` falls back to without ``/meta/index``: it visits every
+dataset and parses every name before any data is wanted. With the index the
+open reads a handful of small datasets instead.
+"""
+
+from __future__ import annotations
+
+import time
+
+import h5py
+import numpy as np
+import pytest
+
+from cfdmod.adapters import XdmfH5Storage
+from cfdmod.adapters.memory import MemoryFieldStore
+from cfdmod.core import ElementMeta, SurfaceDataSource, TimeAxis, Topology
+from cfdmod.io.xdmf import get_pressure_keys
+
+pytestmark = [pytest.mark.perf, pytest.mark.integration]
+
+N_ELEMENTS = 16
+N_TIMESTEPS = 20_000
+
+
+def _best_of(fn, repeats: int = 3) -> float:
+    best = float("inf")
+    for _ in range(repeats):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def test_indexed_open_beats_the_walk(tmp_path):
+    ds = SurfaceDataSource(
+        time=TimeAxis(initial_time=0.0, timestep_size=0.01, n_timesteps=N_TIMESTEPS),
+        topology=Topology.triangles(np.zeros((N_ELEMENTS, 3), dtype=np.int32), np.zeros((1, 3))),
+        elements=ElementMeta(),
+        fields=MemoryFieldStore(
+            {"cp": np.random.default_rng(0).random((N_ELEMENTS, N_TIMESTEPS))}
+        ),
+    )
+    indexed = XdmfH5Storage(tmp_path / "indexed", write_xdmf=False)
+    walked = XdmfH5Storage(tmp_path / "walked", write_xdmf=False)
+    for storage in (indexed, walked):
+        storage.write_data_source("cp", ds)
+    with h5py.File(walked.h5_path("cp"), "a") as f:
+        del f["meta/index"]
+
+    fast = _best_of(lambda: indexed.read_data_source("cp"))
+    slow = _best_of(lambda: walked.read_data_source("cp"))
+    fast_keys = _best_of(lambda: get_pressure_keys(indexed.h5_path("cp"), "cp"))
+    slow_keys = _best_of(lambda: get_pressure_keys(walked.h5_path("cp"), "cp"))
+    print(
+        f"\nread_data_source: indexed {fast * 1e3:.0f} ms, walked {slow * 1e3:.0f} ms"
+        f"\nget_pressure_keys: indexed {fast_keys * 1e3:.0f} ms, walked {slow_keys * 1e3:.0f} ms"
+    )
+    assert fast < slow / 10
+    # Listing names is cheap next to visiting datasets; both are linear in the
+    # keys they return, so the index only has to not lose here.
+    assert fast_keys < slow_keys
@@ -0,0 +1,102 @@
+"""Opt-in benchmark: element-subset reads scale with the subset, not the mesh.
+
+Runs with ``pytest -m perf``. It writes the same per-step timeseries at two
+mesh sizes and reads a 32-element probe subset from each through
+``H5FieldStore``, counting the bytes the process pulls from disk
+(``rchar`` in ``/proc/self/io``, which counts every ``read``/``pread``
+syscall including page-cache hits). With the selection pushed down to
+h5py, the subset read must:
+
+- cost about the same on a mesh four times larger, and
+- stay within one data-sieve buffer per probe run per timestep, a small
+  fraction of what a full read of the same timesteps costs.
+
+Before the pushdown every timestep column was read whole and sliced in RAM,
+so the subset read cost exactly as much as the full read.
+"""
+
+from __future__ import annotations
+
+import pathlib
+
+import numpy as np
+import pytest
+
+from cfdmod.adapters import XdmfH5Storage
+from cfdmod.adapters.memory import MemoryFieldStore
+from cfdmod.core import SurfaceDataSource, TimeAxis
+from cfdmod.core.topology import ElementMeta, Topology
+
+pytestmark = [
+    pytest.mark.perf,
+    pytest.mark.integration,
+    pytest.mark.skipif(
+        not pathlib.Path("/proc/self/io").exists(), reason="needs Linux /proc/self/io"
+    ),
+]
+
+N_TIMESTEPS = 40
+SMALL, LARGE = 100_000, 400_000
+# Four contiguous runs of eight probes, spread across the mesh.
+PROBE_FRACTIONS = (0.1, 0.35, 0.6, 0.85)
+# HDF5's default data-sieve buffer (H5Pset_sieve_buf_size).
+SIEVE_BYTES = 64 * 1024
+
+
+def _rchar() -> int:
+    for line in pathlib.Path("/proc/self/io").read_text().splitlines():
+        if line.startswith("rchar:"):
+            return int(line.split()[1])
+    raise RuntimeError("rchar missing from /proc/self/io")
+
+
+def _write(root: pathlib.Path, n_elements: int) -> XdmfH5Storage:
+    # The field store never looks at coordinates; a degenerate mesh keeps the
+    # fixture cheap to build.
+    triangles = np.zeros((n_elements, 3), dtype=np.int32)
+    ds = SurfaceDataSource(
+        time=TimeAxis(initial_time=0.0, timestep_size=0.1, n_timesteps=N_TIMESTEPS),
+        topology=Topology.triangles(triangles, np.zeros((1, 3))),
+        elements=ElementMeta(),
+        fields=MemoryFieldStore(
+            {"cp": np.random.default_rng(0).random((n_elements, N_TIMESTEPS))}
+        ),
+    )
+    storage = XdmfH5Storage(root, write_xdmf=False)
+    storage.write_data_source("cp", ds)
+    return storage
+
+
+def _probes(n_elements: int) -> np.ndarray:
+    return np.concatenate([int(f * n_elements) + np.arange(8) for f in PROBE_FRACTIONS])
+
+
+def _bytes_read(storage: XdmfH5Storage, **kwargs) -> tuple[int, np.ndarray]:
+    fields = storage.read_data_source("cp").fields
+    before = _rchar()
+    arr = fields.read("cp", **kwargs)
+    return _rchar() - before, arr
+
+
+def test_subset_read_bytes_scale_with_subset(tmp_path):
+    small = _write(tmp_path / "small", SMALL)
+    large = _write(tmp_path / "large", LARGE)
+
+    subset_small, _ = _bytes_read(small, elements=_probes(SMALL))
+    subset_large, got = _bytes_read(large, elements=_probes(LARGE))
+    full_large, full = _bytes_read(large)
+    np.testing.assert_array_equal(got, full[_probes(LARGE)])
+
+    mib = 1 << 20
+    print(
+        f"\nsubset of {SMALL}: {subset_small / mib:.2f} MiB, "
+        f"subset of {LARGE}: {subset_large / mib:.2f} MiB, "
+        f"full {LARGE}: {full_large / mib:.1f} MiB"
+    )
+    # 32 float64 x 40 steps is 10 KiB of payload. HDF5 reads each run of a
+    # contiguous dataset through its data-sieve buffer, so the real cost is
+    # one sieve per run per step plus metadata -- both independent of the
+    # dataset's length.
+    sieve_bound = len(PROBE_FRACTIONS) * N_TIMESTEPS * SIEVE_BYTES + mib
+    assert subset_large < 2 * subset_small + mib
+    assert subset_large < sieve_bound < 0.25 * full_large
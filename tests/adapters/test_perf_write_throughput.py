@@ -0,0 +1,98 @@
+"""Opt-in benchmark: field write throughput (MB/s) of ``XdmfH5Storage``.
+
+Runs with ``pytest -m perf``. The galpao pressure fixture (2915 triangles,
+101 steps) is tiled to 20k steps -- ~470 MB of float64 -- and written through:
+
+- ``step loop``: one ``write_step`` per timestep, the path ``write_field``
+  replaced (a strided column copy and a high-level ``create_dataset`` each);
+- ``write_data_source`` per-step and columnar, uncompressed and with
+  ``shuffle+gzip`` at ``compress_workers`` 0 and 4.
+
+The per-step layout is bound by per-dataset overhead, not bytes, so that is
+where the low-level creation path shows. Worker compression needs cores to
+show; its assertion is skipped on machines with fewer than four.
+"""
+
+from __future__ import annotations
+
+import os
+import pathlib
+import shutil
+import time
+
+import numpy as np
+import pytest
+
+from cfdmod.adapters import XdmfH5Storage
+from cfdmod.adapters.memory import MemoryFieldStore
+from cfdmod.core import ElementMeta, SurfaceDataSource, TimeAxis
+from cfdmod.io.xdmf import timeseries_writer
+
+pytestmark = [pytest.mark.perf, pytest.mark.integration]
+
+REPO = pathlib.Path(__file__).resolve().parents[2]
+DATA = REPO / "fixtures" / "tests" / "pressure" / "data"
+N_TIMESTEPS = 20_000
+
+
+@pytest.fixture(scope="module")
+def galpao() -> SurfaceDataSource:
+    src = XdmfH5Storage(DATA).read_data_source("bodies.galpao")
+    pressure = src.fields.read("pressure")
+    reps = -(-N_TIMESTEPS // pressure.shape[1])
+    values = np.tile(pressure, (1, reps))[:, :N_TIMESTEPS].copy()
+    return SurfaceDataSource(
+        time=TimeAxis(initial_time=0.0, timestep_size=0.01, n_timesteps=N_TIMESTEPS),
+        topology=src.topology,
+        elements=ElementMeta(),
+        fields=MemoryFieldStore({"pressure": values}),
+    )
+
+
+def _mb_per_s(ds: SurfaceDataSource, root: pathlib.Path, write) -> float:
+    start = time.perf_counter()
+    write()
+    elapsed = time.perf_counter() - start
+    shutil.rmtree(root, ignore_errors=True)
+    return ds.fields.read("pressure").nbytes / 1e6 / elapsed
+
+
+def test_write_throughput(tmp_path, galpao):
+    values = galpao.fields.read("pressure")
+    keys = [f"t{t}" for t in galpao.time.times()]
+
+    def step_loop(root: pathlib.Path, codec: str):
+        root.mkdir()
+        with timeseries_writer(root / "p.h5", "w", codec=codec) as writer:
+            for i, key in enumerate(keys):
+                writer.write_step("pressure", key, values[:, i])
+
+    def storage(root: pathlib.Path, **kwargs):
+        return lambda: XdmfH5Storage(root, write_xdmf=False, **kwargs).write_data_source(
+            "p", galpao
+        )
+
+    rates = {}
+    for codec in ("none", "shuffle+gzip"):
+        root = tmp_path / "loop"
+        rates[("step loop", codec, 0)] = _mb_per_s(
+            galpao, root, lambda root=root, codec=codec: step_loop(root, codec)
+        )
+        for layout in ("per_step", "columnar"):
+            for workers in (0, 4) if codec != "none" else (0,):
+                root = tmp_path / f"{layout}-{workers}"
+                rates[(layout, codec, workers)] = _mb_per_s(
+                    galpao,
+                    root,
+                    storage(root, layout=layout, codec=codec, compress_workers=workers),
+                )
+    print()
+    for (path, codec, workers), rate in rates.items():
+        print(f"{path:10s} {codec:13s} workers={workers}  {rate:8.0f} MB/s")
+
+    assert rates[("per_step", "none", 0)] > 1.3 * rates[("step loop", "none", 0)]
+    assert rates[("per_step", "shuffle+gzip", 0)] > rates[("step loop", "shuffle+gzip", 0)]
+    if (os.cpu_count() or 1) >= 4:
+        for layout in ("per_step", "columnar"):
+            threaded = rates[(layout, "shuffle+gzip", 4)]
+            assert threaded > 1.5 * rates[(layout, "shuffle+gzip", 0)]
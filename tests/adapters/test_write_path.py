@@ -0,0 +1,131 @@
+"""Block-buffered field writes and worker-thread compression.
+
+``TimeseriesWriter`` converts fields to their storage dtype through a reusable
+buffer, creates per-step datasets through h5py's low-level API and, with
+``workers``, compresses gzip chunks off the writing thread. None of that may
+show in what a reader gets back: the values, dtype and filters must match a
+plain write, and a default per-step file must match it byte for byte.
+"""
+
+from __future__ import annotations
+
+import h5py
+import numpy as np
+import pytest
+
+import cfdmod.io.xdmf as _xdmf
+from cfdmod.adapters import XdmfH5Storage
+from cfdmod.adapters.memory import MemoryFieldStore
+from cfdmod.core import ElementMeta, SurfaceDataSource, TimeAxis, Topology
+from cfdmod.core.chunked import slice_time
+
+pytestmark = pytest.mark.unit
+
+
+def _surface(n_elements: int = 23, n_timesteps: int = 17) -> SurfaceDataSource:
+    rng = np.random.default_rng(0)
+    t = np.linspace(0.0, 4.0 * np.pi, n_timesteps)
+    cp = np.sin(t)[None, :] * rng.random((n_elements, 1)) + 0.01 * rng.random(
+        (n_elements, n_timesteps)
+    )
+    return SurfaceDataSource(
+        time=TimeAxis(initial_time=0.0, timestep_size=0.1, n_timesteps=n_timesteps),
+        topology=Topology.triangles(
+            np.arange(n_elements * 3, dtype=np.int32).reshape(n_elements, 3),
+            rng.random((n_elements * 3, 3)),
+        ),
+        elements=ElementMeta(),
+        # Fortran order: columns are contiguous, rows are not.
+        fields=MemoryFieldStore({"cp": np.asfortranarray(cp)}),
+    )
+
+
+@pytest.fixture()
+def small_buffer(monkeypatch):
+    """Force several conversion blocks per field."""
+    monkeypatch.setattr(_xdmf, "_WRITE_BUFFER_BYTES", 256)
+
+
+@pytest.mark.parametrize("codec", ["gzip-1", "shuffle+gzip-9"])
+@pytest.mark.parametrize("layout", ["per_step", "columnar"])
+@pytest.mark.parametrize("dtype", ["float64", "float32"])
+def test_worker_compression_reads_back_exactly(tmp_path, small_buffer, codec, layout, dtype):
+    ds = _surface()
+    storage = XdmfH5Storage(
+        tmp_path,
+        codec=codec,
+        layout=layout,
+        storage_dtype=dtype,
+        # Chunks that do not divide the field leave padded edge chunks.
+        chunks=(7, 5) if layout == "columnar" else None,
+        compress_workers=3,
+    )
+    storage.write_data_source("cp", ds)
+
+    back = storage.read_data_source("cp").fields
+    np.testing.assert_array_equal(back.read("cp"), ds.fields.read("cp").astype(dtype))
+    with h5py.File(storage.h5_path("cp"), "r") as f:
+        dset = f["cp"] if layout == "columnar" else f["cp/t0.0"]
+        assert dset.compression == "gzip"
+        assert dset.shuffle == codec.startswith("shuffle")
+        assert dset.dtype == np.dtype(dtype)
+
+
+@pytest.mark.parametrize("layout", ["per_step", "columnar"])
+@pytest.mark.parametrize("dtype", ["float64", "float32"])
+def test_buffered_write_reads_back_exactly(tmp_path, small_buffer, layout, dtype):
+    ds = _surface()
+    storage = XdmfH5Storage(tmp_path, layout=layout, storage_dtype=dtype)
+    storage.write_data_source("cp", ds)
+    np.testing.assert_array_equal(
+        storage.read_data_source("cp").fields.read("cp"), ds.fields.read("cp").astype(dtype)
+    )
+
+
+def test_default_per_step_field_matches_step_by_step_writes(tmp_path, small_buffer):
+    values = _surface().fields.read("cp")
+    keys = [f"t{i * 0.1}" for i in range(values.shape[1])]
+    with _xdmf.timeseries_writer(tmp_path / "steps.h5", "w") as writer:
+        for i, key in enumerate(keys):
+            writer.write_step("cp", key, values[:, i])
+    with _xdmf.timeseries_writer(tmp_path / "field.h5", "w") as writer:
+        writer.write_field("cp", values, keys)
+    assert (tmp_path / "field.h5").read_bytes() == (tmp_path / "steps.h5").read_bytes()
+
+
+def test_rewriting_existing_steps_replaces_them(tmp_path):
+    values = _surface().fields.read("cp")
+    keys = [f"t{i}" for i in range(values.shape[1])]
+    with _xdmf.timeseries_writer(tmp_path / "x.h5", "w") as writer:
+        writer.write_field("cp", values, keys)
+        writer.write_field("cp", 2.0 * values[:, :4], keys[:4])
+    with h5py.File(tmp_path / "x.h5", "r") as f:
+        np.testing.assert_array_equal(f["cp/t3"][:], 2.0 * values[:, 3])
+        np.testing.assert_array_equal(f["cp/t4"][:], values[:, 4])
+
+
+def test_streamed_output_compresses_on_workers(tmp_path, small_buffer):
+    ds = _surface()
+    storage = XdmfH5Storage(tmp_path, codec="shuffle+gzip", compress_workers=2)
+    writer = storage.open_writer("cp", ds)
+    for sl in (slice(0, 6), slice(6, 17)):
+        writer.append(slice_time(ds, sl))
+    writer.commit()
+    np.testing.assert_array_equal(
+        storage.read_data_source("cp").fields.read("cp"), ds.fields.read("cp")
+    )
+
+
+def test_workers_are_ignored_without_a_gzip_codec(tmp_path):
+    ds = _surface()
+    for codec in ("none", "lzf"):
+        storage = XdmfH5Storage(tmp_path / codec, codec=codec, compress_workers=4)
+        storage.write_data_source("cp", ds)
+        np.testing.assert_array_equal(
+            storage.read_data_source("cp").fields.read("cp"), ds.fields.read("cp")
+        )
+
+
+def test_negative_workers_rejected(tmp_path):
+    with pytest.raises(ValueError, match="compress_workers"):
+        XdmfH5Storage(tmp_path, compress_workers=-1)
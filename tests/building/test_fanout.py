@@ -182,3 +182,135 @@ def test_run_fanout_with_a_real_process_pool():
         np.asarray(next(iter(parallel.values())).fields.read("feq_x")),
         np.asarray(next(iter(sequential.values())).fields.read("feq_x")),
     )
+
+
+class _Counting:
+    """A solve_fn that records the directions it actually solved."""
+
+    def __init__(self, solve_fn) -> None:
+        self.solve_fn = solve_fn
+        self.calls: list[str] = []
+
+    def __call__(self, key):
+        self.calls.append(key.direction)
+        return self.solve_fn(key)
+
+
+@pytest.mark.integration
+def test_run_fanout_with_a_cache_solves_only_new_keys(tmp_path):
+    from cfdmod.adapters.xdmf_h5 import XdmfH5Storage
+
+    solve_fn = _template_solve_fn()
+    cache = solve_fn.cache(XdmfH5Storage(tmp_path))
+    counting = _Counting(solve_fn)
+
+    first = run_fanout(
+        FanoutPlan(directions_by_category={"": ["0"]}, bodies=["galpao"]),
+        counting,
+        cache=cache,
+    )
+    extended = run_fanout(
+        FanoutPlan(directions_by_category={"": ["0", "90"]}, bodies=["galpao"]),
+        counting,
+        cache=cache,
+    )
+
+    assert counting.calls == ["0", "90"]
+    assert len(extended) == 2
+    key = StaticCaseKey(direction="0", body="galpao")
+    for field in ("feq_x", "acc_mag", "fs_x"):
+        np.testing.assert_array_equal(
+            np.asarray(extended[key].fields.read(field)),
+            np.asarray(first[key].fields.read(field)),
+        )
+
+    # a different damping ratio is a different result
+    other = build_static_solve_fn(
+        solve_fn.case,
+        solve_fn.storage,
+        MESH,
+        body_key_template=solve_fn.body_key_template,
+        pref_key_template=solve_fn.pref_key_template,
+        damping_ratio=0.05,
+        check_sampling=False,
+    )
+    assert other.cache(XdmfH5Storage(tmp_path)).get(key) is None
+
+
+@pytest.mark.unit
+def test_preloaded_inputs_are_not_read_again():
+    from cfdmod.adapters.memory import MemoryStorage
+
+    solve_fn = _template_solve_fn()
+    key = StaticCaseKey(direction="0", body="galpao")
+    preloaded = solve_fn.preload(solve_fn.input_keys(key))
+    preloaded.storage = MemoryStorage()  # any read would now fail
+
+    np.testing.assert_array_equal(
+        np.asarray(preloaded(key).fields.read("feq_x")),
+        np.asarray(solve_fn(key).fields.read("feq_x")),
+    )
+    assert solve_fn.preloaded == {}
+
+
+@pytest.mark.integration
+def test_run_fanout_broadcasts_the_solve_fn_to_a_process_pool():
+    import multiprocessing
+
+    from cfdmod.core import Broadcast
+
+    plan = FanoutPlan(directions_by_category={"": ["0", "90"]}, bodies=["galpao"])
+    solve_fn = _template_solve_fn()
+    preloaded = solve_fn.preload(solve_fn.input_keys(build_static_keys(plan)[0]))
+
+    sequential = run_fanout(plan, solve_fn)
+    with Broadcast(min_bytes=1024) as broadcast:
+        with multiprocessing.get_context("spawn").Pool(2) as pool:
+            parallel = run_fanout(plan, preloaded, pool=pool, broadcast=broadcast)
+        assert broadcast.nbytes > 0
+
+    for key in sequential.keys():
+        np.testing.assert_allclose(
+            np.asarray(parallel[key].fields.read("feq_x")),
+            np.asarray(sequential[key].fields.read("feq_x")),
+        )
+
+
+@pytest.mark.unit
+def test_a_changed_structure_misses_the_cache():
+    """A mode shape or floor mass edit too small for ``repr`` to show."""
+    from cfdmod.adapters.memory import MemoryStorage
+    from cfdmod.building import example_building_structure
+
+    case = example_building_case(MESH, n_floors=3)
+    structure = example_building_structure(case, 120)  # (120, 3, 3): repr elides it
+    key = StaticCaseKey(direction="0", body="galpao")
+    cached = _template_solve_fn()
+
+    def solve_fn_for(struct):
+        return build_static_solve_fn(
+            cached.case,
+            cached.storage,
+            MESH,
+            structure=struct,
+            body_key_template=cached.body_key_template,
+            pref_key_template=cached.pref_key_template,
+            check_sampling=False,
+        )
+
+    storage = MemoryStorage()
+    result = cached.storage.read_data_source("points.static_pressure")
+    solve_fn_for(structure).cache(storage).put(key, result)
+
+    modes = np.array(structure.mode_shapes, copy=True)
+    modes[60, 0, 0] *= 1.5
+    masses = np.array(structure.floors_mass, dtype=np.float64, copy=True)
+    masses[5] += 1e-9
+
+    assert solve_fn_for(structure.model_copy()).cache(storage).get(key) is not None
+    for changed in (
+        structure.model_copy(update={"mode_shapes": modes}),
+        structure.model_copy(update={"floors_mass": masses}),
+    ):
+        assert repr(changed) == repr(structure)
+        assert solve_fn_for(changed).cache(storage).get(key) is None
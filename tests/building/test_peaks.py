@@ -2,10 +2,20 @@
 
 from __future__ import annotations
 
+import time
+
 import numpy as np
 import pytest
 
-from cfdmod.building import gust_peak_factor, peak_value
+from cfdmod.adapters.memory import MemoryFieldStore
+from cfdmod.building import (
+    container_peaks,
+    gust_peak_factor,
+    peak_value,
+    peak_values,
+    stack_field,
+)
+from cfdmod.core import Container, ElementMeta, PointsDataSource, TimeAxis, Topology
 
 pytestmark = pytest.mark.unit
 
@@ -58,3 +68,110 @@ def test_peak_value_empty_is_nan():
 def test_peak_value_unknown_method():
     with pytest.raises(ValueError):
         peak_value(np.arange(5.0), "nope")  # type: ignore[arg-type]
+
+
+def _series(shape, seed: int = 2) -> np.ndarray:
+    x = np.random.default_rng(seed).normal(0.3, 1.5, size=shape)
+    x[1, 2, 17] = np.nan  # a masked sample: this series' gumbel blocks shift
+    x[2, 0, 5] = np.inf
+    x[3, 1, :] = np.nan  # nothing left: nan
+    return x
+
+
+@pytest.mark.parametrize(
+    ("method", "kwargs"),
+    [("max", {}), ("peak-factor", {"f0": 0.2}), ("gumbel", {}), ("gumbel", {"n_blocks": 1})],
+)
+@pytest.mark.parametrize("absolute", [True, False])
+def test_peak_values_matches_peak_value_series_by_series(method, kwargs, absolute):
+    x = _series((4, 3, 501))
+
+    got = peak_values(x, method, absolute=absolute, **kwargs)
+
+    expected = np.array(
+        [
+            [peak_value(x[i, j], method, absolute=absolute, **kwargs) for j in range(3)]
+            for i in range(4)
+        ]
+    )
+    assert got.shape == (4, 3)
+    np.testing.assert_allclose(got, expected, rtol=1e-12, atol=0.0, equal_nan=True)
+    assert np.isnan(got[3, 1])
+
+
+def test_peak_values_reduces_along_axis_with_per_series_f0():
+    x = _series((4, 3, 200))
+    f0 = np.array([0.2, 0.3, 0.5])
+
+    got = peak_values(np.moveaxis(x, -1, 0), "peak-factor", axis=0, f0=f0)
+
+    expected = np.array(
+        [[peak_value(x[i, j], "peak-factor", f0=f0[j]) for j in range(3)] for i in range(4)]
+    )
+    np.testing.assert_allclose(got, expected, rtol=1e-12, equal_nan=True)
+
+
+def test_peak_values_rejects_what_peak_value_rejects():
+    with pytest.raises(ValueError, match="f0"):
+        peak_values(np.ones((2, 5)), "peak-factor")
+    with pytest.raises(ValueError, match="unknown"):
+        peak_values(np.ones((2, 5)), "nope")  # type: ignore[arg-type]
+
+
+def _case(values: np.ndarray) -> PointsDataSource:
+    n_floors, n_t = values.shape[-2:]
+    return PointsDataSource(
+        time=TimeAxis(initial_time=0.0, timestep_size=0.1, n_timesteps=n_t),
+        topology=Topology.points(np.zeros((n_floors, 3))),
+        elements=ElementMeta(),
+        fields=MemoryFieldStore({"acc_mag": values, "feq_x": -2.0 * values}),
+    )
+
+
+def test_container_peaks_is_one_row_per_case_and_floor():
+    x = np.abs(_series((4, 4, 300), seed=5))
+    container = Container(items={f"{d}": _case(x[i]) for i, d in enumerate((0, 90, 180))})
+
+    table = container_peaks(container, ["acc_mag", "feq_x"], "gumbel", non_exceedance=0.9)
+
+    assert list(table.columns) == ["acc_mag", "feq_x"]
+    assert table.index.names == ["key", "element"]
+    assert table.shape == (12, 2)
+    assert table.loc[("90", 2), "feq_x"] == pytest.approx(
+        peak_value(-2.0 * x[1, 2], "gumbel", non_exceedance=0.9), rel=1e-12
+    )
+    np.testing.assert_array_equal(stack_field(container, "acc_mag", rows=-1), x[:3, -1])
+
+
+def test_stack_field_rejects_ragged_cases():
+    container = Container(items={"a": _case(np.ones((2, 10))), "b": _case(np.ones((2, 11)))})
+    with pytest.raises(ValueError, match="cannot stack"):
+        stack_field(container, "acc_mag")
+
+
+@pytest.mark.perf
+def test_directional_peak_table_is_one_reduction_per_field():
+    """40 floors x 36 directions x 6 fields of 3600 samples.
+
+    Looping peak_value over those 8640 series took ~0.6 s here.
+    """
+    rng = np.random.default_rng(7)
+    fields = ["acc_x", "acc_y", "acc_mag", "feq_x", "feq_y", "meq_z"]
+    container = Container(
+        items={
+            f"{d}": PointsDataSource(
+                time=TimeAxis(initial_time=0.0, timestep_size=0.1, n_timesteps=3600),
+                topology=Topology.points(np.zeros((40, 3))),
+                elements=ElementMeta(),
+                fields=MemoryFieldStore({f: rng.normal(size=(40, 3600)) for f in fields}),
+            )
+            for d in range(0, 360, 10)
+        }
+    )
+
+    t0 = time.perf_counter()
+    table = container_peaks(container, fields, "gumbel")
+    elapsed = time.perf_counter() - t0
+
+    assert table.shape == (36 * 40, 6)
+    assert elapsed < 0.5, f"36 x 40 x 6 gumbel peaks took {elapsed:.3f}s"
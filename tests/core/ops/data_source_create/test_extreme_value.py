@@ -1,8 +1,9 @@
 """Unit tests for the extreme-value / peak op.
 
 Covers the peak-factor identity, a Gumbel known-answer on a synthetic
-draw, event-duration rescaling monotonicity, the time-collapse contract,
-and parameter validation.
+draw, the batched Gumbel engine against the per-series one, event-duration
+rescaling monotonicity, the time-collapse contract, and parameter
+validation.
 """
 
 from __future__ import annotations
@@ -16,6 +17,7 @@ from cfdmod.core.ops.data_source_create.extreme_value import (
     ExtremeValueParams,
     extreme_value,
     gumbel_extreme_value_1d,
+    gumbel_extreme_value_2d,
     reescale_event_duration_peak,
 )
 
@@ -170,6 +172,70 @@ def test_gumbel_op_shape_and_ordering():
     assert np.all(gmax > data.mean(axis=1))
 
 
+@pytest.mark.parametrize("extreme_type", ["max", "min"])
+@pytest.mark.parametrize(
+    ("n_timesteps", "peak_duration", "n_subdivisions"),
+    [
+        (5000, 0.03, 10),  # blocks of equal size
+        (4001, 0.07, 7),  # array_split's longer leading blocks
+        (300, 0.005, 13),  # 1-sample window: no smoothing
+    ],
+)
+def test_batched_gumbel_matches_per_series(
+    extreme_type, n_timesteps, peak_duration, n_subdivisions
+):
+    rng = np.random.default_rng(12)
+    data = 3.0 * rng.random((6, 1)) * rng.normal(size=(6, n_timesteps)) + rng.normal(
+        scale=5.0, size=(6, 1)
+    )
+    kwargs = dict(
+        dt=0.01,
+        peak_duration=peak_duration,
+        event_duration=600.0,
+        extreme_type=extreme_type,
+        n_subdivisions=n_subdivisions,
+        non_exceedance_probability=0.9,
+    )
+    expected = [gumbel_extreme_value_1d(row, **kwargs) for row in data]
+    np.testing.assert_allclose(gumbel_extreme_value_2d(data, **kwargs), expected, rtol=1e-9)
+    # float32 sources are accumulated in float64.
+    np.testing.assert_allclose(
+        gumbel_extreme_value_2d(data.astype(np.float32), **kwargs), expected, rtol=1e-5
+    )
+
+
+def test_batched_gumbel_constant_row_returns_its_value():
+    data = np.vstack([np.full(500, 2.5), np.random.default_rng(13).normal(size=500)])
+    out = gumbel_extreme_value_2d(
+        data, dt=0.01, peak_duration=0.03, event_duration=60.0, extreme_type="max"
+    )
+    assert out[0] == pytest.approx(2.5)
+    assert np.isfinite(out[1])
+
+
+def test_batched_gumbel_rejects_1d():
+    with pytest.raises(ValueError, match="2-D"):
+        gumbel_extreme_value_2d(
+            np.zeros(100), dt=0.01, peak_duration=0.03, event_duration=60.0, extreme_type="max"
+        )
+
+
+@pytest.mark.parametrize("bad", [np.nan, np.inf])
+def test_gumbel_rejects_non_finite_samples_like_the_per_series_fit(bad):
+    data = np.random.default_rng(14).normal(size=(3, 2000))
+    data[1, 700] = bad
+    kwargs = dict(dt=0.01, peak_duration=0.03, event_duration=600.0, extreme_type="max")
+    with pytest.raises(ValueError, match="non-finite"):
+        gumbel_extreme_value_1d(data[1], **kwargs)
+    with pytest.raises(ValueError, match=r"non-finite values \(rows \[1\]\)"):
+        gumbel_extreme_value_2d(data, **kwargs)
+    p = ExtremeValueParams(
+        method="gumbel", extreme_type="max", peak_duration=0.03, event_duration=600.0
+    )
+    with pytest.raises(ValueError, match="non-finite"):
+        extreme_value(_surface(data), p)
+
+
 # --- event-duration rescale ------------------------------------------------
 
 
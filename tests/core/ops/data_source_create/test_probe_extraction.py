@@ -46,3 +46,14 @@ def test_extracted_source_keeps_time_axis():
     )
     assert out.time.n_timesteps == 4
     np.testing.assert_array_equal(out.fields.read("u")[0], np.arange(4))
+
+
+def test_nearest_reuses_the_source_kd_tree():
+    src = _column(np.array([0.0, 1.0, 2.0]), np.array([[10.0], [20.0], [30.0]]))
+    params = ProbeExtractionParams(probes=np.array([[0, 0, 1.9], [0, 0, 0.6]]), field="u")
+    first = probe_extraction(src, params)
+    tree = src.elements.position_tree()
+    second = probe_extraction(src, params)
+    assert src.elements.position_tree() is tree
+    np.testing.assert_array_equal(first.fields.read("u"), [[30.0], [20.0]])
+    np.testing.assert_array_equal(second.fields.read("u"), first.fields.read("u"))
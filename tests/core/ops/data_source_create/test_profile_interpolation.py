@@ -0,0 +1,112 @@
+"""Unit tests for profile_interpolation and its sparse interpolation operator."""
+
+from __future__ import annotations
+
+import numpy as np
+import pytest
+
+from cfdmod.adapters.memory import MemoryFieldStore
+from cfdmod.core import ElementMeta, PointsDataSource, TimeAxis, Topology
+from cfdmod.core.chunked import slice_time
+from cfdmod.core.ops.data_source_create import (
+    ProfileInterpolationParams,
+    linear_interp_matrix,
+    profile_interpolation,
+)
+
+
+def _profile(z: np.ndarray, values: np.ndarray) -> PointsDataSource:
+    pos = np.zeros((z.size, 3))
+    pos[:, 2] = z
+    return PointsDataSource(
+        time=TimeAxis(initial_time=0.0, timestep_size=1.0, n_timesteps=values.shape[1]),
+        topology=Topology.points(pos),
+        elements=ElementMeta(position=pos),
+        fields=MemoryFieldStore({"u": values}),
+    )
+
+
+@pytest.mark.parametrize(
+    "xp",
+    [
+        np.array([3.0, 0.0, 1.0, 7.5, 2.0]),
+        np.array([0.0, 1.0, 1.0, 2.0]),
+        np.array([4.0]),
+    ],
+)
+def test_linear_interp_matrix_matches_np_interp(xp):
+    rng = np.random.default_rng(0)
+    x = np.concatenate([[-1.0, 0.0, 1.0, 100.0], rng.uniform(-1.0, 9.0, size=20), xp])
+    fp = rng.normal(size=(xp.size, 3))
+    order = np.argsort(xp, kind="stable")
+
+    got = linear_interp_matrix(xp, x) @ fp
+    expected = np.column_stack([np.interp(x, xp[order], fp[order, k]) for k in range(3)])
+    np.testing.assert_allclose(got, expected, rtol=1e-12, atol=1e-12)
+
+
+@pytest.mark.parametrize("bad", [0, 2, 4])
+def test_a_nan_sample_reaches_only_the_targets_np_interp_gives_it(bad):
+    """Clamped and on-knot targets carry no zero weight to multiply a NaN by."""
+    xp = np.array([3.0, 0.0, 1.0, 7.5, 2.0])
+    x = np.concatenate([[-1.0, 100.0], xp, np.linspace(-0.5, 8.0, 35)])
+    fp = np.arange(xp.size, dtype=np.float64)
+    fp[bad] = np.nan
+    order = np.argsort(xp, kind="stable")
+
+    got = linear_interp_matrix(xp, x) @ fp
+    expected = np.interp(x, xp[order], fp[order])
+
+    np.testing.assert_array_equal(np.isnan(got), np.isnan(expected))
+    np.testing.assert_allclose(got, expected, rtol=1e-12, atol=1e-12)
+
+
+def test_a_duplicated_lowest_height_clamps_to_the_first_sample():
+    z = np.array([0.0, 0.0, 1.0, 2.0])
+    values = np.array([[10.0], [20.0], [30.0], [40.0]])
+    targets = np.array([-0.5, 0.0, 0.5, 2.0, 3.0])
+
+    out = profile_interpolation(
+        _profile(z, values), ProfileInterpolationParams(target_heights=targets)
+    )
+
+    expected = np.interp(targets, z, values[:, 0])
+    assert expected[0] == 10.0
+    np.testing.assert_allclose(out.fields.read("u")[:, 0], expected)
+
+
+def test_linear_interp_matrix_requires_a_source_sample():
+    with pytest.raises(ValueError, match="at least one"):
+        linear_interp_matrix(np.array([]), np.array([1.0]))
+
+
+def test_profile_interpolation_matches_per_timestep_interp():
+    rng = np.random.default_rng(1)
+    z = np.array([10.0, 0.0, 5.0, 20.0])
+    values = rng.normal(size=(4, 50)).astype(np.float32)
+    targets = np.array([-1.0, 2.5, 7.0, 15.0, 30.0])
+
+    out = profile_interpolation(
+        _profile(z, values), ProfileInterpolationParams(target_heights=targets)
+    )
+
+    order = np.argsort(z)
+    expected = np.column_stack([np.interp(targets, z[order], values[order, t]) for t in range(50)])
+    got = out.fields.read("u")
+    assert got.dtype == np.float32
+    np.testing.assert_allclose(got, expected, rtol=1e-6, atol=1e-6)
+    np.testing.assert_array_equal(out.elements.position[:, 2], targets)
+
+
+def test_profile_interpolation_reuses_the_operator_across_windows():
+    values = np.arange(30, dtype=np.float64).reshape(3, 10)
+    src = _profile(np.array([0.0, 1.0, 2.0]), values)
+    params = ProfileInterpolationParams(target_heights=[0.5, 1.5])
+
+    first = profile_interpolation(slice_time(src, slice(0, 5)), params)
+    built = dict(src.elements._derived[1])
+    second = profile_interpolation(slice_time(src, slice(5, 10)), params)
+
+    assert src.elements._derived[1] == built
+    np.testing.assert_allclose(first.fields.read("u"), (values[:2, :5] + values[1:, :5]) / 2)
+    np.testing.assert_allclose(second.fields.read("u"), (values[:2, 5:] + values[1:, 5:]) / 2)
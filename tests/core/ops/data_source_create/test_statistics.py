@@ -7,7 +7,11 @@ import pytest
 
 from cfdmod.adapters.memory import MemoryFieldStore
 from cfdmod.core import ElementMeta, SurfaceDataSource, TimeAxis, Topology
-from cfdmod.core.ops.data_source_create import StatisticsParams, compute_statistics
+from cfdmod.core.ops.data_source_create import (
+    MomentAccumulator,
+    StatisticsParams,
+    compute_statistics,
+)
 
 
 def _surface_with_data(data: np.ndarray) -> SurfaceDataSource:
@@ -65,3 +69,59 @@ def test_statistics_rejects_time_aggregated_input():
     )
     with pytest.raises(ValueError):
         compute_statistics(ds, StatisticsParams(kinds=["mean"]))
+
+
+# --- mergeable moments ------------------------------------------------------
+
+
+@pytest.mark.parametrize("cuts", [[1], [250, 251, 900], [7, 8, 9, 10, 500]])
+def test_merged_moments_match_the_whole_series(cuts):
+    rng = np.random.default_rng(4)
+    # Offset far from zero: the naive sum-of-powers update would lose the
+    # fluctuation here, the pairwise one must not.
+    data = 1e3 + rng.gamma(shape=2.0, size=(5, 1000))
+    whole = MomentAccumulator.from_array(data)
+    blocks = np.split(data, cuts, axis=1)
+    acc = MomentAccumulator.from_array(blocks[0])
+    for block in blocks[1:]:
+        acc = acc.merge(MomentAccumulator.from_array(block))
+
+    assert acc.count == 1000
+    for kind in ("mean", "rms", "skewness", "kurtosis", "min", "max"):
+        np.testing.assert_allclose(acc.stat(kind), whole.stat(kind), rtol=1e-9, err_msg=kind)
+
+
+def test_moments_keep_the_source_float_dtype():
+    data = np.random.default_rng(5).random((3, 40)).astype(np.float32)
+    acc = MomentAccumulator.from_array(data[:, :15]).merge(
+        MomentAccumulator.from_array(data[:, 15:])
+    )
+    assert acc.mean.dtype == np.float64
+    assert acc.stat("rms").dtype == np.float32
+    assert (
+        MomentAccumulator.from_array(np.arange(6).reshape(2, 3)).stat("mean").dtype == np.float64
+    )
+
+
+def test_moments_track_only_the_requested_order():
+    acc = MomentAccumulator.from_array(np.random.default_rng(6).random((2, 30)), order=2)
+    assert acc.m3 is None and acc.m4 is None
+    acc.stat("rms")
+    with pytest.raises(ValueError, match="order 3"):
+        acc.stat("skewness")
+
+
+def test_moments_refuse_mismatched_merges():
+    a = MomentAccumulator.from_array(np.zeros((2, 5)))
+    with pytest.raises(ValueError, match="elements"):
+        a.merge(MomentAccumulator.from_array(np.zeros((3, 5))))
+    with pytest.raises(ValueError, match="order"):
+        a.merge(MomentAccumulator.from_array(np.zeros((2, 5)), order=2))
+
+
+def test_constant_series_has_zero_skewness_and_kurtosis():
+    acc = MomentAccumulator.from_array(np.full((1, 10), 2.0))
+    acc = acc.merge(MomentAccumulator.from_array(np.full((1, 4), 2.0)))
+    assert acc.stat("rms")[0] == 0.0
+    assert acc.stat("skewness")[0] == 0.0
+    assert acc.stat("kurtosis")[0] == 0.0
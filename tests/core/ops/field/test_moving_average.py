@@ -12,11 +12,13 @@ import pytest
 
 from cfdmod.adapters.memory import MemoryFieldStore
 from cfdmod.core import ElementMeta, SurfaceDataSource, TimeAxis, Topology
+from cfdmod.core.chunked import chunk_map_time
 from cfdmod.core.ops.field.moving_average import (
     MovingAverageParams,
     moving_average,
     window_in_samples,
 )
+from cfdmod.core.ops.time import RescaleTimeParams
 
 
 def _surface(values: np.ndarray, dt: float = 0.1) -> SurfaceDataSource:
@@ -99,3 +101,50 @@ def test_moving_average_rejects_time_aggregated_source():
     )
     with pytest.raises(ValueError):
         moving_average(ds, MovingAverageParams(window=0.1))
+
+
+@pytest.mark.parametrize("n_timesteps", [3, 400])
+def test_moving_average_matches_padded_convolution_for_wide_windows(n_timesteps):
+    """The running sum matches the legacy per-row convolution, window > series included."""
+    data = 50.0 + np.random.default_rng(3).normal(size=(5, n_timesteps))
+    out = moving_average(_surface(data, dt=0.01), MovingAverageParams(window=0.51))
+    n = window_in_samples(0.51, 0.01)
+    padded = np.pad(data, ((0, 0), (n // 2, n // 2)), mode="edge")
+    expected = np.stack([np.convolve(row, np.ones(n) / n, mode="valid") for row in padded])
+    np.testing.assert_allclose(out.fields.read("pressure"), expected, rtol=1e-12)
+
+
+def test_moving_average_keeps_the_field_dtype():
+    data = np.random.default_rng(4).random((3, 30)).astype(np.float32)
+    ds = _surface(data).with_field("pressure", data)
+    out = moving_average(ds, MovingAverageParams(window=0.5))
+    assert out.fields.read("pressure").dtype == np.float32
+
+
+def test_time_halo_is_half_the_window_on_the_input_axis():
+    time = TimeAxis(initial_time=0.0, timestep_size=0.1, n_timesteps=100)
+    assert MovingAverageParams(window=0.5).time_halo(time) == 2
+    assert MovingAverageParams(window=0.001).time_halo(time) == 0
+    # A time rescale upstream changes the samples the same window covers.
+    rescaled = RescaleTimeParams(factor=0.5).output_time(time)
+    assert MovingAverageParams(window=0.5).time_halo(rescaled) == 5
+
+
+@pytest.mark.parametrize("window", [0.001, 0.3])
+def test_chunked_run_with_a_one_step_tail_matches_the_whole_run(window):
+    """11 steps in windows of 5 leave a 1-step tail, which must not be rejected."""
+    data = np.random.default_rng(5).random((4, 11))
+    ds = _surface(data)
+    params = MovingAverageParams(window=window)
+
+    whole = moving_average(ds, params)
+    chunked = chunk_map_time(
+        ds,
+        lambda w: moving_average(w, params),
+        chunk_size=5,
+        halo=params.time_halo(ds.time),
+    )
+
+    np.testing.assert_allclose(
+        chunked.fields.read("pressure"), whole.fields.read("pressure"), rtol=1e-12
+    )
@@ -0,0 +1,85 @@
+"""Shared-memory broadcast: publish once, attach zero-copy, unlink on close."""
+
+from __future__ import annotations
+
+import multiprocessing
+import pickle
+from multiprocessing import shared_memory
+
+import numpy as np
+import pytest
+
+from cfdmod.core import Broadcast, Container
+
+pytestmark = pytest.mark.unit
+
+
+def _payload() -> dict:
+    rng = np.random.default_rng(0)
+    return {
+        "modes": rng.random((500, 1000)),
+        "partition": np.arange(200_000, dtype=np.int32),
+        "small": np.ones(4),
+        "name": "tower",
+    }
+
+
+class _Weighted:
+    """A callable whose state is a large array, as a solve_fn's would be."""
+
+    def __init__(self, weights: np.ndarray) -> None:
+        self.weights = weights
+
+    def __call__(self, i: int) -> tuple[float, bool]:
+        return float(self.weights[i].sum()), bool(self.weights.flags.writeable)
+
+
+def test_the_handle_pickles_small_and_resolves_to_the_original_here():
+    payload = _payload()
+    with Broadcast() as broadcast:
+        shared = broadcast.publish(payload)
+
+        assert shared.nbytes >= payload["modes"].nbytes + payload["partition"].nbytes
+        assert len(pickle.dumps(shared)) < 10_000
+        assert pickle.loads(pickle.dumps(shared)).get() is payload
+
+
+def test_attaching_gives_read_only_views_of_the_segment():
+    payload = _payload()
+    with Broadcast() as broadcast:
+        attached = pickle.loads(pickle.dumps(broadcast.publish(payload)))._attach()
+
+        np.testing.assert_array_equal(attached["modes"], payload["modes"])
+        np.testing.assert_array_equal(attached["partition"], payload["partition"])
+        assert attached["partition"].dtype == np.int32
+        assert attached["name"] == "tower"
+        assert not attached["modes"].flags.owndata
+        assert not attached["modes"].flags.writeable
+        assert not np.shares_memory(attached["modes"], payload["modes"])
+        # below min_bytes, an array simply travels in the skeleton
+        assert attached["small"].flags.writeable
+
+
+def test_close_unlinks_the_segment():
+    broadcast = Broadcast()
+    shared = broadcast.publish(_payload())
+
+    broadcast.close()
+
+    with pytest.raises(FileNotFoundError):
+        shared_memory.SharedMemory(shared.segment)
+    with pytest.raises(ValueError, match="closed"):
+        broadcast.publish(_payload())
+
+
+@pytest.mark.integration
+def test_map_values_through_a_process_pool():
+    weights = np.random.default_rng(1).random((8, 50_000))
+    container = Container(items={f"k{i}": i for i in range(8)})
+    func = _Weighted(weights)
+
+    sequential = container.map_values(func)
+    with Broadcast() as broadcast, multiprocessing.get_context("spawn").Pool(2) as pool:
+        parallel = container.map_values(func, pool=pool, broadcast=broadcast)
+
+    assert parallel.items == {k: (v[0], False) for k, v in sequential.items.items()}
@@ -2,16 +2,27 @@
 
 from __future__ import annotations
 
+import threading
+import time
+
 import numpy as np
 import pytest
 
 from cfdmod.adapters.memory import MemoryFieldStore
 from cfdmod.core.chunked import (
+    assert_element_chunkable,
     assert_time_chunkable,
+    chunk_map_elements,
     chunk_map_time,
+    concat_elements,
     concat_time,
+    element_blocks,
+    halo_windows,
+    prefetch_windows,
+    slice_elements,
     slice_time,
     time_windows,
+    trim_halo,
 )
 from cfdmod.core.data_source import SurfaceDataSource
 from cfdmod.core.field_meta import FieldMeta
@@ -21,6 +32,7 @@ from cfdmod.core.ops.data_source_create.field_series_for_groups import (
     field_series_for_groups,
 )
 from cfdmod.core.ops.field.algebra import ScaleParams, scale
+from cfdmod.core.ops.field.moving_average import MovingAverageParams, moving_average
 from cfdmod.core.time_axis import TimeAxis
 from cfdmod.core.topology import ElementMeta, Topology
 
@@ -70,6 +82,37 @@ def test_group_reduction_parity(chunk_size):
     np.testing.assert_allclose(chunked.fields.read("cp"), whole.fields.read("cp"))
 
 
+@pytest.mark.parametrize("chunk_size", [1, 4, 7, 30, None])
+def test_windowed_op_parity_with_a_halo(chunk_size):
+    """A moving average of a moving average reads 2 + 3 neighbours each side."""
+    ds = _surface(6, 40, seed=5)
+    first, second = (
+        MovingAverageParams(field="cp", window=2.0),
+        MovingAverageParams(field="cp", window=3.0),
+    )
+    pipe = lambda d: moving_average(moving_average(d, first), second)  # noqa: E731
+    halo = first.time_halo(ds.time) + second.time_halo(ds.time)
+    assert halo == 5
+    whole = pipe(ds)
+    chunked = chunk_map_time(ds, pipe, chunk_size=chunk_size, halo=halo)
+    np.testing.assert_allclose(chunked.fields.read("cp"), whole.fields.read("cp"), rtol=1e-12)
+    np.testing.assert_allclose(chunked.time.times(), whole.time.times())
+
+
+def test_halo_windows_stay_inside_the_series_and_trim_back():
+    windows = list(time_windows(10, 4))
+    reads = halo_windows(windows, 10, 3)
+    assert reads == [slice(0, 7), slice(1, 10), slice(5, 10)]
+    ds = _surface(4, 10)
+    part = trim_halo(slice_time(ds, reads[1]), windows[1], reads[1])
+    np.testing.assert_array_equal(part.fields.read("cp"), ds.fields.read("cp")[:, 4:8])
+    np.testing.assert_allclose(part.time.times(), ds.time.times()[4:8])
+    whole = slice_time(ds, slice(0, 4))
+    assert trim_halo(whole, slice(0, 4), slice(0, 4)) is whole
+    with pytest.raises(ValueError, match="halo"):
+        halo_windows(windows, 10, -1)
+
+
 def test_time_windows_cover_all():
     assert list(time_windows(10, 4)) == [slice(0, 4), slice(4, 8), slice(8, 10)]
     assert list(time_windows(8, 4)) == [slice(0, 4), slice(4, 8)]
@@ -105,3 +148,146 @@ def test_assert_time_chunkable():
     # statistics collapses time -> chunkable only along elements, must be rejected
     with pytest.raises(ValueError):
         assert_time_chunkable([StatisticsParams(kinds=["mean"])])
+
+
+def test_element_blocks_cover_all():
+    assert list(element_blocks(7, 3)) == [slice(0, 3), slice(3, 6), slice(6, 7)]
+    with pytest.raises(ValueError):
+        list(element_blocks(7, 0))
+
+
+def test_slice_elements_cuts_every_element_axis():
+    ds = _surface(6, 5)
+    ds = ds.with_elements(ElementMeta(area=np.arange(6.0), annotations={"tag": np.arange(6)}))
+    ds = ds.with_grouping(Grouping(name="g", indices=[0, 0, 1, 1, 2, 2], id_to_label={2: "c"}))
+    block = slice_elements(ds, slice(2, 5))
+    assert block.n_elements == 3
+    assert block.time == ds.time
+    np.testing.assert_array_equal(block.fields.read("cp"), ds.fields.read("cp")[2:5])
+    np.testing.assert_array_equal(block.elements.area, [2.0, 3.0, 4.0])
+    np.testing.assert_array_equal(block.elements.annotations["tag"], [2, 3, 4])
+    np.testing.assert_array_equal(block.groupings["g"].indices, [1, 1, 2])
+    np.testing.assert_array_equal(block.topology.connectivity, ds.topology.connectivity[2:5])
+
+
+def test_concat_elements_roundtrip():
+    ds = _surface(8, 5).with_grouping(Grouping(name="g", indices=np.arange(8) % 3))
+    parts = [slice_elements(ds, sl) for sl in element_blocks(8, 3)]
+    joined = concat_elements(parts)
+    np.testing.assert_array_equal(joined.fields.read("cp"), ds.fields.read("cp"))
+    np.testing.assert_array_equal(joined.topology.connectivity, ds.topology.connectivity)
+    np.testing.assert_array_equal(joined.groupings["g"].indices, ds.groupings["g"].indices)
+    assert concat_elements(parts[:1]) is parts[0]
+
+
+@pytest.mark.parametrize("block_size", [1, 2, 5, None])
+def test_chunk_map_elements_parity_for_a_time_collapsing_op(block_size):
+    from cfdmod.core.ops.data_source_create.statistics import (
+        StatisticsParams,
+        compute_statistics,
+    )
+
+    ds = _surface(6, 40)
+    params = StatisticsParams(kinds=["mean", "rms"], field="cp")
+    pipe = lambda d: compute_statistics(d, params)  # noqa: E731
+    whole = pipe(ds)
+    blocked = chunk_map_elements(ds, pipe, block_size=block_size)
+    for name in whole.field_names:
+        np.testing.assert_allclose(blocked.fields.read(name), whole.fields.read(name))
+
+
+def test_slice_elements_rejects_a_strided_or_empty_block():
+    ds = _surface(6, 5)
+    with pytest.raises(ValueError, match="contiguous"):
+        slice_elements(ds, slice(0, 6, 2))
+    with pytest.raises(ValueError, match="empty"):
+        slice_elements(ds, slice(6, 6))
+
+
+def test_assert_element_chunkable():
+    from cfdmod.core.ops.data_source_create.statistics import StatisticsParams
+
+    assert_element_chunkable(
+        [ScaleParams(field="cp", factor=1.0), StatisticsParams(kinds=["mean"])]
+    )
+    # a group reduction mixes rows -> must be rejected
+    with pytest.raises(ValueError, match="field_series_for_groups"):
+        assert_element_chunkable([FieldSeriesForGroupsParams(grouping="g")])
+
+
+class _WatchedStore(MemoryFieldStore):
+    """Records which thread served each windowed read."""
+
+    def __init__(self, arrays, *, fail_at=None):
+        super().__init__(arrays)
+        self.reads: list[tuple[int, str]] = []
+        self._fail_at = fail_at
+
+    def read(self, name, *, time_slice=None, **kwargs):
+        start = time_slice.start if time_slice is not None else 0
+        if start == self._fail_at:
+            raise OSError("read failed")
+        self.reads.append((start, threading.current_thread().name))
+        return super().read(name, time_slice=time_slice, **kwargs)
+
+
+def _watched(n_t: int, **kwargs) -> tuple[SurfaceDataSource, _WatchedStore]:
+    ds = _surface(4, n_t)
+    store = _WatchedStore({"cp": ds.fields.read("cp")}, **kwargs)
+    return ds.model_copy(update={"fields": store}), store
+
+
+@pytest.mark.parametrize("depth", [0, 1, 3])
+def test_prefetch_windows_yields_every_window_in_order(depth):
+    ds, _ = _watched(10)
+    ref = _surface(4, 1)._copy_validated(
+        time=TimeAxis(initial_time=0.0, timestep_size=0.0, n_timesteps=0),
+        fields=MemoryFieldStore({}),
+    )
+    windows = list(time_windows(10, 3))
+    got = list(prefetch_windows({"body": ds, "ref": ref}, windows, depth))
+    assert len(got) == 4
+    for sl, window in zip(windows, got):
+        assert window["ref"] is ref
+        np.testing.assert_array_equal(
+            window["body"].fields.read("cp"), ds.fields.read("cp")[:, sl]
+        )
+
+
+def test_prefetch_reads_ahead_on_a_background_thread_and_stays_bounded():
+    ds, store = _watched(20)
+    it = prefetch_windows({"body": ds}, list(time_windows(20, 2)), 2)
+    next(it)
+    # The consumer holds window 0; at most two more may have been read.
+    threads = {name for _, name in store.reads}
+    assert threads and all(name.startswith("cfdmod-prefetch") for name in threads)
+    assert max(start for start, _ in store.reads) <= 4
+    it.close()
+
+
+@pytest.mark.parametrize("depth", [1, 2])
+def test_prefetch_reads_exactly_depth_windows_ahead(depth):
+    """What plan_chunking(prefetch=depth) prices: ``depth`` windows beyond the consumed one."""
+    ds, store = _watched(8)
+    it = prefetch_windows({"body": ds}, list(time_windows(8, 1)), depth)
+    for i, _window in enumerate(it):
+        time.sleep(0.05)  # let the background read settle
+        assert max(start for start, _ in store.reads) == min(i + depth, 7)
+    assert len(store.reads) == 8
+
+
+def test_prefetch_surfaces_a_failed_read_at_its_window():
+    ds, _ = _watched(10, fail_at=6)
+    it = prefetch_windows({"body": ds}, list(time_windows(10, 3)), 2)
+    next(it)
+    next(it)
+    with pytest.raises(OSError, match="read failed"):
+        next(it)
+
+
+def test_prefetch_depth_zero_reads_on_the_caller_thread():
+    ds, store = _watched(6)
+    list(prefetch_windows({"body": ds}, list(time_windows(6, 3)), 0))
+    assert [name for _, name in store.reads] == [threading.current_thread().name] * 2
+    with pytest.raises(ValueError, match="non-negative"):
+        next(prefetch_windows({"body": ds}, [], -1))
@@ -0,0 +1,255 @@
+"""Fused, tiled evaluation of elementwise step chains.
+
+A fused chain must return exactly what the steps return one by one -- the
+kernel only changes how much is allocated on the way -- and the runner must
+fuse only what no one else reads.
+"""
+
+from __future__ import annotations
+
+import pathlib
+
+import numpy as np
+import pytest
+from lnas import LnasFormat, LnasGeometry
+from lnas import fmt as lnas_fmt
+
+from cfdmod.adapters.memory import MemoryFieldStore, MemoryStorage
+from cfdmod.core import ElementMeta, SurfaceDataSource, TimeAxis, Topology, fusion
+from cfdmod.core.fusion import FusedGroup, run_fused, tiles
+from cfdmod.core.ops.field import (
+    ForceContributionParams,
+    MomentContributionParams,
+    ScaleParams,
+    SubParams,
+    force_contribution,
+    moment_contribution,
+    scale,
+    sub,
+)
+from cfdmod.core.pipeline_yaml import PipelineTemplate, plan_fusion, run_template
+
+pytestmark = pytest.mark.unit
+
+
+def _surface(n_elements: int, n_timesteps: int, dtype=np.float64, seed: int = 0):
+    rng = np.random.default_rng(seed)
+    verts = rng.random((n_elements * 3, 3))
+    tris = np.arange(n_elements * 3, dtype=np.int32).reshape(n_elements, 3)
+    normal = rng.normal(size=(n_elements, 3))
+    normal /= np.linalg.norm(normal, axis=1, keepdims=True)
+    return SurfaceDataSource(
+        time=TimeAxis(initial_time=0.0, timestep_size=0.1, n_timesteps=n_timesteps),
+        topology=Topology.triangles(tris, verts),
+        elements=ElementMeta(
+            area=rng.random(n_elements) + 0.5,
+            normal=normal,
+            position=rng.random((n_elements, 3)),
+        ),
+        fields=MemoryFieldStore({"pressure": rng.random((n_elements, n_timesteps)).astype(dtype)}),
+    )
+
+
+def _reference(n_timesteps: int, dtype=np.float64) -> SurfaceDataSource:
+    """A single-row, time-resolved reference pressure (``"column"`` broadcast)."""
+    rng = np.random.default_rng(1)
+    return SurfaceDataSource(
+        time=TimeAxis(initial_time=0.0, timestep_size=0.1, n_timesteps=n_timesteps),
+        topology=Topology.triangles(np.array([[0, 1, 2]], dtype=np.int32), np.eye(3)),
+        elements=ElementMeta(),
+        fields=MemoryFieldStore({"pressure": rng.random((1, n_timesteps)).astype(dtype)}),
+    )
+
+
+_SUB = SubParams(field="pressure")
+_SCALE = ScaleParams(field="pressure", factor=1.7, out="cp")
+_FORCE = ForceContributionParams(field="cp", nominal_area=3.0)
+_MOMENT = MomentContributionParams(
+    lever_origin=(0.5, 0.5, 0.0), nominal_area=3.0, nominal_volume=9.0
+)
+
+
+def _unfused(ds, ref):
+    ds = sub(ds, ref, _SUB)
+    ds = scale(ds, _SCALE)
+    ds = force_contribution(ds, _FORCE)
+    return moment_contribution(ds, _MOMENT)
+
+
+@pytest.mark.parametrize(
+    ("n_rows", "n_cols", "tile_values"), [(7, 5, 6), (3, 10_000, 64), (1, 1, 1)]
+)
+def test_tiles_cover_every_value_once(n_rows, n_cols, tile_values):
+    seen = np.zeros((n_rows, n_cols), dtype=int)
+    for tile in tiles(n_rows, n_cols, tile_values):
+        assert tile.shape == (n_rows, n_cols)
+        seen[tile.rows, tile.cols] += 1
+    assert (seen == 1).all()
+
+
+@pytest.mark.parametrize("dtype", [np.float64, np.float32])
+@pytest.mark.parametrize("tile_values", [7, 1 << 15])
+def test_run_fused_matches_the_steps_one_by_one(dtype, tile_values):
+    ds, ref = _surface(13, 11, dtype), _reference(11, dtype)
+    chain = [(_SUB, ref), (_SCALE, None), (_FORCE, None), (_MOMENT, None)]
+
+    fused = run_fused(ds, chain, tile_values=tile_values)
+    expected = _unfused(ds, ref)
+
+    assert set(fused.fields.keys()) == set(expected.fields.keys())
+    for name in expected.fields.keys():
+        got, want = fused.fields.read(name), expected.fields.read(name)
+        assert got.dtype == want.dtype, name
+        np.testing.assert_array_equal(got, want, err_msg=name)
+        assert fused.field_meta[name] == expected.field_meta[name]
+
+
+def test_run_fused_materialises_only_the_kept_fields():
+    ds, ref = _surface(6, 9), _reference(9)
+    chain = [(_SUB, ref), (_SCALE, None), (_FORCE, None), (_MOMENT, None)]
+
+    fused = run_fused(ds, chain, frozenset({"cm_z"}), tile_values=10)
+
+    assert set(fused.fields.keys()) == {"pressure", "cm_z"}
+    np.testing.assert_array_equal(fused.fields.read("cm_z"), _unfused(ds, ref).fields.read("cm_z"))
+
+
+def test_run_fused_declines_a_chain_it_cannot_read():
+    """A missing field is left for the op itself to report."""
+    ds = _surface(4, 6)
+    assert run_fused(ds, [(_FORCE, None), (_MOMENT, None)]) is None
+
+
+def _chain_template(outputs: dict, mesh: str = "body.lnas") -> PipelineTemplate:
+    return PipelineTemplate.model_validate(
+        {
+            "name": "cp_cf_cm",
+            "inputs": {
+                "body": {"kind": "surface", "path": "body", "field": "pressure"},
+                "ref": {"kind": "surface", "path": "ref", "field": "pressure"},
+            },
+            "pipeline": [
+                {"id": "meshed", "kind": "mesh_attach", "source": "body", "mesh": mesh},
+                {
+                    "id": "rel",
+                    "kind": "sub",
+                    "source": "meshed",
+                    "rhs": "ref",
+                    "field": "pressure",
+                },
+                {
+                    "id": "cp",
+                    "kind": "scale",
+                    "source": "rel",
+                    "field": "pressure",
+                    "factor": 1.7,
+                    "out": "cp",
+                },
+                {"id": "cf", "kind": "force_contribution", "source": "cp", "nominal_area": 3.0},
+                {
+                    "id": "cm",
+                    "kind": "moment_contribution",
+                    "source": "cf",
+                    "lever_origin": [0.5, 0.5, 0.0],
+                    "nominal_area": 3.0,
+                    "nominal_volume": 9.0,
+                },
+                {
+                    "id": "stats",
+                    "kind": "statistics",
+                    "source": "cm",
+                    "field": "cm_x",
+                    "kinds": ["mean", "rms"],
+                },
+            ],
+            "outputs": outputs,
+        }
+    )
+
+
+def _storage(n_elements: int = 10, n_timesteps: int = 24) -> MemoryStorage:
+    storage = MemoryStorage()
+    storage.write_data_source("body", _surface(n_elements, n_timesteps))
+    storage.write_data_source("ref", _reference(n_timesteps))
+    return storage
+
+
+def _mesh(tmp_path: pathlib.Path, n_elements: int = 10) -> str:
+    """The mesh of :func:`_surface`, for ``mesh_attach``."""
+    ds = _surface(n_elements, 1)
+    path = tmp_path / "body.lnas"
+    LnasFormat(
+        version=lnas_fmt._CURRENT_VERSION,
+        geometry=LnasGeometry(
+            vertices=ds.topology.vertices.astype(np.float32),
+            triangles=ds.topology.connectivity.astype(np.uint32),
+        ),
+        surfaces={"all": np.arange(n_elements, dtype=np.uint32)},
+    ).to_file(path)
+    return str(path)
+
+
+def test_plan_fusion_groups_the_chain_and_keeps_what_is_read():
+    template = _chain_template({"stats": {"source": "stats", "path": "out/stats"}})
+
+    [group] = plan_fusion(template)
+
+    assert group == FusedGroup(
+        source="meshed",
+        steps=("rel", "cp", "cf", "cm"),
+        kinds=("sub", "scale", "force_contribution", "moment_contribution"),
+        fields=frozenset({"cm_x"}),
+    )
+    assert "rel -> cp -> cf -> cm" in group.describe()
+    assert plan_fusion(template, keep_all=True) == []
+
+
+def test_plan_fusion_stops_at_an_output():
+    template = _chain_template(
+        {
+            "cf": {"source": "cf", "path": "out/cf"},
+            "stats": {"source": "stats", "path": "out/stats"},
+        }
+    )
+
+    groups = plan_fusion(template)
+
+    assert [g.steps for g in groups] == [("rel", "cp", "cf")]
+    assert groups[0].fields is None
+
+
+@pytest.mark.parametrize("chunk_size", [None, 5])
+def test_fused_run_matches_the_unfused_run(chunk_size, tmp_path, monkeypatch):
+    template = _chain_template(
+        {
+            "cm": {"source": "cm", "path": "out/cm"},
+            "stats": {"source": "stats", "path": "out/stats"},
+        },
+        _mesh(tmp_path),
+    )
+    reported: list[list[FusedGroup]] = []
+    kernels: list[bool] = []
+    real_run_fused = fusion.run_fused
+
+    def counting_run_fused(*args, **kwargs):
+        result = real_run_fused(*args, **kwargs)
+        kernels.append(result is not None)
+        return result
+
+    monkeypatch.setattr(fusion, "run_fused", counting_run_fused)
+
+    plain = run_template(template, storage=_storage(), chunk_size=chunk_size)
+    assert kernels == []
+    fused = run_template(
+        template, storage=_storage(), chunk_size=chunk_size, fuse=True, on_fuse=reported.append
+    )
+
+    [groups] = reported
+    assert [g.steps for g in groups] == [("rel", "cp", "cf", "cm")]
+    # One kernel per window, none of which fell back to stepping.
+    assert kernels == [True] * (1 if chunk_size is None else 5)
+    for name in ("cm", "stats"):
+        for field in plain[name].fields.keys():
+            np.testing.assert_array_equal(
+                fused[name].fields.read(field), plain[name].fields.read(field), err_msg=field
+            )
@@ -3,8 +3,10 @@
 from __future__ import annotations
 
 import numpy as np
+import pytest
 
 from cfdmod.core import Grouping, elements_in_group, groups_in
+from cfdmod.core.grouping import GroupReducer, aggregate_rows, group_rows
 
 
 def test_groups_in_excludes_ungrouped_by_default():
@@ -29,3 +31,57 @@ def test_label_resolves_via_id_to_label_or_falls_back():
     assert g.label(0) == "front"
     assert g.label(2) == "back"
     assert g.label(1) == "1"
+
+
+def test_group_rows_matches_ids_in_any_order():
+    rows = group_rows(np.array([5, 10**9, -1, 3, 4]), np.array([10**9, 3, 5]))
+    assert np.array_equal(rows, [2, 0, -1, 1, -1])
+    assert np.array_equal(group_rows(np.array([0, 1]), np.array([], dtype=int)), [-1, -1])
+
+
+@pytest.mark.parametrize("agg", ["sum", "mean", "min", "max", "area_weighted_mean"])
+@pytest.mark.parametrize("dtype", [np.float64, np.float32])
+@pytest.mark.parametrize("shape", [(300,), (300, 7), (300, 40)])
+def test_group_reducer_matches_per_group_aggregation(agg, dtype, shape):
+    rng = np.random.default_rng(3)
+    g = Grouping(name="zones", indices=rng.integers(-1, 25, size=300) * 3)
+    area = rng.uniform(0.1, 2.0, size=300)
+    arr = rng.normal(size=shape).astype(dtype)
+
+    got = GroupReducer.for_grouping(g).reduce(arr, agg, area)
+    expected = np.stack(
+        [
+            np.asarray(aggregate_rows(arr, elements_in_group(g, gid), agg, area))
+            for gid in groups_in(g)
+        ]
+    )
+
+    assert got.dtype == dtype
+    assert got.shape == (groups_in(g).size,) + shape[1:]
+    np.testing.assert_allclose(
+        got, expected, rtol=1e-5 if dtype == np.float32 else 1e-12, atol=1e-6
+    )
+
+
+def test_group_reducer_empty_groups():
+    g = Grouping(name="zones", indices=[0, 0, 2, 2])
+    reducer = GroupReducer.for_grouping(g, np.arange(3))
+    arr = np.array([1.0, 3.0, 5.0, 7.0])
+
+    assert np.array_equal(reducer.counts, [2, 0, 2])
+    assert np.array_equal(reducer.reduce(arr, "sum"), [4.0, 0.0, 12.0])
+    mean = reducer.reduce(arr, "mean")
+    assert np.isnan(mean[1]) and mean[0] == 2.0 and mean[2] == 6.0
+    with pytest.raises(ValueError, match="empty group"):
+        reducer.reduce(arr, "max")
+    with pytest.raises(ValueError, match="non-positive"):
+        reducer.reduce(arr, "area_weighted_mean", np.ones(4))
+    with pytest.raises(ValueError, match="requires per-element weights"):
+        reducer.reduce(arr, "area_weighted_mean")
+
+
+def test_group_reducer_weight_matrix_is_groups_by_elements():
+    g = Grouping(name="zones", indices=[1, -1, 1, 4])
+    matrix = GroupReducer.for_grouping(g).weight_matrix("mean")
+    assert matrix.shape == (2, 4)
+    assert np.array_equal(matrix.toarray(), [[0.5, 0.0, 0.5, 0.0], [0.0, 0.0, 0.0, 1.0]])
@@ -79,6 +79,7 @@ def test_plan_rejects_both_knobs():
         ({"n_live_arrays": 0}, "n_live_arrays must be at least 1"),
         ({"safety_factor": 0}, "safety_factor must be in"),
         ({"safety_factor": 1.5}, "safety_factor must be in"),
+        ({"prefetch": -1}, "prefetch must be non-negative"),
     ],
 )
 def test_plan_rejects_degenerate_inputs(kwargs, match):
@@ -105,6 +106,64 @@ def test_describe_reports_windows_and_the_budget_overrun():
     assert "BUDGET EXCEEDED" in tight.describe()
 
 
+def test_prefetched_windows_shrink_a_budgeted_window():
+    # 1 live array + 2 prefetched windows of 3 inputs = 7 float32 columns per
+    # step; 0.8 MB spendable / (1000 x 4 B x 7) = 28 steps.
+    plain = plan_chunking(1000, 10_000, budget_bytes=1_000_000, n_live_arrays=1)
+    ahead = plan_chunking(
+        1000, 10_000, budget_bytes=1_000_000, n_live_arrays=1, prefetch=2, n_prefetch_arrays=3
+    )
+    assert plain.chunk_size == 200
+    assert ahead.chunk_size == 28
+    assert ahead.estimated_peak_bytes == 1000 * 4 * 7 * 28
+    assert (ahead.prefetch, ahead.n_prefetch_arrays) == (2, 3)
+    assert "2 prefetched" in ahead.describe()
+    assert plan_chunking(1000, 100, chunk_size=10, n_prefetch_arrays=3).n_prefetch_arrays == 0
+
+
+def test_halo_shrinks_a_budgeted_window_by_the_overlap():
+    # 0.8 MB / (1000 x 4 B) = 200 steps per window, less 2 x 15 read either side.
+    plan = plan_chunking(1000, 10_000, budget_bytes=1_000_000, halo=15)
+    assert plan.chunk_size == 170
+    assert plan.estimated_peak_bytes == 1000 * 4 * 200
+    assert "halo 15" in plan.describe()
+    # The whole series has nothing to overlap.
+    whole = plan_chunking(1000, 100, budget_bytes=1_000_000, halo=15)
+    assert (whole.chunk_size, whole.halo) == (100, 0)
+    with pytest.raises(ValueError, match="halo"):
+        plan_chunking(10, 10, halo=-1)
+
+
+def test_element_plan_swaps_the_axes():
+    # One element row = 10_000 steps x 4 B x 2 live arrays = 80 kB;
+    # 8 MB x 0.8 / 80 kB = 80 elements per block.
+    plan = plan_chunking(1000, 10_000, budget_bytes=8_000_000, n_live_arrays=2, axis="elements")
+    assert (plan.axis, plan.chunk_size) == ("elements", 80)
+    assert plan.is_chunked
+    assert plan.estimated_peak_bytes == 10_000 * 4 * 2 * 80
+    assert "80 elements x 13 blocks" in plan.describe()
+    whole = plan_chunking(10, 10_000, budget_bytes=10**9, axis="elements")
+    assert (whole.chunk_size, whole.is_chunked) == (10, False)
+    assert "element chunking: off" in whole.describe()
+    explicit = plan_chunking(100, 50, chunk_size=500, axis="elements")
+    assert (explicit.chunk_size, explicit.clamped) == (100, True)
+    with pytest.raises(ValueError, match="no prefetch or halo"):
+        plan_chunking(100, 50, halo=2, axis="elements")
+
+
+def test_concurrent_windows_share_the_budget():
+    # 0.8 MB / (1000 x 4 B) = 200 steps alone; four windows in flight get 50.
+    plan = plan_chunking(1000, 10_000, budget_bytes=1_000_000, concurrent=4)
+    assert (plan.chunk_size, plan.concurrent) == (50, 4)
+    assert plan.estimated_peak_bytes == 1000 * 4 * 50 * 4
+    assert "4 concurrent" in plan.describe()
+    # A series that fits in one pass runs alone.
+    whole = plan_chunking(1000, 100, budget_bytes=1_000_000, concurrent=4)
+    assert (whole.is_chunked, whole.concurrent) == (False, 1)
+    with pytest.raises(ValueError, match="concurrent"):
+        plan_chunking(10, 10, concurrent=0)
+
+
 def test_chunk_plan_is_frozen():
     plan = plan_chunking(10, 10)
     assert isinstance(plan, ChunkPlan)
@@ -0,0 +1,50 @@
+"""Opt-in benchmark: batched Gumbel engine vs the per-element scipy fit.
+
+Runs with ``pytest -m perf``. ``extreme_value(method="gumbel")`` used to run
+:func:`gumbel_extreme_value_1d` -- a scipy convolution, an ``array_split``
+and a ``gumbel_r.fit`` root-find -- once per element. At 10k elements the
+loop is timed in full; at 100k it is timed on a 2k-element sample and
+scaled, since the loop is linear in elements and would take minutes. Both
+engines see the same rows, so the check that they agree comes for free.
+"""
+
+from __future__ import annotations
+
+import time
+
+import numpy as np
+import pytest
+
+from cfdmod.core.ops.data_source_create.extreme_value import (
+    gumbel_extreme_value_1d,
+    gumbel_extreme_value_2d,
+)
+
+pytestmark = [pytest.mark.perf, pytest.mark.integration]
+
+N_TIMESTEPS = 1000
+LOOP_SAMPLE = 2_000
+PARAMS = dict(dt=0.01, peak_duration=0.03, event_duration=600.0, extreme_type="max")
+
+
+@pytest.mark.parametrize("n_elements", [10_000, 100_000])
+def test_batched_gumbel_beats_the_per_element_loop(n_elements):
+    rng = np.random.default_rng(0)
+    values = (rng.normal(size=(n_elements, N_TIMESTEPS)) - 1.0).astype(np.float32)
+
+    start = time.perf_counter()
+    batched = gumbel_extreme_value_2d(values, **PARAMS)
+    fast = time.perf_counter() - start
+
+    sample = values[: n_elements if n_elements <= 10_000 else LOOP_SAMPLE]
+    start = time.perf_counter()
+    looped = np.array([gumbel_extreme_value_1d(row, **PARAMS) for row in sample])
+    slow = (time.perf_counter() - start) * n_elements / len(sample)
+
+    print(
+        f"\n{n_elements} elements: batched {fast:.2f} s, "
+        f"per-element {slow:.1f} s{' (scaled)' if len(sample) < n_elements else ''}, "
+        f"{slow / fast:.0f}x"
+    )
+    np.testing.assert_allclose(batched[: len(sample)], looped, rtol=1e-6)
+    assert fast < slow / 5
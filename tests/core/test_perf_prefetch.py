@@ -0,0 +1,90 @@
+"""Opt-in benchmark: read-ahead overlaps window I/O with window compute.
+
+Runs with ``pytest -m perf``. The input sits behind a field store that adds
+a fixed latency to every windowed read -- the shape of a network filesystem
+or object store, where the wait is not CPU work and releases the GIL. The
+latency is calibrated to the measured compute time of one window, so I/O
+and compute cost about the same, which is where read-ahead matters most:
+serially a run costs ``I + C`` per window, overlapped ``max(I, C)``.
+"""
+
+from __future__ import annotations
+
+import time
+
+import numpy as np
+import pytest
+
+from cfdmod.adapters.memory import MemoryFieldStore, MemoryStorage
+from cfdmod.core import ElementMeta, SurfaceDataSource, TimeAxis, Topology
+from cfdmod.core.pipeline_yaml import PipelineTemplate, run_template
+
+pytestmark = [pytest.mark.perf, pytest.mark.integration]
+
+N_ELEMENTS = 50_000
+N_TIMESTEPS = 400
+CHUNK = 20
+
+
+class _SlowStore(MemoryFieldStore):
+    latency = 0.0
+
+    def read(self, name, *, time_slice=None, **kwargs):
+        if time_slice is not None:
+            time.sleep(self.latency)
+        return super().read(name, time_slice=time_slice, **kwargs)
+
+
+def _template() -> PipelineTemplate:
+    steps = []
+    source = "body"
+    for i in range(8):
+        steps.append(
+            {
+                "id": f"s{i}",
+                "kind": "scale",
+                "source": source,
+                "field": "pressure",
+                "factor": 1.01,
+            }
+        )
+        source = f"s{i}"
+    return PipelineTemplate.model_validate(
+        {
+            "inputs": {"body": {"kind": "surface", "path": "body"}},
+            "pipeline": steps,
+            "outputs": {"out": {"source": source, "path": "out", "persist": False}},
+        }
+    )
+
+
+def _run(store: _SlowStore, prefetch: int) -> float:
+    ds = SurfaceDataSource(
+        time=TimeAxis(initial_time=0.0, timestep_size=0.1, n_timesteps=N_TIMESTEPS),
+        topology=Topology.triangles(np.zeros((N_ELEMENTS, 3), dtype=np.int32), np.zeros((1, 3))),
+        elements=ElementMeta(),
+        fields=store,
+    )
+    storage = MemoryStorage()
+    storage.write_data_source("body", ds)
+    start = time.perf_counter()
+    run_template(_template(), storage=storage, chunk_size=CHUNK, prefetch=prefetch)
+    return time.perf_counter() - start
+
+
+def test_prefetch_hides_read_latency():
+    store = _SlowStore({"pressure": np.random.default_rng(0).random((N_ELEMENTS, N_TIMESTEPS))})
+    n_windows = N_TIMESTEPS // CHUNK
+    compute = _run(store, prefetch=0)
+    store.latency = compute / n_windows
+
+    serial = _run(store, prefetch=0)
+    overlapped = _run(store, prefetch=1)
+    print(
+        f"\ncompute {compute:.2f}s, serial {serial:.2f}s, prefetch=1 {overlapped:.2f}s "
+        f"({serial / overlapped:.2f}x)"
+    )
+    # Ideal is 2x. The first read and the final concatenation are not hidden,
+    # and the reader's copy competes with compute for memory bandwidth;
+    # measured ~1.4x here.
+    assert overlapped < 0.8 * serial
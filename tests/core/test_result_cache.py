@@ -0,0 +1,107 @@
+"""Persistent per-key result cache: reuse while the inputs hold, miss when not."""
+
+from __future__ import annotations
+
+import numpy as np
+import pytest
+from pydantic import BaseModel
+
+from cfdmod.adapters.memory import MemoryFieldStore, MemoryStorage
+from cfdmod.core import ElementMeta, PointsDataSource, ResultCache, TimeAxis, Topology
+from cfdmod.core.result_cache import map_cached
+
+pytestmark = pytest.mark.unit
+
+
+class _Key(BaseModel, frozen=True):
+    direction: str
+
+
+def _points(values) -> PointsDataSource:
+    values = np.atleast_2d(np.asarray(values, dtype=np.float64))
+    return PointsDataSource(
+        time=TimeAxis(initial_time=0.0, timestep_size=1.0, n_timesteps=values.shape[1]),
+        topology=Topology.points(np.zeros((values.shape[0], 3))),
+        elements=ElementMeta(),
+        fields=MemoryFieldStore({"u": values}),
+    )
+
+
+class _Solve:
+    """Doubles the key's input; records the keys it was called for."""
+
+    def __init__(self, storage: MemoryStorage) -> None:
+        self.storage = storage
+        self.calls: list[str] = []
+
+    def __call__(self, key: _Key) -> PointsDataSource:
+        self.calls.append(key.direction)
+        u = np.asarray(self.storage.read_data_source(f"in/{key.direction}").fields.read("u"))
+        return _points(2 * u)
+
+
+def _setup(params=None):
+    storage = MemoryStorage()
+    for d in ("0", "90", "180"):
+        storage.write_data_source(f"in/{d}", _points([[float(d), 1.0]]))
+    cache = ResultCache(storage, inputs=lambda k: [f"in/{k.direction}"], params=params)
+    return storage, cache, _Solve(storage)
+
+
+def test_hit_after_put_and_miss_before():
+    storage, cache, solve = _setup()
+    key = _Key(direction="90")
+
+    assert cache.get(key) is None
+    cache.put(key, solve(key))
+
+    hit = cache.get(key)
+    assert hit is not None
+    np.testing.assert_array_equal(hit.fields.read("u"), [[180.0, 2.0]])
+    assert cache.missing([_Key(direction=d) for d in ("0", "90")]) == [_Key(direction="0")]
+
+
+def test_an_edited_input_invalidates_only_its_key():
+    storage, cache, solve = _setup()
+    keys = [_Key(direction="0"), _Key(direction="90")]
+    map_cached(keys, solve, cache)
+
+    storage.write_data_source("in/90", _points([[5.0, 5.0]]))
+    solve.calls.clear()
+    results = map_cached(keys, solve, cache)
+
+    assert solve.calls == ["90"]
+    np.testing.assert_array_equal(results[1].fields.read("u"), [[10.0, 10.0]])
+
+
+def test_changed_params_miss():
+    storage, cache, solve = _setup(params={"xi": 0.02})
+    key = _Key(direction="0")
+    cache.put(key, solve(key))
+
+    other = ResultCache(storage, inputs=cache.inputs, params={"xi": 0.01})
+
+    assert cache.get(key) is not None
+    assert other.get(key) is None
+
+
+def test_a_missing_input_is_never_a_hit():
+    storage, cache, solve = _setup()
+    key = _Key(direction="270")
+    cache.put(key, _points([[1.0]]))
+
+    assert cache.get(key) is None
+
+
+def test_map_cached_resumes_and_keeps_key_order():
+    storage, cache, solve = _setup()
+    first = [_Key(direction="0"), _Key(direction="90")]
+    map_cached(first, solve, cache)
+
+    solve.calls.clear()
+    keys = [_Key(direction="180"), *first]
+    results = map_cached(keys, solve, cache)
+
+    assert solve.calls == ["180"]
+    for key, result in zip(keys, results):
+        np.testing.assert_array_equal(result.fields.read("u"), [[2 * float(key.direction), 2.0]])
@@ -10,10 +10,14 @@ must fall.
 
 from __future__ import annotations
 
+import importlib
+import threading
 import tracemalloc
 
 import numpy as np
 import pytest
+from lnas import LnasFormat, LnasGeometry
+from lnas import fmt as lnas_fmt
 
 from cfdmod.adapters.memory import MemoryFieldStore, MemoryStorage
 from cfdmod.core import ElementMeta, Grouping, SurfaceDataSource, TimeAxis, Topology
@@ -133,23 +137,208 @@ def test_on_plan_fires_even_when_not_chunking():
     assert plan.estimated_peak_bytes > 0
 
 
-def test_statistics_cannot_be_chunked_and_says_so():
-    """Windowed statistics are not the statistics of the series.
+def test_moving_average_chunks_with_overlapping_windows():
+    """The runner sums the chain's halos on the axes the steps see, and overlaps by it."""
+    template = PipelineTemplate.model_validate(
+        {
+            "name": "smoothed",
+            "inputs": {"body": {"kind": "surface", "path": "body", "field": "pressure"}},
+            "pipeline": [
+                {"id": "fast", "kind": "time_rescale", "source": "body", "factor": 0.5},
+                {
+                    "id": "ma",
+                    "kind": "moving_average",
+                    "source": "fast",
+                    "field": "pressure",
+                    "window": 0.35,
+                },
+                {
+                    "id": "ma2",
+                    "kind": "moving_average",
+                    "source": "ma",
+                    "field": "pressure",
+                    "window": 0.5,
+                    "out": "smooth",
+                },
+            ],
+            "outputs": {"smooth": {"source": "ma2", "path": "out/smooth"}},
+        }
+    )
+    ds = _surface(20, 203)
+    plans: list[ChunkPlan] = []
+    whole = run_template(template, storage=_storage_with(ds))
+    windowed = run_template(
+        template, storage=_storage_with(ds), chunk_size=17, on_plan=plans.append
+    )
 
-    `statistics` declares chunkability along elements, not time, so asking for
-    a chunked run must fail loudly rather than return plausible wrong numbers.
-    """
+    # dt 0.1 -> 0.05: 7 samples (halo 3), then 11 samples (halo 5).
+    assert plans[0].halo == 8
+    np.testing.assert_allclose(
+        windowed["ma2"].fields.read("smooth"), whole["ma2"].fields.read("smooth"), rtol=1e-6
+    )
+    np.testing.assert_allclose(windowed["ma2"].time.times(), whole["ma2"].time.times())
+
+
+def test_geometry_is_prepared_once_per_chunked_run(monkeypatch, tmp_path):
+    """mesh_attach + face_cut load and slice the mesh on the first window only."""
+    face_cut_module = importlib.import_module("cfdmod.core.ops.data_source_create.face_cut")
+    calls: list[int] = []
+    real_slice = face_cut_module.slice_triangles_with_parents
+
+    def counting_slice(*args, **kwargs):
+        calls.append(1)
+        return real_slice(*args, **kwargs)
+
+    monkeypatch.setattr(face_cut_module, "slice_triangles_with_parents", counting_slice)
+
+    ds = _surface(30, 60)
+    mesh = tmp_path / "body.lnas"
+    LnasFormat(
+        version=lnas_fmt._CURRENT_VERSION,
+        geometry=LnasGeometry(
+            vertices=ds.topology.vertices.astype(np.float32),
+            triangles=ds.topology.connectivity.astype(np.uint32),
+        ),
+        surfaces={"all": np.arange(30, dtype=np.uint32)},
+    ).to_file(mesh)
     template = PipelineTemplate.model_validate(
+        {
+            "name": "floors",
+            "inputs": {"body": {"kind": "surface", "path": "body", "field": "pressure"}},
+            "pipeline": [
+                {"id": "meshed", "kind": "mesh_attach", "source": "body", "mesh": str(mesh)},
+                {
+                    "id": "cut",
+                    "kind": "face_cut",
+                    "source": "meshed",
+                    "z_intervals": [0.0, 0.5, 1.0],
+                },
+                {
+                    "id": "floors",
+                    "kind": "field_series_for_groups",
+                    "source": "cut",
+                    "grouping": "floor",
+                    "field": "pressure",
+                    "agg": "area_weighted_mean",
+                },
+            ],
+            "outputs": {},
+        }
+    )
+
+    whole = run_template(template, storage=_storage_with(ds))
+    assert len(calls) == 1
+    windowed = run_template(template, storage=_storage_with(ds), chunk_size=7)
+
+    assert len(calls) == 2
+    np.testing.assert_allclose(
+        windowed["floors"].fields.read("pressure"),
+        whole["floors"].fields.read("pressure"),
+        rtol=1e-6,
+    )
+    assert windowed["cut"].topology is not None
+    np.testing.assert_array_equal(
+        windowed["cut"].topology.connectivity, whole["cut"].topology.connectivity
+    )
+
+
+def _stats_template(kinds: list[str]) -> PipelineTemplate:
+    """Cp -> stats, plus a step that reads the statistics."""
+    return PipelineTemplate.model_validate(
         {
             "name": "with_stats",
             "inputs": {"body": {"kind": "surface", "path": "body", "field": "pressure"}},
             "pipeline": [
+                {
+                    "id": "cp",
+                    "kind": "scale",
+                    "source": "body",
+                    "field": "pressure",
+                    "factor": 800.0,
+                    "out": "cp",
+                },
                 {
                     "id": "stats",
                     "kind": "statistics",
+                    "source": "cp",
+                    "field": "cp",
+                    "kinds": kinds,
+                },
+                {
+                    "id": "mean_scaled",
+                    "kind": "scale",
+                    "source": "stats",
+                    "field": "mean",
+                    "factor": 2.0,
+                    "out": "mean2",
+                },
+            ],
+            "outputs": {
+                "stats": {"source": "stats", "path": "out/stats"},
+                "mean_scaled": {"source": "mean_scaled", "path": "out/mean2"},
+            },
+        }
+    )
+
+
+def test_statistics_fold_across_windows():
+    """Windowed statistics are not the statistics of the series -- folded ones are.
+
+    `statistics` folds each window into mergeable moments and finishes once, so
+    a chunked Cp -> stats run returns the statistics of the whole record, and a
+    step reading them runs once after the last window.
+    """
+    kinds = ["mean", "rms", "min", "max", "skewness", "kurtosis"]
+    ds = _surface(30, 97)
+    whole = run_template(_stats_template(kinds), storage=_storage_with(ds))
+    windowed = run_template(_stats_template(kinds), storage=_storage_with(ds), chunk_size=8)
+
+    assert windowed["stats"].time.is_time_aggregated
+    for kind in kinds:
+        np.testing.assert_allclose(
+            windowed["stats"].fields.read(kind),
+            whole["stats"].fields.read(kind),
+            rtol=1e-6,
+            err_msg=kind,
+        )
+    np.testing.assert_allclose(
+        windowed["mean_scaled"].fields.read("mean2"),
+        2.0 * windowed["stats"].fields.read("mean"),
+    )
+
+
+def test_statistics_runs_under_a_memory_budget():
+    ds = _surface(1000, 400)
+    storage = _storage_with(ds)
+    plans: list[ChunkPlan] = []
+    run_template(
+        _stats_template(["mean", "rms"]),
+        storage=storage,
+        memory_budget=1_000_000,
+        on_plan=plans.append,
+    )
+    assert plans[0].is_chunked
+    stats = storage.read_data_source("out/stats")
+    cp = 800.0 * ds.fields.read("pressure").astype(np.float64)
+    np.testing.assert_allclose(stats.fields.read("mean"), cp.mean(axis=1), rtol=1e-6)
+    np.testing.assert_allclose(stats.fields.read("rms"), cp.std(axis=1), rtol=1e-5)
+
+
+def test_time_collapsing_op_that_cannot_fold_is_rejected():
+    """`extreme_value` has no mergeable form; chunking it must fail loudly."""
+    template = PipelineTemplate.model_validate(
+        {
+            "name": "with_peaks",
+            "inputs": {"body": {"kind": "surface", "path": "body", "field": "pressure"}},
+            "pipeline": [
+                {
+                    "id": "peaks",
+                    "kind": "extreme_value",
                     "source": "body",
                     "field": "pressure",
-                    "kinds": ["mean", "rms"],
+                    "method": "peak_factor",
+                    "extreme_type": "max",
+                    "peak_factor": 3.0,
                 },
             ],
             "outputs": {},
@@ -165,15 +354,17 @@ def test_unchunkable_template_is_rejected_before_any_step_runs():
 
     template = PipelineTemplate.model_validate(
         {
-            "name": "with_stats",
+            "name": "with_peaks",
             "inputs": {"body": {"kind": "surface", "path": "body", "field": "pressure"}},
             "pipeline": [
                 {
-                    "id": "stats",
-                    "kind": "statistics",
+                    "id": "peaks",
+                    "kind": "extreme_value",
                     "source": "body",
                     "field": "pressure",
-                    "kinds": ["mean"],
+                    "method": "peak_factor",
+                    "extreme_type": "max",
+                    "peak_factor": 3.0,
                 },
             ],
             "outputs": {},
@@ -193,6 +384,226 @@ def test_unchunkable_template_is_rejected_before_any_step_runs():
     assert calls == ["body"]
 
 
+def _peaks_template() -> PipelineTemplate:
+    return PipelineTemplate.model_validate(
+        {
+            "name": "peaks",
+            "inputs": {"body": {"kind": "surface", "path": "body", "field": "pressure"}},
+            "pipeline": [
+                {
+                    "id": "cp",
+                    "kind": "scale",
+                    "source": "body",
+                    "field": "pressure",
+                    "factor": 800.0,
+                    "out": "cp",
+                },
+                {
+                    "id": "peaks",
+                    "kind": "extreme_value",
+                    "source": "cp",
+                    "field": "cp",
+                    "method": "peak_factor",
+                    "extreme_type": "max",
+                    "peak_factor": 3.0,
+                },
+            ],
+            "outputs": {"peaks": {"source": "peaks", "path": "out/peaks"}},
+        }
+    )
+
+
+@pytest.mark.parametrize("element_chunk", [1, 7, 30])
+def test_element_blocks_agree_with_a_single_pass(element_chunk):
+    """A time-collapsing op that cannot be windowed runs over element blocks."""
+    ds = _surface(30, 64)
+    whole = run_template(_peaks_template(), storage=_storage_with(ds))
+    plans: list[ChunkPlan] = []
+    blocked = run_template(
+        _peaks_template(),
+        storage=_storage_with(ds),
+        element_chunk=element_chunk,
+        on_plan=plans.append,
+    )
+    assert plans[0].axis == "elements"
+    assert plans[0].is_chunked == (element_chunk < 30)
+    for name in whole["peaks"].field_names:
+        np.testing.assert_array_equal(
+            blocked["peaks"].fields.read(name), whole["peaks"].fields.read(name)
+        )
+    np.testing.assert_array_equal(
+        blocked["peaks"].topology.connectivity, whole["peaks"].topology.connectivity
+    )
+
+
+def test_statistics_over_element_blocks():
+    kinds = ["mean", "rms", "max"]
+    ds = _surface(30, 97)
+    whole = run_template(_stats_template(kinds), storage=_storage_with(ds))
+    blocked = run_template(_stats_template(kinds), storage=_storage_with(ds), element_chunk=8)
+    for kind in kinds:
+        np.testing.assert_array_equal(
+            blocked["stats"].fields.read(kind), whole["stats"].fields.read(kind)
+        )
+    np.testing.assert_array_equal(
+        blocked["mean_scaled"].fields.read("mean2"), whole["mean_scaled"].fields.read("mean2")
+    )
+
+
+def test_auto_axis_spends_the_budget_on_whichever_axis_can_be_cut():
+    ds = _surface(1000, 400)
+    plans: list[ChunkPlan] = []
+    # extreme_value cannot be windowed, so the budget goes to element blocks...
+    run_template(
+        _peaks_template(),
+        storage=_storage_with(ds),
+        memory_budget=1_000_000,
+        chunk_axis="auto",
+        on_plan=plans.append,
+    )
+    # ...while a time-preserving chain keeps its streaming time windows.
+    run_template(
+        _scaling_template(),
+        storage=_storage_with(ds),
+        memory_budget=1_000_000,
+        chunk_axis="auto",
+        on_plan=plans.append,
+    )
+    assert [(p.axis, p.is_chunked) for p in plans] == [("elements", True), ("time", True)]
+
+
+def test_element_chunking_rejects_an_op_that_mixes_rows():
+    template = PipelineTemplate.model_validate(
+        {
+            "name": "grouped",
+            "inputs": {"body": {"kind": "surface", "path": "body", "field": "pressure"}},
+            "pipeline": [
+                {
+                    "id": "series",
+                    "kind": "field_series_for_groups",
+                    "source": "body",
+                    "grouping": "g",
+                    "field": "pressure",
+                },
+            ],
+            "outputs": {},
+        }
+    )
+    ds = _surface(8, 16).with_grouping(Grouping(name="g", indices=np.arange(8) % 2))
+    with pytest.raises(TemplateError, match="chunked over elements"):
+        run_template(template, storage=_storage_with(ds), element_chunk=4)
+    with pytest.raises(ValueError, match="one of"):
+        run_template(template, storage=_storage_with(ds), element_chunk=4, chunk_size=4)
+
+
+class _SerialPool:
+    """A ``Pool`` that records its batches and runs them in order."""
+
+    def __init__(self) -> None:
+        self.batches: list[list[int]] = []
+
+    def map(self, func, iterable):
+        items = list(iterable)
+        self.batches.append(items)
+        return [func(item) for item in items]
+
+
+def test_pool_runs_windows_in_batches_and_agrees_with_a_serial_run():
+    ds = _surface(40, 96)
+    whole = run_template(_scaling_template(), storage=_storage_with(ds))
+    pool = _SerialPool()
+    plans: list[ChunkPlan] = []
+    pooled = run_template(
+        _scaling_template(),
+        storage=_storage_with(ds),
+        chunk_size=10,
+        pool=pool,
+        pool_size=4,
+        on_plan=plans.append,
+    )
+    assert plans[0].concurrent == 4
+    assert pool.batches == [[0, 1, 2, 3], [4, 5, 6, 7], [8, 9]]
+    np.testing.assert_array_equal(
+        pooled["smoothed"].fields.read("cp_half"), whole["smoothed"].fields.read("cp_half")
+    )
+
+
+def test_statistics_folds_merge_across_pooled_windows():
+    from multiprocessing.pool import ThreadPool
+
+    kinds = ["mean", "rms", "min", "max", "skewness", "kurtosis"]
+    ds = _surface(30, 97)
+    whole = run_template(_stats_template(kinds), storage=_storage_with(ds))
+    with ThreadPool(3) as pool:
+        pooled = run_template(
+            _stats_template(kinds),
+            storage=_storage_with(ds),
+            chunk_size=8,
+            pool=pool,
+            pool_size=3,
+        )
+    for kind in kinds:
+        np.testing.assert_allclose(
+            pooled["stats"].fields.read(kind),
+            whole["stats"].fields.read(kind),
+            rtol=1e-6,
+            err_msg=kind,
+        )
+    np.testing.assert_allclose(
+        pooled["mean_scaled"].fields.read("mean2"), whole["mean_scaled"].fields.read("mean2")
+    )
+
+
+def test_pool_runs_element_blocks():
+    ds = _surface(30, 64)
+    whole = run_template(_peaks_template(), storage=_storage_with(ds))
+    pool = _SerialPool()
+    pooled = run_template(
+        _peaks_template(), storage=_storage_with(ds), element_chunk=7, pool=pool, pool_size=2
+    )
+    assert pool.batches == [[0, 1], [2, 3], [4]]
+    for name in whole["peaks"].field_names:
+        np.testing.assert_array_equal(
+            pooled["peaks"].fields.read(name), whole["peaks"].fields.read(name)
+        )
+
+
+def test_pooled_windows_cross_a_process_boundary():
+    """Tasks must pickle: a real process pool is what the option is for."""
+    import multiprocessing
+
+    ds = _surface(12, 40)
+    whole = run_template(_scaling_template(), storage=_storage_with(ds))
+    with multiprocessing.get_context("spawn").Pool(2) as pool:
+        pooled = run_template(
+            _scaling_template(), storage=_storage_with(ds), chunk_size=10, pool=pool, pool_size=2
+        )
+    np.testing.assert_array_equal(
+        pooled["smoothed"].fields.read("cp_half"), whole["smoothed"].fields.read("cp_half")
+    )
+
+
+def test_pool_and_prefetch_are_exclusive():
+    with pytest.raises(ValueError, match="exclusive"):
+        run_template(
+            _scaling_template(),
+            storage=_storage_with(_surface(8, 16)),
+            chunk_size=4,
+            pool=_SerialPool(),
+            prefetch=1,
+        )
+
+
+def test_pool_requires_pool_size():
+    with pytest.raises(ValueError, match="pool_size"):
+        run_template(
+            _scaling_template(),
+            storage=_storage_with(_surface(8, 16)),
+            chunk_size=4,
+            pool=_SerialPool(),
+        )
+
+
 def test_single_timestep_source_is_never_chunked():
     ds = _surface(8, 1)
     plans: list[ChunkPlan] = []
@@ -289,3 +700,51 @@ def test_chunking_lowers_the_peak_allocation():
         f"chunked peak {windowed_peak / 1e6:.1f} MB exceeded the whole field "
         f"({field_bytes / 1e6:.1f} MB)"
     )
+
+
+def test_prefetch_overlaps_the_next_read_with_this_window():
+    """Window 1 is read while window 0 is still being computed."""
+    ds = _surface(40, 30)
+    second_read = threading.Event()
+
+    class _Store(MemoryFieldStore):
+        def read(self, name, *, time_slice=None, **kwargs):
+            if time_slice is not None and time_slice.start == 10:
+                second_read.set()
+            return super().read(name, time_slice=time_slice, **kwargs)
+
+    body = ds.model_copy(update={"fields": _Store({"pressure": ds.fields.read("pressure")})})
+    overlapped: list[bool] = []
+
+    def on_progress(event):
+        # Runs inside window 0's step, i.e. while it computes.
+        if event.phase == "step" and event.window == 0 and event.name == "scaled":
+            overlapped.append(second_read.wait(timeout=10))
+
+    whole = run_template(_scaling_template(), storage=_storage_with(ds))
+    ahead = run_template(
+        _scaling_template(),
+        storage=_storage_with(body),
+        chunk_size=10,
+        prefetch=1,
+        on_progress=on_progress,
+    )
+    assert overlapped == [True]
+    np.testing.assert_array_equal(
+        ahead["smoothed"].fields.read("cp_half"), whole["smoothed"].fields.read("cp_half")
+    )
+
+
+def test_prefetch_is_priced_into_a_budgeted_plan():
+    plans: list[ChunkPlan] = []
+    for prefetch in (0, 2):
+        run_template(
+            _scaling_template(),
+            storage=_storage_with(_surface(1000, 200)),
+            memory_budget=1_000_000,
+            prefetch=prefetch,
+            on_plan=plans.append,
+        )
+    # 3 live arrays, plus 2 prefetched windows of the one input = 5 columns.
+    assert [p.chunk_size for p in plans] == [66, 40]
+    assert plans[1].prefetch == 2
@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+import pickle
+
 import numpy as np
 import pytest
 
@@ -49,3 +51,32 @@ def test_topology_is_frozen():
     topo = Topology.points(np.zeros((1, 3)))
     with pytest.raises(Exception):
         topo.cell_type = "triangle"  # type: ignore[misc]
+
+
+def test_element_meta_nearest_matches_brute_force_and_caches_tree():
+    rng = np.random.default_rng(0)
+    pos = rng.uniform(size=(500, 3))
+    probes = rng.uniform(size=(40, 3))
+    em = ElementMeta(position=pos)
+
+    expected = [np.argmin(((pos - p) ** 2).sum(axis=1)) for p in probes]
+    np.testing.assert_array_equal(em.nearest(probes), expected)
+    assert em.position_tree() is em.position_tree()
+
+    moved = em.model_copy(update={"position": pos[::-1].copy()})
+    np.testing.assert_array_equal(moved.nearest(probes), 499 - np.asarray(expected))
+
+
+def test_element_meta_tree_is_not_pickled():
+    em = ElementMeta(position=np.eye(3))
+    em.position_tree()
+    clone = pickle.loads(pickle.dumps(em))
+    assert clone._derived is None
+    np.testing.assert_array_equal(clone.nearest([[0.9, 0.0, 0.1]]), [0])
+
+
+def test_element_meta_nearest_requires_positions():
+    with pytest.raises(ValueError, match="position"):
+        ElementMeta().nearest([[0.0, 0.0, 0.0]])
+    with pytest.raises(ValueError, match="at least one"):
+        ElementMeta(position=np.zeros((0, 3))).nearest([[0.0, 0.0, 0.0]])
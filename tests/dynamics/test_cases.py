@@ -23,7 +23,10 @@ from cfdmod.dynamics import (
     get_stats_forces_effective,
     join_by_direction,
     solve_building_cases,
+    sweep_building_cases,
 )
+from cfdmod.dynamics import cases as cases_module
+from cfdmod.dynamics.forces import DimensionalData
 from cfdmod.dynamics.structural import BuildingStructuralData, mass_normalize_mode_shapes
 
 N_FLOORS = 3
@@ -149,6 +152,161 @@ def test_multiplier_parity_with_legacy_case_build():
         assert nrms < 2e-2, f"{field} drifted from the legacy solve: nrms={nrms:.2e}"
 
 
+def _base_structure() -> BuildingStructuralData:
+    _, _, _, df_floors, df_modes, shapes = _raw_inputs()
+    phi_raw = np.stack([np.column_stack([s["DX"], s["DY"], s["RZ"]]) for s in shapes], axis=1)
+    mass, radius = df_floors["M"].to_numpy(), df_floors["R"].to_numpy()
+    return BuildingStructuralData(
+        mode_shapes=mass_normalize_mode_shapes(phi_raw, mass, radius),
+        natural_frequencies=df_modes["wp"].to_numpy(),
+        floor_points=np.column_stack([np.zeros(N_FLOORS), np.zeros(N_FLOORS), df_floors["Z"]]),
+        cm_positions=df_floors[["XR", "YR"]].to_numpy(),
+        floors_mass=mass,
+        floors_radius=radius,
+    )
+
+
+def _coefficients(direction: float) -> PointsDataSource:
+    """Per-floor coefficients on a normalised time axis, distinct per direction."""
+    cf_x, cf_y, cm_z = _raw_inputs()[:3]
+    turn = np.deg2rad(direction)
+    return _floor_source(
+        np.cos(turn) * cf_x - np.sin(turn) * cf_y, np.sin(turn) * cf_x + cf_y, cm_z
+    ).model_copy(update={"time": TimeAxis(initial_time=0.0, timestep_size=0.02, n_timesteps=N_T)})
+
+
+def _dimensions(case: BuildingCaseParameters) -> DimensionalData:
+    # kd is 1 for every direction but 90, so use_kd leaves the others unchanged.
+    kd = 0.85 if case.use_kd and case.direction == 90.0 else 1.0
+    return DimensionalData(
+        U_H=30.0 * kd * (case.recurrence_period / 50.0) ** 0.1,
+        height=9.0,
+        base=4.0,
+        integral_scale_multiplier=case.integral_scale_multiplier,
+        simul_characteristic_length=9.0,
+    )
+
+
+def _solve_one_by_one(case: BuildingCaseParameters) -> PointsDataSource:
+    """The per-case chain the sweep factorises: scale, multiply, solve."""
+    dim = _dimensions(case)
+    ds = _coefficients(case.direction)
+    scale = dim.time_normalization_factor
+    scaled = PointsDataSource(
+        time=TimeAxis(
+            initial_time=0.0, timestep_size=ds.time.timestep_size * scale, n_timesteps=N_T
+        ),
+        topology=ds.topology,
+        elements=ds.elements,
+        fields=MemoryFieldStore(
+            {
+                "cf_x": ds.fields.read("cf_x") * dim.force_normalization_factor,
+                "cf_y": ds.fields.read("cf_y") * dim.force_normalization_factor,
+                "cm_z": ds.fields.read("cm_z") * dim.moments_normalization_factor,
+            }
+        ),
+    )
+    structure = _base_structure().with_multipliers(
+        mass_multiplier=case.mass_multiplier, frequency_multiplier=case.frequency_multiplier
+    )
+    return build_building_dynamic_response(
+        scaled, structure.to_config(case.xi, check_sampling=False)
+    )
+
+
+def test_sweep_matches_solving_every_case():
+    cases = build_cases(
+        directions=[0.0, 90.0],
+        xis=[0.01, 0.02],
+        recurrence_periods=[10.0, 50.0],
+        frequency_multipliers=[1.0, 1.2],
+        mass_multipliers=[1.0, 1.4],
+    )
+
+    swept = sweep_building_cases(
+        cases,
+        structure=_base_structure(),
+        floor_loads=_coefficients,
+        dimensions=_dimensions,
+        check_sampling=False,
+    )
+    direct = solve_building_cases(cases, _solve_one_by_one)
+
+    assert list(swept.keys()) == cases
+    for case in cases:
+        assert swept[case].time.timestep_size == pytest.approx(direct[case].time.timestep_size)
+        for field in ("disp_x", "rot_z", "feq_y", "meq_z"):
+            np.testing.assert_allclose(
+                swept[case].fields.read(field),
+                direct[case].fields.read(field),
+                rtol=1e-10,
+                atol=1e-12 * np.abs(direct[case].fields.read(field)).max(),
+                err_msg=f"{case} {field}",
+            )
+
+
+def test_sweep_reads_each_direction_once_and_shares_solves(monkeypatch):
+    cases = build_cases(
+        directions=[0.0, 90.0, 180.0],
+        xis=[0.01, 0.02],
+        recurrence_periods=[50.0],
+        use_kd=[False, True],
+    )
+    reads: list[float] = []
+    solves: list[int] = []
+    real_solve = cases_module._solve_modal
+
+    def counting_loads(direction):
+        reads.append(direction)
+        return _coefficients(direction)
+
+    def counting_solve(task):
+        solves.append(1)
+        return real_solve(task)
+
+    monkeypatch.setattr(cases_module, "_solve_modal", counting_solve)
+
+    swept = sweep_building_cases(
+        cases,
+        structure=_base_structure(),
+        floor_loads=counting_loads,
+        dimensions=_dimensions,
+        check_sampling=False,
+    )
+
+    assert len(swept) == 12
+    assert reads == [0.0, 90.0, 180.0]
+    # use_kd only changes the speed at 90 degrees: 3 directions x 2 damping
+    # ratios, plus the 2 reduced-speed solves at 90.
+    assert len(solves) == 8
+    for case in cases:
+        np.testing.assert_allclose(
+            swept[case].fields.read("disp_x"),
+            _solve_one_by_one(case).fields.read("disp_x"),
+            rtol=1e-10,
+            atol=1e-14,
+        )
+
+
+def test_sweep_rejects_supercritical_damping_before_solving(monkeypatch):
+    """The same error solve_building_cases raises, not NaN responses."""
+    cases = build_cases(directions=[0.0], xis=[0.01, 1.2], recurrence_periods=[50.0])
+    solves: list[int] = []
+    monkeypatch.setattr(cases_module, "_solve_modal", lambda task: solves.append(1))
+
+    with pytest.raises(ValueError, match="sub-critical damping"):
+        solve_building_cases(cases[1:], _solve_one_by_one)
+    with pytest.raises(ValueError, match="sub-critical damping"):
+        sweep_building_cases(
+            cases,
+            structure=_base_structure(),
+            floor_loads=_coefficients,
+            dimensions=_dimensions,
+            check_sampling=False,
+        )
+    assert solves == []
+
+
 def _nrms(actual, expected) -> float:
     """Normalized RMS difference, robust to the signals' zero crossings."""
     a = np.asarray(actual, dtype=np.float64)
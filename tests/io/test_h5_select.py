@@ -0,0 +1,72 @@
+"""Element-subset reads pushed down to h5py (``cfdmod.io.h5_select``).
+
+Every read must match numpy's own fancy indexing of the full array --
+unsorted, duplicated, negative and boolean indices included -- whether the
+selection is pushed down as coalesced runs or falls back to a whole read.
+"""
+
+from __future__ import annotations
+
+import h5py
+import numpy as np
+import pytest
+
+from cfdmod.io.h5_select import RowSelection, coalesce_runs, read_rows
+
+pytestmark = pytest.mark.unit
+
+
+@pytest.fixture()
+def datasets(tmp_path):
+    values = np.arange(100 * 9, dtype=np.float32).reshape(100, 9)
+    with h5py.File(tmp_path / "d.h5", "w") as f:
+        f["flat"] = values[:, 0]
+        f["grid"] = values
+        f.create_dataset("chunked", data=values, chunks=(16, 4))
+    with h5py.File(tmp_path / "d.h5", "r") as f:
+        yield f, values
+
+
+def test_coalesce_runs():
+    starts, lengths = coalesce_runs(np.array([3, 4, 5, 9, 11, 12]))
+    assert starts.tolist() == [3, 9, 11]
+    assert lengths.tolist() == [3, 1, 2]
+    assert [a.size for a in coalesce_runs(np.array([], dtype=np.int64))] == [0, 0]
+
+
+def test_selection_normalises_caller_index():
+    sel = RowSelection(np.array([7, 2, 7, -1]), 10)
+    assert sel.rows.tolist() == [2, 7, 9]
+    assert len(sel) == 4 and sel.size == 3
+    assert sel.rows[sel.inverse].tolist() == [7, 2, 7, 9]
+    assert RowSelection(np.array([1, 2, 5]), 10).inverse is None
+    with pytest.raises(IndexError):
+        RowSelection(np.array([10]), 10)
+
+
+@pytest.mark.parametrize(
+    "elements",
+    [
+        np.array([5, 6, 7, 40, 41, 99]),
+        np.array([41, 5, 5, -1, 0]),
+        np.array([], dtype=np.int64),
+        np.arange(100) % 7 == 0,
+        np.arange(80),  # wide enough to fall back to a whole read
+    ],
+)
+@pytest.mark.parametrize("name", ["grid", "chunked"])
+def test_read_rows_matches_numpy(datasets, elements, name):
+    f, values = datasets
+    sel = RowSelection(elements, 100)
+    np.testing.assert_array_equal(read_rows(f["flat"], sel), values[:, 0][elements])
+    np.testing.assert_array_equal(read_rows(f[name], sel), values[elements])
+    np.testing.assert_array_equal(
+        read_rows(f[name], sel, slice(1, 8, 3)), values[elements][:, 1:8:3]
+    )
+    assert read_rows(f[name], sel, slice(4, 4)).shape == (len(sel), 0)
+
+
+def test_read_rows_rejects_reversed_time_slice(datasets):
+    f, _ = datasets
+    with pytest.raises(ValueError, match="forward"):
+        read_rows(f["grid"], RowSelection(np.array([1]), 100), slice(None, None, -1))
@@ -7,7 +7,12 @@ import pandas as pd
 import pytest
 
 from cfdmod.io.timeseries import plot_timeseries, read_timeseries_df, to_csv
-from cfdmod.io.xdmf import write_timeseries_geometry, write_timeseries_meta, write_timeseries_step
+from cfdmod.io.xdmf import (
+    timeseries_writer,
+    write_timeseries_geometry,
+    write_timeseries_meta,
+    write_timeseries_step,
+)
 
 pytestmark = pytest.mark.unit
 
@@ -64,6 +69,26 @@ def test_filter_by_timestep_range_inclusive(per_triangle_h5):
     np.testing.assert_array_equal(df.index.to_numpy(), [0.1, 0.2])
 
 
+@pytest.mark.parametrize("timestep_range", [None, (1.0, 2.0)])
+def test_columnar_file_reads_like_per_step(per_triangle_h5, tmp_path, timestep_range):
+    path = tmp_path / "columnar.h5"
+    triangles = np.array([[0, 1, 2], [1, 3, 2]], dtype=np.int32)
+    vertices = np.zeros((4, 3), dtype=np.float64)
+    write_timeseries_geometry(path, triangles, vertices)
+    times = np.array([0.0, 1.0, 2.0, 3.0])
+    values = np.array([[1.0, 2.0, 3.0, 4.0], [2.0, 3.0, 4.0, 5.0], [3.0, 4.0, 5.0, 6.0]])
+    with timeseries_writer(path) as w:
+        w.write_columnar_field("cp", values, [f"t{t}" for t in times])
+    write_timeseries_meta(path, time_steps=times, time_normalized=times / 10.0)
+
+    for tri in (None, [2, 0]):
+        expected = read_timeseries_df(
+            per_triangle_h5, "cp", triangles=tri, timestep_range=timestep_range
+        )
+        got = read_timeseries_df(path, "cp", triangles=tri, timestep_range=timestep_range)
+        pd.testing.assert_frame_equal(got, expected)
+
+
 def test_regions_dedupe_collapses_constant_columns(per_region_h5):
     df = read_timeseries_df(per_region_h5, "cf_x", regions=True)
     assert df.shape == (3, 2)